@@ -0,0 +1,49 @@
+"""Add webhook_inbox table
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Create webhook_inbox table
+    op.create_table(
+        'webhook_inbox',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('delivery_id', sa.String(255), nullable=False),
+        sa.Column('event_type', sa.String(100), nullable=False),
+        sa.Column('installation_id', sa.String(255), nullable=True),
+        sa.Column('repository', sa.String(512), nullable=True),
+        sa.Column('integration_id', sa.Integer(), nullable=True),
+        sa.Column('payload', sa.Text(), nullable=False),
+        sa.Column('status', sa.String(50), nullable=False, server_default='pending'),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('received_at', sa.DateTime(), nullable=False),
+        sa.Column('processed_at', sa.DateTime(), nullable=True),
+    )
+
+    # Create indexes for webhook_inbox
+    op.create_index('ix_webhook_inbox_id', 'webhook_inbox', ['id'])
+    op.create_index('ix_webhook_inbox_delivery_id', 'webhook_inbox', ['delivery_id'], unique=True)
+    op.create_index('ix_webhook_inbox_status', 'webhook_inbox', ['status'])
+    op.create_index('idx_webhook_inbox_status_received', 'webhook_inbox', ['status', 'received_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_webhook_inbox_status_received', 'webhook_inbox')
+    op.drop_index('ix_webhook_inbox_status', 'webhook_inbox')
+    op.drop_index('ix_webhook_inbox_delivery_id', 'webhook_inbox')
+    op.drop_index('ix_webhook_inbox_id', 'webhook_inbox')
+    op.drop_table('webhook_inbox')
@@ -0,0 +1,34 @@
+"""Add keyset pagination indexes for history listings
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # (started_at, id) / (created_at, id) 키셋 페이지네이션용 복합 인덱스
+    op.create_index(
+        'idx_deployment_histories_user_op_started',
+        'deployment_histories',
+        ['user_id', 'operation_type', 'started_at', 'id'],
+    )
+    op.create_index(
+        'idx_command_history_user_created',
+        'command_history',
+        ['user_id', 'created_at', 'id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_command_history_user_created', 'command_history')
+    op.drop_index('idx_deployment_histories_user_op_started', 'deployment_histories')
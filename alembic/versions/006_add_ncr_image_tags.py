@@ -0,0 +1,38 @@
+"""Add ncr_image_tags table
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Create ncr_image_tags table
+    op.create_table(
+        'ncr_image_tags',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('image_name', sa.String(255), nullable=False),
+        sa.Column('tag', sa.String(128), nullable=False),
+        sa.Column('source', sa.String(20), nullable=False, server_default='registry'),
+        sa.Column('indexed_at', sa.DateTime(), nullable=False),
+        sa.UniqueConstraint('image_name', 'tag', name='uq_ncr_image_tags_image_tag'),
+    )
+
+    op.create_index('ix_ncr_image_tags_id', 'ncr_image_tags', ['id'])
+    op.create_index('ix_ncr_image_tags_image_name', 'ncr_image_tags', ['image_name'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ncr_image_tags_image_name', 'ncr_image_tags')
+    op.drop_index('ix_ncr_image_tags_id', 'ncr_image_tags')
+    op.drop_table('ncr_image_tags')
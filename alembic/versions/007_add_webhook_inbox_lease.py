@@ -0,0 +1,25 @@
+"""Add lease_expires_at to webhook_inbox
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 레플리카 간 원자적 점유를 위한 처리 만료 시각
+    op.add_column('webhook_inbox', sa.Column('lease_expires_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('webhook_inbox', 'lease_expires_at')
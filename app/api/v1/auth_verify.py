@@ -2,16 +2,17 @@
 JWT 토큰 검증 API
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import jwt
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from ...core.config import get_settings
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 # JWT 설정
 JWT_ALGORITHM = "HS256"
@@ -47,29 +48,45 @@ async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(secur
     except Exception as e:
         raise HTTPException(status_code=401, detail=f"Token verification failed: {str(e)}")
 
-@router.get("/me", response_model=Dict[str, Any])
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict[str, Any]:
-    """현재 사용자 정보 조회"""
+def get_user_from_token(token: str) -> Dict[str, Any]:
+    """JWT를 검증하고 사용자 정보를 반환합니다. (WebSocket 등 헤더 인증이 어려운 경로용)"""
     try:
-        token = credentials.credentials
         payload = jwt.decode(token, get_jwt_secret(), algorithms=[JWT_ALGORITHM])
-        
-        return {
-            "id": payload.get("sub"),
-            "email": payload.get("email"),
-            "name": payload.get("name"),
-            "picture": payload.get("picture"),
-            "provider": payload.get("provider")
-        }
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
-    except Exception as e:
-        raise HTTPException(status_code=401, detail=f"Token verification failed: {str(e)}")
-
-
+    return {
+        "id": payload.get("sub"),
+        "email": payload.get("email"),
+        "name": payload.get("name"),
+        "picture": payload.get("picture"),
+        "provider": payload.get("provider")
+    }
 
 
+@router.get("/me", response_model=Dict[str, Any])
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict[str, Any]:
+    """현재 사용자 정보 조회"""
+    try:
+        return get_user_from_token(credentials.credentials)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=401, detail=f"Token verification failed: {str(e)}")
 
 
+async def get_current_user_or_query_token(
+    token: Optional[str] = Query(None, description="JWT (헤더를 보낼 수 없는 EventSource용)"),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+) -> Dict[str, Any]:
+    """Authorization 헤더 또는 token 쿼리 파라미터로 사용자를 인증합니다. (SSE용)"""
+    raw = credentials.credentials if credentials is not None else token
+    if not raw:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    try:
+        return get_user_from_token(raw)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=401, detail=f"Token verification failed: {str(e)}")
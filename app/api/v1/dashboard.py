@@ -1,19 +1,19 @@
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 import asyncio
-import random
 import logging
 
-from fastapi import APIRouter, Request, HTTPException, status, Depends
+from fastapi import APIRouter, Request, HTTPException, status, Depends, Query
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
 
+from ...core.config import get_settings
 from ...services.monitoring import get_system_metrics
 from ...services.deployment import get_deployment_stats
 from ...services.cluster import get_cluster_info
-from ...database import get_db
+from ...services.dashboard_overview import DashboardOverviewBuilder, OverviewContext, OverviewSection
+from ...database import SessionLocal
 from .auth_verify import get_current_user
-from ...services.user_repository import get_user_repositories
+from ...services.user_repository import list_user_repositories
 
 logger = logging.getLogger(__name__)
 
@@ -67,166 +67,203 @@ class DashboardData(BaseModel):
     systemHealth: List[SystemHealth]
     connectedRepositories: List[ConnectedRepository]
     pullRequests: List[PullRequest]
+    # 섹션 조립 메타데이터
+    partial: bool = False  # 타임아웃/실패한 섹션이 있으면 True
+    degradedSections: List[str] = []
+    sectionTimings: Dict[str, float] = {}  # 섹션별 소요 시간 (ms)
+    cacheStatus: str = "miss"  # hit, stale, miss
+    generatedAt: Optional[str] = None
+
+
+def _system_health() -> List[SystemHealth]:
+    return [
+        SystemHealth(service="NCP Connection", status="healthy"),
+        SystemHealth(service="Kubernetes API", status="healthy"),
+        SystemHealth(service="GitHub Integration", status="warning"),
+        SystemHealth(service="Monitoring", status="healthy")
+    ]
+
+
+def _user_repositories(ctx: OverviewContext):
+    """사용자 리포지토리 목록 (repositories/pull_requests 섹션이 공유)"""
+    def load():
+        session = SessionLocal()
+        try:
+            return list_user_repositories(session, ctx.user_id)
+        finally:
+            session.close()
+
+    async def fetch():
+        return await asyncio.to_thread(load)
+    return ctx.shared("user_repositories", fetch)
+
+
+def _github_token(ctx: OverviewContext):
+    """GitHub App 설치 토큰 (리포지토리 조회와 동시에 준비)"""
+    async def fetch():
+        from ...services.github_app import github_app_auth
+        installations = await github_app_auth.get_app_installations()
+        if not installations:
+            return None
+        return await github_app_auth.get_installation_token(str(installations[0]["id"]))
+    return ctx.shared("github_token", fetch)
+
+
+async def _fetch_cluster(ctx: OverviewContext) -> Dict[str, Any]:
+    return await get_cluster_info()
+
+
+async def _fetch_deployment_stats(ctx: OverviewContext) -> Dict[str, Any]:
+    return await get_deployment_stats()
+
+
+async def _fetch_system_metrics(ctx: OverviewContext) -> Dict[str, Any]:
+    return get_system_metrics()
+
+
+async def _fetch_recent_deployments(ctx: OverviewContext) -> List[RecentDeployment]:
+    """최근 배포 이력 (실제 데이터 조회)"""
+    from .deployment_histories import collect_latest_deployments
+
+    def load():
+        session = SessionLocal()
+        try:
+            return collect_latest_deployments(session, ctx.user_id)
+        finally:
+            session.close()
+
+    # DB/Kubernetes 동기 조회는 이벤트 루프를 막지 않도록 스레드에서 실행
+    deployments = await asyncio.to_thread(load)
+
+    recent_deployments = []
+    for deployment in deployments[:3]:  # 최대 3개만
+        latest = deployment.get("latest_deployment") or {}
+        recent_deployments.append(RecentDeployment(
+            name=deployment.get("full_name", ""),
+            version=(latest.get("image") or {}).get("tag") or "",
+            status=latest.get("status") or "unknown",
+            time=latest.get("created_at") or "",
+            message=f"Deployed {latest.get('created_at') or ''}"
+        ))
+    return recent_deployments
+
+
+async def _fetch_connected_repositories(ctx: OverviewContext) -> List[ConnectedRepository]:
+    """연결된 리포지토리 정보 (사용자별, 최대 3개)"""
+    user_repos = await _user_repositories(ctx)
+    return [
+        ConnectedRepository(
+            id=repo.get("id", ""),
+            name=repo.get("name", ""),
+            fullName=repo.get("fullName", ""),
+            branch=repo.get("branch", "main"),
+            lastSync=repo.get("lastSync", "")
+        )
+        for repo in user_repos[:3]
+    ]
+
+
+async def _fetch_pull_requests(ctx: OverviewContext) -> List[PullRequest]:
+    """Pull Request 정보 (사용자 리포지토리에서만, 리포지토리별 병렬 조회)"""
+    user_repos, token = await asyncio.gather(_user_repositories(ctx), _github_token(ctx))
+    if not user_repos or not token:
+        return []
+
+    from ...services.github_client import github_client
+
+    async def fetch_repo_prs(repo_name):
+        try:
+            response = await github_client.get(
+                f"/repos/{repo_name}/pulls",
+                token=token,
+                params={"state": "open", "per_page": 3},  # 최대 3개로 제한
+                endpoint="/repos/{owner}/{repo}/pulls",
+            )
+            if response.status_code == 200:
+                return response.json()
+            return []
+        except Exception as e:
+            logger.warning(f"Failed to fetch PRs for {repo_name}: {e}")
+            return []
+
+    repo_names = [repo.get("fullName") for repo in user_repos if repo.get("fullName")]
+    pr_responses = await asyncio.gather(*[fetch_repo_prs(name) for name in repo_names])
+
+    all_prs = [pr for prs_data in pr_responses if isinstance(prs_data, list) for pr in prs_data]
+    # 생성일 기준으로 정렬하고 최신 3개만 선택
+    all_prs.sort(key=lambda pr: pr.get("created_at", ""), reverse=True)
+    return [
+        PullRequest(
+            id=str(pr["id"]),
+            number=pr["number"],
+            title=pr["title"],
+            author=pr["user"]["login"],
+            status=pr.get("state", "open"),
+            createdAt=pr.get("created_at", ""),
+            htmlUrl=pr.get("html_url", "")
+        )
+        for pr in all_prs[:3]
+    ]
+
+
+_overview_builder: Optional[DashboardOverviewBuilder] = None
+
+
+def get_overview_builder() -> DashboardOverviewBuilder:
+    """대시보드 섹션 정의와 사용자별 캐시를 가진 빌더를 반환합니다."""
+    global _overview_builder
+    if _overview_builder is None:
+        settings = get_settings()
+        _overview_builder = DashboardOverviewBuilder(
+            sections=[
+                OverviewSection("cluster", _fetch_cluster, dict),
+                OverviewSection("deployment_stats", _fetch_deployment_stats, dict),
+                OverviewSection("system_metrics", _fetch_system_metrics, dict),
+                OverviewSection("recent_deployments", _fetch_recent_deployments, list),
+                OverviewSection("repositories", _fetch_connected_repositories, list),
+                OverviewSection("pull_requests", _fetch_pull_requests, list),
+            ],
+            ttl_seconds=settings.dashboard_cache_ttl,
+            stale_seconds=settings.dashboard_cache_stale_ttl,
+            default_timeout=settings.dashboard_section_timeout,
+        )
+    return _overview_builder
 
 
 @router.get("/dashboard/overview", response_model=DashboardData)
 async def get_dashboard_overview(
     request: Request,
-    db: Session = Depends(get_db),
+    refresh: bool = Query(False, description="캐시를 무시하고 다시 조회"),
     current_user: Dict[str, Any] = Depends(get_current_user)
 ) -> DashboardData:
-    """대시보드 개요 데이터를 반환합니다."""
+    """대시보드 개요 데이터를 반환합니다.
+
+    각 섹션은 동시에 조회되며, 타임아웃된 섹션은 기본값으로 채운 부분 응답을 반환합니다.
+    """
     try:
-        # 실제 서비스에서 데이터를 가져오는 로직
-        # 현재는 목업 데이터를 반환하지만, 실제 구현에서는 서비스들을 호출
-        
-        # 클러스터 정보 가져오기
-        cluster_info = await get_cluster_info()
-        clusters = cluster_info.get('total_clusters', 3)
-        
-        # 배포 통계 가져오기
-        deployment_stats = await get_deployment_stats()
-        total_deployments = deployment_stats.get('total', 12)
-        pending_deployments = deployment_stats.get('pending', 4)
-        active_deployments = deployment_stats.get('active', 8)
-        
-        # 시스템 메트릭 가져오기
-        metrics = get_system_metrics()
-        cpu_usage = int(metrics.get('cpu_usage', 68))
-        memory_usage = int(metrics.get('memory_usage', 45))
-        
-        # 최근 배포 이력 (실제 데이터 조회)
-        recent_deployments = []
-        try:
-            from .deployment_histories import get_repositories_latest_deployments
-            deployment_response = await get_repositories_latest_deployments(db=db, current_user=current_user)
-            if deployment_response.get("status") == "success":
-                deployments = deployment_response.get("repositories", [])
-                for deployment in deployments[:3]:  # 최대 3개만
-                    recent_deployments.append(RecentDeployment(
-                        name=deployment.get("full_name", ""),
-                        version=deployment.get("latest_deployment", {}).get("image", {}).get("tag", ""),
-                        status=deployment.get("latest_deployment", {}).get("status", "unknown"),
-                        time=deployment.get("latest_deployment", {}).get("created_at", ""),
-                        message=f"Deployed {deployment.get('latest_deployment', {}).get('created_at', '')}"
-                    ))
-        except Exception as e:
-            logger.warning(f"Failed to fetch recent deployments: {e}")
-            # 데이터가 없으면 빈 배열 반환
-            recent_deployments = []
-        
-        # 시스템 상태
-        system_health = [
-            SystemHealth(service="NCP Connection", status="healthy"),
-            SystemHealth(service="Kubernetes API", status="healthy"),
-            SystemHealth(service="GitHub Integration", status="warning"),
-            SystemHealth(service="Monitoring", status="healthy")
-        ]
-        
-        # 연결된 리포지토리 정보 가져오기 (사용자별)
-        connected_repositories = []
-        try:
-            user_repos = await get_user_repositories(db, str(current_user.get("id", "")))
-            # 최대 3개만 표시
-            for repo in user_repos[:3]:
-                connected_repositories.append(ConnectedRepository(
-                    id=repo.get("id", ""),
-                    name=repo.get("name", ""),
-                    fullName=repo.get("fullName", ""),
-                    branch=repo.get("branch", "main"),
-                    lastSync=repo.get("lastSync", "")
-                ))
-        except Exception as e:
-            logger.warning(f"Failed to fetch user repositories: {e}")
-            # 데이터가 없으면 빈 배열 반환
-            connected_repositories = []
-        
-        # Pull Request 정보 가져오기 (사용자 리포지토리에서만) - 병렬 처리로 최적화
-        pull_requests = []
-        try:
-            # 사용자 리포지토리 목록 가져오기
-            user_repos = await get_user_repositories(db, str(current_user.get("id", "")))
-            
-            if not user_repos:
-                pull_requests = []
-            else:
-                # GitHub App 토큰 가져오기
-                from ...services.github_app import github_app_auth
-                installations = await github_app_auth.get_app_installations()
-                
-                if installations:
-                    installation_id = installations[0]["id"]
-                    token = await github_app_auth.get_installation_token(str(installation_id))
-                    
-                    import httpx
-                    import asyncio
-                    async with httpx.AsyncClient(timeout=10.0) as client:  # 타임아웃 설정
-                        # 병렬로 모든 리포지토리의 PR 조회
-                        async def fetch_repo_prs(repo_name):
-                            try:
-                                response = await client.get(
-                                    f"https://api.github.com/repos/{repo_name}/pulls",
-                                    headers={
-                                        "Authorization": f"Bearer {token}",
-                                        "Accept": "application/vnd.github+json",
-                                        "X-GitHub-Api-Version": "2022-11-28"
-                                    },
-                                    params={"state": "open", "per_page": 3}  # 최대 3개로 제한
-                                )
-                                if response.status_code == 200:
-                                    return response.json()
-                                return []
-                            except Exception as e:
-                                logger.warning(f"Failed to fetch PRs for {repo_name}: {e}")
-                                return []
-                        
-                        # 모든 리포지토리의 PR을 병렬로 조회
-                        repo_names = [repo.get("fullName") for repo in user_repos if repo.get("fullName")]
-                        pr_responses = await asyncio.gather(*[fetch_repo_prs(name) for name in repo_names], return_exceptions=True)
-                        
-                        # 결과 수집
-                        all_prs = []
-                        for prs_data in pr_responses:
-                            if isinstance(prs_data, list):
-                                for pr in prs_data:
-                                    all_prs.append({
-                                        "id": str(pr["id"]),
-                                        "number": pr["number"],
-                                        "title": pr["title"],
-                                        "author": pr["user"]["login"],
-                                        "status": pr["state"],
-                                        "createdAt": pr["created_at"],
-                                        "htmlUrl": pr["html_url"]
-                                    })
-                        
-                        # 생성일 기준으로 정렬하고 최신 3개만 선택
-                        all_prs.sort(key=lambda x: x.get("createdAt", ""), reverse=True)
-                        for pr in all_prs[:3]:
-                            pull_requests.append(PullRequest(
-                                id=pr.get("id", ""),
-                                number=pr.get("number", 0),
-                                title=pr.get("title", ""),
-                                author=pr.get("author", ""),
-                                status=pr.get("status", "open"),
-                                createdAt=pr.get("createdAt", ""),
-                                htmlUrl=pr.get("htmlUrl", "")
-                            ))
-        except Exception as e:
-            logger.warning(f"Failed to fetch pull requests: {e}")
-            # 데이터가 없으면 빈 배열 반환
-            pull_requests = []
-        
+        result, cache_status = await get_overview_builder().get(current_user, force_refresh=refresh)
+        data = result.data
+
+        cluster_info = data["cluster"]
+        deployment_stats = data["deployment_stats"]
+        metrics = data["system_metrics"]
+
         return DashboardData(
-            clusters=clusters,
-            deployments=total_deployments,
-            pendingDeployments=pending_deployments,
-            activeDeployments=active_deployments,
-            cpuUsage=cpu_usage,
-            memoryUsage=memory_usage,
-            recentDeployments=recent_deployments,
-            systemHealth=system_health,
-            connectedRepositories=connected_repositories,
-            pullRequests=pull_requests
+            clusters=cluster_info.get('total_clusters', 3),
+            deployments=deployment_stats.get('total', 12),
+            pendingDeployments=deployment_stats.get('pending', 4),
+            activeDeployments=deployment_stats.get('active', 8),
+            cpuUsage=int(metrics.get('cpu_usage', 68)),
+            memoryUsage=int(metrics.get('memory_usage', 45)),
+            recentDeployments=data["recent_deployments"],
+            systemHealth=_system_health(),
+            connectedRepositories=data["repositories"],
+            pullRequests=data["pull_requests"],
+            partial=result.partial,
+            degradedSections=result.degraded,
+            sectionTimings=result.timings_ms,
+            cacheStatus=cache_status,
+            generatedAt=datetime.fromtimestamp(result.generated_at, tz=timezone.utc).isoformat()
         )
         
     except Exception as e:
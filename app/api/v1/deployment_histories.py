@@ -5,13 +5,15 @@ CI/CD 파이프라인의 배포 히스토리를 조회하는 API 엔드포인트
 실시간 배포 진행률 표시를 위한 데이터를 제공합니다.
 """
 
+import asyncio
 from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import JSONResponse
+from ...core.serialization import FastJSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import desc, and_
 from kubernetes.client.rest import ApiException
 
+from ...core.pagination import InvalidCursorError, keyset_page, offset_page, parse_fields
 from ...database import get_db
 from ...models.deployment_history import DeploymentHistory
 from .auth_verify import get_current_user
@@ -20,12 +22,62 @@ from ...services.k8s_client import get_apps_v1_api
 router = APIRouter()
 
 
+def _paginate_deployments(
+    query,
+    limit: int,
+    offset: int,
+    cursor: Optional[str],
+    fields: Optional[str],
+) -> Dict[str, Any]:
+    """
+    배포 목록을 필요한 컬럼만 로드해 페이지 단위로 조회합니다.
+
+    cursor가 있으면 (started_at, id) 키셋으로 이어서 조회하고, 없으면 첫 페이지
+    (또는 하위 호환용 offset 페이지)를 조회합니다. 전체 건수는 커서 없는 요청에서만
+    계산합니다.
+    """
+    try:
+        selected = parse_fields(fields, list(DeploymentHistory.FIELD_COLUMNS))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    query = query.options(DeploymentHistory.list_load_options(selected))
+    total_count = None if cursor else query.order_by(None).count()
+
+    if offset and not cursor:
+        rows, next_cursor = offset_page(
+            query, DeploymentHistory.started_at, DeploymentHistory.id, limit, offset
+        )
+        has_more = next_cursor is not None
+    else:
+        try:
+            rows, next_cursor = keyset_page(
+                query, DeploymentHistory.started_at, DeploymentHistory.id, limit, cursor
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        has_more = next_cursor is not None
+
+    return {
+        "deployments": [row.to_dict(selected) for row in rows],
+        "pagination": {
+            "total": total_count,
+            "limit": limit,
+            "offset": offset,
+            "has_more": has_more,
+            "next_cursor": next_cursor
+        }
+    }
+
+
 @router.get("/deployment-histories")
 async def get_deployment_histories(
     repository: Optional[str] = Query(None, description="Repository name (owner/repo)"),
     status: Optional[str] = Query(None, description="Deployment status (running, success, failed)"),
     limit: int = Query(20, ge=1, le=100, description="Number of deployments to return"),
-    offset: int = Query(0, ge=0, description="Number of deployments to skip"),
+    offset: int = Query(0, ge=0, description="Number of deployments to skip (deprecated, use cursor)"),
+    cursor: Optional[str] = Query(None, description="Cursor from pagination.next_cursor"),
+    fields: Optional[str] = Query(None, description="Comma-separated top-level fields to return"),
     db: Session = Depends(get_db),
     current_user: Dict[str, Any] = Depends(get_current_user)
 ) -> Dict[str, Any]:
@@ -33,6 +85,7 @@ async def get_deployment_histories(
     배포 히스토리 조회
     
     사용자의 배포 히스토리를 조회합니다. 특정 리포지토리나 상태로 필터링할 수 있습니다.
+    다음 페이지는 응답의 pagination.next_cursor를 cursor로 전달해 조회합니다.
     """
     try:
         # 기본 쿼리 (사용자별 필터링 + deploy 작업만 표시)
@@ -68,27 +121,15 @@ async def get_deployment_histories(
             query = query.filter(DeploymentHistory.status == status)
         
         # 정렬 및 페이징
-        total_count = query.count()
-        deployments = query.order_by(desc(DeploymentHistory.started_at)).offset(offset).limit(limit).all()
-        
-        # 응답 데이터 구성
-        deployment_list = [deployment.to_dict() for deployment in deployments]
-        
-        data = {
-            "deployments": deployment_list,
-            "pagination": {
-                "total": total_count,
-                "limit": limit,
-                "offset": offset,
-                "has_more": offset + limit < total_count
-            },
+        data = _paginate_deployments(query, limit, offset, cursor, fields)
+        data.update({
             "filters": {
                 "repository": repository,
                 "status": status
             }
-        }
+        })
         # Return with no-cache headers
-        return JSONResponse(
+        return FastJSONResponse(
             content=data,
             headers={
                 "Cache-Control": "no-store, no-cache, must-revalidate",
@@ -97,6 +138,8 @@ async def get_deployment_histories(
             }
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch deployment histories: {str(e)}")
 
@@ -139,7 +182,9 @@ async def get_repository_deployment_histories(
     repo: str,
     status: Optional[str] = Query(None, description="Deployment status"),
     limit: int = Query(20, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, description="Deprecated, use cursor"),
+    cursor: Optional[str] = Query(None, description="Cursor from pagination.next_cursor"),
+    fields: Optional[str] = Query(None, description="Comma-separated top-level fields to return"),
     db: Session = Depends(get_db),
     current_user: Dict[str, Any] = Depends(get_current_user)
 ) -> Dict[str, Any]:
@@ -169,21 +214,11 @@ async def get_repository_deployment_histories(
             query = query.filter(DeploymentHistory.status == status)
         
         # 정렬 및 페이징
-        total_count = query.count()
-        deployments = query.order_by(desc(DeploymentHistory.started_at)).offset(offset).limit(limit).all()
-        
-        # 응답 데이터 구성
-        deployment_list = [deployment.to_dict() for deployment in deployments]
+        page = _paginate_deployments(query, limit, offset, cursor, fields)
         
         return {
             "repository": f"{owner}/{repo}",
-            "deployments": deployment_list,
-            "pagination": {
-                "total": total_count,
-                "limit": limit,
-                "offset": offset,
-                "has_more": offset + limit < total_count
-            },
+            **page,
             "filters": {
                 "status": status
             }
@@ -261,7 +296,9 @@ async def get_deployment_stats(
         ).with_entities(func.avg(DeploymentHistory.total_duration)).scalar() or 0
         
         # 최근 배포들
-        recent_deployments = query.order_by(desc(DeploymentHistory.started_at)).limit(5).all()
+        recent_deployments = query.options(DeploymentHistory.list_load_options()).order_by(
+            desc(DeploymentHistory.started_at), desc(DeploymentHistory.id)
+        ).limit(5).all()
         recent_deployment_list = [d.to_dict() for d in recent_deployments]
         
         return {
@@ -301,68 +338,8 @@ async def get_repositories_latest_deployments(
     각 repository의 최신 배포 상태와 Kubernetes 워크로드 정보를 반환합니다.
     """
     try:
-        from ...models.user_project_integration import UserProjectIntegration
-        from sqlalchemy import func
-        import random
-
-        # 사용자의 모든 연동된 repository 조회
-        integrations = db.query(UserProjectIntegration).filter(
-            UserProjectIntegration.user_id == current_user["id"]
-        ).all()
-
-        repositories = []
-
-        for integration in integrations:
-            # 각 repository의 최신 배포 조회 (operation_type이 "deploy"인 것만)
-            latest_deployment = db.query(DeploymentHistory).filter(
-                and_(
-                    DeploymentHistory.user_id == current_user["id"],
-                    DeploymentHistory.github_owner == integration.github_owner,
-                    DeploymentHistory.github_repo == integration.github_repo,
-                    DeploymentHistory.operation_type == "deploy"  # 배포 작업만 필터링
-                )
-            ).order_by(desc(DeploymentHistory.started_at)).first()
-
-            if latest_deployment:
-                # Kubernetes 워크로드 정보 (실제 K8s API 조회)
-                k8s_info = await _get_kubernetes_deployment_info(
-                    integration.github_owner,
-                    integration.github_repo,
-                    latest_deployment.namespace or "default"
-                )
-
-                # 배포 정보에 K8s 정보 추가
-                deployment_dict = latest_deployment.to_dict()
-                deployment_dict["cluster"] = k8s_info
-
-                # service_url 추가
-                from ...services.pipeline_user_url import get_deployment_url
-                deployment_url = get_deployment_url(
-                    db=db,
-                    user_id=current_user["id"],
-                    github_owner=integration.github_owner,
-                    github_repo=integration.github_repo
-                )
-                deployment_dict["service_url"] = deployment_url.url if deployment_url else None
-
-                repositories.append({
-                    "owner": integration.github_owner,
-                    "repo": integration.github_repo,
-                    "full_name": integration.github_full_name,
-                    "branch": integration.branch or "main",
-                    "latest_deployment": deployment_dict,
-                    "auto_deploy_enabled": integration.auto_deploy_enabled
-                })
-            else:
-                # 배포 이력이 없는 경우
-                repositories.append({
-                    "owner": integration.github_owner,
-                    "repo": integration.github_repo,
-                    "full_name": integration.github_full_name,
-                    "branch": integration.branch or "main",
-                    "latest_deployment": None,
-                    "auto_deploy_enabled": integration.auto_deploy_enabled
-                })
+        # DB/Kubernetes 조회가 모두 동기 호출이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        repositories = await asyncio.to_thread(collect_latest_deployments, db, current_user["id"])
 
         # FastAPI가 자동 직렬화하도록 dict를 직접 반환합니다.
         # 캐싱 방지 헤더는 필요 시 미들웨어에서 일괄 적용하세요.
@@ -375,7 +352,73 @@ async def get_repositories_latest_deployments(
         )
 
 
-async def _get_kubernetes_deployment_info(owner: str, repo: str, namespace: str) -> dict:
+def collect_latest_deployments(db: Session, user_id: str) -> List[Dict[str, Any]]:
+    """연동된 repository별 최신 배포와 Kubernetes 워크로드 정보를 조회합니다 (동기)."""
+    from ...models.user_project_integration import UserProjectIntegration
+
+    # 사용자의 모든 연동된 repository 조회
+    integrations = db.query(UserProjectIntegration).filter(
+        UserProjectIntegration.user_id == user_id
+    ).all()
+
+    repositories = []
+
+    for integration in integrations:
+        # 각 repository의 최신 배포 조회 (operation_type이 "deploy"인 것만)
+        latest_deployment = db.query(DeploymentHistory).filter(
+            and_(
+                DeploymentHistory.user_id == user_id,
+                DeploymentHistory.github_owner == integration.github_owner,
+                DeploymentHistory.github_repo == integration.github_repo,
+                DeploymentHistory.operation_type == "deploy"  # 배포 작업만 필터링
+            )
+        ).order_by(desc(DeploymentHistory.started_at)).first()
+
+        if latest_deployment:
+            # Kubernetes 워크로드 정보 (실제 K8s API 조회)
+            k8s_info = _get_kubernetes_deployment_info(
+                integration.github_owner,
+                integration.github_repo,
+                latest_deployment.namespace or "default"
+            )
+
+            # 배포 정보에 K8s 정보 추가
+            deployment_dict = latest_deployment.to_dict()
+            deployment_dict["cluster"] = k8s_info
+
+            # service_url 추가
+            from ...services.pipeline_user_url import get_deployment_url
+            deployment_url = get_deployment_url(
+                db=db,
+                user_id=user_id,
+                github_owner=integration.github_owner,
+                github_repo=integration.github_repo
+            )
+            deployment_dict["service_url"] = deployment_url.url if deployment_url else None
+
+            repositories.append({
+                "owner": integration.github_owner,
+                "repo": integration.github_repo,
+                "full_name": integration.github_full_name,
+                "branch": integration.branch or "main",
+                "latest_deployment": deployment_dict,
+                "auto_deploy_enabled": integration.auto_deploy_enabled
+            })
+        else:
+            # 배포 이력이 없는 경우
+            repositories.append({
+                "owner": integration.github_owner,
+                "repo": integration.github_repo,
+                "full_name": integration.github_full_name,
+                "branch": integration.branch or "main",
+                "latest_deployment": None,
+                "auto_deploy_enabled": integration.auto_deploy_enabled
+            })
+
+    return repositories
+
+
+def _get_kubernetes_deployment_info(owner: str, repo: str, namespace: str) -> dict:
     """
     Kubernetes API를 통해 실제 Deployment 정보를 조회합니다.
     
@@ -1,19 +1,23 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 import json
 import asyncio
+import hashlib
 
-from fastapi import APIRouter, HTTPException, Depends, Query, Request, BackgroundTasks, status
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
 from ...services.github_workflow import create_or_update_workflow, DEFAULT_CI_YAML
 from ...services.github_app import github_app_auth
+from ...services.github_client import github_client
 from ...services.notification import SlackNotificationService
 from ...models.deployment_history import DeploymentHistory, get_kst_now
 from datetime import datetime
 from ...services.user_repository import get_user_repositories, add_user_repository, remove_user_repository
-from ...database import get_db
+from ...services.webhook_ingestion import get_webhook_pipeline
+from ...core.pagination import InvalidCursorError, keyset_page, offset_page, parse_fields
+from ...database import SessionLocal, get_db
 from ...models.user_project_integration import UserProjectIntegration
 from ..v1.auth_verify import get_current_user
 import logging
@@ -242,21 +246,18 @@ async def simulate_progress(
             await asyncio.sleep(time_step)
 
 
-async def get_pr_ci_status(client, token: str, repo_full_name: str, pr_number: int) -> str:
+async def get_pr_ci_status(token: str, repo_full_name: str, pr_number: int) -> str:
     """PR의 실제 CI 상태를 조회합니다."""
     try:
         # GitHub Actions 워크플로우 실행 상태 조회
-        response = await client.get(
-            f"https://api.github.com/repos/{repo_full_name}/actions/runs",
-            headers={
-                "Authorization": f"Bearer {token}",
-                "Accept": "application/vnd.github+json",
-                "X-GitHub-Api-Version": "2022-11-28"
-            },
+        response = await github_client.get(
+            f"/repos/{repo_full_name}/actions/runs",
+            token=token,
             params={
                 "per_page": 10,  # 최근 10개 실행만 조회
                 "branch": f"pr/{pr_number}"  # PR 브랜치의 워크플로우 실행
-            }
+            },
+            endpoint="/repos/{owner}/{repo}/actions/runs",
         )
         
         if response.status_code == 200:
@@ -278,13 +279,10 @@ async def get_pr_ci_status(client, token: str, repo_full_name: str, pr_number: i
                     return "pending"
         
         # 워크플로우가 없거나 조회 실패 시 PR 상태 기반으로 판단
-        pr_response = await client.get(
-            f"https://api.github.com/repos/{repo_full_name}/pulls/{pr_number}",
-            headers={
-                "Authorization": f"Bearer {token}",
-                "Accept": "application/vnd.github+json",
-                "X-GitHub-Api-Version": "2022-11-28"
-            }
+        pr_response = await github_client.get(
+            f"/repos/{repo_full_name}/pulls/{pr_number}",
+            token=token,
+            endpoint="/repos/{owner}/{repo}/pulls/{number}",
         )
         
         if pr_response.status_code == 200:
@@ -366,6 +364,15 @@ async def get_installation_token(installation_id: str) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=f"Failed to get installation token: {str(e)}")
 
 
+@router.get("/github/api-cache/stats", response_model=Dict[str, Any])
+async def get_github_api_cache_stats() -> Dict[str, Any]:
+    """공유 GitHub 클라이언트의 엔드포인트별 캐시 적중률을 조회합니다."""
+    return {
+        "status": "success",
+        "endpoints": github_client.stats()
+    }
+
+
 @router.get("/github/app/install-url", response_model=Dict[str, Any])
 async def get_app_install_url() -> Dict[str, Any]:
     """GitHub App 설치 URL을 생성합니다."""
@@ -424,51 +431,46 @@ async def check_repository_installation(owner: str, repo: str) -> Dict[str, Any]
         logger.info(f"Using installation ID: {installation_id}")
         token = await github_app_auth.get_installation_token(str(installation_id))
         
-        import httpx
-        async with httpx.AsyncClient() as client:
-            # GitHub App이 접근 가능한 리포지토리 목록 조회
-            repos_response = await client.get(
-                "https://api.github.com/installation/repositories",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Accept": "application/vnd.github+json",
-                    "X-GitHub-Api-Version": "2022-11-28"
-                }
-            )
-            
-            if repos_response.status_code != 200:
-                return {
-                    "status": "error",
-                    "installed": False,
-                    "repository": f"{owner}/{repo}",
-                    "message": f"리포지토리 목록 조회 실패: {repos_response.status_code}"
-                }
-            
-            # 설치된 리포지토리 목록에서 해당 리포지토리 찾기
-            repos_data = repos_response.json()
-            target_repo = f"{owner}/{repo}"
-            
-            for repo_info in repos_data.get("repositories", []):
-                if repo_info["full_name"] == target_repo:
-                    return {
-                        "status": "success",
-                        "installed": True,
-                        "repository": target_repo,
-                        "message": "GitHub App이 설치되어 있습니다.",
-                        "installation_id": str(installation_id)
-                    }
-            
-            # 리포지토리를 찾지 못한 경우 (조직/사용자별 설치 안내 링크 포함)
-            from ...core.config import get_settings
-            settings = get_settings()
-            install_url = settings.github_app_install_url or "https://github.com/apps/K-Le-PaaS/installations/new"
+        # GitHub App이 접근 가능한 리포지토리 목록 조회 (ETag 캐시)
+        repos_response = await github_client.get(
+            "/installation/repositories",
+            token=token,
+            endpoint="/installation/repositories",
+        )
+        
+        if repos_response.status_code != 200:
             return {
                 "status": "error",
                 "installed": False,
                 "repository": f"{owner}/{repo}",
-                "message": "GitHub App이 해당 리포지토리에 설치되어 있지 않습니다.",
-                "install_url": install_url
+                "message": f"리포지토리 목록 조회 실패: {repos_response.status_code}"
             }
+        
+        # 설치된 리포지토리 목록에서 해당 리포지토리 찾기
+        repos_data = repos_response.json()
+        target_repo = f"{owner}/{repo}"
+        
+        for repo_info in repos_data.get("repositories", []):
+            if repo_info["full_name"] == target_repo:
+                return {
+                    "status": "success",
+                    "installed": True,
+                    "repository": target_repo,
+                    "message": "GitHub App이 설치되어 있습니다.",
+                    "installation_id": str(installation_id)
+                }
+        
+        # 리포지토리를 찾지 못한 경우 (조직/사용자별 설치 안내 링크 포함)
+        from ...core.config import get_settings
+        settings = get_settings()
+        install_url = settings.github_app_install_url or "https://github.com/apps/K-Le-PaaS/installations/new"
+        return {
+            "status": "error",
+            "installed": False,
+            "repository": f"{owner}/{repo}",
+            "message": "GitHub App이 해당 리포지토리에 설치되어 있지 않습니다.",
+            "install_url": install_url
+        }
     except Exception as e:
         return {
             "status": "error",
@@ -496,42 +498,37 @@ async def get_connected_repositories() -> Dict[str, Any]:
         installation_id = installations[0]["id"]
         token = await github_app_auth.get_installation_token(str(installation_id))
         
-        # GitHub API로 리포지토리 목록 조회
-        import httpx
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://api.github.com/installation/repositories",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Accept": "application/vnd.github+json",
-                    "X-GitHub-Api-Version": "2022-11-28"
-                }
-            )
-            
-            if response.status_code != 200:
-                raise HTTPException(status_code=response.status_code, detail=f"GitHub API error: {response.text}")
-            
-            data = response.json()
-            repositories = []
-            
-            for repo in data.get("repositories", []):
-                repositories.append({
-                    "id": str(repo["id"]),
-                    "name": repo["name"],
-                    "fullName": repo["full_name"],
-                    "connected": True,
-                    "lastSync": repo["updated_at"],
-                    "branch": repo.get("default_branch", "main"),
-                    "status": "healthy" if not repo.get("archived", False) else "warning",
-                    "autoDeployEnabled": True,
-                    "webhookConfigured": True,
-                })
-            
-            return {
-                "status": "success",
-                "repositories": repositories,
-                "count": len(repositories)
-            }
+        # GitHub API로 리포지토리 목록 조회 (ETag 캐시)
+        response = await github_client.get(
+            "/installation/repositories",
+            token=token,
+            endpoint="/installation/repositories",
+        )
+        
+        if response.status_code != 200:
+            raise HTTPException(status_code=response.status_code, detail=f"GitHub API error: {response.text}")
+        
+        data = response.json()
+        repositories = []
+        
+        for repo in data.get("repositories", []):
+            repositories.append({
+                "id": str(repo["id"]),
+                "name": repo["name"],
+                "fullName": repo["full_name"],
+                "connected": True,
+                "lastSync": repo["updated_at"],
+                "branch": repo.get("default_branch", "main"),
+                "status": "healthy" if not repo.get("archived", False) else "warning",
+                "autoDeployEnabled": True,
+                "webhookConfigured": True,
+            })
+        
+        return {
+            "status": "success",
+            "repositories": repositories,
+            "count": len(repositories)
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get repositories: {str(e)}")
 
@@ -573,95 +570,116 @@ async def get_pull_requests(
         
         installation_id = installations[0]["id"]
         token = await github_app_auth.get_installation_token(str(installation_id))
-        
-        import httpx
-        async with httpx.AsyncClient() as client:
-            repositories_data = []
-            
-            # 각 연동된 리포지토리의 PR 조회
-            for repo in user_repositories:
-                full_name = repo.get("fullName")
-                if not full_name:
-                    continue
-                    
-                prs_response = await client.get(
-                    f"https://api.github.com/repos/{full_name}/pulls",
-                    headers={
-                        "Authorization": f"Bearer {token}",
-                        "Accept": "application/vnd.github+json",
-                        "X-GitHub-Api-Version": "2022-11-28"
-                    }
+
+        # 리포지토리 × PR 팬아웃이 커져도 동시 GitHub API 요청 수를 제한
+        from ...core.config import get_settings
+        semaphore = asyncio.Semaphore(max(1, get_settings().github_fanout_concurrency))
+
+        async def fetch_ci_status(full_name: str, number: int) -> str:
+            async with semaphore:
+                return await get_pr_ci_status(token, full_name, number)
+
+        async def fetch_repository_prs(repo: Dict[str, Any]) -> Dict[str, Any]:
+            full_name = repo.get("fullName")
+            async with semaphore:
+                prs_response = await github_client.get(
+                    f"/repos/{full_name}/pulls",
+                    token=token,
+                    endpoint="/repos/{owner}/{repo}/pulls",
                 )
-                
-                pull_requests = []
-                if prs_response.status_code == 200:
-                    prs_data = prs_response.json()
-                    for pr in prs_data:
-                        # 🔧 수정: 실제 CI 상태 조회
-                        ci_status = await get_pr_ci_status(client, token, full_name, pr["number"])
-                        
-                        pr_data = {
-                            "id": str(pr["id"]),
-                            "number": pr["number"],
-                            "title": pr["title"],
-                            "author": pr["user"]["login"],
-                            "status": pr["state"],
-                            "branch": pr["head"]["ref"],
-                            "targetBranch": pr["base"]["ref"],
-                            "createdAt": pr["created_at"],
-                            "ciStatus": ci_status,
-                            "deploymentStatus": None,
-                            "htmlUrl": pr["html_url"],
-                            "deploymentUrl": None  # TODO: 실제 배포 URL 조회
-                        }
-                        # debug removed; keep data minimal in logs
-                        pull_requests.append(pr_data)
-                
-                # 리포지토리별로 PR 데이터 그룹화
-                repositories_data.append({
-                    "repository": {
-                        "id": repo.get("id"),
-                        "name": repo.get("name"),
-                        "fullName": repo.get("fullName"),
-                        "branch": repo.get("branch"),
-                        "status": repo.get("status"),
-                        "lastSync": repo.get("lastSync")
-                    },
-                    "pullRequests": pull_requests,
-                    "prCount": len(pull_requests)
-                })
-            
-            # PR 개수로 정렬
-            repositories_data.sort(key=lambda x: x["prCount"], reverse=True)
             
-            total_prs = sum(repo["prCount"] for repo in repositories_data)
+            pull_requests = []
+            if prs_response.status_code == 200:
+                prs_data = prs_response.json() or []
+                # 🔧 수정: 실제 CI 상태 조회 (PR별 병렬, 조건부 요청 캐시 사용)
+                ci_statuses = await asyncio.gather(
+                    *[fetch_ci_status(full_name, pr["number"]) for pr in prs_data]
+                )
+                for pr, ci_status in zip(prs_data, ci_statuses):
+                    pr_data = {
+                        "id": str(pr["id"]),
+                        "number": pr["number"],
+                        "title": pr["title"],
+                        "author": pr["user"]["login"],
+                        "status": pr["state"],
+                        "branch": pr["head"]["ref"],
+                        "targetBranch": pr["base"]["ref"],
+                        "createdAt": pr["created_at"],
+                        "ciStatus": ci_status,
+                        "deploymentStatus": None,
+                        "htmlUrl": pr["html_url"],
+                        "deploymentUrl": None  # TODO: 실제 배포 URL 조회
+                    }
+                    pull_requests.append(pr_data)
             
+            # 리포지토리별로 PR 데이터 그룹화
             return {
-                "status": "success",
-                "repositories": repositories_data,
-                "count": total_prs
+                "repository": {
+                    "id": repo.get("id"),
+                    "name": repo.get("name"),
+                    "fullName": repo.get("fullName"),
+                    "branch": repo.get("branch"),
+                    "status": repo.get("status"),
+                    "lastSync": repo.get("lastSync")
+                },
+                "pullRequests": pull_requests,
+                "prCount": len(pull_requests)
             }
+        
+        # 각 연동된 리포지토리의 PR 조회
+        repositories_data = list(await asyncio.gather(
+            *[fetch_repository_prs(repo) for repo in user_repositories if repo.get("fullName")]
+        ))
+        
+        # PR 개수로 정렬
+        repositories_data.sort(key=lambda x: x["prCount"], reverse=True)
+        
+        total_prs = sum(repo["prCount"] for repo in repositories_data)
+        
+        return {
+            "status": "success",
+            "repositories": repositories_data,
+            "count": total_prs
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get pull requests: {str(e)}")
 
 
+def _pipeline_item(deployment, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """배포 히스토리를 파이프라인 화면 형식으로 변환합니다."""
+    item = deployment.to_dict(fields)
+    commit = item.get("commit")
+    if commit is not None:
+        for key in ("sha", "short_sha", "message", "author"):
+            commit[key] = commit[key] or ""
+    image = item.get("image")
+    if image is not None:
+        image["url"] = f"{image['name']}:{image['tag']}" if image["name"] and image["tag"] else None
+    return item
+
+
 @router.get("/github/pipelines", response_model=Dict[str, Any])
 async def get_pipelines(
     repository: str = None,
     status: str = None,
-    limit: int = 20,
-    offset: int = 0,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0, description="Deprecated, use cursor"),
+    cursor: Optional[str] = Query(None, description="Cursor from next_cursor"),
+    fields: Optional[str] = Query(None, description="Comma-separated top-level fields to return"),
     db = Depends(get_db),
     current_user: Dict[str, Any] = Depends(get_current_user)
 ) -> Dict[str, Any]:
-    """배포 히스토리를 조회합니다."""
+    """배포 히스토리를 조회합니다. 다음 페이지는 next_cursor를 cursor로 전달합니다."""
     try:
-        from ...models.deployment_history import DeploymentHistory
-        
         # 실제 인증된 사용자 ID 사용
         actual_user_id = str(current_user.get("id", "default"))
         logger.debug(f"Using user_id for pipelines: {actual_user_id}")
 
+        try:
+            selected = parse_fields(fields, list(DeploymentHistory.FIELD_COLUMNS))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
         # 배포 히스토리 조회 (deploy 작업만 표시)
         from sqlalchemy import and_
         query = db.query(DeploymentHistory).filter(
@@ -683,70 +701,35 @@ async def get_pipelines(
         
         if status:
             query = query.filter(DeploymentHistory.status == status)
-            
-        deployments = query.order_by(DeploymentHistory.started_at.desc()).offset(offset).limit(limit).all()
-        
-        # 배포 히스토리를 프론트엔드 형식으로 변환
-        deployments_data = []
-        for deployment in deployments:
-            logger.debug(f"Processing deployment ID {deployment.id}, status: {deployment.status}")
-            deployments_data.append({
-                "id": deployment.id,
-                "user_id": deployment.user_id,
-                "repository": f"{deployment.github_owner}/{deployment.github_repo}",
-                "commit": {
-                    "sha": deployment.github_commit_sha or "",
-                    "short_sha": deployment.github_commit_sha[:7] if deployment.github_commit_sha else "",
-                    "message": deployment.github_commit_message or "",
-                    "author": deployment.github_commit_author or "",
-                    "url": deployment.github_commit_url
-                },
-                "status": deployment.status,
-                "stages": {
-                    "sourcecommit": {
-                        "status": deployment.sourcecommit_status,
-                        "duration": deployment.sourcecommit_duration
-                    },
-                    "sourcebuild": {
-                        "status": deployment.sourcebuild_status,
-                        "duration": deployment.sourcebuild_duration
-                    },
-                    "sourcedeploy": {
-                        "status": deployment.sourcedeploy_status,
-                        "duration": deployment.sourcedeploy_duration
-                    }
-                },
-                "image": {
-                    "name": deployment.image_name,
-                    "tag": deployment.image_tag,
-                    "url": f"{deployment.image_name}:{deployment.image_tag}" if deployment.image_name and deployment.image_tag else None
-                },
-                "cluster": {
-                    "id": deployment.cluster_id,
-                    "name": deployment.cluster_name,
-                    "namespace": deployment.namespace
-                },
-                "timing": {
-                    "started_at": deployment.started_at.isoformat() if deployment.started_at else None,
-                    "completed_at": deployment.completed_at.isoformat() if deployment.completed_at else None,
-                    "total_duration": deployment.total_duration
-                },
-                "error": {
-                    "message": deployment.error_message,
-                    "stage": deployment.error_stage
-                } if deployment.error_message else None,
-                "auto_deploy_enabled": deployment.auto_deploy_enabled,
-                "created_at": deployment.created_at.isoformat() if deployment.created_at else None,
-                "updated_at": deployment.updated_at.isoformat() if deployment.updated_at else None
-            })
+
+        # 필요한 컬럼만 로드 (webhook_payload 등 큰 Text 컬럼 제외)
+        query = query.options(DeploymentHistory.list_load_options(selected))
+
+        if offset and not cursor:
+            deployments, next_cursor = offset_page(
+                query, DeploymentHistory.started_at, DeploymentHistory.id, limit, offset
+            )
+        else:
+            try:
+                deployments, next_cursor = keyset_page(
+                    query, DeploymentHistory.started_at, DeploymentHistory.id, limit, cursor
+                )
+            except InvalidCursorError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+        deployments_data = [_pipeline_item(deployment, selected) for deployment in deployments]
         
         return {
             "status": "success",
             "deployments": deployments_data,
             "count": len(deployments_data),
-            "total": query.count()
+            # 전체 건수는 첫 페이지에서만 계산 (깊은 페이지에서 COUNT 스캔 방지)
+            "total": None if cursor else query.order_by(None).count(),
+            "next_cursor": next_cursor
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"get_pipelines failed: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to get deployment histories: {str(e)}")
@@ -773,40 +756,35 @@ async def connect_repository(
             installation_id = installation_check.get("installation_id")
             token = await github_app_auth.get_installation_token(str(installation_id))
             
-            import httpx
-            async with httpx.AsyncClient() as client:
-                repo_response = await client.get(
-                    f"https://api.github.com/repos/{owner}/{repo}",
-                    headers={
-                        "Authorization": f"Bearer {token}",
-                        "Accept": "application/vnd.github+json",
-                        "X-GitHub-Api-Version": "2022-11-28"
-                    }
+            repo_response = await github_client.get(
+                f"/repos/{owner}/{repo}",
+                token=token,
+                endpoint="/repos/{owner}/{repo}",
+            )
+            
+            if repo_response.status_code == 200:
+                repo_data = repo_response.json()
+                
+                # 데이터베이스에 리포지토리 연동 정보 저장
+                result = await add_user_repository(
+                    db=db,
+                    user_id=user_id,
+                    user_email=user_email,
+                    repository_owner=owner,
+                    repository_name=repo,
+                    repository_full_name=f"{owner}/{repo}",
+                    repository_id=str(repo_data["id"]),
+                    branch=repo_data.get("default_branch", "main"),
+                    installation_id=installation_id
                 )
                 
-                if repo_response.status_code == 200:
-                    repo_data = repo_response.json()
-                    
-                    # 데이터베이스에 리포지토리 연동 정보 저장
-                    result = await add_user_repository(
-                        db=db,
-                        user_id=user_id,
-                        user_email=user_email,
-                        repository_owner=owner,
-                        repository_name=repo,
-                        repository_full_name=f"{owner}/{repo}",
-                        repository_id=str(repo_data["id"]),
-                        branch=repo_data.get("default_branch", "main"),
-                        installation_id=installation_id
-                    )
-                    
-                    return result
-                else:
-                    return {
-                        "status": "error",
-                        "message": f"리포지토리 정보 조회 실패: {repo_response.status_code}",
-                        "repository": f"{owner}/{repo}"
-                    }
+                return result
+            else:
+                return {
+                    "status": "error",
+                    "message": f"리포지토리 정보 조회 실패: {repo_response.status_code}",
+                    "repository": f"{owner}/{repo}"
+                }
         else:
             return {
                 "status": "error",
@@ -861,6 +839,7 @@ async def update_webhook_config(
         integration.auto_deploy_enabled = enabled
         db.commit()
         db.refresh(integration)
+        get_webhook_pipeline().invalidate_integration(integration.github_owner, integration.github_repo)
         
         return {
             "status": "success",
@@ -925,6 +904,38 @@ async def get_webhook_status(
         )
 
 
+# 진행 중인 백그라운드 배포 태스크 (GC로 사라지지 않도록 강한 참조 유지)
+_deploy_tasks: "set[asyncio.Task]" = set()
+
+
+async def _run_push_deploy(payload: Dict[str, Any], integration_id: int) -> None:
+    session = SessionLocal()
+    try:
+        integration = session.query(UserProjectIntegration).filter(
+            UserProjectIntegration.id == integration_id
+        ).first()
+        if integration is None:
+            logger.error(f"Integration {integration_id} not found in background deploy")
+            return
+        await handle_push_webhook(payload, integration=integration, db=session)
+    except Exception as e:
+        logger.error(f"Background deploy failed for integration {integration_id}: {str(e)}")
+    finally:
+        session.close()
+
+
+def schedule_push_deploy(payload: Dict[str, Any], integration_id: int) -> asyncio.Task:
+    """push 이벤트 형식의 배포를 메인 이벤트 루프의 백그라운드 태스크로 시작합니다.
+
+    공유 httpx/Redis 클라이언트, asyncio 락, Slack 발신 큐 등은 메인 루프에 묶여 있으므로
+    별도 스레드의 asyncio.run()이 아닌 현재 루프에서 실행해야 합니다.
+    """
+    task = asyncio.get_running_loop().create_task(_run_push_deploy(payload, integration_id))
+    _deploy_tasks.add(task)
+    task.add_done_callback(_deploy_tasks.discard)
+    return task
+
+
 class ManualDeployRequest(BaseModel):
     """수동 배포 요청 모델"""
     github_owner: str = Field(..., description="GitHub repository owner")
@@ -935,7 +946,6 @@ class ManualDeployRequest(BaseModel):
 @router.post("/github/manual-deploy")
 async def manual_deploy(
     request: ManualDeployRequest,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: Dict[str, Any] = Depends(get_current_user),
 ) -> Dict[str, Any]:
@@ -993,29 +1003,8 @@ async def manual_deploy(
 
         logger.info(f"Manual deploy payload created for commit {commit_info['sha'][:7]}")
 
-        # 4. handle_push_webhook 함수를 백그라운드 태스크로 실행
-        from ...database import SessionLocal
-
-        def run_async_in_thread(coro_func, *args, **kwargs):
-            """백그라운드 스레드에서 비동기 함수 실행"""
-            session = SessionLocal()
-            try:
-                # 통합 객체는 스레드 세이프하게 재조회
-                integ = session.query(UserProjectIntegration).filter(
-                    UserProjectIntegration.id == integration.id
-                ).first()
-                if integ is None:
-                    logger.error(f"Integration {integration.id} not found in background task")
-                    return
-                asyncio.run(coro_func(*args, **kwargs, db=session, integration=integ))
-            finally:
-                try:
-                    session.close()
-                except Exception:
-                    pass
-
-        # 백그라운드로 배포 실행
-        background_tasks.add_task(run_async_in_thread, handle_push_webhook, payload)
+        # 4. handle_push_webhook을 메인 루프의 백그라운드 태스크로 실행
+        schedule_push_deploy(payload, integration.id)
 
         # 5. 즉시 응답 반환
         return {
@@ -1042,7 +1031,6 @@ async def manual_deploy(
 @router.post("/github/webhook")
 async def github_webhook_handler(
     request: Request,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ) -> JSONResponse:
     """GitHub App 웹훅 수신 및 auto_deploy_enabled 상태에 따른 처리"""
@@ -1069,6 +1057,9 @@ async def github_webhook_handler(
         logger.info(f"Webhook event type: {event_type}")
         if not event_type:
             raise HTTPException(status_code=400, detail="Missing event type header")
+
+        # 재전송 시에도 동일한 전송 ID (헤더가 없으면 본문 해시로 대체)
+        delivery_id = request.headers.get("X-GitHub-Delivery") or hashlib.sha256(body_bytes).hexdigest()
         
         # installation_id와 리포지토리 정보 추출
         installation_id = payload.get("installation", {}).get("id")
@@ -1082,20 +1073,20 @@ async def github_webhook_handler(
             return {"status": "ignored", "reason": "no repository full_name"}
         
         owner, repo_name = full_name.split("/", 1)
+
+        pipeline = get_webhook_pipeline()
+        if not pipeline.supports(event_type):
+            return JSONResponse(content={"status": "ignored", "reason": f"unsupported_event_type: {event_type}"}, status_code=status.HTTP_202_ACCEPTED)
         
-        # 🔧 수정: installation_id + 리포지토리 이름으로 정확한 통합 정보 조회
-        integration = db.query(UserProjectIntegration).filter(
-            UserProjectIntegration.github_installation_id == str(installation_id),
-            UserProjectIntegration.github_owner == owner,
-            UserProjectIntegration.github_repo == repo_name
-        ).first()
+        # installation_id + 리포지토리 이름으로 통합 정보 조회 (캐시 우선)
+        integration = pipeline.lookup_integration(db, str(installation_id), owner, repo_name)
         
         if not integration:
             return {"status": "ignored", "reason": "integration_not_found", "repository": full_name}
         
         # auto_deploy_enabled 상태 확인
-        logger.info(f"Integration found: {integration.github_owner}/{integration.github_repo}, auto_deploy_enabled: {getattr(integration, 'auto_deploy_enabled', False)}")
-        if not getattr(integration, 'auto_deploy_enabled', False):
+        logger.info(f"Integration found: {integration.github_owner}/{integration.github_repo}, auto_deploy_enabled: {integration.auto_deploy_enabled}")
+        if not integration.auto_deploy_enabled:
             logger.info(f"Auto deploy disabled for {integration.github_owner}/{integration.github_repo}")
             return {
                 "status": "skipped",
@@ -1104,42 +1095,30 @@ async def github_webhook_handler(
                 "message": "Auto deploy is disabled for this repository"
             }
         
-        # 이벤트 타입별 처리(비동기 스케줄링)
-        # BackgroundTasks는 스레드에서 실행되므로, 코루틴을 직접 스케줄링하지 말고
-        # 새 이벤트 루프에서 실행하는 동기 래퍼를 사용합니다.
-        from ...database import SessionLocal  # type: ignore
-
-        def run_async_in_thread(coro_func, *args, **kwargs):
-            # 스레드에서 별도 세션을 열고, 새로운 이벤트 루프에서 코루틴 실행
-            session = SessionLocal()
-            try:
-                # 통합 객체는 스레드 세이프하게 재조회
-                integ = session.query(UserProjectIntegration).filter(
-                    UserProjectIntegration.id == integration.id
-                ).first()
-                if integ is None:
-                    return
-                asyncio.run(coro_func(*args, **kwargs, db=session, integration=integ))
-            finally:
-                try:
-                    session.close()
-                except Exception:
-                    pass
-
-        if event_type == "push":
-            background_tasks.add_task(run_async_in_thread, handle_push_webhook, payload)
-        elif event_type == "pull_request":
-            background_tasks.add_task(run_async_in_thread, handle_pull_request_webhook, payload)
-        elif event_type == "release":
-            background_tasks.add_task(run_async_in_thread, handle_release_webhook, payload)
-        else:
-            return JSONResponse(content={"status": "ignored", "reason": f"unsupported_event_type: {event_type}"}, status_code=status.HTTP_202_ACCEPTED)
+        # 인박스에 저장 후 메인 이벤트 루프의 워커 풀에서 처리
+        accepted = await pipeline.ingest(
+            db,
+            delivery_id=delivery_id,
+            event_type=event_type,
+            payload=payload,
+            integration_id=integration.id,
+            installation_id=str(installation_id),
+            repository=full_name,
+        )
+        if not accepted:
+            return JSONResponse(content={
+                "status": "duplicate",
+                "repository": full_name,
+                "delivery_id": delivery_id,
+                "event": event_type
+            }, status_code=status.HTTP_200_OK)
 
         # 즉시 수락 응답
         return JSONResponse(content={
             "status": "accepted",
             "repository": full_name,
             "installation_id": installation_id,
+            "delivery_id": delivery_id,
             "event": event_type
         }, status_code=status.HTTP_202_ACCEPTED)
             
@@ -1196,7 +1175,7 @@ async def auto_link_sourcecommit(integration: UserProjectIntegration, db: Sessio
         
         # SourceCommit 리포지토리 생성
         from ...services.ncp_pipeline import ensure_sourcecommit_repo
-        ensure_result = ensure_sourcecommit_repo(sc_project_id, sc_repo_name)
+        ensure_result = await asyncio.to_thread(ensure_sourcecommit_repo, sc_project_id, sc_repo_name)
         
         if ensure_result.get("status") not in ("created", "exists"):
             logger.warning(f"SourceCommit repository creation failed: {ensure_result}")
@@ -1209,7 +1188,9 @@ async def auto_link_sourcecommit(integration: UserProjectIntegration, db: Sessio
         from ...services.github_app import github_app_auth
         github_token = await github_app_auth.get_installation_token(str(integration.github_installation_id))
         
-        mirror_result = mirror_to_sourcecommit(
+        # git clone/push가 이벤트 루프를 막지 않도록 스레드에서 실행
+        mirror_result = await asyncio.to_thread(
+            mirror_to_sourcecommit,
             github_repo_url=github_repo_url,
             installation_or_access_token=github_token,
             sc_project_id=sc_project_id,
@@ -1280,7 +1261,7 @@ async def handle_sourcecommit_mirror(payload: Dict[str, Any], integration: UserP
         
         # SourceCommit 리포지토리 확인 (기존 리포지토리 사용)
         from ...services.ncp_pipeline import ensure_sourcecommit_repo
-        ensure_result = ensure_sourcecommit_repo(integration.sc_project_id, integration.sc_repo_name)
+        ensure_result = await asyncio.to_thread(ensure_sourcecommit_repo, integration.sc_project_id, integration.sc_repo_name)
         
         if ensure_result.get("status") not in ("created", "exists"):
             return {
@@ -1300,7 +1281,9 @@ async def handle_sourcecommit_mirror(payload: Dict[str, Any], integration: UserP
         sc_username = getattr(settings, 'ncp_sourcecommit_username', None)
         sc_password = getattr(settings, 'ncp_sourcecommit_password', None)
         
-        mirror_result = mirror_to_sourcecommit(
+        # git clone/push가 이벤트 루프를 막지 않도록 스레드에서 실행
+        mirror_result = await asyncio.to_thread(
+            mirror_to_sourcecommit,
             github_repo_url=github_repo_url,
             installation_or_access_token=github_token,
             sc_project_id=integration.sc_project_id,
@@ -2059,4 +2042,11 @@ async def handle_release_webhook(payload: Dict[str, Any], integration: UserProje
         "repository": f"{integration.github_owner}/{integration.github_repo}",
         "tag": tag_name,
         "message": "Production deployment triggered"
-    }
\ No newline at end of file
+    }
+
+
+# 웹훅 수집 파이프라인에 이벤트별 처리기 등록
+_webhook_pipeline = get_webhook_pipeline()
+_webhook_pipeline.register_handler("push", handle_push_webhook)
+_webhook_pipeline.register_handler("pull_request", handle_pull_request_webhook)
+_webhook_pipeline.register_handler("release", handle_release_webhook)
@@ -1,12 +1,19 @@
 from typing import Any, Dict, List, Optional
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from ...mcp.tools.k8s_resources import (
     k8s_create, k8s_get, k8s_apply, k8s_delete,
     ResourceKind, K8sObject, K8sRef
 )
+from ...core.serialization import dumps_str
 from ...services.k8s_client import get_core_v1_api, get_apps_v1_api
+from ...services.k8s_watch_mux import namespace_allowed
+from ...services.log_stream import (
+    LogLineFilter, LogStreamLimitError, LogStreamOptions, get_log_stream_manager
+)
+from .auth_verify import get_current_user_or_query_token
 
 router = APIRouter()
 
@@ -225,6 +232,70 @@ async def list_namespaces(
         raise HTTPException(status_code=500, detail=f"Failed to list namespaces: {str(e)}")
 
 
+@router.get("/logs/{namespace}/{pod_name}/stream")
+async def stream_pod_logs(
+    namespace: str,
+    pod_name: str,
+    container: Optional[str] = Query(None, description="컨테이너 이름"),
+    tail_lines: Optional[int] = Query(100, ge=0, le=5000, description="시작 시 보여줄 최근 줄 수"),
+    since_seconds: Optional[int] = Query(None, ge=1, description="최근 N초 로그부터 시작"),
+    since_time: Optional[str] = Query(None, description="이 타임스탬프(cursor) 이후 로그부터 재개"),
+    grep: Optional[str] = Query(None, description="포함할 줄 정규식"),
+    exclude: Optional[str] = Query(None, description="제외할 줄 정규식"),
+    level: Optional[str] = Query(None, description="최소 로그 레벨 (debug, info, warn, error)"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    current_user: Dict[str, Any] = Depends(get_current_user_or_query_token),
+):
+    """
+    Pod 로그 실시간 스트리밍 (Server-Sent Events)
+
+    `logs` 이벤트의 id가 재개 커서이며, 브라우저 EventSource가 재연결할 때 보내는
+    Last-Event-ID 헤더로 자동으로 이어서 받습니다. EventSource는 헤더를 보낼 수 없으므로
+    `?token=<JWT>`로도 인증할 수 있습니다. /ws/kubernetes와 같은 네임스페이스 허용 규칙을 적용합니다.
+    """
+    if not namespace_allowed(namespace):
+        raise HTTPException(status_code=403, detail=f"로그를 볼 수 없는 네임스페이스입니다: {namespace}")
+    user_id = str(current_user.get("id"))
+    manager = get_log_stream_manager()
+    options = LogStreamOptions(
+        namespace=namespace,
+        pod_name=pod_name,
+        container=container,
+        tail_lines=tail_lines,
+        since_seconds=since_seconds,
+        since_time=since_time or last_event_id,
+    )
+    try:
+        line_filter = LogLineFilter(grep=grep, exclude=exclude, level=level)
+        manager.check_capacity(user_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except LogStreamLimitError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+    def frame(message: Dict[str, Any]) -> str:
+        event_id = f"id: {message['cursor']}\n" if message.get("cursor") else ""
+        return f"{event_id}event: {message['type']}\ndata: {dumps_str(message)}\n\n"
+
+    async def events():
+        # 슬롯은 응답 본문을 실제로 보내기 시작할 때 점유하고 종료 시 반환
+        # (응답이 전송되기 전에 연결이 끊겨도 슬롯이 새지 않음)
+        try:
+            stream = manager.open(user_id, options, line_filter)
+        except LogStreamLimitError as e:
+            yield frame({"type": "end", "reason": "limit", "error": str(e)})
+            return
+        async with stream:
+            async for message in stream.batches():
+                yield frame(message)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/contexts")
 async def list_contexts() -> List[Dict[str, Any]]:
     """사용 가능한 Kubernetes 컨텍스트 목록 조회"""
@@ -5,7 +5,9 @@ from sqlalchemy import text
 from pydantic import BaseModel, Field
 import structlog
 from ...database import get_db
-from ...services.monitoring import PromQuery, query_prometheus
+from ...services.monitoring import PromQuery, PromRangeQuery, query_prometheus, query_prometheus_range
+from ...services.prometheus_client import prometheus_client
+from ...services.alert_rules import reload_alert_engines
 from ...services.notification_service import NotificationService
 
 router = APIRouter()
@@ -23,6 +25,26 @@ async def prom_query(body: PromQuery) -> Dict[str, Any]:
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Query failed: {str(e)}")
 
+@router.post("/monitoring/query_range", response_model=dict)
+async def prom_query_range(body: PromRangeQuery) -> Dict[str, Any]:
+    """Prometheus range 쿼리 실행 (차트용, step 미지정 시 서버에서 선택)"""
+    try:
+        result = await query_prometheus_range(body)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Query failed: {str(e)}")
+    return {
+        "status": "success",
+        "data": result,
+        "message": "Range query executed successfully"
+    }
+
+@router.get("/monitoring/prometheus/stats", response_model=dict)
+async def prom_client_stats() -> Dict[str, Any]:
+    """공유 Prometheus 클라이언트의 조회 종류별 캐시 적중률"""
+    return {"status": "success", "data": prometheus_client.stats()}
+
 @router.get("/monitoring/metrics/details", response_model=Dict[str, Any])
 async def get_monitoring_details(cluster: str = "nks-cluster") -> Dict[str, Any]:
     """클러스터 노드별 상세 모니터링 지표 반환 (CPU/Memory/Disk/Network).
@@ -181,7 +203,7 @@ async def get_alerts(
     cluster: str = "nks-cluster",
     db: Session = Depends(get_db)
 ) -> List[Dict[str, Any]]:
-    """활성 알림 목록 조회 (Prometheus + DB)"""
+    """활성 알림 목록 조회 (백그라운드 규칙 평가 상태에서 반환)"""
     service = NotificationService(db)
     return await service.list_active_alerts(cluster=cluster)
 
@@ -211,6 +233,7 @@ async def seed_example_alerts(db: Session = Depends(get_db)) -> Dict[str, Any]:
     service = NotificationService(db)
     created = service.seed_example_alerts()
     # 반환은 현재 firing/ resolved 상태 포함하여 DB에서 다시 읽어 제공
+    await reload_alert_engines()
     alerts = await service.list_active_alerts()
     return {
         "status": "success",
@@ -229,6 +252,7 @@ async def seed_from_current_metrics(
     """현재 Prometheus 데이터 기반으로 각 규칙 유형의 데모 알림을 생성합니다."""
     service = NotificationService(db)
     created = await service.seed_examples_from_current_metrics(cluster=cluster, per_rule=per_rule, max_total=max_total)
+    await reload_alert_engines()
     alerts = await service.list_active_alerts(cluster=cluster)
     return {"status": "success", "created": created, "alerts": alerts}
 
@@ -584,7 +608,7 @@ async def create_alert_snapshot(
         service = NotificationService(db)
         
         # 알림 정보 조회
-        alerts = service.list_active_alerts(cluster=cluster)
+        alerts = await service.list_active_alerts(cluster=cluster)
         alert = next((a for a in alerts if a.get("id") == alert_id), None)
         
         if not alert:
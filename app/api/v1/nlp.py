@@ -1,21 +1,45 @@
-from fastapi import APIRouter, HTTPException, Depends, Security
+from fastapi import APIRouter, HTTPException, Depends, Response, Security
 from fastapi.security import HTTPAuthorizationCredentials
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 import logging
 from datetime import datetime
 import uuid
-import json
 from sqlalchemy.orm import Session
 
 # commands.py 연동을 위한 import
 from ...services.commands import CommandRequest, plan_command, execute_command
 from ...database import get_db
+from ...core.pagination import InvalidCursorError
+from ...core.serialization import loads
 from ...services.security import get_current_user_id, security
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+
+def _page_params(context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    요청 context의 목록 페이지 인자(limit, continue)를 CommandRequest 필드로 변환합니다.
+
+    프론트엔드는 이전 응답 metadata의 cursor 값을 context.continue로 그대로 보내
+    다음 페이지를 조회합니다.
+    """
+    if not context:
+        return {}
+    params: Dict[str, Any] = {}
+    try:
+        limit = int(context.get("limit") or 0)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="limit은 0 이상의 정수여야 합니다.")
+    if limit < 0:
+        raise HTTPException(status_code=400, detail="limit은 0 이상의 정수여야 합니다.")
+    if limit:
+        params["limit"] = limit
+    if context.get("continue"):
+        params["continue_token"] = str(context["continue"])
+    return params
+
 # 자연어 명령 처리 모델
 class NaturalLanguageCommand(BaseModel):
     command: str
@@ -72,6 +96,7 @@ async def process_command(
 
         command = command_data.command.strip()
         logger.info(f"자연어 명령 처리 시작: {command} (user_id: {effective_user_id})")
+        page_params = _page_params(command_data.context)
 
         # 명령 유효성 검사
         if not command:
@@ -98,10 +123,12 @@ async def process_command(
         if any(keyword in command.lower() for keyword in dangerous_keywords):
             raise HTTPException(status_code=400, detail="위험한 명령어가 포함되어 있습니다.")
 
-        # Gemini API를 통한 자연어 해석 (1회만!)
+        # Gemini API를 통한 자연어 해석 (1회만!, 단순 조회 명령은 로컬 파서로 처리)
         try:
-            from ...llm.gemini import GeminiClient
-            gemini_client = GeminiClient()
+            from ...llm.fast_intent import FastPathLLMClient
+            from ...llm.router import get_llm_router
+            # 로컬 파서 → 지연 예산/헤지/장애 조치를 적용한 LLM 라우터 (Gemini 우선)
+            gemini_client = FastPathLLMClient(get_llm_router())
             
             # Gemini로 명령 해석
             gemini_result = await gemini_client.interpret(
@@ -122,7 +149,12 @@ async def process_command(
                 db=db,
                 command_text=command,
                 tool="nlp_process",
-                args={"intent": intent, "entities": entities},
+                # provider="local"(로컬 파서 처리분)은 벤치마크 정답 코퍼스에서 제외됨
+                args={
+                    "intent": intent,
+                    "entities": entities,
+                    "provider": (gemini_result.get("llm") or {}).get("provider"),
+                },
                 status="processing",
                 user_id=effective_user_id
             )
@@ -152,11 +184,15 @@ async def process_command(
                     version=entities.get("version") or "",
                     namespace=entities.get("namespace") or "default",
                     previous=bool(entities.get("previous", False)),
+                    all_pods=bool(entities.get("all_pods", False)),
+                    grep=entities.get("grep") or "",
+                    level=entities.get("level") or "",
                     # NCP 롤백 관련 필드
                     github_owner=entities.get("github_owner") or "",
                     github_repo=entities.get("github_repo") or "",
                     target_commit_sha=entities.get("target_commit_sha") or "",
-                    steps_back=entities.get("steps_back", 0)
+                    steps_back=entities.get("steps_back", 0),
+                    **page_params
                 )
             
             logger.info(f"CommandRequest 생성: {req}")
@@ -239,27 +275,32 @@ async def process_command(
 
 @router.get("/nlp/history")
 async def get_command_history(
+    response: Response,
     limit: int = 10,
     offset: int = 0,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     user_id: Optional[str] = Depends(get_current_user_id)
 ):
     """
     명령 히스토리를 조회합니다. (사용자 메시지만)
+
+    다음 페이지 커서는 X-Next-Cursor 헤더로 내려줍니다.
     """
     try:
-        from ...services.command_history import get_command_history as get_command_history_service
+        from ...services.command_history import get_command_history_page
         
-        # 데이터베이스에서 명령 히스토리 조회 (사용자 메시지만)
-        command_histories = await get_command_history_service(
+        # 데이터베이스에서 명령 히스토리 조회 (사용자 메시지만, tool 필터를 쿼리에 적용해 페이지 크기 유지)
+        user_messages, next_cursor = await get_command_history_page(
             db=db,
             user_id=user_id,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor,
+            tool="user_message"
         )
-        
-        # 사용자 메시지만 필터링 (tool이 "user_message"인 것만)
-        user_messages = [ch for ch in command_histories if ch.tool == "user_message"]
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
         
         # CommandHistory 모델로 변환 (프론트엔드 인터페이스와 일치)
         return [
@@ -277,30 +318,39 @@ async def get_command_history(
             }
             for ch in user_messages
         ]
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"명령 히스토리 조회 실패: {str(e)}")
         raise HTTPException(status_code=500, detail="명령 히스토리 조회에 실패했습니다.")
 
 @router.get("/nlp/conversation-history")
 async def get_conversation_history(
+    response: Response,
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     user_id: Optional[str] = Depends(get_current_user_id)
 ):
     """
     대화 히스토리를 조회합니다. (사용자 메시지와 AI 응답 모두)
+
+    더 이전 대화는 X-Next-Cursor 헤더 값을 cursor로 전달해 조회합니다.
     """
     try:
-        from ...services.command_history import get_command_history as get_command_history_service
+        from ...services.command_history import get_command_history_page
         
         # 데이터베이스에서 명령 히스토리 조회 (모든 메시지)
-        command_histories = await get_command_history_service(
+        command_histories, next_cursor = await get_command_history_page(
             db=db,
             user_id=user_id,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor
         )
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
         
         # 대화 히스토리는 오래된 순서로 정렬 (사용자 질문 → AI 응답 순서)
         command_histories.sort(key=lambda x: x.created_at)
@@ -321,6 +371,8 @@ async def get_conversation_history(
             }
             for ch in command_histories
         ]
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"대화 히스토리 조회 실패: {str(e)}")
         raise HTTPException(status_code=500, detail="대화 히스토리 조회에 실패했습니다.")
@@ -440,6 +492,7 @@ async def process_conversation(
     - Redis를 사용한 대화 세션 관리
     """
     try:
+        page_params = _page_params(request.context)
         redis_client = get_redis_client()
         conv_manager = ConversationManager(redis_client)
         classifier = ActionClassifier()
@@ -481,8 +534,9 @@ async def process_conversation(
         session_context = session.get("context", {}) if session else {}
 
         # 5. Gemini로 명령 해석 (컨텍스트 정보 포함)
-        from ...llm.gemini import GeminiClient
-        gemini_client = GeminiClient()
+        from ...llm.fast_intent import interpret_locally
+        from ...llm.router import get_llm_router
+        gemini_client = get_llm_router()
 
         # 컨텍스트 정보를 프롬프트에 포함
         context_info = ""
@@ -494,7 +548,8 @@ async def process_conversation(
         logger.info(f"Gemini API 호출 시작 - 명령: '{request.command}', 컨텍스트 포함: {bool(context_info)}")
         
         try:
-            interpretation = await gemini_client.interpret(
+            # 단순 조회 명령은 로컬 파서를 먼저 시도 (대기 중인 작업/저장소 컨텍스트가 있는 세션은 LLM으로)
+            interpretation = interpret_locally(request.command, session=session) or await gemini_client.interpret(
                 prompt=f"{request.command}{context_info}",
                 user_id=user_id,
                 project_name="default"
@@ -699,10 +754,14 @@ async def process_conversation(
                 version=entities.get("version") or "",
                 namespace=entities.get("namespace") or "default",
                 previous=bool(entities.get("previous", False)),
+                all_pods=bool(entities.get("all_pods", False)),
+                grep=entities.get("grep") or "",
+                level=entities.get("level") or "",
                 github_owner=entities.get("github_owner") or "",
                 github_repo=entities.get("github_repo") or "",
                 target_commit_sha=entities.get("target_commit_sha") or "",
-                steps_back=entities.get("steps_back", 0)
+                steps_back=entities.get("steps_back", 0),
+                **page_params
             )
 
             try:
@@ -898,7 +957,7 @@ async def list_conversations(
         for key in keys:
             data = redis_client.get(key)
             if data:
-                session = json.loads(data)
+                session = loads(data)
                 sessions.append({
                     "session_id": session["session_id"],
                     "created_at": session["created_at"],
@@ -4,11 +4,13 @@ import asyncio
 import httpx
 import logging
 
-from fastapi import APIRouter, Request, HTTPException, status
+from fastapi import APIRouter, Depends, Query, Request, HTTPException, status
+from fastapi.responses import JSONResponse
 from prometheus_client import Counter, Gauge, Histogram, Info, Enum
 from pydantic import BaseModel
 
 from ...core.config import get_settings
+from .auth_verify import get_current_user
 from ...services.alerting import send_health_alert, send_circuit_breaker_alert
 
 logger = logging.getLogger(__name__)
@@ -113,9 +115,10 @@ async def check_component_health(component: str, url: str, timeout: float = 5.0)
 
 @router.get("/health")
 async def health(request: Request) -> Dict[str, Any]:
-    """Liveness/Readiness combined health endpoint.
+    """Liveness endpoint.
 
-    Returns basic process health with uptime in seconds.
+    Returns basic process health with uptime in seconds. 백그라운드 초기화 상태와 무관하게
+    응답하므로 livenessProbe에 사용하고, readinessProbe는 /ready를 사용합니다.
     """
     started_at = getattr(request.app.state, "started_at", None)
     now = datetime.now(timezone.utc)
@@ -252,3 +255,38 @@ async def version(request: Request) -> Dict[str, Any]:
     }
 
 
+@router.get("/ready")
+async def ready(request: Request) -> JSONResponse:
+    """Readiness endpoint.
+
+    DB 스키마 확인과 서비스 초기화(필수 서브시스템)가 끝나야 200, 그 전에는 503을 반환합니다.
+    kubeconfig 로드 실패 같은 선택 서브시스템 실패는 readiness를 막지 않습니다.
+    """
+    startup = getattr(request.app.state, "startup", None)
+    if startup is None:
+        return JSONResponse({"ready": True, "subsystems": {}})
+    body = startup.readiness()
+    return JSONResponse(body, status_code=200 if body["ready"] else status.HTTP_503_SERVICE_UNAVAILABLE)
+
+
+@router.get("/admin/startup-profile")
+async def startup_profile(
+    request: Request,
+    imports: bool = Query(default=False, description="새 인터프리터로 -X importtime 측정 결과 포함"),
+    top: int = Query(default=30, ge=1, le=200, description="import 상위 항목 수"),
+    current_user: Dict[str, Any] = Depends(get_current_user),
+) -> Dict[str, Any]:
+    """
+    기동 단계별 소요 시간, 서브시스템 초기화 결과, (선택) 모듈별 import 시간
+
+    import 측정은 새 인터프리터를 띄우므로 startup_profile_imports_enabled 설정이 켜진 경우에만 허용합니다.
+    """
+    startup = getattr(request.app.state, "startup", None)
+    if startup is None:
+        raise HTTPException(status_code=404, detail="startup profile not available")
+    if imports and not get_settings().startup_profile_imports_enabled:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="import profiling is disabled")
+    profile = startup.snapshot()
+    if imports:
+        profile["imports"] = await asyncio.to_thread(startup.import_profile, "app.main", top)
+    return profile
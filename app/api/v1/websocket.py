@@ -4,17 +4,27 @@ WebSocket API 엔드포인트
 실시간 배포 모니터링을 위한 WebSocket 엔드포인트입니다.
 """
 
+import asyncio
 import uuid
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 import structlog
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
+from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect, Depends
 from fastapi.websockets import WebSocketState
 
 from ...websocket.deployment_monitor import (
     get_deployment_monitor_manager,
     DeploymentMonitorManager
 )
+from ...services.log_stream import (
+    LogLineFilter,
+    LogStreamLimitError,
+    LogStreamOptions,
+    get_log_stream_manager,
+)
+from ...services.k8s_watch_mux import WatchLimitError, get_k8s_watch_mux, namespace_allowed
+from ...core.serialization import dumps_str
+from .auth_verify import get_user_from_token
 
 logger = structlog.get_logger(__name__)
 
@@ -22,22 +32,60 @@ router = APIRouter()
 
 
 @router.websocket("/ws/kubernetes")
-async def websocket_kubernetes_monitor(websocket: WebSocket):
+async def websocket_kubernetes_monitor(websocket: WebSocket, token: str):
     """
     Kubernetes 리소스 모니터링 WebSocket 엔드포인트
     
     클라이언트는 이 엔드포인트에 연결하여 실시간 Kubernetes 리소스 상태를 받을 수 있습니다.
+    구독은 공유 WATCH 멀티플렉서에 연결되어, 같은 (kind, namespace)를 보는 클라이언트가
+    많아도 API 서버에는 WATCH 하나만 유지됩니다.
+
+    인증은 /ws/logs와 같이 token 쿼리 파라미터(JWT)로 하며, 실패하면 4401로 닫습니다.
+    비었거나 허용되지 않은 네임스페이스, 연결별/전체 WATCH 상한을 넘는 구독은 error로 거부합니다.
+
+    클라이언트 메시지:
+    - {"type": "subscribe", "data": {"namespace": ..., "kind": "pods"|"deployments"|"services",
+       "label_selector": "app=web"}}
+    - {"type": "unsubscribe", "data": {"namespace": ..., "kind": ...}} (kind 생략 시 네임스페이스 전체)
+    - {"type": "ping"}
+
+    서버 메시지:
+    - {"type": "snapshot", "data": {"kind", "namespace", "resource_version", "items": [...]}}
+      구독 직후 한 번, 전송이 밀려 재동기화할 때 다시 전송 (목록 전체 교체)
+    - {"type": "delta", "data": {"kind", "namespace", "event": "ADDED"|"MODIFIED"|"DELETED", "object": {...}}}
     """
     connection_id = str(uuid.uuid4())
-    
+    mux = get_k8s_watch_mux()
+    subscriptions: Dict[tuple, tuple] = {}
+    send_lock = asyncio.Lock()
+
+    async def send(message: Dict[str, Any]) -> None:
+        # 구독별 전송 태스크와 응답 전송이 한 소켓에 섞이지 않도록 직렬화
+        async with send_lock:
+            await websocket.send_text(dumps_str(message))
+
+    async def pump(subscription) -> None:
+        async for message in subscription.messages():
+            await send(message)
+
+    def detach(key: tuple) -> None:
+        subscription, task = subscriptions.pop(key)
+        if task is not None:
+            task.cancel()
+        mux.unsubscribe(subscription)
+
+    await websocket.accept()
     try:
-        # WebSocket 연결 수락
-        await websocket.accept()
-        
-        logger.info("kubernetes_websocket_connected", connection_id=connection_id)
+        user = get_user_from_token(token)
+    except HTTPException as e:
+        await websocket.close(code=4401, reason=str(e.detail))
+        return
+
+    try:
+        logger.info("kubernetes_websocket_connected", connection_id=connection_id, user_id=user.get("id"))
         
         # 연결 확인 메시지 전송
-        await websocket.send_json({
+        await send({
             "type": "connection",
             "data": {
                 "status": "connected",
@@ -51,30 +99,58 @@ async def websocket_kubernetes_monitor(websocket: WebSocket):
             try:
                 # 메시지 수신
                 data = await websocket.receive_json()
+                payload = data.get("data") or {}
                 
                 # 핑/퐁 처리
                 if data.get("type") == "ping":
-                    await websocket.send_json({
+                    await send({
                         "type": "pong",
                         "data": {"timestamp": str(uuid.uuid4())}
                     })
                 elif data.get("type") == "subscribe":
-                    # 구독 처리
-                    namespace = data.get("data", {}).get("namespace", "default")
-                    await websocket.send_json({
+                    # 구독 처리: 공유 WATCH에 연결하고 스냅샷 → delta 전송 시작
+                    namespace = payload.get("namespace")
+                    kind = payload.get("kind", "pods")
+                    label_selector = payload.get("label_selector") or None
+                    if not namespace_allowed(namespace):
+                        await send({
+                            "type": "error",
+                            "data": {"message": f"구독할 수 없는 네임스페이스입니다: {namespace or '(없음)'}"}
+                        })
+                        continue
+                    key = (kind, namespace, label_selector)
+                    if key not in subscriptions:
+                        try:
+                            subscription = mux.subscribe(kind, namespace, label_selector, owner=connection_id)
+                        except (ValueError, WatchLimitError) as e:
+                            await send({"type": "error", "data": {"message": str(e)}})
+                            continue
+                        subscriptions[key] = (subscription, None)
+                    await send({
                         "type": "subscribed",
-                        "data": {"namespace": namespace, "message": f"구독됨: {namespace}"}
+                        "data": {
+                            "namespace": namespace,
+                            "kind": kind,
+                            "label_selector": label_selector,
+                            "message": f"구독됨: {namespace}",
+                        }
                     })
+                    subscription, task = subscriptions[key]
+                    if task is None:
+                        subscriptions[key] = (subscription, asyncio.ensure_future(pump(subscription)))
                 elif data.get("type") == "unsubscribe":
                     # 구독 해제 처리
-                    namespace = data.get("data", {}).get("namespace", "default")
-                    await websocket.send_json({
+                    namespace = payload.get("namespace", "default")
+                    kind = payload.get("kind")
+                    for key in [k for k in subscriptions if k[1] == namespace and kind in (None, k[0])]:
+                        detach(key)
+                    await send({
                         "type": "unsubscribed",
-                        "data": {"namespace": namespace, "message": f"구독 해제됨: {namespace}"}
+                        "data": {"namespace": namespace, "kind": kind, "message": f"구독 해제됨: {namespace}"}
                     })
                 else:
                     # 다른 메시지 처리
-                    await websocket.send_json({
+                    await send({
                         "type": "response",
                         "data": {"message": "메시지를 받았습니다.", "received": data}
                     })
@@ -98,6 +174,8 @@ async def websocket_kubernetes_monitor(websocket: WebSocket):
         )
     
     finally:
+        for key in list(subscriptions):
+            detach(key)
         logger.info("kubernetes_websocket_cleanup", connection_id=connection_id)
 
 
@@ -223,7 +301,7 @@ async def websocket_nks_monitoring(websocket: WebSocket):
         
         # NKS 모니터링 데이터 전송 루프
         import asyncio
-        from ..services.prometheus_client import query_prometheus, PromQuery
+        from ...services.monitoring import query_prometheus, PromQuery
         
         while True:
             try:
@@ -303,7 +381,7 @@ async def websocket_nks_monitoring(websocket: WebSocket):
                         }
                     }
                     
-                    await websocket.send_json(monitoring_data)
+                    await websocket.send_text(dumps_str(monitoring_data))
                     
                 except Exception as e:
                     logger.error(f"NKS monitoring data collection failed: {e}")
@@ -328,6 +406,86 @@ async def websocket_nks_monitoring(websocket: WebSocket):
         logger.info("nks_monitoring_websocket_cleanup", connection_id=connection_id)
 
 
+@router.websocket("/ws/logs")
+async def websocket_log_stream(
+    websocket: WebSocket,
+    token: str,
+    namespace: str,
+    pod: str,
+    container: Optional[str] = None,
+    tail_lines: Optional[int] = 100,
+    since_seconds: Optional[int] = None,
+    since_time: Optional[str] = None,
+    grep: Optional[str] = None,
+    exclude: Optional[str] = None,
+    level: Optional[str] = None,
+):
+    """
+    Pod 로그 실시간 스트리밍 WebSocket 엔드포인트
+
+    쿼리 파라미터로 대상 Pod와 필터를 지정합니다. 서버는 다음 메시지를 전송합니다.
+    - {"type": "logs", "lines": [{"ts": ..., "line": ...}], "cursor": ...}
+    - {"type": "end", "reason": "eof" | "idle" | "error", "cursor": ...}
+    재연결 시 마지막 cursor를 since_time으로 전달하면 이어서 받을 수 있습니다.
+    클라이언트 메시지: {"type": "ping"}
+    /ws/kubernetes와 같은 네임스페이스 허용 규칙을 적용하며, 허용되지 않으면 4403으로 닫습니다.
+    """
+    await websocket.accept()
+    try:
+        user = get_user_from_token(token)
+        if not namespace_allowed(namespace):
+            await websocket.close(code=4403, reason=f"namespace not allowed: {namespace}")
+            return
+        line_filter = LogLineFilter(grep=grep, exclude=exclude, level=level)
+        stream = get_log_stream_manager().open(
+            str(user.get("id")),
+            LogStreamOptions(
+                namespace=namespace,
+                pod_name=pod,
+                container=container,
+                tail_lines=tail_lines,
+                since_seconds=since_seconds,
+                since_time=since_time,
+            ),
+            line_filter,
+        )
+    except HTTPException as e:
+        await websocket.close(code=4401, reason=str(e.detail))
+        return
+    except ValueError as e:
+        await websocket.close(code=4400, reason=str(e))
+        return
+    except LogStreamLimitError as e:
+        await websocket.close(code=4429, reason=str(e))
+        return
+
+    async def pump_logs():
+        # send_text가 완료될 때까지 다음 배치를 꺼내지 않으므로 느린 클라이언트가 읽기 속도를 제한함
+        async for message in stream.batches():
+            await websocket.send_text(dumps_str(message))
+
+    async def read_client():
+        while True:
+            data = await websocket.receive_json()
+            if data.get("type") == "ping":
+                await websocket.send_json({"type": "pong", "data": {"cursor": stream.cursor}})
+
+    async with stream:
+        tasks = [asyncio.ensure_future(pump_logs()), asyncio.ensure_future(read_client())]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    if websocket.client_state == WebSocketState.CONNECTED:
+        try:
+            await websocket.close()
+        except Exception:
+            pass
+
+
 @router.get("/ws/stats")
 async def get_websocket_stats(
     manager: DeploymentMonitorManager = Depends(get_deployment_monitor_manager)
@@ -338,7 +496,9 @@ async def get_websocket_stats(
     현재 활성 연결 수, 구독 정보 등을 반환합니다.
     """
     try:
-        return manager.get_connection_stats()
+        stats = manager.get_connection_stats()
+        stats["kubernetes_watch"] = get_k8s_watch_mux().stats()
+        return stats
     except Exception as e:
         logger.error("websocket_stats_failed", error=str(e))
         return {
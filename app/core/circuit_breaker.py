@@ -0,0 +1,81 @@
+"""
+회로 차단기 상태 머신
+
+외부 MCP 공급자(app.mcp.external.resilience)와 LLM 공급자(app.llm.router)가 같은
+closed → open → half_open 규칙을 공유합니다.
+
+- closed: 호출 통과. failure_threshold번 연속 실패하면 open
+- open: reset_timeout이 지날 때까지 호출 거부
+- half_open: 시험 호출 하나만 통과. 성공하면 closed, 실패하면 임계값과 무관하게 다시 open
+
+메트릭 기록처럼 상태 전이에 따른 부가 동작은 하위 클래스가 _on_state_change에서 처리합니다.
+"""
+
+import time
+from typing import Callable, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """공급자 하나의 연속 실패를 추적하는 회로 차단기"""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self._probe_inflight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return CLOSED
+        if self.clock() - self.opened_at < self.reset_timeout:
+            return OPEN
+        return HALF_OPEN
+
+    def try_acquire(self) -> bool:
+        """호출 가능 여부. half-open 상태에서는 시험 호출 하나만 허용합니다."""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and not self._probe_inflight:
+            self._probe_inflight = True
+            self._on_state_change(HALF_OPEN)
+            return True
+        return False
+
+    def release(self) -> None:
+        """결과 없이 끝난 호출 (취소). 상태는 바꾸지 않고 시험 호출 슬롯만 반환합니다."""
+        self._probe_inflight = False
+
+    def record_success(self) -> None:
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self._probe_inflight = False
+        self._on_state_change(CLOSED)
+
+    def record_failure(self) -> bool:
+        """실패를 기록하고, 이번 실패로 차단기가 (다시) 열렸으면 True를 반환합니다."""
+        self.consecutive_failures += 1
+        self._probe_inflight = False
+        # half-open 시험 호출이 실패하면 임계값과 무관하게 다시 연다
+        if self.opened_at is not None or self.consecutive_failures >= self.failure_threshold:
+            self.opened_at = self.clock()
+            self._on_state_change(OPEN)
+            return True
+        return False
+
+    def _on_state_change(self, state: str) -> None:
+        """상태 전이 훅 (기본 동작 없음)"""
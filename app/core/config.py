@@ -15,12 +15,27 @@ class Settings(BaseSettings):
     )
     app_name: str = Field(default="K-Le-PaaS Backend Hybrid")
     app_version: str = Field(default="0.1.0")
+    json_backend: str = Field(default="orjson", description="API 응답/WebSocket/Redis JSON 직렬화 백엔드 (orjson, json)")
 
     # Vertex AI / Gemini
     gcp_project: str | None = None
     gcp_location: str | None = "europe-west4"
     gemini_model: str | None = "gemini-2.0-flash"
     # Authentication expects ADC or service account via env; optional here
+    nlp_fast_path_enabled: bool = Field(default=True, description="단순 조회 명령을 LLM 없이 로컬 파서로 해석")
+    nlp_fast_path_min_confidence: float = Field(default=0.85, description="로컬 파서 결과를 사용할 최소 confidence")
+    # LLM 라우터 (지연 예산, 헤지 요청, 공급자 장애 조치)
+    llm_providers: str = Field(default="gemini,anthropic,openai", description="LLM 공급자 우선순위 (쉼표 구분, API 키가 있는 공급자만 사용)")
+    llm_request_timeout_seconds: float = Field(default=30.0, description="공급자 단일 호출 타임아웃(초)")
+    llm_latency_budget_seconds: float = Field(default=8.0, description="명령 해석 1건의 전체 지연 예산(초)")
+    llm_hedge_enabled: bool = Field(default=True, description="느린 응답에 대해 다음 공급자로 헤지 요청 전송")
+    llm_hedge_quantile: float = Field(default=0.95, description="헤지 지연 기준이 되는 공급자 지연 분위수")
+    llm_hedge_min_delay_seconds: float = Field(default=0.3, description="헤지 요청 최소 대기 시간(초)")
+    llm_hedge_default_delay_seconds: float = Field(default=2.0, description="지연 표본이 부족할 때의 헤지 대기 시간(초)")
+    llm_breaker_failure_threshold: int = Field(default=3, description="회로 차단기를 여는 연속 실패 횟수")
+    llm_breaker_reset_timeout_seconds: float = Field(default=30.0, description="회로 차단 후 half-open 시도까지 대기 시간(초)")
+    anthropic_model: str = Field(default="claude-3-5-haiku-latest", description="Anthropic 해석 모델")
+    openai_model: str = Field(default="gpt-4o-mini", description="OpenAI 해석 모델")
 
     # GitHub Webhook
     github_webhook_secret: str | None = None
@@ -30,12 +45,26 @@ class Settings(BaseSettings):
 
     # Prometheus
     prometheus_base_url: str | None = None
+    prometheus_scrape_interval_seconds: float = Field(default=15.0, description="Prometheus scrape 주기 (초). 조회 결과 캐시는 이 경계에서 만료")
+    prometheus_timeout_seconds: float = Field(default=10.0, description="Prometheus API 요청 타임아웃 (초)")
+    prometheus_range_max_points: int = Field(default=300, description="query_range 시계열당 최대 포인트 수 (step 자동 선택 기준)")
+    alert_eval_interval_seconds: float = Field(default=30.0, description="알림 규칙 백그라운드 평가 주기 (초)")
+    alert_eval_clusters: str = Field(default="nks-cluster", description="백그라운드로 평가 상태를 유지할 클러스터 (쉼표 구분, 그 밖의 클러스터는 요청마다 일회성 평가)")
+    alert_eval_max_clusters: int = Field(default=4, description="백그라운드로 평가 상태를 유지할 최대 클러스터 수")
+    ncr_tag_index_enabled: bool = Field(default=True, description="NCR 이미지 태그 백그라운드 색인 사용 여부 (롤백 후보/배포 시 레지스트리 확인 생략)")
+    ncr_tag_index_interval_seconds: float = Field(default=600.0, description="저장소별 NCR 태그 목록 재색인 주기 (초)")
+    ncr_tag_index_max_age_seconds: float = Field(default=3600.0, description="이 시간보다 오래된 색인은 신뢰하지 않고 레지스트리로 확인 (초)")
 
     # Health Check & Monitoring
     rabbitmq_bridge_url: str | None = Field(default="http://localhost:8001/health")
     prometheus_health_url: str | None = None
     database_url: str | None = None
-    
+    db_migrate_on_startup: bool = Field(default=False, description="기동 시 DDL 마이그레이션 실행 (기본: python -m app.migrate 단계에서 일회 실행)")
+    startup_import_budget_seconds: float = Field(default=4.0, description="콜드 스타트 벤치마크의 app.main import 시간 상한(초)")
+    startup_profile_imports_enabled: bool = Field(default=False, description="startup-profile에서 하위 프로세스로 import 시간 측정 허용 (디버그용)")
+    startup_retry_initial_delay_seconds: float = Field(default=1.0, description="필수 서브시스템 초기화 실패 시 첫 재시도 대기 시간 (초, 실패마다 두 배)")
+    startup_retry_max_delay_seconds: float = Field(default=30.0, description="필수 서브시스템 초기화 재시도 대기 시간 상한 (초)")
+
     # Alertmanager
     alertmanager_url: str | None = None
     alertmanager_webhook_url: str | None = None
@@ -48,6 +77,40 @@ class Settings(BaseSettings):
     # Kubernetes Config 경로 (환경별 다른 클러스터 사용 시)
     k8s_config_file: str | None = Field(default=None, description="Kubeconfig 파일 경로 (기본: ~/.kube/config)")
     k8s_context: str | None = Field(default=None, description="사용할 Kubernetes context")
+    k8s_overview_max_age: float = Field(default=15.0, description="클러스터 overview 스냅샷 재사용 최대 시간 (초)")
+    k8s_list_page_size: int | None = Field(default=None, description="목록 명령 기본 페이지 크기 (None/0이면 전체 조회, limit 인자로 페이지 조회)")
+    k8s_list_max_page_size: int = Field(default=1000, description="목록 명령 페이지 크기 상한")
+
+    # 비용 분석 (NKS Standard 2vCPU/4GB 월 50,000원을 CPU 65% / 메모리 35%로 배분)
+    cost_cpu_core_monthly_krw: float = Field(default=16250.0, description="vCPU 1코어 월 단가 (원)")
+    cost_memory_gib_monthly_krw: float = Field(default=4375.0, description="메모리 1GiB 월 단가 (원)")
+    cost_cache_ttl_seconds: float = Field(default=180.0, description="네임스페이스별 비용 분석 결과 캐시 시간 (초)")
+    cost_forecast_lookback_days: int = Field(default=7, description="비용 추세 예측에 사용할 사용량 기간 (일)")
+    cost_min_savings_krw: float = Field(default=1000.0, description="최적화 제안에 포함할 최소 월 절감액 (원)")
+
+    # 배포 진행 이벤트 저장소 (WebSocket 재연결 시 재생)
+    deployment_events_backend: str = Field(default="memory", description="배포 이벤트 저장소 (memory, redis)")
+    deployment_events_max_per_deployment: int = Field(default=200, description="배포별 보관 이벤트 수 (링 버퍼)")
+    deployment_events_completed_ttl_seconds: int = Field(default=3600, description="완료된 배포 이벤트 보관 시간 (초)")
+    deployment_events_active_ttl_seconds: int = Field(default=86400, description="완료 이벤트 없이 멈춘 배포 이벤트 보관 시간 (초, redis)")
+    deployment_events_max_deployments: int = Field(default=1000, description="메모리 저장소가 추적하는 최대 배포 수")
+    ws_fanout_backend: str = Field(default="local", description="배포 WebSocket 이벤트 팬아웃 (local: 단일 레플리카, redis: Redis pub/sub로 레플리카 간 전달)")
+
+    # 로그 스트리밍 (follow)
+    log_stream_max_per_user: int = Field(default=3, description="사용자별 동시 로그 스트림 최대 수")
+    log_stream_idle_timeout: float = Field(default=300.0, description="새 로그가 없을 때 스트림을 닫기까지 대기 시간 (초)")
+    log_stream_queue_size: int = Field(default=1000, description="스트림별 전송 대기 줄 수 (가득 차면 읽기 중단)")
+    log_stream_batch_lines: int = Field(default=200, description="한 번에 전송할 최대 줄 수")
+    log_aggregate_byte_budget: int = Field(default=262144, description="여러 Pod 로그 병합 시 응답 최대 바이트")
+    log_aggregate_concurrency: int = Field(default=8, description="여러 Pod 로그 동시 조회 수")
+
+    # Kubernetes 리소스 실시간 스트림 (/ws/kubernetes)
+    k8s_watch_queue_size: int = Field(default=500, description="구독자별 전송 대기 delta 수 (가득 차면 스냅샷으로 재동기화)")
+    k8s_watch_linger_seconds: float = Field(default=30.0, description="마지막 구독자가 떠난 뒤 업스트림 WATCH를 유지하는 시간 (초)")
+    k8s_watch_timeout_seconds: int = Field(default=300, description="업스트림 WATCH 요청의 서버 측 타임아웃 (초, 만료 시 같은 resourceVersion으로 재개)")
+    k8s_watch_max_upstreams: int = Field(default=100, description="프로세스 전체 업스트림 WATCH 최대 수 (초과 시 새 (kind, namespace) 구독 거부)")
+    k8s_watch_max_subscriptions_per_connection: int = Field(default=20, description="WebSocket 연결당 동시 구독 최대 수")
+    k8s_watch_allowed_namespaces: str = Field(default="", description="구독 가능한 네임스페이스 (쉼표 구분, 비우면 kube- 시스템 네임스페이스를 제외한 전체)")
 
     # MCP trigger (optional)
     mcp_trigger_provider: str | None = None
@@ -81,6 +144,12 @@ class Settings(BaseSettings):
 
     # Slack
     slack_webhook_url: str | None = None
+    slack_bot_token: str | None = Field(default=None, description="Bot 토큰 (설정 시 chat.postMessage/chat.update로 전송하고 같은 배포 알림은 메시지 수정으로 병합)")
+    slack_rate_per_channel: float = Field(default=1.0, description="채널별 초당 전송 수 (Slack 권장 1건/초)")
+    slack_rate_burst: int = Field(default=2, description="채널별 순간 허용 전송 수")
+    slack_queue_max_pending: int = Field(default=1000, description="발신 큐 최대 대기 메시지 수 (초과 시 버림)")
+    slack_max_attempts: int = Field(default=5, description="메시지당 최대 전송 시도 횟수")
+    slack_send_timeout_seconds: float = Field(default=10.0, description="Slack 요청 타임아웃 (초)")
     
     # Slack OAuth 2.0 (사용자 친화적 연동용)
     slack_client_id: str | None = None
@@ -104,6 +173,17 @@ class Settings(BaseSettings):
     github_app_private_key_file: str | None = None
     github_app_webhook_secret: str | None = None
     github_app_install_url: str | None = None
+    github_token_refresh_margin: int = Field(default=300, description="설치 토큰 만료 전 미리 갱신할 여유 시간 (초)")
+    github_installations_cache_ttl: int = Field(default=60, description="GitHub App 설치 목록 캐시 TTL (초)")
+    github_repo_installation_cache_ttl: int = Field(default=600, description="owner/repo → installation_id 캐시 TTL (초)")
+    github_fanout_concurrency: int = Field(default=8, description="리포지토리 × PR 조회 시 동시 GitHub API 요청 수")
+
+    # GitHub 웹훅 수집 파이프라인
+    webhook_worker_concurrency: int = Field(default=4, description="웹훅 처리 워커 수")
+    webhook_dedup_ttl: int = Field(default=3600, description="X-GitHub-Delivery 중복 제거 TTL (초)")
+    webhook_dedup_max_entries: int = Field(default=10000, description="중복 제거 집합 최대 크기")
+    webhook_integration_cache_ttl: int = Field(default=60, description="웹훅 통합 정보 캐시 TTL (초)")
+    webhook_processing_lease_seconds: int = Field(default=3600, description="인박스 항목 처리 점유 기간 (초, 만료 시 다른 레플리카가 재처리)")
 
     # Deployment-config repo access (for webhook-based updates)
     deployment_config_repo: str | None = Field(default="K-Le-PaaS/deployment-config")
@@ -166,6 +246,11 @@ class Settings(BaseSettings):
     # JWT Configuration
     secret_key: str = Field(default="your-secret-key-here", description="JWT secret key")
     
+    # Dashboard Overview
+    dashboard_cache_ttl: float = Field(default=10.0, description="대시보드 개요 사용자별 캐시 TTL (초)")
+    dashboard_cache_stale_ttl: float = Field(default=60.0, description="TTL 만료 후 캐시를 반환하며 백그라운드 갱신하는 시간 (초)")
+    dashboard_section_timeout: float = Field(default=3.0, description="대시보드 섹션별 조회 타임아웃 (초)")
+
     # Frontend/Backend URLs
     frontend_url: str = Field(default="http://localhost:3000", description="Frontend application URL")
     backend_url: str = Field(default="http://localhost:8000", description="Backend application URL")
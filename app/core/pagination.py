@@ -0,0 +1,100 @@
+"""
+키셋(커서) 페이지네이션 유틸리티
+
+OFFSET/LIMIT은 깊은 페이지일수록 건너뛸 행을 모두 스캔하므로 점점 느려집니다.
+정렬 키 (타임스탬프, id)의 마지막 값을 불투명한 커서로 내려주고 다음 요청에서
+`(ts, id) < (cursor_ts, cursor_id)` 조건으로 이어서 조회하면 페이지 깊이와
+무관하게 인덱스 범위 스캔 한 번으로 끝납니다.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import desc, tuple_
+from sqlalchemy.orm import Query
+
+
+class InvalidCursorError(ValueError):
+    """디코딩할 수 없는 커서"""
+
+
+def encode_cursor(timestamp: Optional[datetime], row_id: int) -> str:
+    """정렬 키를 URL-safe 커서 문자열로 인코딩합니다."""
+    raw = json.dumps([timestamp.isoformat() if timestamp else None, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """커서 문자열을 (타임스탬프, id)로 디코딩합니다."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        ts_raw, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        return datetime.fromisoformat(ts_raw), int(row_id)
+    except Exception as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+
+
+def parse_fields(fields: Optional[str], allowed: Sequence[str]) -> Optional[List[str]]:
+    """`fields=a,b` 쿼리 값을 검증된 필드 목록으로 변환합니다. 미지정 시 None."""
+    if not fields:
+        return None
+    selected = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in selected if f not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)} (allowed: {', '.join(allowed)})")
+    return selected
+
+
+def keyset_page(
+    query: Query,
+    ts_column: Any,
+    id_column: Any,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    (ts, id) 내림차순 키셋 페이지를 조회합니다.
+
+    limit + 1 행을 읽어 다음 페이지 존재 여부를 판단하므로 COUNT 쿼리가 필요 없습니다.
+
+    Returns:
+        (행 목록, 다음 페이지 커서 또는 None)
+    """
+    if cursor:
+        cursor_ts, cursor_id = decode_cursor(cursor)
+        query = query.filter(tuple_(ts_column, id_column) < tuple_(cursor_ts, cursor_id))
+
+    rows = query.order_by(desc(ts_column), desc(id_column)).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, ts_column.key), getattr(last, id_column.key))
+
+
+def offset_page(
+    query: Query,
+    ts_column: Any,
+    id_column: Any,
+    limit: int,
+    offset: int,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    (ts, id) 내림차순 offset 페이지를 조회합니다 (하위 호환용).
+
+    offset으로 진입했더라도 다음 페이지부터는 커서로 이어갈 수 있도록, 다음 행이
+    있으면 마지막 행의 정렬 키로 커서를 만들어 반환합니다.
+
+    Returns:
+        (행 목록, 다음 페이지 커서 또는 None)
+    """
+    rows = query.order_by(desc(ts_column), desc(id_column)).offset(offset).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, ts_column.key), getattr(last, id_column.key))
@@ -0,0 +1,60 @@
+"""
+공유 비동기 Redis 클라이언트
+
+여러 레플리카가 공유해야 하는 캐시/스트림/브로드캐스트용 redis.asyncio
+클라이언트를 지연 생성합니다. Redis에 연결할 수 없으면 일정 시간 동안
+호출을 건너뛰어 요청 경로가 연결 타임아웃에 묶이지 않도록 합니다.
+"""
+
+import time
+from typing import Any, Optional
+
+import structlog
+
+from .config import get_settings
+
+logger = structlog.get_logger(__name__)
+
+_async_client: Optional[Any] = None
+_unavailable_until: float = 0.0
+
+# 연결 실패 후 재시도까지 대기 시간 (초)
+REDIS_RETRY_BACKOFF_SECONDS = 30.0
+
+
+def get_async_redis() -> Optional[Any]:
+    """redis.asyncio 클라이언트를 반환합니다. 최근 연결 실패 시 None."""
+    global _async_client
+    if time.monotonic() < _unavailable_until:
+        return None
+    if _async_client is None:
+        try:
+            import redis.asyncio as aioredis
+        except ImportError:
+            return None
+        settings = get_settings()
+        _async_client = aioredis.from_url(
+            settings.redis_url,
+            decode_responses=True,
+            socket_connect_timeout=0.5,
+            socket_timeout=1.0,
+        )
+    return _async_client
+
+
+def mark_redis_unavailable(error: Exception) -> None:
+    """Redis 호출 실패를 기록하고 백오프 동안 클라이언트를 비활성화합니다."""
+    global _unavailable_until
+    if time.monotonic() >= _unavailable_until:
+        logger.warning("redis_unavailable", error=str(error), backoff_seconds=REDIS_RETRY_BACKOFF_SECONDS)
+    _unavailable_until = time.monotonic() + REDIS_RETRY_BACKOFF_SECONDS
+
+
+async def close_async_redis() -> None:
+    global _async_client
+    if _async_client is not None:
+        try:
+            await _async_client.aclose()
+        except Exception:
+            pass
+        _async_client = None
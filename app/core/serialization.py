@@ -0,0 +1,112 @@
+"""
+JSON 직렬화 (orjson 우선, 표준 json 대체)
+
+API 응답, WebSocket 메시지, Redis 저장 값에 같은 직렬화 규칙을 사용합니다.
+
+- datetime/date/UUID/Enum/dataclass는 네이티브로 처리 (DateTimeEncoder 같은 커스텀 인코더 불필요)
+- Decimal, set, pydantic 모델은 default 훅으로 변환
+- 백엔드는 KLEPAAS_JSON_BACKEND(orjson|json)로 선택하며 orjson 미설치 시 표준 json 사용
+- 출력은 ensure_ascii=False와 같은 UTF-8 바이트 (한국어 메시지가 \\uXXXX로 부풀지 않음)
+"""
+
+import dataclasses
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Union
+from uuid import UUID
+
+from starlette.responses import JSONResponse
+
+from .config import get_settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 미설치 환경
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """두 백엔드가 공통으로 쓰는 비표준 타입 변환"""
+    if isinstance(obj, Decimal):
+        return int(obj) if obj == obj.to_integral_value() else float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    model_dump = getattr(obj, "model_dump", None)
+    if callable(model_dump):
+        return model_dump(mode="json")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stdlib_default(obj: Any) -> Any:
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, UUID):
+        return str(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    return _default(obj)
+
+
+class _StdlibBackend:
+    name = "json"
+
+    @staticmethod
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_stdlib_default).encode("utf-8")
+
+    loads: Callable[[Union[bytes, str]], Any] = staticmethod(json.loads)
+
+
+class _OrjsonBackend:
+    name = "orjson"
+
+    @staticmethod
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+    loads: Callable[[Union[bytes, str]], Any] = staticmethod(orjson.loads if orjson else json.loads)
+
+
+def _select_backend(name: str):
+    if name == "orjson" and orjson is not None:
+        return _OrjsonBackend
+    return _StdlibBackend
+
+
+_backend = _select_backend(get_settings().json_backend)
+
+
+def set_backend(name: str) -> str:
+    """직렬화 백엔드를 바꾸고 실제 적용된 이름을 반환합니다 (벤치마크/테스트용)."""
+    global _backend
+    _backend = _select_backend(name)
+    return _backend.name
+
+
+def backend_name() -> str:
+    return _backend.name
+
+
+def dumps(obj: Any) -> bytes:
+    """UTF-8 JSON 바이트로 직렬화합니다."""
+    return _backend.dumps(obj)
+
+
+def dumps_str(obj: Any) -> str:
+    """텍스트 프레임/Redis 문자열 값처럼 str이 필요한 곳에서 사용합니다."""
+    return _backend.dumps(obj).decode("utf-8")
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    return _backend.loads(data)
+
+
+class FastJSONResponse(JSONResponse):
+    """앱 기본 응답 클래스. 설정된 백엔드(기본 orjson)로 본문을 렌더링합니다."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
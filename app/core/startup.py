@@ -0,0 +1,254 @@
+"""
+기동 경로 계측과 readiness 상태
+
+- StartupProfiler: create_app 단계별 소요 시간과 서브시스템 초기화 결과를 기록
+  (/api/v1/admin/startup-profile 로 노출)
+- 서브시스템 readiness: DB 스키마 확인, 서비스 초기화, kubeconfig 로드처럼 무거운 작업은 서빙 시작 후
+  백그라운드에서 실행하고, 필수 서브시스템이 모두 준비되어야 /api/v1/ready 가 200을 반환
+  (liveness인 /api/v1/health 는 초기화 상태와 무관하게 응답). 필수 서브시스템은 실패하면
+  상한이 있는 지수 백오프로 성공할 때까지 재시도하므로, 기동 중 잠깐의 DB 장애가 지나가면 준비 상태가 됨
+- import_breakdown: `python -X importtime` 출력으로 모듈별 누적 import 시간을 집계
+
+CI 콜드 스타트 벤치마크:
+
+    python -m app.core.startup --budget-seconds 4
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+PENDING = "pending"
+READY = "ready"
+RETRYING = "retrying"
+FAILED = "failed"
+
+
+@dataclass
+class Subsystem:
+    name: str
+    required: bool = True
+    status: str = PENDING
+    duration_ms: Optional[float] = None
+    error: Optional[str] = None
+    attempts: int = 0
+
+
+class StartupProfiler:
+    """create_app 단계별 소요 시간과 백그라운드 초기화 상태"""
+
+    def __init__(self, retry_initial_delay: float = 1.0, retry_max_delay: float = 30.0) -> None:
+        self._origin = time.perf_counter()
+        self.retry_initial_delay = retry_initial_delay
+        self.retry_max_delay = retry_max_delay
+        self.phases: List[Dict[str, Any]] = []
+        self.subsystems: Dict[str, Subsystem] = {}
+        self.serving_after_ms: Optional[float] = None
+        self.ready_after_ms: Optional[float] = None
+        self._import_profile: Optional[Dict[str, Any]] = None
+
+    def _elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self._origin) * 1000, 1)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append({
+                "name": name,
+                "offset_ms": round((start - self._origin) * 1000, 1),
+                "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+            })
+
+    def mark_phase(self, name: str) -> None:
+        """프로파일러 생성 시점부터 지금까지를 하나의 단계로 기록합니다 (모듈 import 구간 등)."""
+        self.phases.append({"name": name, "offset_ms": 0.0, "duration_ms": self._elapsed_ms()})
+
+    def register(self, name: str, required: bool = True) -> None:
+        self.subsystems[name] = Subsystem(name, required)
+
+    def mark_serving(self) -> None:
+        self.serving_after_ms = self._elapsed_ms()
+
+    async def run_subsystem(self, name: str, init: Callable[[], Any], required: bool = True) -> bool:
+        """동기 초기화 함수를 스레드에서 실행하고 결과를 readiness에 기록합니다.
+
+        필수 서브시스템은 실패하면 retrying 상태로 두고 retry_initial_delay부터 두 배씩
+        (retry_max_delay 상한) 기다리며 성공할 때까지 재시도합니다. 선택 서브시스템은 한 번만 시도합니다.
+        """
+        subsystem = self.subsystems.get(name) or Subsystem(name, required)
+        self.subsystems[name] = subsystem
+        start = time.perf_counter()
+        delay = self.retry_initial_delay
+        try:
+            while True:
+                subsystem.attempts += 1
+                try:
+                    await asyncio.to_thread(init)
+                except Exception as e:
+                    subsystem.error = str(e)
+                    if not subsystem.required:
+                        subsystem.status = FAILED
+                        logger.warning("subsystem_init_failed", subsystem=name, required=False, error=str(e))
+                        break
+                    subsystem.status = RETRYING
+                    logger.error(
+                        "subsystem_init_failed", subsystem=name, required=True, error=str(e),
+                        attempt=subsystem.attempts, retry_in_seconds=delay,
+                    )
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, self.retry_max_delay)
+                    continue
+                subsystem.status = READY
+                subsystem.error = None
+                break
+        finally:
+            subsystem.duration_ms = round((time.perf_counter() - start) * 1000, 1)
+        if self.ready and self.ready_after_ms is None:
+            self.ready_after_ms = self._elapsed_ms()
+            logger.info("application_ready", ready_after_ms=self.ready_after_ms)
+        return subsystem.status == READY
+
+    @property
+    def ready(self) -> bool:
+        """필수 서브시스템이 모두 준비되었는지 (선택 서브시스템 실패는 기능 저하로만 취급)"""
+        return all(
+            s.status == READY or (not s.required and s.status == FAILED)
+            for s in self.subsystems.values()
+        )
+
+    def readiness(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "subsystems": {name: asdict(s) for name, s in self.subsystems.items()},
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "phases": self.phases,
+            "phases_total_ms": round(sum(p["duration_ms"] for p in self.phases), 1),
+            "serving_after_ms": self.serving_after_ms,
+            "ready_after_ms": self.ready_after_ms,
+            **self.readiness(),
+        }
+
+    def import_profile(self, module: str = "app.main", top: int = 30) -> Dict[str, Any]:
+        """import 시간은 프로세스 수명 동안 바뀌지 않으므로 첫 측정 결과를 재사용합니다."""
+        if self._import_profile is None or self._import_profile.get("module") != module:
+            self._import_profile = import_breakdown(module, top=max(top, 100))
+        profile = dict(self._import_profile)
+        profile["modules"] = profile["modules"][:top]
+        profile["packages"] = profile["packages"][:top]
+        return profile
+
+
+def parse_importtime(output: str) -> List[Dict[str, Any]]:
+    """`-X importtime` stderr 출력을 {module, self_ms, cumulative_ms, depth} 목록으로 변환합니다."""
+    rows: List[Dict[str, Any]] = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            indent = len(name) - len(name.lstrip()) - 1
+            rows.append({
+                "module": name.strip(),
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+                "depth": max(0, indent // 2),
+            })
+        except ValueError:
+            continue
+    return rows
+
+
+def _child_env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env.setdefault("PYTHONDONTWRITEBYTECODE", "1")
+    return env
+
+
+def import_breakdown(module: str = "app.main", top: int = 30, timeout: float = 120.0) -> Dict[str, Any]:
+    """
+    새 인터프리터에서 모듈을 import하며 `-X importtime`으로 모듈별 시간을 측정합니다.
+
+    - modules: 누적 시간이 큰 모듈 순
+    - packages: 최상위 패키지별 self 시간 합계 (kubernetes, sqlalchemy, app 등)
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, timeout=timeout, env=_child_env(),
+    )
+    rows = parse_importtime(proc.stderr)
+    packages: Dict[str, float] = {}
+    for row in rows:
+        root = row["module"].split(".", 1)[0]
+        packages[root] = packages.get(root, 0.0) + row["self_ms"]
+    target = next((r for r in rows if r["module"] == module), None)
+    return {
+        "module": module,
+        "ok": proc.returncode == 0,
+        "total_ms": round(target["cumulative_ms"], 1) if target else None,
+        "modules": sorted(rows, key=lambda r: r["cumulative_ms"], reverse=True)[:top],
+        "packages": [
+            {"package": name, "self_ms": round(ms, 1)}
+            for name, ms in sorted(packages.items(), key=lambda kv: kv[1], reverse=True)
+        ][:top],
+    }
+
+
+def measure_cold_start(module: str = "app.main", runs: int = 3, timeout: float = 120.0) -> Dict[str, Any]:
+    """새 프로세스에서 모듈 import까지 걸린 벽시계 시간(인터프리터 기동 포함)을 runs회 측정합니다."""
+    samples: List[float] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-c", f"import {module}"],
+            capture_output=True, text=True, timeout=timeout, env=_child_env(),
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"{module} import 실패: {proc.stderr.strip()[-500:]}")
+        samples.append(time.perf_counter() - start)
+    return {
+        "module": module,
+        "runs": runs,
+        "median_seconds": round(statistics.median(samples), 3),
+        "max_seconds": round(max(samples), 3),
+    }
+
+
+def main() -> None:
+    from .config import get_settings
+
+    cli = argparse.ArgumentParser(description="콜드 스타트(app.main import) 시간 벤치마크")
+    cli.add_argument("--module", default="app.main")
+    cli.add_argument("--runs", type=int, default=3)
+    cli.add_argument("--top", type=int, default=15)
+    cli.add_argument("--budget-seconds", type=float, default=None)
+    options = cli.parse_args()
+
+    budget = options.budget_seconds or get_settings().startup_import_budget_seconds
+    result = measure_cold_start(options.module, runs=options.runs)
+    result["budget_seconds"] = budget
+    result["imports"] = import_breakdown(options.module, top=options.top)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    if result["median_seconds"] > budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
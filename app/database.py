@@ -66,16 +66,29 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def _register_models() -> None:
+    """테이블을 가진 모든 모델을 임포트하여 Base.metadata에 등록합니다."""
+    from .models.audit_log import AuditLogModel
+    from .models.command_history import CommandHistory
+    from .models.deployment_config import DeploymentConfig
+    from .models.deployment_history import DeploymentHistory
+    from .models.deployment_url import DeploymentUrl
+    from .models.ncr_image_tag import NcrImageTag
+    from .models.notification import Notification, NotificationReport
+    from .models.oauth_token import OAuthToken
+    from .models.user_project_integration import UserProjectIntegration
+    from .models.user_repository import UserRepository
+    from .models.user_slack_config import UserSlackConfig
+    from .models.webhook_inbox import WebhookInbox
+
+
 def init_database():
     """데이터베이스 테이블을 생성합니다."""
     import os
     import structlog
     from .models.base import Base
-    from .models.audit_log import AuditLogModel
-    from .models.deployment_history import DeploymentHistory
-    from .models.user_slack_config import UserSlackConfig
-    from .models.notification import Notification, NotificationReport
-    
+
+    _register_models()
     logger = structlog.get_logger(__name__)
     
     try:
@@ -112,6 +125,11 @@ def init_database():
             _ensure_deployment_url_table()
         except Exception as e:
             logger.warning(f"DeploymentUrl table ensure failed: {e}")
+
+        try:
+            _ensure_webhook_inbox_columns()
+        except Exception as e:
+            logger.warning(f"WebhookInbox column ensure failed: {e}")
         logger.info("Database tables created successfully")
         
     except Exception as e:
@@ -119,22 +137,58 @@ def init_database():
         raise
 
 
+# _ensure_*_columns()로 기존 테이블에 뒤늦게 추가된 컬럼 (create_all은 기존 테이블을 고치지 않음)
+_ADDED_COLUMNS: dict[str, tuple[str, ...]] = {
+    "user_slack_configs": ("dm_enabled", "dm_user_id"),
+    "deployment_histories": ("pipeline_id", "pipeline_history_id", "replica_count"),
+    "webhook_inbox": ("lease_expires_at",),
+}
+
+
+def check_schema() -> list[str]:
+    """
+    init_database()로 만들어지는 스키마 중 DB에 없는 항목을 반환합니다.
+
+    누락 테이블은 테이블 이름으로, 컬럼 보정 마이그레이션으로 추가되는 컬럼이 없으면
+    "테이블.컬럼" 형식으로 반환합니다.
+    앱 기동 시에는 DDL 대신 이 확인만 수행하고, 누락 시 `python -m app.migrate` 실행이 필요합니다.
+    """
+    from sqlalchemy import inspect
+    from .models.base import Base
+
+    _register_models()
+    inspector = inspect(engine)
+    existing = set(inspector.get_table_names())
+    missing = sorted(name for name in Base.metadata.tables if name not in existing)
+    for table, columns in _ADDED_COLUMNS.items():
+        if table not in existing:
+            continue
+        present = {column["name"] for column in inspector.get_columns(table)}
+        missing.extend(f"{table}.{column}" for column in columns if column not in present)
+    return missing
+
+
 def init_services(db_session: Session):
-    """서비스들을 초기화합니다."""
+    """서비스들을 초기화합니다. (kubeconfig가 필요한 서비스는 init_kubernetes_services)"""
     from .services.audit_logger import init_audit_logger
     from .services.deployment_history import init_deployment_history_service
+    from .websocket.deployment_monitor import init_deployment_monitor_manager
+
+    # 서비스 초기화
+    init_audit_logger(db_session)
+    init_deployment_history_service(db_session)
+    init_deployment_monitor_manager()
+
+
+def init_kubernetes_services():
+    """kubeconfig를 로드하고 Kubernetes Watcher를 초기화합니다."""
     from .services.kubernetes_watcher import (
         init_kubernetes_watcher,
         get_kubernetes_watcher,
         update_deployment_history_on_success
     )
-    from .websocket.deployment_monitor import init_deployment_monitor_manager
 
-    # 서비스 초기화
-    init_audit_logger(db_session)
-    init_deployment_history_service(db_session)
     init_kubernetes_watcher()
-    init_deployment_monitor_manager()
 
     # Kubernetes Watcher 이벤트 핸들러 등록
     try:
@@ -266,3 +320,38 @@ def _ensure_deployment_url_table() -> None:
     except Exception:
         # Best-effort; do not crash app on migration failure
         raise
+
+
+def _ensure_webhook_inbox_columns() -> None:
+    """Ensure recently added columns exist for WebhookInbox.
+
+    Adds lease_expires_at (DATETIME/TIMESTAMP) used for atomic claiming of inbox rows across replicas.
+    It does nothing if the table doesn't exist yet or the column already exists.
+    """
+    try:
+        with engine.connect() as conn:
+            dialect = engine.dialect.name
+            existing_cols: set[str] = set()
+            if dialect == "sqlite":
+                res = conn.execute(text("PRAGMA table_info('webhook_inbox')"))
+                existing_cols = {row[1] for row in res.fetchall()}
+            else:
+                res = conn.execute(
+                    text(
+                        """
+                        SELECT column_name FROM information_schema.columns
+                        WHERE table_name = 'webhook_inbox'
+                        """
+                    )
+                )
+                existing_cols = {row[0] for row in res.fetchall()}
+
+            if existing_cols and "lease_expires_at" not in existing_cols:
+                if dialect == "sqlite":
+                    conn.execute(text("ALTER TABLE webhook_inbox ADD COLUMN lease_expires_at DATETIME"))
+                else:
+                    conn.execute(text("ALTER TABLE webhook_inbox ADD COLUMN lease_expires_at TIMESTAMP"))
+            conn.commit()
+    except Exception:
+        # Best-effort; do not crash app on migration failure
+        raise
@@ -0,0 +1,262 @@
+"""
+LLM 호출 전 로컬 의도 파서 (fast path)
+
+"default 네임스페이스 파드 목록", "web-1 로그 50줄", "cluster overview"처럼 모호하지 않은
+조회 명령은 정규식 문법만으로 {intent, entities}를 만들 수 있습니다. 이런 입력은
+Gemini 왕복 없이 수 마이크로초 안에 처리하고, 나머지만 LLM으로 보냅니다.
+
+- 입력을 토큰으로 나누고 각 토큰을 키워드/리소스 종류/이름/불용어로 분류
+- 문법이 설명한 토큰 비율을 confidence로 사용 (설명 못 한 토큰이 많을수록 낮음)
+- 배포/롤백/스케일/재시작 같은 변경 명령, 이름이 여러 개인 입력 등은 항상 LLM으로 위임
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import structlog
+
+from .gemini import INTENT_MESSAGES
+from .interfaces import LLMClient
+from ..core.config import get_settings
+
+logger = structlog.get_logger(__name__)
+
+# 한국어 조사/복수 접미사 (토큰 끝에 붙는 경우)
+_PARTICLE = r"(?:들)?(?:을|를|이|가|은|는|의|도|에서|에|으로|로|만)?"
+
+
+def _token_pattern(*stems: str) -> "re.Pattern[str]":
+    return re.compile(rf"^(?:{'|'.join(stems)}){_PARTICLE}$")
+
+
+_KINDS: Tuple[Tuple[str, "re.Pattern[str]"], ...] = (
+    ("pod", _token_pattern("파드", "포드", "pods?", "po")),
+    ("deployment", _token_pattern("디플로이먼트", "deployments?")),
+    ("service", _token_pattern("서비스", "services?", "svc")),
+    ("ingress", _token_pattern("인그레스", "ingress(?:es)?", "도메인", "domains?")),
+    ("namespace", _token_pattern("네임스페이스", "namespaces?")),
+    ("endpoint", _token_pattern("엔드포인트", "endpoints?", "접속주소")),
+)
+
+_LIST = _token_pattern("목록", "리스트", "list", "ls", "전체", "모든", "모두", "all", "다")
+_STATUS = _token_pattern("상태", "status", "describe")
+_LOGS = _token_pattern("로그", "logs?")
+_OVERVIEW = _token_pattern("현황", "overview", "대시보드", "dashboard", "요약", "summary")
+_CLUSTER = _token_pattern("클러스터", "cluster")
+_PREVIOUS = _token_pattern("이전", "직전", "previous", "prev")
+_FILLER = re.compile(
+    r"^(?:"
+    r"(?:보여|알려|조회|확인|출력|나열|찾아|불러)(?:해)?(?:줘|줘요|주세요|줄래|봐|봐줘|해줘|하기)?"
+    r"|해줘|줘|좀|현재|지금|있는|뭐야|뭐있어|어때|최근|마지막|최신|주세요"
+    r"|show|me|get|display|view|check|the|of|for|in|on|from|please|pls|what|are|is|current|give|tail|last|recent|my"
+    r")$"
+)
+_NAME = re.compile(rf"^([a-z0-9](?:[a-z0-9._-]*[a-z0-9])?){_PARTICLE}$")
+
+# 변경 작업은 확인 절차와 저장소 정보가 필요하므로 로컬에서 처리하지 않음
+_MUTATING = re.compile(
+    r"배포|deploy(?!ment)|롤백|rollback|스케일|scale|재시작|restart|삭제|delete|지워|늘려|줄여|"
+    r"생성|create|apply|수정|edit|중지|stop|kill|비용|cost|명령어|help"
+)
+_NAMESPACE_SPANS = (
+    re.compile(r"([a-z0-9][a-z0-9-]*)\s*(?:네임스페이스|namespace|ns)(?:의|에서|에)?(?=\s|$)"),
+    re.compile(r"(?<![a-z0-9-])(?:-n|--namespace=?|namespace|ns)\s+([a-z0-9][a-z0-9-]*)"),
+)
+_LINES_SPANS = (
+    re.compile(r"(\d+)\s*(?:줄|lines?)"),
+    re.compile(r"tail\s+(\d+)"),
+)
+_PUNCTUATION = re.compile(r"[?!,~\"'`()\[\]]")
+
+_LIST_COMMANDS = {
+    "pod": "list_pods",
+    "deployment": "list_deployments",
+    "service": "list_services",
+    "ingress": "list_ingresses",
+    "namespace": "list_namespaces",
+    "endpoint": "list_endpoints",
+}
+_NAME_FIELDS = {"pod": "pod_name", "service": "service_name", "deployment": "deployment_name"}
+
+
+@dataclass
+class IntentMatch:
+    """로컬 파서 결과"""
+    command: str
+    entities: Dict[str, Any] = field(default_factory=dict)
+    confidence: float = 0.0
+
+    def to_interpretation(self) -> Dict[str, Any]:
+        """GeminiClient.interpret과 같은 형식으로 변환합니다."""
+        return {
+            "intent": self.command,
+            "entities": self.entities,
+            "message": INTENT_MESSAGES.get(self.command, "명령을 해석했습니다."),
+            "llm": {
+                "provider": "local",
+                "model": "fast_intent",
+                "mode": "fast_path",
+                "confidence": round(self.confidence, 3),
+            },
+        }
+
+
+def _is_keyword(token: str) -> bool:
+    return any(p.match(token) for _, p in _KINDS) or any(
+        p.match(token) for p in (_LIST, _STATUS, _LOGS, _OVERVIEW, _CLUSTER, _PREVIOUS, _FILLER)
+    )
+
+
+class FastIntentParser:
+    """자주 쓰는 조회 명령(list/status/logs/overview)을 위한 결정적 의도 파서"""
+
+    def _extract(self, text: str, patterns) -> Tuple[Optional[str], str, int]:
+        """패턴에 맞는 첫 구간의 값을 꺼내고 해당 구간을 제거한 텍스트를 반환합니다."""
+        for pattern in patterns:
+            for m in pattern.finditer(text):
+                value = m.group(1)
+                if _is_keyword(value):
+                    continue
+                return value, f"{text[:m.start()]} {text[m.end():]}", 1
+        return None, text, 0
+
+    def match(self, text: str) -> Optional[IntentMatch]:
+        """문법에 맞으면 IntentMatch, 모호하거나 지원하지 않는 입력이면 None"""
+        normalized = _PUNCTUATION.sub(" ", text.lower()).strip()
+        if not normalized or _MUTATING.search(normalized):
+            return None
+
+        namespace, normalized, ns_spans = self._extract(normalized, _NAMESPACE_SPANS)
+        lines, normalized, line_spans = self._extract(normalized, _LINES_SPANS)
+
+        kinds: List[str] = []
+        names: List[str] = []
+        flags = set()
+        unexplained = 0
+        tokens = normalized.split()
+        for token in tokens:
+            token = token.strip(".")
+            kind = next((k for k, p in _KINDS if p.match(token)), None)
+            if kind:
+                if kind not in kinds:
+                    kinds.append(kind)
+            elif _LIST.match(token):
+                flags.add("list")
+            elif _STATUS.match(token):
+                flags.add("status")
+            elif _LOGS.match(token):
+                flags.add("logs")
+            elif _OVERVIEW.match(token):
+                flags.add("overview")
+            elif _CLUSTER.match(token):
+                flags.add("cluster")
+            elif _PREVIOUS.match(token):
+                flags.add("previous")
+            elif _FILLER.match(token):
+                pass
+            elif not token.isdigit() and (m := _NAME.match(token)):
+                names.append(m.group(1))
+            else:
+                unexplained += 1
+
+        total = len(tokens) + ns_spans + line_spans
+        if total == 0:
+            return None
+        confidence = 1.0 - unexplained / total
+        ns = namespace or "default"
+
+        if "logs" in flags:
+            if len(names) != 1 or set(kinds) - {"pod"}:
+                return None
+            return IntentMatch("logs", {
+                "pod_name": names[0],
+                "namespace": ns,
+                "lines": max(1, min(int(lines), 100)) if lines else 30,
+                "previous": "previous" in flags,
+                "all_pods": False,
+                "grep": "",
+                "level": "",
+            }, confidence)
+
+        if "previous" in flags or lines:
+            return None
+
+        if not kinds and not names and (
+            "overview" in flags or ("cluster" in flags and "status" in flags)
+        ):
+            return IntentMatch("overview", {"namespace": ns}, confidence)
+
+        if "status" in flags and len(names) == 1 and len(kinds) <= 1:
+            resource_type = kinds[0] if kinds else "pod"
+            if resource_type not in _NAME_FIELDS:
+                return None
+            return IntentMatch("status", {
+                _NAME_FIELDS[resource_type]: names[0],
+                "resource_type": resource_type,
+                "namespace": ns,
+            }, confidence)
+
+        if len(kinds) == 1 and not names and not flags - {"list"}:
+            command = _LIST_COMMANDS[kinds[0]]
+            entities = {} if command in ("list_ingresses", "list_namespaces") else {"namespace": ns}
+            return IntentMatch(command, entities, confidence)
+
+        return None
+
+
+_parser = FastIntentParser()
+
+
+def _session_has_pending_state(session: Optional[Dict[str, Any]]) -> bool:
+    """확인 대기 중인 작업이나 직전 저장소 컨텍스트가 있으면 같은 문장도 다르게 해석될 수 있음"""
+    if not session:
+        return False
+    if session.get("pending_action"):
+        return True
+    context = session.get("context") or {}
+    return bool(context.get("github_owner") or context.get("github_repo"))
+
+
+def interpret_locally(
+    text: str,
+    min_confidence: Optional[float] = None,
+    session: Optional[Dict[str, Any]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    로컬 파서로 해석합니다. 비활성화되어 있거나 confidence가 기준 미만이면 None.
+
+    session(대화 세션)에 대기 중인 작업이나 저장소 컨텍스트가 있으면 컨텍스트를 반영할 수
+    있는 LLM 해석에 맡기도록 None을 반환합니다. 반환 형식은 GeminiClient.interpret 결과와 같습니다.
+    """
+    settings = get_settings()
+    if not settings.nlp_fast_path_enabled:
+        return None
+    if _session_has_pending_state(session):
+        return None
+    threshold = settings.nlp_fast_path_min_confidence if min_confidence is None else min_confidence
+    start = time.perf_counter()
+    match = _parser.match(text)
+    if match is None or match.confidence < threshold:
+        return None
+    logger.info(
+        "fast_intent_hit",
+        intent=match.command,
+        confidence=round(match.confidence, 3),
+        duration_us=round((time.perf_counter() - start) * 1e6, 1),
+    )
+    return match.to_interpretation()
+
+
+class FastPathLLMClient(LLMClient):
+    """로컬 파서로 먼저 해석하고, 모호한 입력만 fallback LLM으로 보내는 클라이언트"""
+
+    def __init__(self, fallback: LLMClient) -> None:
+        self.fallback = fallback
+
+    async def interpret(self, prompt: str, user_id: str = "default", project_name: str = "default") -> Dict[str, Any]:
+        local = interpret_locally(prompt)
+        if local is not None:
+            return local
+        return await self.fallback.interpret(prompt, user_id=user_id, project_name=project_name)
@@ -1,293 +1,38 @@
+import asyncio
 import os
 import json
 import re
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+import httpx
 
 from .interfaces import LLMClient
 from ..core.config import get_settings
 
+# 명령어에 따른 기본 메시지
+INTENT_MESSAGES = {
+    "deploy": "배포 명령을 해석했습니다.",
+    "rollback": "롤백 명령을 해석했습니다.",
+    "list_rollback": "롤백 목록 조회 명령을 해석했습니다.",
+    "scale": "스케일링 명령을 해석했습니다.",
+    "status": "상태 확인 명령을 해석했습니다.",
+    "logs": "로그 조회 명령을 해석했습니다.",
+    "endpoint": "엔드포인트 조회 명령을 해석했습니다.",
+    "restart": "재시작 명령을 해석했습니다.",
+    "list_pods": "파드 목록 조회 명령을 해석했습니다.",
+    "list_deployments": "Deployment 목록 조회 명령을 해석했습니다.",
+    "list_services": "전체 Service 조회 명령을 해석했습니다.",
+    "list_ingresses": "전체 Ingress/도메인 조회 명령을 해석했습니다.",
+    "list_namespaces": "네임스페이스 목록 조회 명령을 해석했습니다.",
+    "list_endpoints": "네임스페이스 엔드포인트 목록 조회 명령을 해석했습니다.",
+    "overview": "통합 대시보드 조회 명령을 해석했습니다.",
+    "get_service": "Service 상세 정보 조회 명령을 해석했습니다.",
+    "get_deployment": "Deployment 상세 정보 조회 명령을 해석했습니다.",
+    "unknown": "알 수 없는 명령입니다."
+}
 
-class GeminiClient(LLMClient):
-    def __init__(self) -> None:
-        self.settings = get_settings()
-
-    async def interpret(self, prompt: str, user_id: str = "default", project_name: str = "default") -> Dict[str, Any]:
-        """자연어 명령을 해석하고 구조화된 데이터를 반환합니다."""
-        try:
-            # Gemini API를 직접 호출하여 명령 해석
-            gemini_response = await self._call_gemini_api(prompt)
-            
-            # Gemini 응답에서 command와 parameters 추출
-            command_data = self._parse_gemini_response(gemini_response)
-            
-            # 파라미터 파싱 및 명령어 결정
-            parameters = command_data.get("parameters", {})
-            command = command_data.get("command", "unknown")
-
-            # 명령어에 따른 entities 구성 (해당 명령에 필요한 필드만 포함)
-            entities: Dict[str, Any] = {}
-
-            # status 명령어 처리 (Pod/Service/Deployment 구분)
-            if command == "status":
-                resource_type = parameters.get("resource_type", "pod")
-                owner = parameters.get("owner", "")
-                repo = parameters.get("repo", "")
-                # owner/repo가 있으면 네이밍 규칙 적용
-                if owner and repo:
-                    # k-le-paas-test01 형식으로 변환
-                    base_name = f"{owner.lower()}-{repo.lower()}"
-                    if resource_type == "service":
-                        entities["service_name"] = f"{base_name}-svc"
-                        entities["resource_type"] = "service"
-                    elif resource_type == "deployment":
-                        entities["deployment_name"] = f"{base_name}-deploy"
-                        entities["resource_type"] = "deployment"
-                    else:  # pod (기본값)
-                        entities["pod_name"] = base_name
-                        entities["resource_type"] = "pod"
-                else:
-                    # 기존 로직: 명시된 이름 사용
-                    if resource_type == "service" and parameters.get("serviceName"):
-                        entities["service_name"] = parameters.get("serviceName")
-                        entities["resource_type"] = "service"
-                    elif resource_type == "deployment" and parameters.get("deploymentName"):
-                        entities["deployment_name"] = parameters.get("deploymentName")
-                        entities["resource_type"] = "deployment"
-                    elif parameters.get("podName"):
-                        entities["pod_name"] = parameters.get("podName")
-                        entities["resource_type"] = "pod"
-                    else:
-                        # resource_type만 있고 이름이 없으면 설정
-                        entities["resource_type"] = resource_type
-
-                # namespace 설정
-                entities["namespace"] = parameters.get("namespace", "default")
-
-            # 기타 Pod 관련 명령어 (logs)
-            elif command == "logs":
-                if parameters.get("podName") is not None:
-                    entities["pod_name"] = parameters.get("podName")
-
-            # Deployment 관련 명령어
-            elif command in ("scale", "deploy", "get_deployment"):
-                if parameters.get("deploymentName") is not None:
-                    entities["deployment_name"] = parameters.get("deploymentName")
-            # Service 관련 명령어
-            elif command in ("endpoint", "get_service"):
-                if parameters.get("serviceName") is not None:
-                    entities["service_name"] = parameters.get("serviceName")
-                entities["namespace"] = parameters.get("namespace", "default")
-
-            # restart 명령어 처리
-            if command == "restart":
-                # GitHub 저장소 정보 (필수)
-                owner = parameters.get("owner", "")
-                repo = parameters.get("repo", "")
-
-                # owner/repo가 비어있는 경우 에러 처리
-                if not owner or not repo:
-                    entities["error"] = "GitHub 저장소 정보가 필요합니다. 'K-Le-PaaS/test01 재시작해줘' 형식으로 입력해주세요."
-                    return {
-                        "intent": "error",
-                        "entities": entities,
-                        "message": entities["error"]
-                    }
-
-                entities["github_owner"] = owner
-                entities["github_repo"] = repo
-
-            
-
-            # namespace 기본값 포함이 필요한 명령어들
-            if command in ("status", "endpoint", "restart", "overview", "list_pods", "logs", "get_service", "get_deployment", "cost_analysis", "list_endpoints", "list_deployments", "list_services"):
-                if "namespace" not in entities:
-                    entities["namespace"] = parameters.get("namespace", "default")
-
-            # 비용 분석 파라미터
-            if command == "cost_analysis":
-                entities["analysis_type"] = parameters.get("analysis_type", "usage")
-
-            # 스케일링 복제수 및 GitHub 저장소 정보
-            if command == "scale":
-                # GitHub 저장소 정보 (필수)
-                owner = parameters.get("owner", "")
-                repo = parameters.get("repo", "")
-                
-                # owner/repo가 비어있는 경우 에러 처리
-                if not owner or not repo:
-                    entities["error"] = "GitHub 저장소 정보가 필요합니다. 'K-Le-PaaS/test01 4개로 스케일링 해줘' 형식으로 입력해주세요."
-                    return {
-                        "intent": "error",
-                        "entities": entities,
-                        "message": entities["error"]
-                    }
-                
-                entities["github_owner"] = owner
-                entities["github_repo"] = repo
-
-                # 복제수 파싱
-                raw_replicas = parameters.get("replicas", 1)
-                try:
-                    coerced_replicas = int(raw_replicas)
-                except (TypeError, ValueError):
-                    coerced_replicas = 1
-                if coerced_replicas < 1:
-                    coerced_replicas = 1
-                if coerced_replicas > 100:  # 최대 100개로 제한
-                    coerced_replicas = 100
-                entities["replicas"] = coerced_replicas
-
-            # NCP 롤백 파라미터
-            if command == "rollback":
-                # GitHub 저장소 정보 (필수)
-                owner = parameters.get("owner", "")
-                repo = parameters.get("repo", "")
-                
-                # owner/repo가 비어있는 경우 에러 처리
-                if not owner or not repo:
-                    entities["error"] = "GitHub 저장소 정보가 필요합니다. 'K-Le-PaaS/test01 롤백해줘' 형식으로 입력해주세요."
-                    return {
-                        "intent": "error",
-                        "entities": entities,
-                        "message": entities["error"]
-                    }
-                
-                entities["github_owner"] = owner
-                entities["github_repo"] = repo
-
-                # 커밋 SHA (선택: commitSha가 있으면 커밋 기반 롤백)
-                commit_sha = parameters.get("commitSha")
-                if commit_sha and isinstance(commit_sha, str):
-                    entities["target_commit_sha"] = commit_sha.strip()
-                else:
-                    entities["target_commit_sha"] = None
-
-                # N번째 전 (선택: stepsBack이 있으면 N번째 전 롤백)
-                steps_back = parameters.get("stepsBack")
-                if steps_back is not None:
-                    try:
-                        steps = int(steps_back)
-                        entities["steps_back"] = max(1, min(steps, 10))  # 1~10 제한
-                    except (TypeError, ValueError):
-                        entities["steps_back"] = 1  # 기본값
-                else:
-                    entities["steps_back"] = None
-
-            # 롤백 목록 조회 파라미터
-            if command == "list_rollback":
-                # GitHub 저장소 정보 (필수)
-                entities["github_owner"] = parameters.get("owner", "")
-                entities["github_repo"] = parameters.get("repo", "")
-
-            # 배포 파라미터
-            if command == "deploy":
-                # GitHub 저장소 정보 (필수)
-                owner = parameters.get("owner", "")
-                repo = parameters.get("repo", "")
-                
-                # owner/repo가 비어있는 경우 에러 처리
-                if not owner or not repo:
-                    entities["error"] = "GitHub 저장소 정보가 필요합니다. 'K-Le-PaaS/test01 배포해줘' 형식으로 입력해주세요."
-                    return {
-                        "intent": "error",
-                        "entities": entities,
-                        "message": entities["error"]
-                    }
-                
-                entities["github_owner"] = owner
-                entities["github_repo"] = repo
-                # 브랜치 (선택, 기본값 main)
-                entities["branch"] = parameters.get("branch", "main")
-
-            # 로그 관련 옵션: lines, previous
-            if command == "logs":
-                raw_lines = parameters.get("lines", 30)
-                try:
-                    coerced_lines = int(raw_lines)
-                except (TypeError, ValueError):
-                    coerced_lines = 30
-                if coerced_lines < 1:
-                    coerced_lines = 1
-                if coerced_lines >= 100:
-                    coerced_lines = 100
-                entities["lines"] = coerced_lines
-                
-                # 이전 파드 로그 여부
-                raw_previous = parameters.get("previous", False)
-                if isinstance(raw_previous, bool):
-                    entities["previous"] = raw_previous
-                elif isinstance(raw_previous, str):
-                    entities["previous"] = raw_previous.lower() in ("true", "1", "yes", "on")
-                else:
-                    entities["previous"] = False
-
-            # list_ingresses / list_namespaces 는 파라미터 없음
-            # list_deployments는 namespace를 사용할 수 있음 (기본값: default)
-            if command == "list_deployments":
-                entities["namespace"] = parameters.get("namespace", "default")
-            # list_services는 namespace를 사용할 수 있음 (기본값: default)
-            if command == "list_services":
-                entities["namespace"] = parameters.get("namespace", "default")
-            
-            # 명령어에 따른 기본 메시지 생성
-            messages = {
-                "deploy": "배포 명령을 해석했습니다.",
-                "rollback": "롤백 명령을 해석했습니다.",
-                "list_rollback": "롤백 목록 조회 명령을 해석했습니다.",
-                "scale": "스케일링 명령을 해석했습니다.",
-                "status": "상태 확인 명령을 해석했습니다.",
-                "logs": "로그 조회 명령을 해석했습니다.",
-                "endpoint": "엔드포인트 조회 명령을 해석했습니다.",
-                "restart": "재시작 명령을 해석했습니다.",
-                "list_pods": "파드 목록 조회 명령을 해석했습니다.",
-                "list_deployments": "Deployment 목록 조회 명령을 해석했습니다.",
-                "list_services": "전체 Service 조회 명령을 해석했습니다.",
-                "list_ingresses": "전체 Ingress/도메인 조회 명령을 해석했습니다.",
-                "list_namespaces": "네임스페이스 목록 조회 명령을 해석했습니다.",
-                "list_endpoints": "네임스페이스 엔드포인트 목록 조회 명령을 해석했습니다.",
-                "overview": "통합 대시보드 조회 명령을 해석했습니다.",
-                "get_service": "Service 상세 정보 조회 명령을 해석했습니다.",
-                "get_deployment": "Deployment 상세 정보 조회 명령을 해석했습니다.",
-                "unknown": "알 수 없는 명령입니다."
-            }
-            
-            return {
-                "intent": command,
-                "entities": entities,
-                "message": messages.get(command, "명령을 해석했습니다."),
-                "llm": {
-                    "provider": "gemini",
-                    "model": self.settings.gemini_model,
-                    "mode": "interpretation_only",
-                },
-            }
-        except Exception as e:
-            return {
-                "intent": "error",
-                "entities": {},
-                "error": str(e),
-                "message": f"명령 해석 중 오류가 발생했습니다: {str(e)}",
-                "llm": {
-                    "provider": "gemini",
-                    "model": self.settings.gemini_model,
-                    "mode": "error",
-                },
-            }
-
-    async def _call_gemini_api(self, prompt: str) -> str:
-        """Gemini API를 직접 호출하여 응답을 받습니다."""
-        import httpx
-        
-        # Gemini API 설정
-        # Settings에서 API 키 가져오기 (.env 파일 지원)
-        api_key = self.settings.gemini_api_key or os.getenv("KLEPAAS_GEMINI_API_KEY")
-        if not api_key:
-            raise ValueError("Gemini API 키가 설정되지 않았습니다. .env 파일 또는 환경변수에 KLEPAAS_GEMINI_API_KEY를 설정하세요.")
-        
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent?key={api_key}"
-        
-        # MVP 시스템 프롬프트
-        system_prompt = """SYSTEM PROMPT:
+# MVP 시스템 프롬프트 (모든 LLM 공급자가 같은 출력 형식을 쓰도록 공유)
+SYSTEM_PROMPT = """SYSTEM PROMPT:
 당신은 쿠버네티스 전문가 AI 어시스턴트입니다. 당신의 역할은 사용자의 자연어 명령을 분석하여, 미리 정의된 구조화된 JSON 형식으로 변환하는 것입니다. 
 
 중요한 지침:
@@ -329,7 +74,7 @@ owner/repo 형식 감지:
 - App 호칭 예시: "k-le-paas-test01 app 로그", "my-app 로그 확인", "앱 로그 보여줘"
 제한사항: 로그 줄 수는 최대 100줄까지 조회 가능합니다.
 네임스페이스 추출 규칙: "test 네임스페이스", "default 네임스페이스", "kube-system에서" 등의 표현에서 네임스페이스명을 정확히 추출하세요.
-필수 JSON 형식: { "command": "logs", "parameters": { "podName": "<추출된_파드이름_없으면_null>", "lines": <추출된_줄_수_없으면_30_최대_100>, "previous": <이전_파드_로그_요청시_true>, "namespace": "<추출된_네임스페이스_없으면_'default'>" } }
+필수 JSON 형식: { "command": "logs", "parameters": { "podName": "<추출된_파드이름_없으면_null>", "lines": <추출된_줄_수_없으면_30_최대_100>, "previous": <이전_파드_로그_요청시_true>, "allPods": <전체/모든_파드_로그_요청시_true>, "grep": "<특정_문자열_검색시_해당_문자열_없으면_null>", "level": "<에러_로그_요청시_'error'_경고는_'warn'_없으면_null>", "namespace": "<추출된_네임스페이스_없으면_'default'>" } }
 
 3. 엔드포인트/URL 확인 (command: "endpoint")
 설명: 배포된 서비스의 전체 접속 정보를 확인하는 명령입니다.
@@ -634,31 +379,327 @@ B) N번째 전으로 롤백: 숫자를 지정하여 N번째 이전 성공 배포
   * 둘 다 없으면 stepsBack=1로 기본 설정 (1번 전 배포로 롤백)
   * owner/repo가 없어도 롤백 키워드가 있으면 rollback 명령으로 인식 (저장소 정보는 컨텍스트에서 복원)
 - 오직 JSON 객체만 반환하며, 추가 설명이나 대화는 포함하지 않습니다."""
+
+
+class GeminiClient(LLMClient):
+    provider = "gemini"
+
+    def __init__(self, timeout: float | None = None) -> None:
+        self.settings = get_settings()
+        # 라우터가 요청별 지연 예산을 따로 관리하므로 여기서는 단일 호출 상한만 둠
+        self.timeout = timeout or self.settings.llm_request_timeout_seconds
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def model(self) -> str | None:
+        return self.settings.gemini_model
+
+    def _http(self) -> httpx.AsyncClient:
+        """공급자 API용 공유 커넥션 풀. 호출마다 TLS 핸드셰이크를 반복하지 않도록 재사용합니다."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            # 커넥션은 생성한 이벤트 루프에 묶이므로 루프가 바뀌면 새 풀을 만듦
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+
+    async def _complete(self, prompt: str) -> str:
+        """공급자 API를 호출해 원문 응답 텍스트를 받습니다. 다른 공급자는 이 메서드만 재정의합니다."""
+        return await self._call_gemini_api(prompt)
+
+    async def interpret(self, prompt: str, user_id: str = "default", project_name: str = "default") -> Dict[str, Any]:
+        """자연어 명령을 해석하고 구조화된 데이터를 반환합니다."""
+        try:
+            # Gemini API를 직접 호출하여 명령 해석
+            gemini_response = await self._complete(prompt)
+            
+            # Gemini 응답에서 command와 parameters 추출
+            command_data = self._parse_gemini_response(gemini_response)
+            
+            # 파라미터 파싱 및 명령어 결정
+            parameters = command_data.get("parameters", {})
+            command = command_data.get("command", "unknown")
+
+            # 명령어에 따른 entities 구성 (해당 명령에 필요한 필드만 포함)
+            entities: Dict[str, Any] = {}
+
+            # status 명령어 처리 (Pod/Service/Deployment 구분)
+            if command == "status":
+                resource_type = parameters.get("resource_type", "pod")
+                owner = parameters.get("owner", "")
+                repo = parameters.get("repo", "")
+                # owner/repo가 있으면 네이밍 규칙 적용
+                if owner and repo:
+                    # k-le-paas-test01 형식으로 변환
+                    base_name = f"{owner.lower()}-{repo.lower()}"
+                    if resource_type == "service":
+                        entities["service_name"] = f"{base_name}-svc"
+                        entities["resource_type"] = "service"
+                    elif resource_type == "deployment":
+                        entities["deployment_name"] = f"{base_name}-deploy"
+                        entities["resource_type"] = "deployment"
+                    else:  # pod (기본값)
+                        entities["pod_name"] = base_name
+                        entities["resource_type"] = "pod"
+                else:
+                    # 기존 로직: 명시된 이름 사용
+                    if resource_type == "service" and parameters.get("serviceName"):
+                        entities["service_name"] = parameters.get("serviceName")
+                        entities["resource_type"] = "service"
+                    elif resource_type == "deployment" and parameters.get("deploymentName"):
+                        entities["deployment_name"] = parameters.get("deploymentName")
+                        entities["resource_type"] = "deployment"
+                    elif parameters.get("podName"):
+                        entities["pod_name"] = parameters.get("podName")
+                        entities["resource_type"] = "pod"
+                    else:
+                        # resource_type만 있고 이름이 없으면 설정
+                        entities["resource_type"] = resource_type
+
+                # namespace 설정
+                entities["namespace"] = parameters.get("namespace", "default")
+
+            # 기타 Pod 관련 명령어 (logs)
+            elif command == "logs":
+                if parameters.get("podName") is not None:
+                    entities["pod_name"] = parameters.get("podName")
+
+            # Deployment 관련 명령어
+            elif command in ("scale", "deploy", "get_deployment"):
+                if parameters.get("deploymentName") is not None:
+                    entities["deployment_name"] = parameters.get("deploymentName")
+            # Service 관련 명령어
+            elif command in ("endpoint", "get_service"):
+                if parameters.get("serviceName") is not None:
+                    entities["service_name"] = parameters.get("serviceName")
+                entities["namespace"] = parameters.get("namespace", "default")
+
+            # restart 명령어 처리
+            if command == "restart":
+                # GitHub 저장소 정보 (필수)
+                owner = parameters.get("owner", "")
+                repo = parameters.get("repo", "")
+
+                # owner/repo가 비어있는 경우 에러 처리
+                if not owner or not repo:
+                    entities["error"] = "GitHub 저장소 정보가 필요합니다. 'K-Le-PaaS/test01 재시작해줘' 형식으로 입력해주세요."
+                    return {
+                        "intent": "error",
+                        "entities": entities,
+                        "message": entities["error"]
+                    }
+
+                entities["github_owner"] = owner
+                entities["github_repo"] = repo
+
+            
+
+            # namespace 기본값 포함이 필요한 명령어들
+            if command in ("status", "endpoint", "restart", "overview", "list_pods", "logs", "get_service", "get_deployment", "cost_analysis", "list_endpoints", "list_deployments", "list_services"):
+                if "namespace" not in entities:
+                    entities["namespace"] = parameters.get("namespace", "default")
+
+            # 비용 분석 파라미터
+            if command == "cost_analysis":
+                entities["analysis_type"] = parameters.get("analysis_type", "usage")
+
+            # 스케일링 복제수 및 GitHub 저장소 정보
+            if command == "scale":
+                # GitHub 저장소 정보 (필수)
+                owner = parameters.get("owner", "")
+                repo = parameters.get("repo", "")
+                
+                # owner/repo가 비어있는 경우 에러 처리
+                if not owner or not repo:
+                    entities["error"] = "GitHub 저장소 정보가 필요합니다. 'K-Le-PaaS/test01 4개로 스케일링 해줘' 형식으로 입력해주세요."
+                    return {
+                        "intent": "error",
+                        "entities": entities,
+                        "message": entities["error"]
+                    }
+                
+                entities["github_owner"] = owner
+                entities["github_repo"] = repo
+
+                # 복제수 파싱
+                raw_replicas = parameters.get("replicas", 1)
+                try:
+                    coerced_replicas = int(raw_replicas)
+                except (TypeError, ValueError):
+                    coerced_replicas = 1
+                if coerced_replicas < 1:
+                    coerced_replicas = 1
+                if coerced_replicas > 100:  # 최대 100개로 제한
+                    coerced_replicas = 100
+                entities["replicas"] = coerced_replicas
+
+            # NCP 롤백 파라미터
+            if command == "rollback":
+                # GitHub 저장소 정보 (필수)
+                owner = parameters.get("owner", "")
+                repo = parameters.get("repo", "")
+                
+                # owner/repo가 비어있는 경우 에러 처리
+                if not owner or not repo:
+                    entities["error"] = "GitHub 저장소 정보가 필요합니다. 'K-Le-PaaS/test01 롤백해줘' 형식으로 입력해주세요."
+                    return {
+                        "intent": "error",
+                        "entities": entities,
+                        "message": entities["error"]
+                    }
+                
+                entities["github_owner"] = owner
+                entities["github_repo"] = repo
+
+                # 커밋 SHA (선택: commitSha가 있으면 커밋 기반 롤백)
+                commit_sha = parameters.get("commitSha")
+                if commit_sha and isinstance(commit_sha, str):
+                    entities["target_commit_sha"] = commit_sha.strip()
+                else:
+                    entities["target_commit_sha"] = None
+
+                # N번째 전 (선택: stepsBack이 있으면 N번째 전 롤백)
+                steps_back = parameters.get("stepsBack")
+                if steps_back is not None:
+                    try:
+                        steps = int(steps_back)
+                        entities["steps_back"] = max(1, min(steps, 10))  # 1~10 제한
+                    except (TypeError, ValueError):
+                        entities["steps_back"] = 1  # 기본값
+                else:
+                    entities["steps_back"] = None
+
+            # 롤백 목록 조회 파라미터
+            if command == "list_rollback":
+                # GitHub 저장소 정보 (필수)
+                entities["github_owner"] = parameters.get("owner", "")
+                entities["github_repo"] = parameters.get("repo", "")
+
+            # 배포 파라미터
+            if command == "deploy":
+                # GitHub 저장소 정보 (필수)
+                owner = parameters.get("owner", "")
+                repo = parameters.get("repo", "")
+                
+                # owner/repo가 비어있는 경우 에러 처리
+                if not owner or not repo:
+                    entities["error"] = "GitHub 저장소 정보가 필요합니다. 'K-Le-PaaS/test01 배포해줘' 형식으로 입력해주세요."
+                    return {
+                        "intent": "error",
+                        "entities": entities,
+                        "message": entities["error"]
+                    }
+                
+                entities["github_owner"] = owner
+                entities["github_repo"] = repo
+                # 브랜치 (선택, 기본값 main)
+                entities["branch"] = parameters.get("branch", "main")
+
+            # 로그 관련 옵션: lines, previous
+            if command == "logs":
+                raw_lines = parameters.get("lines", 30)
+                try:
+                    coerced_lines = int(raw_lines)
+                except (TypeError, ValueError):
+                    coerced_lines = 30
+                if coerced_lines < 1:
+                    coerced_lines = 1
+                if coerced_lines >= 100:
+                    coerced_lines = 100
+                entities["lines"] = coerced_lines
+                
+                # 이전 파드 로그 여부
+                raw_previous = parameters.get("previous", False)
+                if isinstance(raw_previous, bool):
+                    entities["previous"] = raw_previous
+                elif isinstance(raw_previous, str):
+                    entities["previous"] = raw_previous.lower() in ("true", "1", "yes", "on")
+                else:
+                    entities["previous"] = False
+
+                # 모든 레플리카 병합 및 서버 측 필터
+                raw_all_pods = parameters.get("allPods", False)
+                if isinstance(raw_all_pods, str):
+                    raw_all_pods = raw_all_pods.lower() in ("true", "1", "yes", "on")
+                entities["all_pods"] = bool(raw_all_pods)
+                entities["grep"] = parameters.get("grep") or ""
+                raw_level = (parameters.get("level") or "").lower()
+                entities["level"] = raw_level if raw_level in ("debug", "info", "warn", "error") else ""
+
+            # list_ingresses / list_namespaces 는 파라미터 없음
+            # list_deployments는 namespace를 사용할 수 있음 (기본값: default)
+            if command == "list_deployments":
+                entities["namespace"] = parameters.get("namespace", "default")
+            # list_services는 namespace를 사용할 수 있음 (기본값: default)
+            if command == "list_services":
+                entities["namespace"] = parameters.get("namespace", "default")
+            
+            return {
+                "intent": command,
+                "entities": entities,
+                "message": INTENT_MESSAGES.get(command, "명령을 해석했습니다."),
+                "llm": {
+                    "provider": self.provider,
+                    "model": self.model,
+                    "mode": "interpretation_only",
+                },
+            }
+        except Exception as e:
+            return {
+                "intent": "error",
+                "entities": {},
+                "error": str(e),
+                "message": f"명령 해석 중 오류가 발생했습니다: {str(e)}",
+                "llm": {
+                    "provider": self.provider,
+                    "model": self.model,
+                    "mode": "error",
+                },
+            }
+
+    async def _call_gemini_api(self, prompt: str) -> str:
+        """Gemini API를 직접 호출하여 응답을 받습니다."""
+        # Gemini API 설정
+        # Settings에서 API 키 가져오기 (.env 파일 지원)
+        api_key = self.settings.gemini_api_key or os.getenv("KLEPAAS_GEMINI_API_KEY")
+        if not api_key:
+            raise ValueError("Gemini API 키가 설정되지 않았습니다. .env 파일 또는 환경변수에 KLEPAAS_GEMINI_API_KEY를 설정하세요.")
+        
+        url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent?key={api_key}"
         
         payload = {
             "contents": [{
                 "parts": [{
-                    "text": f"{system_prompt}\n\n사용자 명령: {prompt}"
+                    "text": f"{SYSTEM_PROMPT}\n\n사용자 명령: {prompt}"
                 }]
             }]
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url,
-                headers={"Content-Type": "application/json"},
-                json=payload,
-                timeout=30.0
-            )
-            response.raise_for_status()
-            result = response.json()
-            
-            # Gemini 응답에서 텍스트 추출
-            if "candidates" in result and len(result["candidates"]) > 0:
-                content = result["candidates"][0]["content"]["parts"][0]["text"]
-                return content
-            else:
-                raise ValueError("Gemini API에서 유효한 응답을 받지 못했습니다")
+        response = await self._http().post(
+            url,
+            headers={"Content-Type": "application/json"},
+            json=payload,
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        result = response.json()
+        
+        # Gemini 응답에서 텍스트 추출
+        if "candidates" in result and len(result["candidates"]) > 0:
+            content = result["candidates"][0]["content"]["parts"][0]["text"]
+            return content
+        else:
+            raise ValueError("Gemini API에서 유효한 응답을 받지 못했습니다")
 
     def _parse_gemini_response(self, response: str) -> Dict[str, Any]:
         """Gemini 응답을 파싱하여 command와 parameters를 추출합니다."""
@@ -0,0 +1,136 @@
+"""
+로컬 의도 파서 오프라인 벤치마크
+
+command_history에 저장된 Gemini 해석 결과(tool="nlp_process", args={intent, entities, provider})를
+정답 코퍼스로 사용해 로컬 파서의 커버리지(LLM 생략 비율), 정확도, 지연 시간을 측정합니다.
+
+    python -m app.llm.intent_benchmark --limit 5000
+"""
+
+import argparse
+import json
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from .fast_intent import FastIntentParser
+from ..models.command_history import CommandHistory
+
+# 정확도 비교에 사용하는 엔티티 (실행 결과에 영향을 주는 필드)
+COMPARED_ENTITIES = (
+    "pod_name", "service_name", "deployment_name", "resource_type", "namespace", "lines", "previous",
+)
+
+
+@dataclass
+class LabeledCommand:
+    text: str
+    intent: str
+    entities: Dict[str, Any] = field(default_factory=dict)
+
+
+def load_history_corpus(db: Session, limit: int = 5000) -> List[LabeledCommand]:
+    """Gemini가 해석한 명령 히스토리에서 중복 없는 라벨 코퍼스를 만듭니다.
+
+    로컬 파서가 처리한 행(provider="local")은 파서 자신의 출력이므로 제외합니다.
+    """
+    provider = CommandHistory.args["provider"].as_string()
+    rows = (
+        db.query(CommandHistory.command_text, CommandHistory.args)
+        .filter(CommandHistory.tool == "nlp_process")
+        .filter(or_(provider.is_(None), provider != "local"))
+        .order_by(CommandHistory.id.desc())
+        .limit(limit)
+        .all()
+    )
+    corpus: List[LabeledCommand] = []
+    seen = set()
+    for text, args in rows:
+        intent = (args or {}).get("intent")
+        key = (text or "").strip()
+        if not key or intent in (None, "error", "unknown") or key in seen:
+            continue
+        seen.add(key)
+        corpus.append(LabeledCommand(key, intent, (args or {}).get("entities") or {}))
+    return corpus
+
+
+def _entities_agree(expected: Dict[str, Any], actual: Dict[str, Any]) -> bool:
+    for key in COMPARED_ENTITIES:
+        if key in expected and key in actual and expected[key] != actual[key]:
+            return False
+    return True
+
+
+def evaluate(
+    corpus: List[LabeledCommand],
+    parser: Optional[FastIntentParser] = None,
+    min_confidence: float = 0.85,
+    repeat: int = 5,
+) -> Dict[str, Any]:
+    """
+    코퍼스에 대해 파서를 실행하고 결과 요약을 반환합니다.
+
+    - coverage: 로컬에서 처리한 비율 (LLM 호출 생략)
+    - accuracy: 로컬 처리 건 중 intent와 주요 엔티티가 Gemini 라벨과 일치한 비율
+    - latency_us: 입력 1건당 파싱 시간 (repeat회 반복 측정의 p50/p99)
+    """
+    parser = parser or FastIntentParser()
+    hits = correct = 0
+    mismatches: List[Dict[str, Any]] = []
+    samples: List[float] = []
+
+    for item in corpus:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            match = parser.match(item.text)
+            samples.append((time.perf_counter() - start) * 1e6)
+        if match is None or match.confidence < min_confidence:
+            continue
+        hits += 1
+        if match.command == item.intent and _entities_agree(item.entities, match.entities):
+            correct += 1
+        else:
+            mismatches.append({
+                "text": item.text,
+                "expected": {"intent": item.intent, "entities": item.entities},
+                "actual": {"intent": match.command, "entities": match.entities},
+            })
+
+    samples.sort()
+    total = len(corpus)
+    return {
+        "total": total,
+        "local_hits": hits,
+        "coverage": round(hits / total, 4) if total else 0.0,
+        "accuracy": round(correct / hits, 4) if hits else None,
+        "latency_us": {
+            "p50": round(statistics.median(samples), 2) if samples else None,
+            "p99": round(samples[min(len(samples) - 1, int(len(samples) * 0.99))], 2) if samples else None,
+        },
+        "mismatches": mismatches,
+    }
+
+
+def main() -> None:
+    from ..database import SessionLocal
+
+    cli = argparse.ArgumentParser(description="로컬 의도 파서 정확도/지연 시간 벤치마크")
+    cli.add_argument("--limit", type=int, default=5000, help="사용할 최근 히스토리 건수")
+    cli.add_argument("--min-confidence", type=float, default=0.85)
+    options = cli.parse_args()
+
+    db = SessionLocal()
+    try:
+        corpus = load_history_corpus(db, options.limit)
+    finally:
+        db.close()
+    print(json.dumps(evaluate(corpus, min_confidence=options.min_confidence), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
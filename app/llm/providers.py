@@ -0,0 +1,109 @@
+"""
+Gemini 외 LLM 공급자 클라이언트
+
+Anthropic/OpenAI도 같은 SYSTEM_PROMPT로 같은 JSON 형식을 받으므로, 응답 파싱과
+entities 구성은 GeminiClient를 그대로 쓰고 API 호출(_complete)만 재정의합니다.
+"""
+
+from typing import Dict, List
+
+from .gemini import SYSTEM_PROMPT, GeminiClient
+from .interfaces import LLMClient
+from ..core.config import get_settings
+
+
+class AnthropicClient(GeminiClient):
+    provider = "anthropic"
+
+    @property
+    def model(self) -> str | None:
+        return self.settings.anthropic_model
+
+    async def _complete(self, prompt: str) -> str:
+        api_key = self.settings.claude_api_key
+        if not api_key:
+            raise ValueError("Anthropic API 키가 설정되지 않았습니다 (KLEPAAS_CLAUDE_API_KEY)")
+
+        response = await self._http().post(
+            "https://api.anthropic.com/v1/messages",
+            headers={
+                "x-api-key": api_key,
+                "anthropic-version": "2023-06-01",
+                "content-type": "application/json",
+            },
+            json={
+                "model": self.model,
+                "max_tokens": 1024,
+                "system": SYSTEM_PROMPT,
+                "messages": [{"role": "user", "content": f"사용자 명령: {prompt}"}],
+            },
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        result = response.json()
+
+        texts = [block.get("text", "") for block in result.get("content", []) if block.get("type") == "text"]
+        if not texts:
+            raise ValueError("Anthropic API에서 유효한 응답을 받지 못했습니다")
+        return "".join(texts)
+
+
+class OpenAIClient(GeminiClient):
+    provider = "openai"
+
+    @property
+    def model(self) -> str | None:
+        return self.settings.openai_model
+
+    async def _complete(self, prompt: str) -> str:
+        api_key = self.settings.openai_api_key
+        if not api_key:
+            raise ValueError("OpenAI API 키가 설정되지 않았습니다 (KLEPAAS_OPENAI_API_KEY)")
+
+        response = await self._http().post(
+            "https://api.openai.com/v1/chat/completions",
+            headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
+            json={
+                "model": self.model,
+                "response_format": {"type": "json_object"},
+                "messages": [
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": f"사용자 명령: {prompt}"},
+                ],
+            },
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        result = response.json()
+
+        choices = result.get("choices") or []
+        if not choices or not choices[0].get("message", {}).get("content"):
+            raise ValueError("OpenAI API에서 유효한 응답을 받지 못했습니다")
+        return choices[0]["message"]["content"]
+
+
+_PROVIDERS = {
+    "gemini": (GeminiClient, "gemini_api_key"),
+    "anthropic": (AnthropicClient, "claude_api_key"),
+    "openai": (OpenAIClient, "openai_api_key"),
+}
+
+
+def configured_providers() -> Dict[str, LLMClient]:
+    """
+    llm_providers 순서대로 API 키가 설정된 공급자 클라이언트를 만듭니다.
+
+    Gemini는 환경변수(KLEPAAS_GEMINI_API_KEY)로만 키를 주는 기존 배포가 있어 항상 포함합니다.
+    """
+    settings = get_settings()
+    names: List[str] = [n.strip() for n in settings.llm_providers.split(",") if n.strip()]
+    clients: Dict[str, LLMClient] = {}
+    for name in names:
+        entry = _PROVIDERS.get(name)
+        if entry is None or name in clients:
+            continue
+        cls, key_field = entry
+        if name != "gemini" and not getattr(settings, key_field, None):
+            continue
+        clients[name] = cls()
+    return clients or {"gemini": GeminiClient()}
@@ -0,0 +1,298 @@
+"""
+지연 예산 기반 LLM 라우터
+
+명령 해석은 사용자가 응답을 기다리는 경로에 있어 평균보다 꼬리 지연(p99)이 중요합니다.
+단일 공급자에 30초 타임아웃을 거는 대신 여러 공급자를 다음 규칙으로 조합합니다.
+
+- 요청별 지연 예산: 예산 안에 성공한 응답이 없으면 진행 중인 호출을 모두 취소하고 오류 반환
+- 헤지 요청: 1차 호출이 해당 공급자 p95 지연을 넘기면 다음 공급자로 두 번째 요청을 보내고
+  먼저 성공한 응답을 사용 (나머지는 취소)
+- 장애 조치: 호출이 실패하면 즉시 다음 공급자로 재시도
+- 공급자별 상태 추적: EWMA 지연으로 우선순위를 정하고, 연속 실패 시 회로 차단기를 열어
+  reset 시간 동안 제외한 뒤 half-open 상태에서 한 번의 시험 호출로 복구 여부를 판단
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import structlog
+
+from .interfaces import LLMClient
+from ..core.circuit_breaker import CircuitBreaker
+from ..core.config import get_settings
+from ..monitoring.metrics import llm_request_duration_seconds, llm_requests_total, llm_router_events_total
+
+logger = structlog.get_logger(__name__)
+
+
+class LLMProviderError(Exception):
+    """공급자가 해석에 실패한 경우 (예외, 전송/파싱 실패로 인한 오류 응답)"""
+
+
+class ProviderHealth(CircuitBreaker):
+    """공급자별 지연(EWMA, 분위수)과 연속 실패를 추적하는 회로 차단기
+
+    상태 전이는 app.core.circuit_breaker.CircuitBreaker를 그대로 사용하고
+    성공 시 지연 표본만 추가로 기록합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+        alpha: float = 0.2,
+        window: int = 200,
+        min_samples: int = 20,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(name, failure_threshold=failure_threshold, reset_timeout=reset_timeout, clock=clock)
+        self.alpha = alpha
+        self.min_samples = min_samples
+        self.ewma: Optional[float] = None
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def record_success(self, latency: Optional[float] = None) -> None:
+        if latency is not None:
+            self.samples.append(latency)
+            self.ewma = latency if self.ewma is None else self.alpha * latency + (1 - self.alpha) * self.ewma
+        super().record_success()
+
+    def quantile(self, q: float) -> Optional[float]:
+        """최근 지연 표본의 분위수. 표본이 min_samples 미만이면 None."""
+        if len(self.samples) < self.min_samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+    def snapshot(self) -> Dict[str, Any]:
+        p95 = self.quantile(0.95)
+        return {
+            "state": self.state,
+            "ewma_ms": round(self.ewma * 1000, 1) if self.ewma is not None else None,
+            "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            "samples": len(self.samples),
+            "consecutive_failures": self.consecutive_failures,
+        }
+
+
+class LLMRouter(LLMClient):
+    """여러 LLMClient를 지연 예산, 헤지 요청, 장애 조치로 묶는 클라이언트"""
+
+    def __init__(
+        self,
+        providers: Dict[str, LLMClient],
+        budget_seconds: Optional[float] = None,
+        hedge_enabled: Optional[bool] = None,
+        hedge_quantile: Optional[float] = None,
+        hedge_min_delay: Optional[float] = None,
+        hedge_default_delay: Optional[float] = None,
+        failure_threshold: Optional[int] = None,
+        reset_timeout: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not providers:
+            raise ValueError("LLM 공급자가 하나 이상 필요합니다")
+        settings = get_settings()
+        self.providers = dict(providers)
+        self.budget_seconds = budget_seconds if budget_seconds is not None else settings.llm_latency_budget_seconds
+        self.hedge_enabled = hedge_enabled if hedge_enabled is not None else settings.llm_hedge_enabled
+        self.hedge_quantile = hedge_quantile if hedge_quantile is not None else settings.llm_hedge_quantile
+        self.hedge_min_delay = hedge_min_delay if hedge_min_delay is not None else settings.llm_hedge_min_delay_seconds
+        self.hedge_default_delay = (
+            hedge_default_delay if hedge_default_delay is not None else settings.llm_hedge_default_delay_seconds
+        )
+        self.health: Dict[str, ProviderHealth] = {
+            name: ProviderHealth(
+                name,
+                failure_threshold=failure_threshold or settings.llm_breaker_failure_threshold,
+                reset_timeout=reset_timeout if reset_timeout is not None else settings.llm_breaker_reset_timeout_seconds,
+                clock=clock,
+            )
+            for name in self.providers
+        }
+
+    def _ordered(self) -> List[str]:
+        """
+        EWMA 지연이 낮은 순서 (같으면 설정 순서).
+
+        표본이 없는 공급자는 지연 0이 아니라 사전값(hedge_default_delay)으로 보고 정렬해,
+        측정된 빠른 공급자보다 앞서지 않게 합니다.
+        """
+        def expected(name: str) -> float:
+            ewma = self.health[name].ewma
+            return self.hedge_default_delay if ewma is None else ewma
+
+        return sorted(self.providers, key=expected)
+
+    def hedge_delay(self, name: str) -> float:
+        observed = self.health[name].quantile(self.hedge_quantile)
+        if observed is None:
+            return self.hedge_default_delay
+        return max(self.hedge_min_delay, observed)
+
+    def _model(self, name: str) -> str:
+        return str(getattr(self.providers[name], "model", None) or "unknown")
+
+    async def _call(self, name: str, prompt: str, user_id: str, project_name: str) -> Dict[str, Any]:
+        result = await self.providers[name].interpret(prompt, user_id=user_id, project_name=project_name)
+        # 공급자 클라이언트는 호출/파싱 예외를 최상위 "error" 키가 있는 결과로 바꿔 반환합니다.
+        # 소유자/저장소 누락 같은 검증 오류는 entities.error에만 담기며, 공급자는 정상 응답한
+        # 것이므로 장애 조치나 차단기 실패로 세지 않고 그대로 돌려줍니다.
+        if result.get("intent") == "error" and (
+            result.get("error") or (result.get("llm") or {}).get("mode") == "error"
+        ):
+            raise LLMProviderError(result.get("error") or result.get("message") or "intent=error")
+        return result
+
+    def _record_failure(self, name: str, error: str) -> None:
+        llm_requests_total.labels(provider=name, model=self._model(name), status="error").inc()
+        if self.health[name].record_failure():
+            llm_router_events_total.labels(provider=name, event="breaker_open").inc()
+            logger.warning("llm_breaker_open", provider=name, error=error,
+                           reset_timeout=self.health[name].reset_timeout)
+
+    async def interpret(
+        self,
+        prompt: str,
+        user_id: str = "default",
+        project_name: str = "default",
+        budget_seconds: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + (budget_seconds if budget_seconds is not None else self.budget_seconds)
+        candidates = iter(self._ordered())
+        inflight: Dict["asyncio.Task[Dict[str, Any]]", Tuple[str, float]] = {}
+        attempts: List[Dict[str, Any]] = []
+        hedged = False
+
+        def launch() -> Optional[str]:
+            for name in candidates:
+                if not self.health[name].try_acquire():
+                    continue
+                task = asyncio.ensure_future(self._call(name, prompt, user_id, project_name))
+                inflight[task] = (name, loop.time())
+                return name
+            return None
+
+        if launch() is None:
+            return self._error_result("사용 가능한 LLM 공급자가 없습니다 (모든 회로 차단기가 열림)", attempts, started)
+
+        try:
+            while inflight:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                wait_for = remaining
+                if self.hedge_enabled and not hedged and len(inflight) == 1:
+                    name, call_started = next(iter(inflight.values()))
+                    wait_for = min(remaining, max(0.0, call_started + self.hedge_delay(name) - loop.time()))
+
+                done, _ = await asyncio.wait(list(inflight), timeout=wait_for, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    if loop.time() < deadline and self.hedge_enabled and not hedged:
+                        hedged = True
+                        hedge = launch()
+                        if hedge is not None:
+                            llm_router_events_total.labels(provider=hedge, event="hedge").inc()
+                            logger.info("llm_hedge_sent", provider=hedge,
+                                        after_ms=round((loop.time() - started) * 1000, 1))
+                    continue
+
+                for task in done:
+                    name, call_started = inflight.pop(task)
+                    elapsed = loop.time() - call_started
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        attempts.append({"provider": name, "status": "error", "latency_ms": round(elapsed * 1000, 1)})
+                        self._record_failure(name, str(e))
+                        continue
+
+                    self.health[name].record_success(elapsed)
+                    llm_requests_total.labels(provider=name, model=self._model(name), status="success").inc()
+                    llm_request_duration_seconds.labels(provider=name, model=self._model(name)).observe(elapsed)
+                    attempts.append({"provider": name, "status": "success", "latency_ms": round(elapsed * 1000, 1)})
+                    llm_meta = dict(result.get("llm") or {})
+                    llm_meta["router"] = {
+                        "attempts": attempts,
+                        "hedged": hedged,
+                        "latency_ms": round((loop.time() - started) * 1000, 1),
+                    }
+                    for loser, _ in inflight.values():
+                        llm_requests_total.labels(provider=loser, model=self._model(loser), status="cancelled").inc()
+                    return {**result, "llm": llm_meta}
+
+                if not inflight:
+                    failover = launch()
+                    if failover is not None:
+                        llm_router_events_total.labels(provider=failover, event="failover").inc()
+        finally:
+            for task, (name, _) in inflight.items():
+                task.cancel()
+                self.health[name].release()
+
+        if inflight:
+            # 예산 안에 응답하지 못한 공급자는 느린 것으로 보고 실패로 기록
+            for name, _ in inflight.values():
+                attempts.append({"provider": name, "status": "timeout"})
+                self._record_failure(name, "latency budget exceeded")
+            llm_router_events_total.labels(provider="router", event="budget_exhausted").inc()
+            return self._error_result("LLM 응답이 지연 예산을 초과했습니다", attempts, started, hedged)
+        return self._error_result("모든 LLM 공급자 호출이 실패했습니다", attempts, started, hedged)
+
+    def _error_result(
+        self, error: str, attempts: List[Dict[str, Any]], started: float, hedged: bool = False
+    ) -> Dict[str, Any]:
+        logger.warning("llm_router_failed", error=error, attempts=attempts)
+        return {
+            "intent": "error",
+            "entities": {},
+            "error": error,
+            "message": f"명령 해석 중 오류가 발생했습니다: {error}",
+            "llm": {
+                "provider": "router",
+                "model": None,
+                "mode": "error",
+                "router": {
+                    "attempts": attempts,
+                    "hedged": hedged,
+                    "latency_ms": round((asyncio.get_running_loop().time() - started) * 1000, 1),
+                },
+            },
+        }
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {name: health.snapshot() for name, health in self.health.items()}
+
+    async def aclose(self) -> None:
+        """공급자 클라이언트의 커넥션 풀을 닫습니다."""
+        for provider in self.providers.values():
+            close = getattr(provider, "aclose", None)
+            if close is not None:
+                await close()
+
+
+_router: Optional[LLMRouter] = None
+
+
+def get_llm_router() -> LLMRouter:
+    """설정된 공급자로 프로세스 전역 라우터를 만듭니다. 공급자 상태는 요청 간에 유지됩니다."""
+    global _router
+    if _router is None:
+        from .providers import configured_providers
+
+        _router = LLMRouter(configured_providers())
+    return _router
+
+
+async def close_llm_router() -> None:
+    """애플리케이션 종료 시 라우터가 만든 공급자 커넥션 풀을 정리합니다."""
+    global _router
+    if _router is not None:
+        await _router.aclose()
+        _router = None
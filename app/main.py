@@ -1,11 +1,18 @@
 from datetime import datetime, timezone
+import asyncio
 import os
+from contextlib import asynccontextmanager
 from typing import Any, Dict
 from dotenv import load_dotenv
 
 # .env 파일 로드
 load_dotenv()
 
+from .core.startup import StartupProfiler
+
+# 라우터 import 시간도 기동 프로파일에 포함되도록 가장 먼저 생성
+startup_profiler = StartupProfiler()
+
 from fastapi import FastAPI
 from fastapi.openapi.utils import get_openapi
 from starlette.middleware.cors import CORSMiddleware
@@ -35,16 +42,11 @@ from .mcp.external.api import router as mcp_external_router
 from .api.v1.admin_db import router as admin_db_router
 from .api.v1.user_url import router as user_url_router
 from .core.error_handler import setup_error_handlers
+from .core.serialization import FastJSONResponse
+from .monitoring.middleware import PrometheusMiddleware
 from .core.logging_config import setup_logging
-from .database import init_database, init_services, get_db
-
-# 모든 모델을 import하여 테이블이 생성되도록 함
-from .models.user_repository import UserRepository
-from .models.command_history import CommandHistory
-from .models.deployment_history import DeploymentHistory
-from .models.audit_log import AuditLogModel
-from .models.deployment_url import DeploymentUrl
-from .models.notification import Notification, NotificationReport
+from .core.config import get_settings
+from .database import check_schema, init_database, init_kubernetes_services, init_services, get_db
 import structlog
 
 
@@ -59,6 +61,7 @@ def create_app() -> FastAPI:
     """Create and configure FastAPI application instance."""
     # 로깅 설정
     setup_logging(level="INFO", enable_colors=True)
+    startup_profiler.mark_phase("import_modules")
     
     # Explicitly set OpenAPI version so Swagger UI can render without errors
     # Note: FastAPI defaults to OpenAPI 3.1.0, but we set it explicitly to avoid
@@ -78,6 +81,7 @@ def create_app() -> FastAPI:
         docs_url=docs_url,
         redoc_url=None,
         openapi_url=openapi_url,
+        default_response_class=FastJSONResponse,
     )
 
     # Harden schema generation: always include a valid OpenAPI version header
@@ -121,6 +125,7 @@ def create_app() -> FastAPI:
 
     # App state
     app.state.started_at = datetime.now(timezone.utc)
+    app.state.startup = startup_profiler
     
     # 에러 핸들러 설정
     setup_error_handlers(app)
@@ -134,6 +139,10 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # HTTP 메트릭 (사용자 미들웨어 중 가장 바깥: CORS 처리 시간까지 포함.
+    # Starlette의 ServerErrorMiddleware는 여전히 이 바깥에 있어, 처리되지 않은 예외는 미들웨어가 500으로 직접 기록)
+    app.add_middleware(PrometheusMiddleware)
+
     # Routers
     app.include_router(system_router, prefix="/api/v1", tags=["system"])
     app.include_router(dashboard_router, prefix="/api/v1", tags=["dashboard"])
@@ -172,21 +181,11 @@ def create_app() -> FastAPI:
 
 
     # MCP mount (stub or real based on availability)
-    _mount_mcp(app)
-
-    # Initialize database and services
-    try:
-        # 데이터베이스 초기화
-        init_database()
-        logger.info("Database initialized successfully")
+    with startup_profiler.phase("mount_mcp"):
+        _mount_mcp(app)
 
-        # 서비스 초기화
-        db_session = next(get_db())
-        init_services(db_session)
-        logger.info("All services initialized successfully")
-
-    except Exception as e:
-        logger.warning("Failed to initialize database or services", error=str(e))
+    # DB/서비스/kubeconfig 초기화는 서빙을 막지 않도록 lifespan에서 백그라운드로 실행
+    _install_background_init(app)
 
     # Shutdown 이벤트 핸들러 추가
     @app.on_event("shutdown")
@@ -202,12 +201,156 @@ def create_app() -> FastAPI:
             logger.info("Kubernetes Watcher stopped successfully")
         except Exception as e:
             logger.warning(f"Failed to stop Kubernetes Watcher: {e}")
+
+        # 웹훅 워커 중지 (미처리 인박스는 다음 기동 시 재처리)
+        try:
+            from .services.webhook_ingestion import get_webhook_pipeline
+            await get_webhook_pipeline().stop()
+            logger.info("Webhook ingestion workers stopped successfully")
+        except Exception as e:
+            logger.warning(f"Failed to stop webhook ingestion workers: {e}")
+
+        # 알림 규칙 평가 루프 중지
+        try:
+            from .services.alert_rules import stop_alert_engines
+            await stop_alert_engines()
+        except Exception as e:
+            logger.warning(f"Failed to stop alert rule engines: {e}")
+
+        # NCR 태그 색인 루프 중지
+        try:
+            from .services.ncr_tag_index import stop_ncr_tag_index
+            await stop_ncr_tag_index()
+        except Exception as e:
+            logger.warning(f"Failed to stop NCR tag index: {e}")
+
+        # /ws/kubernetes 공유 WATCH 중지
+        try:
+            from .services.k8s_watch_mux import stop_k8s_watch_mux
+            await stop_k8s_watch_mux()
+        except Exception as e:
+            logger.warning(f"Failed to stop Kubernetes watch multiplexer: {e}")
+
+        # 공유 GitHub 클라이언트 커넥션 풀 정리
+        try:
+            from .services.github_client import github_client
+            await github_client.aclose()
+        except Exception as e:
+            logger.warning(f"Failed to close GitHub client: {e}")
+
+        try:
+            from .llm.router import close_llm_router
+            await close_llm_router()
+        except Exception as e:
+            logger.warning(f"Failed to close LLM provider clients: {e}")
+
+        # 대기 중인 Slack 메시지를 잠시 전송한 뒤 발신 큐 정리
+        try:
+            from .services.slack_delivery import get_slack_delivery_queue
+            await get_slack_delivery_queue().stop()
+        except Exception as e:
+            logger.warning(f"Failed to stop Slack delivery queue: {e}")
+
+        # 배포 WebSocket 팬아웃 구독 해제 (Redis 연결을 닫기 전에)
+        try:
+            from .websocket.deployment_monitor import deployment_monitor_manager
+            await deployment_monitor_manager.stop()
+        except Exception as e:
+            logger.warning(f"Failed to stop deployment WebSocket fan-out: {e}")
+
+        try:
+            from .services.prometheus_client import prometheus_client
+            await prometheus_client.aclose()
+        except Exception as e:
+            logger.warning(f"Failed to close Prometheus client: {e}")
+
+        try:
+            from .core.redis_client import close_async_redis
+            await close_async_redis()
+        except Exception as e:
+            logger.warning(f"Failed to close Redis client: {e}")
         
         logger.info("Application shutdown complete")
 
     return app
 
 
+def _init_database_schema() -> None:
+    """DDL은 `python -m app.migrate` 단계에서 실행하고, 기동 시에는 누락 테이블/컬럼만 확인합니다."""
+    if get_settings().db_migrate_on_startup:
+        init_database()
+        return
+    missing = check_schema()
+    if missing:
+        raise RuntimeError(f"DB 스키마에 누락된 테이블/컬럼이 있습니다 ({', '.join(missing)}). `python -m app.migrate`를 실행하세요.")
+
+
+def _init_core_services() -> None:
+    db_session = next(get_db())
+    init_services(db_session)
+
+
+def _start_webhook_workers() -> None:
+    """재시작 이전에 남은 인박스 항목을 다음 웹훅을 기다리지 않고 바로 재처리합니다."""
+    try:
+        from .services.webhook_ingestion import get_webhook_pipeline
+        get_webhook_pipeline().start()
+    except Exception as e:
+        logger.warning(f"Failed to start webhook ingestion workers: {e}")
+
+
+def _start_ncr_tag_index() -> None:
+    """NCR 태그 백그라운드 색인을 앱 이벤트 루프에서 한 번 시작합니다 (DB 적재가 필요해 스키마 확인 후)."""
+    try:
+        from .services.ncr_tag_index import start_ncr_tag_index
+        start_ncr_tag_index()
+    except Exception as e:
+        logger.warning(f"Failed to start NCR tag index: {e}")
+
+
+def _bind_slack_delivery() -> None:
+    """Slack 발신 큐를 앱 이벤트 루프에 묶습니다 (다른 스레드의 루프가 먼저 묶지 않도록)."""
+    try:
+        from .services.slack_delivery import get_slack_delivery_queue
+        get_slack_delivery_queue().start()
+    except Exception as e:
+        logger.warning(f"Failed to bind Slack delivery queue: {e}")
+
+
+async def _run_background_init() -> None:
+    if await startup_profiler.run_subsystem("database", _init_database_schema):
+        _start_webhook_workers()
+        _start_ncr_tag_index()
+    await startup_profiler.run_subsystem("services", _init_core_services)
+    # kubeconfig가 없는 환경에서도 K8s 외 기능은 서빙 가능하므로 선택 서브시스템
+    await startup_profiler.run_subsystem("kubernetes", init_kubernetes_services, required=False)
+
+
+def _install_background_init(app: FastAPI) -> None:
+    """기존 lifespan(기본 startup/shutdown 핸들러 또는 MCP lifespan)을 감싸 초기화 태스크를 시작합니다."""
+    settings = get_settings()
+    startup_profiler.retry_initial_delay = settings.startup_retry_initial_delay_seconds
+    startup_profiler.retry_max_delay = settings.startup_retry_max_delay_seconds
+    startup_profiler.register("database")
+    startup_profiler.register("services")
+    startup_profiler.register("kubernetes", required=False)
+    inner_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app_: FastAPI):
+        _bind_slack_delivery()
+        init_task = asyncio.create_task(_run_background_init())
+        startup_profiler.mark_serving()
+        try:
+            async with inner_lifespan(app_):
+                yield
+        finally:
+            if not init_task.done():
+                init_task.cancel()
+
+    app.router.lifespan_context = lifespan
+
+
 def _mount_mcp(app: FastAPI) -> None:
     """Mount MCP server at /mcp using fastmcp."""
     try:
@@ -5,6 +5,7 @@ Packages:
 - errors: normalized error schema
 - retry: async retry utilities
 - metrics: Prometheus counters/histograms
+- catalog: cached, name-indexed tool catalogs
 - providers: vendor-specific clients (e.g., GitHub)
 """
 
@@ -13,6 +14,7 @@ __all__ = [
     "errors",
     "retry",
     "metrics",
+    "catalog",
     "providers",
 ]
 
@@ -125,10 +125,10 @@ async def call_tool(request: ToolCallRequest):
 
 
 @router.get("/tools/{provider_name}", response_model=ListToolsResponse)
-async def list_tools(provider_name: str):
-    """List tools for a specific MCP provider."""
+async def list_tools(provider_name: str, refresh: bool = False):
+    """List tools for a specific MCP provider (cached catalog; ``refresh`` forces a refetch)."""
     try:
-        tools = await mcp_registry.list_tools(provider_name)
+        tools = await mcp_registry.list_tools(provider_name, force_refresh=refresh)
         return ListToolsResponse(
             provider=provider_name,
             tools=tools
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .metrics import MCP_TOOL_CATALOG_CACHE
+
+
+@dataclass
+class ToolCatalog:
+    """Snapshot of a provider's tools, indexed by tool name."""
+
+    tools: List[Dict[str, Any]]
+    version: str
+    fetched_at: float
+    by_name: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not self.by_name:
+            self.by_name = {tool.get("name"): tool for tool in self.tools if tool.get("name")}
+
+    def get(self, tool_name: str) -> Optional[Dict[str, Any]]:
+        return self.by_name.get(tool_name)
+
+    def schema(self, tool_name: str) -> Optional[Dict[str, Any]]:
+        tool = self.by_name.get(tool_name)
+        return None if tool is None else tool.get("inputSchema", {})
+
+
+def fingerprint(tools: List[Dict[str, Any]]) -> str:
+    """Content hash used as the catalog version when the server sends no ETag."""
+    payload = json.dumps(tools, sort_keys=True, default=str).encode()
+    return hashlib.sha1(payload).hexdigest()[:16]
+
+
+class ToolCatalogCache:
+    """TTL cache for one provider's tool catalog.
+
+    - Concurrent lookups during a refresh share one remote ``list_tools`` call.
+    - ``observe_version`` drops the catalog when the ``tools_version`` the
+      server advertises in health changes, so changes are picked up before
+      the TTL expires. It is tracked apart from ``ToolCatalog.version``
+      (ETag or content hash), which uses a different namespace.
+    - A failed refresh keeps serving the previous catalog if there is one.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.provider = provider
+        self.ttl = ttl
+        self._clock = clock
+        self._catalog: Optional[ToolCatalog] = None
+        self._stale = False
+        self._inflight: Optional[asyncio.Future] = None
+        self._server_version: Optional[str] = None
+
+    @property
+    def catalog(self) -> Optional[ToolCatalog]:
+        return self._catalog
+
+    def fresh(self) -> bool:
+        return (
+            self._catalog is not None
+            and not self._stale
+            and self._clock() - self._catalog.fetched_at < self.ttl
+        )
+
+    async def get(
+        self,
+        fetch: Callable[[], Awaitable[List[Dict[str, Any]]]],
+        version: Callable[[], Optional[str]] = lambda: None,
+        force_refresh: bool = False,
+    ) -> ToolCatalog:
+        if not force_refresh and self.fresh():
+            MCP_TOOL_CATALOG_CACHE.labels(provider=self.provider, result="hit").inc()
+            return self._catalog
+        if self._inflight is None or self._inflight.done():
+            MCP_TOOL_CATALOG_CACHE.labels(provider=self.provider, result="miss").inc()
+            self._inflight = asyncio.ensure_future(self._refresh(fetch, version))
+        else:
+            MCP_TOOL_CATALOG_CACHE.labels(provider=self.provider, result="coalesced").inc()
+        return await asyncio.shield(self._inflight)
+
+    async def _refresh(
+        self,
+        fetch: Callable[[], Awaitable[List[Dict[str, Any]]]],
+        version: Callable[[], Optional[str]],
+    ) -> ToolCatalog:
+        try:
+            tools = await fetch()
+        except Exception:
+            if self._catalog is not None:
+                MCP_TOOL_CATALOG_CACHE.labels(provider=self.provider, result="stale_served").inc()
+                return self._catalog
+            raise
+        self._catalog = ToolCatalog(tools=tools, version=version() or fingerprint(tools), fetched_at=self._clock())
+        self._stale = False
+        return self._catalog
+
+    def observe_version(self, version: Optional[str]) -> None:
+        """Invalidate when the server-reported ``tools_version`` changes.
+
+        The first value seen is only recorded as the baseline.
+        """
+        if not version or version == self._server_version:
+            return
+        previous, self._server_version = self._server_version, version
+        if previous is not None:
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        if self._catalog is not None and not self._stale:
+            MCP_TOOL_CATALOG_CACHE.labels(provider=self.provider, result="invalidated").inc()
+        self._stale = True
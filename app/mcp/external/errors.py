@@ -15,6 +15,8 @@ ErrorCode = Literal[
     "bad_request",
     "conflict",
     "internal",
+    "overloaded",
+    "circuit_open",
 ]
 
 
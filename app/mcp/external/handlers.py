@@ -6,7 +6,10 @@ from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
 
 from .interfaces import ExternalMCPClient
+from .catalog import ToolCatalog, ToolCatalogCache
 from .errors import MCPExternalError
+from .resilience import CircuitBreaker
+from .metrics import MCP_EXTERNAL_HEALTH, MCP_HEALTH_CHECK_LATENCY, MCP_PROVIDER_INIT_LATENCY
 from .message_converter import MCPMessageConverter, MCPRequestHandler
 from ...services.notify import slack_notify
 from ...core.config import get_settings
@@ -20,19 +23,33 @@ class MCPHandlerConfig:
     retry_delay: float = 1.0
     breaker_failure_threshold: int = 5
     breaker_reset_timeout_sec: float = 30.0
+    catalog_ttl_sec: float = 300.0
+    health_timeout_sec: float = 5.0
+    init_timeout_sec: float = 10.0
 
 
 class MCPHandler:
     """Main handler for MCP operations."""
     
-    def __init__(self, external_client: ExternalMCPClient, config: Optional[MCPHandlerConfig] = None):
+    def __init__(
+        self,
+        external_client: ExternalMCPClient,
+        config: Optional[MCPHandlerConfig] = None,
+        name: Optional[str] = None,
+    ):
         self.external_client = external_client
         self.config = config or MCPHandlerConfig()
+        self.name = name or type(external_client).__name__
+        # Cached tool catalog (TTL + version invalidation), indexed by tool name
+        self.catalog = ToolCatalogCache(self.name, ttl=self.config.catalog_ttl_sec)
         self.converter = MCPMessageConverter()
         self.request_handler = MCPRequestHandler(external_client)
-        # Circuit breaker state
-        self._breaker_failures = 0
-        self._breaker_opened_at: float | None = None
+        # Half-open circuit breaker (one probe after the reset timeout)
+        self.breaker = CircuitBreaker(
+            self.name,
+            failure_threshold=self.config.breaker_failure_threshold,
+            reset_timeout=self.config.breaker_reset_timeout_sec,
+        )
     
     def _select_alert_channel(self, code: str) -> str | None:
         s = get_settings()
@@ -48,24 +65,9 @@ class MCPHandler:
             return s.slack_alert_template_health_down or "[MCP][HEALTH][DOWN] code={{code}} msg={{message}}"
         return s.slack_alert_template_error or "[MCP][ERROR] {{operation}} failed: code={{code}} msg={{message}}"
 
-    def _breaker_is_open(self) -> bool:
-        if self._breaker_opened_at is None:
-            return False
-        # Half-open after reset timeout
-        elapsed = time.time() - self._breaker_opened_at
-        if elapsed >= self.config.breaker_reset_timeout_sec:
-            # allow a trial call (half-open)
-            return False
-        return True
-
-    def _breaker_record_success(self) -> None:
-        self._breaker_failures = 0
-        self._breaker_opened_at = None
-
-    def _breaker_record_failure(self) -> None:
-        self._breaker_failures += 1
-        if self._breaker_failures >= self.config.breaker_failure_threshold:
-            self._breaker_opened_at = time.time()
+    def _breaker_acquire(self) -> None:
+        if not self.breaker.try_acquire():
+            raise MCPExternalError(code="circuit_open", message="Circuit breaker is open")
 
     async def initialize(self) -> None:
         """Initialize the MCP handler."""
@@ -75,16 +77,25 @@ class MCPHandler:
         """Cleanup the MCP handler."""
         await self.external_client.close()
     
-    async def list_tools(self) -> List[Dict[str, Any]]:
-        """List available tools from external MCP server."""
-        if self._breaker_is_open():
-            raise MCPExternalError(code="circuit_open", message="Circuit breaker is open")
+    async def list_tools(self, force_refresh: bool = False) -> List[Dict[str, Any]]:
+        """List available tools (served from the cached catalog)."""
+        catalog = await self.tool_catalog(force_refresh=force_refresh)
+        return list(catalog.tools)
+
+    async def tool_catalog(self, force_refresh: bool = False) -> ToolCatalog:
+        """Return the tool catalog, fetching it only when missing, expired or invalidated."""
+        version = getattr(self.external_client, "catalog_version", None) or (lambda: None)
+        return await self.catalog.get(self._fetch_tools, version, force_refresh=force_refresh)
+
+    async def _fetch_tools(self) -> List[Dict[str, Any]]:
+        """Fetch the tool list from the external MCP server."""
+        self._breaker_acquire()
         try:
             result = await self.request_handler.handle_list_tools()
-            self._breaker_record_success()
+            self.breaker.record_success()
             return result
         except MCPExternalError as e:
-            self._breaker_record_failure()
+            self.breaker.record_failure()
             # Non-blocking Slack alert
             try:
                 await slack_notify(
@@ -95,8 +106,11 @@ class MCPHandler:
             except Exception:
                 pass
             raise
+        except asyncio.CancelledError:
+            self.breaker.release()
+            raise
         except Exception as e:
-            self._breaker_record_failure()
+            self.breaker.record_failure()
             try:
                 await slack_notify(
                     template=self._select_template("error"),
@@ -112,14 +126,16 @@ class MCPHandler:
     
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Call a tool on external MCP server."""
-        if self._breaker_is_open():
-            raise MCPExternalError(code="circuit_open", message="Circuit breaker is open")
+        self._breaker_acquire()
         try:
             result = await self.request_handler.handle_tool_call(tool_name, arguments)
-            self._breaker_record_success()
+            self.breaker.record_success()
             return result
         except MCPExternalError as e:
-            self._breaker_record_failure()
+            self.breaker.record_failure()
+            if e.code == "not_found":
+                # The tool may have been removed; refetch the catalog on next lookup
+                self.catalog.invalidate()
             try:
                 await slack_notify(
                     template=self._select_template("error"),
@@ -129,8 +145,11 @@ class MCPHandler:
             except Exception:
                 pass
             raise
+        except asyncio.CancelledError:
+            self.breaker.release()
+            raise
         except Exception as e:
-            self._breaker_record_failure()
+            self.breaker.record_failure()
             try:
                 await slack_notify(
                     template=self._select_template("error"),
@@ -146,14 +165,15 @@ class MCPHandler:
     
     async def health_check(self) -> Dict[str, Any]:
         """Check health of external MCP server."""
-        if self._breaker_is_open():
-            raise MCPExternalError(code="circuit_open", message="Circuit breaker is open")
+        self._breaker_acquire()
         try:
             result = await self.request_handler.handle_health_check()
-            self._breaker_record_success()
+            self.breaker.record_success()
+            if isinstance(result, dict):
+                self.catalog.observe_version(result.get("tools_version"))
             return result
         except MCPExternalError as e:
-            self._breaker_record_failure()
+            self.breaker.record_failure()
             try:
                 await slack_notify(
                     template=self._select_template("health"),
@@ -163,8 +183,11 @@ class MCPHandler:
             except Exception:
                 pass
             raise
+        except asyncio.CancelledError:
+            self.breaker.release()
+            raise
         except Exception as e:
-            self._breaker_record_failure()
+            self.breaker.record_failure()
             try:
                 await slack_notify(
                     template=self._select_template("health"),
@@ -179,13 +202,9 @@ class MCPHandler:
             )
     
     async def get_tool_schema(self, tool_name: str) -> Optional[Dict[str, Any]]:
-        """Get schema for a specific tool."""
+        """Get schema for a specific tool (O(1) lookup in the cached catalog)."""
         try:
-            tools = await self.list_tools()
-            for tool in tools:
-                if tool.get("name") == tool_name:
-                    return tool.get("inputSchema", {})
-            return None
+            catalog = await self.tool_catalog()
         except Exception as e:
             try:
                 await slack_notify(f"[MCP][ERROR] get_tool_schema {tool_name} failed: code=internal msg={e}")
@@ -195,6 +214,7 @@ class MCPHandler:
                 code="internal",
                 message=f"Failed to get tool schema for {tool_name}: {e}"
             )
+        return catalog.schema(tool_name)
 
 
 class MCPHandlerPool:
@@ -215,10 +235,23 @@ class MCPHandlerPool:
         """List all handler names."""
         return list(self.handlers.keys())
     
-    async def initialize_all(self) -> None:
-        """Initialize all handlers."""
-        tasks = [handler.initialize() for handler in self.handlers.values()]
-        await asyncio.gather(*tasks, return_exceptions=True)
+    async def initialize_all(self) -> Dict[str, bool]:
+        """Initialize all handlers concurrently, each bounded by its init timeout."""
+        names = list(self.handlers)
+        results = await asyncio.gather(*(self._initialize_one(name, self.handlers[name]) for name in names))
+        return dict(zip(names, results))
+
+    async def _initialize_one(self, name: str, handler: MCPHandler) -> bool:
+        start = time.perf_counter()
+        outcome = "ok"
+        try:
+            await asyncio.wait_for(handler.initialize(), handler.config.init_timeout_sec)
+        except asyncio.TimeoutError:
+            outcome = "timeout"
+        except Exception:
+            outcome = "error"
+        MCP_PROVIDER_INIT_LATENCY.labels(provider=name, result=outcome).observe(time.perf_counter() - start)
+        return outcome == "ok"
     
     async def cleanup_all(self) -> None:
         """Cleanup all handlers."""
@@ -226,14 +259,29 @@ class MCPHandlerPool:
         await asyncio.gather(*tasks, return_exceptions=True)
     
     async def health_check_all(self) -> Dict[str, Dict[str, Any]]:
-        """Check health of all handlers."""
-        results = {}
-        for name, handler in self.handlers.items():
-            try:
-                results[name] = await handler.health_check()
-            except Exception as e:
-                results[name] = {
-                    "ok": False,
-                    "error": str(e)
-                }
-        return results
+        """Check health of all handlers concurrently with per-handler timeouts.
+
+        Total latency is bounded by the slowest handler's timeout instead of
+        the sum of all handlers' latencies.
+        """
+        names = list(self.handlers)
+        results = await asyncio.gather(*(self._health_check_one(name, self.handlers[name]) for name in names))
+        return dict(zip(names, results))
+
+    async def _health_check_one(self, name: str, handler: MCPHandler) -> Dict[str, Any]:
+        start = time.perf_counter()
+        timeout = handler.config.health_timeout_sec
+        outcome = "ok"
+        try:
+            result = await asyncio.wait_for(handler.health_check(), timeout)
+        except asyncio.TimeoutError:
+            outcome = "timeout"
+            # A hung probe counts as a failure for the circuit breaker
+            handler.breaker.record_failure()
+            MCP_EXTERNAL_HEALTH.labels(provider=name).set(0)
+            result = {"ok": False, "error": f"Health check timed out after {timeout}s"}
+        except Exception as e:
+            outcome = "error"
+            result = {"ok": False, "error": str(e)}
+        MCP_HEALTH_CHECK_LATENCY.labels(provider=name, result=outcome).observe(time.perf_counter() - start)
+        return result
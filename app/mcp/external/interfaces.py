@@ -42,5 +42,10 @@ class ExternalMCPClient(ABC):
     async def close(self) -> None:
         """Release resources and close connections if applicable."""
 
+    def catalog_version(self) -> str | None:
+        """Opaque version of the last tool listing (e.g. ETag), if the server provides one.
 
-
+        Used by handlers to invalidate cached tool catalogs; ``None`` means the
+        handler falls back to a content hash.
+        """
+        return None
@@ -28,4 +28,46 @@ MCP_EXTERNAL_HEALTH = Gauge(
     labelnames=("provider",),
 )
 
+MCP_TOOL_CATALOG_CACHE = Counter(
+    "mcp_tool_catalog_cache_total",
+    "Tool catalog cache lookups (hit, miss, coalesced, invalidated, stale_served)",
+    labelnames=("provider", "result"),
+)
+
+MCP_HEALTH_CHECK_LATENCY = Histogram(
+    "mcp_external_health_check_latency_seconds",
+    "Latency of per-provider health checks during fan-out",
+    labelnames=("provider", "result"),
+    buckets=(0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0, 10.0),
+)
+
+MCP_PROVIDER_INIT_LATENCY = Histogram(
+    "mcp_external_provider_init_latency_seconds",
+    "Latency of provider initialization during fan-out",
+    labelnames=("provider", "result"),
+    buckets=(0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0),
+)
+
+MCP_RETRY_BUDGET_EXHAUSTED = Counter(
+    "mcp_external_retry_budget_exhausted_total",
+    "Retries skipped because the provider's retry budget was exhausted",
+    labelnames=("provider",),
+)
 
+MCP_CONCURRENCY_LIMIT = Gauge(
+    "mcp_external_concurrency_limit",
+    "Current adaptive (AIMD) concurrency limit per provider",
+    labelnames=("provider",),
+)
+
+MCP_LIMITER_REJECTED = Counter(
+    "mcp_external_limiter_rejected_total",
+    "Calls rejected locally because the provider's concurrency limit was reached",
+    labelnames=("provider",),
+)
+
+MCP_BREAKER_STATE = Gauge(
+    "mcp_external_breaker_state",
+    "Circuit breaker state per provider (0=closed,1=half_open,2=open)",
+    labelnames=("provider",),
+)
@@ -12,6 +12,7 @@ from ..interfaces import ExternalMCPClient
 from ..errors import MCPExternalError
 from ..metrics import MCP_EXTERNAL_LATENCY, MCP_EXTERNAL_REQUESTS
 from ..retry import retry_async
+from ..resilience import get_provider_policy
 from ..metrics import MCP_EXTERNAL_ERRORS, MCP_EXTERNAL_HEALTH
 
 
@@ -40,6 +41,9 @@ class GitHubMCPClient(ExternalMCPClient):
         self._http_client: httpx.AsyncClient | None = http_client
         self._installation_token: str | None = None
         self._token_expires_at: float = 0
+        # Last tool listing and its ETag for conditional discovery requests
+        self._tools_etag: str | None = None
+        self._tools_cache: list[dict[str, Any]] | None = None
 
     async def connect(self) -> None:
         """Establish HTTP client and authenticate if needed."""
@@ -68,12 +72,17 @@ class GitHubMCPClient(ExternalMCPClient):
                 async def _run() -> list[dict[str, Any]]:
                     await self._ensure_connected()
                     
-                    # Call GitHub MCP discovery endpoint
-                    response = await self._make_request("GET", "/mcp/tools")
-                    tools_data = response.get("tools", [])
+                    # Call GitHub MCP discovery endpoint (conditional when we hold an ETag)
+                    headers = {}
+                    if self._tools_etag and self._tools_cache is not None:
+                        headers["If-None-Match"] = self._tools_etag
+                    response = await self._make_request("GET", "/mcp/tools", headers=headers, raw=True)
+                    if response.status_code == 304 and self._tools_cache is not None:
+                        return list(self._tools_cache)
+                    tools_data = (response.json() if response.content else {}).get("tools", [])
                     
                     # Normalize tool format
-                    return [
+                    tools = [
                         {
                             "name": tool.get("name", ""),
                             "description": tool.get("description", ""),
@@ -81,8 +90,11 @@ class GitHubMCPClient(ExternalMCPClient):
                         }
                         for tool in tools_data
                     ]
+                    self._tools_etag = response.headers.get("ETag")
+                    self._tools_cache = tools
+                    return list(tools)
 
-                result = await retry_async(_run)
+                result = await retry_async(_run, policy=get_provider_policy(provider))
                 MCP_EXTERNAL_REQUESTS.labels(provider, op, "ok").inc()
                 return result
             except MCPExternalError as e:
@@ -121,7 +133,7 @@ class GitHubMCPClient(ExternalMCPClient):
                         "content": response.get("content", response)
                     }
 
-                result = await retry_async(_run)
+                result = await retry_async(_run, policy=get_provider_policy(provider))
                 MCP_EXTERNAL_REQUESTS.labels(provider, op, "ok").inc()
                 return result
             except MCPExternalError as e:
@@ -155,7 +167,7 @@ class GitHubMCPClient(ExternalMCPClient):
                         "server_status": response.get("status", "unknown")
                     }
 
-                result = await retry_async(_run)
+                result = await retry_async(_run, policy=get_provider_policy(provider))
                 MCP_EXTERNAL_REQUESTS.labels(provider, op, "ok").inc()
                 MCP_EXTERNAL_HEALTH.labels(provider=provider).set(1)
                 return result
@@ -170,6 +182,10 @@ class GitHubMCPClient(ExternalMCPClient):
                 MCP_EXTERNAL_HEALTH.labels(provider=provider).set(0)
                 raise MCPExternalError(code="internal", message=str(e))
 
+    def catalog_version(self) -> str | None:
+        """ETag of the last /mcp/tools response."""
+        return self._tools_etag
+
     async def close(self) -> None:
         """Close HTTP client and clean up resources."""
         if self._http_client:
@@ -229,8 +245,12 @@ class GitHubMCPClient(ExternalMCPClient):
         # This is a placeholder - use proper JWT library in production
         return f"jwt.{base64.b64encode(json.dumps(header).encode()).decode()}.{base64.b64encode(json.dumps(payload).encode()).decode()}"
 
-    async def _make_request(self, method: str, path: str, **kwargs) -> dict[str, Any]:
-        """Make authenticated HTTP request to GitHub MCP server."""
+    async def _make_request(self, method: str, path: str, raw: bool = False, **kwargs) -> Any:
+        """Make authenticated HTTP request to GitHub MCP server.
+
+        Returns the decoded JSON body, or the ``httpx.Response`` itself when
+        ``raw`` is set (used for conditional requests that may return 304).
+        """
         if not self._http_client:
             raise MCPExternalError(code="internal", message="HTTP client not initialized")
         
@@ -272,6 +292,8 @@ class GitHubMCPClient(ExternalMCPClient):
                 MCP_EXTERNAL_ERRORS.labels(provider="github", operation=f"{method} {path}", code=code).inc()
                 raise MCPExternalError(code=code, message=error_message)
             
+            if raw:
+                return response
             return response.json() if response.content else {}
             
         except httpx.TimeoutException as e:
@@ -14,6 +14,7 @@ from ..errors import MCPExternalError
 from ..metrics import MCP_EXTERNAL_LATENCY, MCP_EXTERNAL_REQUESTS
 from ..metrics import MCP_EXTERNAL_ERRORS, MCP_EXTERNAL_HEALTH
 from ..retry import retry_async
+from ..resilience import get_provider_policy
 from ....services.notification import get_slack_notification_service
 from ....models.slack_events import SlackEventType
 
@@ -317,7 +318,7 @@ class SlackMCPClient(ExternalMCPClient):
                 
                 return data
 
-        return await retry_async(_request, attempts=3, base_delay=1.0)
+        return await retry_async(_request, attempts=3, base_delay=1.0, policy=get_provider_policy("slack"))
 
     async def _send_message(
         self, 
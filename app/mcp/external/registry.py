@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from typing import Any, Dict, List, Optional, Type
 from dataclasses import dataclass
 
@@ -9,6 +10,7 @@ from .handlers import MCPHandler, MCPHandlerPool, MCPHandlerConfig
 from .providers.github import GitHubMCPClient
 from .providers.slack import SlackMCPClient
 from .errors import MCPExternalError
+from .metrics import MCP_PROVIDER_INIT_LATENCY
 
 
 @dataclass
@@ -33,6 +35,7 @@ class MCPProviderRegistry:
     def __init__(self):
         self.configs: Dict[str, MCPProviderConfig] = {}
         self.handler_pool = MCPHandlerPool()
+        self.init_timeout_sec = MCPHandlerConfig().init_timeout_sec
     
     def register_provider(self, provider_type: str, client_class: Type[ExternalMCPClient]) -> None:
         """Register a new provider type."""
@@ -70,7 +73,7 @@ class MCPProviderRegistry:
         )
         
         # Create handler
-        handler = MCPHandler(external_client)
+        handler = MCPHandler(external_client, name=name)
         
         # Add to pool
         self.handler_pool.add_handler(name, handler)
@@ -92,14 +95,25 @@ class MCPProviderRegistry:
             )
     
     async def initialize_all_providers(self) -> Dict[str, bool]:
-        """Initialize all enabled providers."""
-        results = {}
-        for name in self.list_providers():
-            try:
-                results[name] = await self.initialize_provider(name)
-            except Exception as e:
-                results[name] = False
-        return results
+        """Initialize all enabled providers concurrently with a per-provider timeout."""
+        names = self.list_providers()
+        results = await asyncio.gather(*(self._initialize_with_timeout(name) for name in names))
+        return dict(zip(names, results))
+
+    async def _initialize_with_timeout(self, name: str) -> bool:
+        start = time.perf_counter()
+        ok = False
+        outcome = "ok"
+        try:
+            ok = await asyncio.wait_for(self.initialize_provider(name), self.init_timeout_sec)
+            if not ok:
+                outcome = "skipped"
+        except asyncio.TimeoutError:
+            outcome = "timeout"
+        except Exception:
+            outcome = "error"
+        MCP_PROVIDER_INIT_LATENCY.labels(provider=name, result=outcome).observe(time.perf_counter() - start)
+        return ok
     
     async def cleanup_all_providers(self) -> None:
         """Cleanup all providers."""
@@ -120,7 +134,7 @@ class MCPProviderRegistry:
         
         return await handler.call_tool(tool_name, arguments)
     
-    async def list_tools(self, provider_name: str) -> List[Dict[str, Any]]:
+    async def list_tools(self, provider_name: str, force_refresh: bool = False) -> List[Dict[str, Any]]:
         """List tools for a specific provider."""
         handler = self.get_handler(provider_name)
         if not handler:
@@ -129,7 +143,7 @@ class MCPProviderRegistry:
                 message=f"Provider {provider_name} not found"
             )
         
-        return await handler.list_tools()
+        return await handler.list_tools(force_refresh=force_refresh)
     
     async def health_check(self, provider_name: str) -> Dict[str, Any]:
         """Check health of a specific provider."""
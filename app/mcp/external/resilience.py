@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Deque, Dict, List, Optional
+
+from ...core.circuit_breaker import CLOSED, HALF_OPEN, OPEN
+from ...core.circuit_breaker import CircuitBreaker as _BaseCircuitBreaker
+from .errors import MCPExternalError
+from .metrics import (
+    MCP_BREAKER_STATE,
+    MCP_CONCURRENCY_LIMIT,
+    MCP_LIMITER_REJECTED,
+    MCP_RETRY_BUDGET_EXHAUSTED,
+)
+
+_STATE_VALUE = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+# Error codes that mean "the provider is overloaded": shrink the concurrency limit
+OVERLOAD_CODES = frozenset({"rate_limited", "timeout", "unavailable"})
+
+
+@dataclass
+class ProviderPolicyConfig:
+    """Per-provider retry budget and concurrency limiter settings."""
+    retry_budget_ratio: float = 0.1
+    retry_budget_min_per_sec: float = 1.0
+    retry_budget_window_sec: float = 10.0
+    initial_limit: int = 10
+    min_limit: int = 1
+    max_limit: int = 64
+    backoff_ratio: float = 0.5
+    queue_timeout_sec: float = 1.0
+
+
+class RetryBudget:
+    """Caps retries to a fraction of requests over a sliding window.
+
+    Retries are allowed while ``retries < ratio * requests + min_per_sec * window``
+    within the last ``window`` seconds, so a degraded provider sees at most
+    ~``1 + ratio`` attempts per logical request instead of ``attempts`` each.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        min_per_sec: float = 1.0,
+        window: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ratio = ratio
+        self.min_per_sec = min_per_sec
+        self.window = window
+        self._clock = clock
+        # (second, requests, retries) buckets
+        self._buckets: Deque[List[float]] = deque()
+        self._requests = 0
+        self._retries = 0
+
+    def _bucket(self) -> List[float]:
+        now = int(self._clock())
+        while self._buckets and self._buckets[0][0] <= now - self.window:
+            _, requests, retries = self._buckets.popleft()
+            self._requests -= requests
+            self._retries -= retries
+        if not self._buckets or self._buckets[-1][0] != now:
+            self._buckets.append([now, 0, 0])
+        return self._buckets[-1]
+
+    def record_request(self) -> None:
+        self._bucket()[1] += 1
+        self._requests += 1
+
+    def try_retry(self) -> bool:
+        bucket = self._bucket()
+        allowed = self.ratio * self._requests + self.min_per_sec * self.window
+        if self._retries + 1 > allowed:
+            return False
+        bucket[2] += 1
+        self._retries += 1
+        return True
+
+    def stats(self) -> Dict[str, float]:
+        self._bucket()
+        return {"requests": self._requests, "retries": self._retries}
+
+
+class AIMDLimiter:
+    """Adaptive concurrency limit (additive increase, multiplicative decrease).
+
+    Each success while the limit is saturated adds ``1/limit`` (≈ +1 per
+    round of requests); each overload signal multiplies the limit by
+    ``backoff_ratio``. Callers beyond the limit wait up to ``queue_timeout``
+    and are then rejected locally instead of adding load to the provider.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff_ratio: float = 0.5,
+        queue_timeout: float = 1.0,
+    ) -> None:
+        self.name = name
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.queue_timeout = queue_timeout
+        self.inflight = 0
+        self._cond: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        MCP_CONCURRENCY_LIMIT.labels(provider=name).set(self.limit)
+
+    def _condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._cond = asyncio.Condition()
+            self.inflight = 0
+        return self._cond
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        cond = self._condition()
+        async with cond:
+            try:
+                await asyncio.wait_for(
+                    cond.wait_for(lambda: self.inflight < int(self.limit)), self.queue_timeout
+                )
+            except asyncio.TimeoutError:
+                MCP_LIMITER_REJECTED.labels(provider=self.name).inc()
+                raise MCPExternalError(
+                    code="overloaded",
+                    message=f"{self.name}: concurrency limit {int(self.limit)} reached",
+                )
+            self.inflight += 1
+        saturated = self.inflight >= int(self.limit)
+        try:
+            yield
+        except MCPExternalError as e:
+            if e.code in OVERLOAD_CODES:
+                self._decrease()
+            raise
+        except asyncio.TimeoutError:
+            self._decrease()
+            raise
+        else:
+            if saturated:
+                self._increase()
+        finally:
+            async with cond:
+                self.inflight -= 1
+                cond.notify_all()
+
+    def _increase(self) -> None:
+        self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+        MCP_CONCURRENCY_LIMIT.labels(provider=self.name).set(self.limit)
+
+    def _decrease(self) -> None:
+        self.limit = max(float(self.min_limit), self.limit * self.backoff_ratio)
+        MCP_CONCURRENCY_LIMIT.labels(provider=self.name).set(self.limit)
+
+
+class ProviderPolicy:
+    """Retry budget + concurrency limiter shared by all calls to one provider."""
+
+    def __init__(self, name: str, config: Optional[ProviderPolicyConfig] = None) -> None:
+        config = config or ProviderPolicyConfig()
+        self.name = name
+        self.budget = RetryBudget(
+            ratio=config.retry_budget_ratio,
+            min_per_sec=config.retry_budget_min_per_sec,
+            window=config.retry_budget_window_sec,
+        )
+        self.limiter = AIMDLimiter(
+            name,
+            initial=config.initial_limit,
+            min_limit=config.min_limit,
+            max_limit=config.max_limit,
+            backoff_ratio=config.backoff_ratio,
+            queue_timeout=config.queue_timeout_sec,
+        )
+
+    def allow_retry(self) -> bool:
+        if self.budget.try_retry():
+            return True
+        MCP_RETRY_BUDGET_EXHAUSTED.labels(provider=self.name).inc()
+        return False
+
+
+_policies: Dict[str, ProviderPolicy] = {}
+
+
+def get_provider_policy(name: str) -> ProviderPolicy:
+    """Process-wide policy per provider name."""
+    policy = _policies.get(name)
+    if policy is None:
+        policy = _policies[name] = ProviderPolicy(name)
+    return policy
+
+
+class CircuitBreaker(_BaseCircuitBreaker):
+    """closed → open → half_open state machine for one provider.
+
+    The state machine lives in ``app.core.circuit_breaker`` (shared with the
+    LLM router); this subclass only exports the state as a gauge.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(name, failure_threshold=failure_threshold, reset_timeout=reset_timeout, clock=clock)
+        MCP_BREAKER_STATE.labels(provider=name).set(_STATE_VALUE[CLOSED])
+
+    def _on_state_change(self, state: str) -> None:
+        MCP_BREAKER_STATE.labels(provider=self.name).set(_STATE_VALUE[state])
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import random
-from typing import Any, Awaitable, Callable, Iterable
+from typing import Any, Awaitable, Callable, Iterable, Optional
 
 from .errors import MCPExternalError
+from .resilience import ProviderPolicy
 
 
 def _is_retryable(exc: BaseException) -> bool:
@@ -20,20 +21,30 @@ async def retry_async(
     base_delay: float = 0.2,
     max_delay: float = 5.0,
     jitter: float = 0.2,
+    policy: Optional[ProviderPolicy] = None,
 ) -> Any:
     """Exponential backoff with jitter for retryable errors.
 
     - attempts includes the first try
     - jitter is a fraction of delay (+/-)
+    - with a provider ``policy``, every attempt goes through the provider's
+      concurrency limiter and retries stop once its retry budget is spent
     """
+    if policy is not None:
+        policy.budget.record_request()
     attempt = 0
     while True:
         try:
-            return await op()
+            if policy is None:
+                return await op()
+            async with policy.limiter.acquire():
+                return await op()
         except BaseException as exc:  # noqa: BLE001 - deliberate to centralize policy
             attempt += 1
             if attempt >= attempts or not _is_retryable(exc):
                 raise
+            if policy is not None and not policy.allow_retry():
+                raise
 
             # Compute delay
             delay = min(base_delay * (2 ** (attempt - 1)), max_delay)
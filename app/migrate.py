@@ -0,0 +1,40 @@
+"""
+일회성 DB 마이그레이션 단계
+
+테이블 생성(create_all)과 컬럼 보정 마이그레이션은 replica마다 기동 경로에서 실행할 필요가 없으므로
+배포 시 한 번만 실행합니다 (Helm pre-upgrade Job 또는 initContainer).
+컨테이너 이미지는 별도 단계가 없는 배포도 고려해 uvicorn 실행 전에 이 단계를 거칩니다 (멱등).
+
+    python -m app.migrate
+
+앱 기동 시에는 check_schema()로 누락 테이블/컬럼만 확인하며, 누락이 있으면 readiness가 실패합니다.
+로컬 개발처럼 별도 단계를 두기 어려운 환경은 KLEPAAS_DB_MIGRATE_ON_STARTUP=true로 기존처럼 기동 시 실행합니다.
+"""
+
+import sys
+import time
+
+import structlog
+
+from .database import DATABASE_URL, check_schema, init_database
+
+logger = structlog.get_logger(__name__)
+
+
+def main() -> int:
+    start = time.perf_counter()
+    try:
+        init_database()
+        missing = check_schema()
+    except Exception as e:
+        logger.error("db_migration_failed", error=str(e), database_url=DATABASE_URL.split("@")[-1])
+        return 1
+    if missing:
+        logger.error("db_migration_incomplete", missing=missing)
+        return 1
+    logger.info("db_migration_completed", duration_ms=round((time.perf_counter() - start) * 1000, 1))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
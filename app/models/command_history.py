@@ -2,7 +2,7 @@
 
 from datetime import datetime, timezone, timedelta
 from typing import Optional, Dict, Any
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Index
 from pydantic import BaseModel
 from .base import Base
 
@@ -29,6 +29,11 @@ class CommandHistory(Base):
     created_at = Column(DateTime, default=get_kst_now)
     updated_at = Column(DateTime, default=get_kst_now, onupdate=get_kst_now)
 
+    __table_args__ = (
+        # 사용자별 최신순 키셋 페이지네이션용
+        Index('idx_command_history_user_created', 'user_id', 'created_at', 'id'),
+    )
+
 
 class CommandHistoryCreate(BaseModel):
     """명령어 히스토리 생성 모델"""
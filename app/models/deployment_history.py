@@ -6,7 +6,8 @@ GitHub Push 이벤트부터 SourceCommit, SourceBuild, SourceDeploy까지의
 전체 배포 과정을 추적하고 실시간 진행률 표시에 사용됩니다.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Index
+from sqlalchemy.orm import deferred, load_only
 from sqlalchemy.sql import func
 from datetime import datetime, timezone, timedelta
 from typing import Optional, List
@@ -126,11 +127,11 @@ class DeploymentHistory(Base):
     sourcedeploy_duration = Column(Integer, nullable=True)  # SourceDeploy 소요 시간
     
     # 에러 정보
-    error_message = Column(Text, nullable=True)
+    error_message = deferred(Column(Text, nullable=True))  # 스택 트레이스 등 큰 텍스트 (접근 시에만 로드)
     error_stage = Column(String(50), nullable=True)  # 어느 단계에서 에러 발생
     
     # 메타데이터
-    webhook_payload = Column(Text, nullable=True)  # 원본 웹훅 페이로드 (디버깅용)
+    webhook_payload = deferred(Column(Text, nullable=True))  # 원본 웹훅 페이로드 (디버깅용, 접근 시에만 로드)
     auto_deploy_enabled = Column(Boolean, default=True)
 
     # 롤백 정보
@@ -140,6 +141,32 @@ class DeploymentHistory(Base):
     # 작업 유형 구분
     operation_type = Column(String(50), nullable=True, default="deploy")  # deploy, rollback, scale
 
+    __table_args__ = (
+        # 목록 조회의 키셋 페이지네이션용 (사용자별, 작업 유형별 started_at/id 내림차순)
+        Index('idx_deployment_histories_user_op_started', 'user_id', 'operation_type', 'started_at', 'id'),
+    )
+
+    # to_dict() 최상위 필드 → 필요한 컬럼 (목록 조회 시 load_only 프로젝션에 사용)
+    FIELD_COLUMNS = {
+        "id": ("id",),
+        "user_id": ("user_id",),
+        "repository": ("github_owner", "github_repo"),
+        "commit": ("github_commit_sha", "github_commit_message", "github_commit_author", "github_commit_url"),
+        "status": ("status",),
+        "stages": (
+            "sourcecommit_status", "sourcecommit_duration",
+            "sourcebuild_status", "sourcebuild_duration",
+            "sourcedeploy_status", "sourcedeploy_duration",
+        ),
+        "image": ("image_name", "image_tag", "image_url"),
+        "cluster": ("cluster_id", "cluster_name", "namespace"),
+        "timing": ("started_at", "completed_at", "total_duration"),
+        "error": ("error_message", "error_stage"),
+        "auto_deploy_enabled": ("auto_deploy_enabled",),
+        "created_at": ("created_at",),
+        "updated_at": ("updated_at",),
+    }
+
     def __repr__(self):
         return f"<DeploymentHistory(id={self.id}, user_id={self.user_id}, repo={self.github_owner}/{self.github_repo}, status={self.status})>"
     
@@ -224,54 +251,69 @@ class DeploymentHistory(Base):
         }
         return stage_mapping.get(stage_name.lower())
     
-    def to_dict(self):
-        """딕셔너리로 변환 (API 응답용)"""
-        return {
-            "id": self.id,
-            "user_id": self.user_id,
-            "repository": self.repository_name,
-            "commit": {
+    @classmethod
+    def list_load_options(cls, fields=None):
+        """
+        목록 조회용 컬럼 프로젝션을 반환합니다.
+
+        선택한 필드에 필요한 컬럼과 커서 키(started_at, id)만 로드합니다.
+        webhook_payload는 어떤 필드에도 포함되지 않으므로 항상 제외되고, error_message는
+        error 필드를 선택했을 때만 로드됩니다.
+        """
+        names = {"id", "started_at"}
+        for field in (fields or cls.FIELD_COLUMNS.keys()):
+            names.update(cls.FIELD_COLUMNS[field])
+        return load_only(*[getattr(cls, name) for name in sorted(names)])
+
+    def to_dict(self, fields=None):
+        """
+        딕셔너리로 변환 (API 응답용)
+
+        fields를 지정하면 해당 최상위 필드만 직렬화합니다. 선택하지 않은 필드의
+        컬럼에는 접근하지 않으므로 load_only로 조회한 행에서 추가 쿼리가 발생하지 않습니다.
+        """
+        return {field: self._serialize_field(field) for field in (fields or self.FIELD_COLUMNS)}
+
+    def _serialize_field(self, field):
+        """최상위 필드 하나를 직렬화합니다."""
+        if field == "id":
+            return self.id
+        if field == "user_id":
+            return self.user_id
+        if field == "repository":
+            return self.repository_name
+        if field == "commit":
+            return {
                 "sha": self.github_commit_sha,
                 "short_sha": self.short_commit_sha,
                 "message": self.github_commit_message,
                 "author": self.github_commit_author,
                 "url": self.github_commit_url
-            },
-            "status": self.status,
-            "stages": {
-                "sourcecommit": {
-                    "status": self.sourcecommit_status,
-                    "duration": self.sourcecommit_duration
-                },
-                "sourcebuild": {
-                    "status": self.sourcebuild_status,
-                    "duration": self.sourcebuild_duration
-                },
-                "sourcedeploy": {
-                    "status": self.sourcedeploy_status,
-                    "duration": self.sourcedeploy_duration
-                }
-            },
-            "image": {
-                "name": self.image_name,
-                "tag": self.image_tag,
-                "url": self.image_url
-            },
-            "cluster": {
-                "id": self.cluster_id,
-                "name": self.cluster_name,
-                "namespace": self.namespace
-            },
-            "timing": {
+            }
+        if field == "status":
+            return self.status
+        if field == "stages":
+            return {
+                "sourcecommit": {"status": self.sourcecommit_status, "duration": self.sourcecommit_duration},
+                "sourcebuild": {"status": self.sourcebuild_status, "duration": self.sourcebuild_duration},
+                "sourcedeploy": {"status": self.sourcedeploy_status, "duration": self.sourcedeploy_duration}
+            }
+        if field == "image":
+            return {"name": self.image_name, "tag": self.image_tag, "url": self.image_url}
+        if field == "cluster":
+            return {"id": self.cluster_id, "name": self.cluster_name, "namespace": self.namespace}
+        if field == "timing":
+            return {
                 "started_at": self.started_at.isoformat() if self.started_at else None,
                 "completed_at": self.completed_at.isoformat() if self.completed_at else None,
                 "total_duration": self.total_duration
-            },
-            "error": {
-                "message": self.error_message,
-                "stage": self.error_stage
-            } if self.error_message else None,
-            "auto_deploy_enabled": self.auto_deploy_enabled,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
-        }
\ No newline at end of file
+            }
+        if field == "error":
+            return {"message": self.error_message, "stage": self.error_stage} if self.error_message else None
+        if field == "auto_deploy_enabled":
+            return self.auto_deploy_enabled
+        if field == "created_at":
+            return self.created_at.isoformat() if self.created_at else None
+        if field == "updated_at":
+            return self.updated_at.isoformat() if self.updated_at else None
+        raise KeyError(field)
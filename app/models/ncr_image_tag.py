@@ -0,0 +1,33 @@
+"""
+NCR 이미지 태그 인덱스 모델
+
+레지스트리에 존재하는 이미지 태그를 저장소(이미지 이름)별로 보관하여
+롤백 후보 조회 시 레지스트리 호출 없이 이미지 존재 여부를 판단할 수 있게 합니다.
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, UniqueConstraint
+from .base import Base
+from .deployment_history import get_kst_now
+
+
+class NcrImageTag(Base):
+    """NCR 이미지 태그 (이미지 이름 + 태그 기준 중복 없음)"""
+
+    __tablename__ = "ncr_image_tags"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # 레지스트리 호스트를 뺀 이미지 경로 (예: myorg-myrepo)
+    image_name = Column(String(255), nullable=False, index=True)
+    tag = Column(String(128), nullable=False)
+
+    # 출처: registry (주기 색인), build (빌드 성공 시 기록)
+    source = Column(String(20), nullable=False, default="registry")
+    indexed_at = Column(DateTime, default=get_kst_now, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint('image_name', 'tag', name='uq_ncr_image_tags_image_tag'),
+    )
+
+    def __repr__(self):
+        return f"<NcrImageTag(image={self.image_name}, tag={self.tag}, source={self.source})>"
@@ -0,0 +1,51 @@
+"""
+GitHub 웹훅 인박스 모델
+
+수신한 웹훅 이벤트를 처리 전에 영속화하여 재시작/중복 전송에도
+정확히 한 번 처리되도록 보장하는 모델입니다.
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
+from .base import Base
+from .deployment_history import get_kst_now
+
+
+class WebhookInbox(Base):
+    """GitHub 웹훅 수신함 (X-GitHub-Delivery 기준 중복 제거)"""
+
+    __tablename__ = "webhook_inbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # GitHub가 재전송 시에도 동일하게 유지하는 전송 ID
+    delivery_id = Column(String(255), nullable=False, unique=True, index=True)
+    event_type = Column(String(100), nullable=False)
+
+    # 라우팅 정보
+    installation_id = Column(String(255), nullable=True)
+    repository = Column(String(512), nullable=True)  # owner/repo
+    integration_id = Column(Integer, nullable=True)
+
+    # 원본 페이로드 (JSON 문자열)
+    payload = Column(Text, nullable=False)
+
+    # 처리 상태: pending, processing, done, failed
+    status = Column(String(50), nullable=False, default="pending", index=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    error_message = Column(Text, nullable=True)
+
+    # processing 점유 만료 시각: 처리 중 레플리카가 죽으면 만료 후 다른 레플리카가 재점유
+    lease_expires_at = Column(DateTime, nullable=True)
+
+    received_at = Column(DateTime, default=get_kst_now, nullable=False)
+    processed_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index('idx_webhook_inbox_status_received', 'status', 'received_at'),
+    )
+
+    def __repr__(self):
+        return (
+            f"<WebhookInbox(id={self.id}, delivery_id={self.delivery_id}, "
+            f"event={self.event_type}, status={self.status})>"
+        )
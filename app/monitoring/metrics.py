@@ -19,6 +19,34 @@ http_request_duration_seconds = Histogram(
     ['method', 'endpoint']
 )
 
+http_requests_in_progress = Gauge(
+    'http_requests_in_progress',
+    'HTTP requests currently being processed',
+    ['method']
+)
+
+_SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+http_request_size_bytes = Histogram(
+    'http_request_size_bytes',
+    'HTTP request body size in bytes (Content-Length)',
+    ['method', 'endpoint'],
+    buckets=_SIZE_BUCKETS
+)
+
+http_response_size_bytes = Histogram(
+    'http_response_size_bytes',
+    'HTTP response body size in bytes',
+    ['method', 'endpoint'],
+    buckets=_SIZE_BUCKETS
+)
+
+event_loop_lag_seconds = Histogram(
+    'event_loop_lag_seconds',
+    'Delay between scheduled and actual wake-up of the event loop lag probe',
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+
 # 애플리케이션 메트릭
 active_connections = Gauge(
     'active_connections',
@@ -93,14 +121,132 @@ llm_request_duration_seconds = Histogram(
     ['provider', 'model']
 )
 
+llm_router_events_total = Counter(
+    'llm_router_events_total',
+    'LLM router hedge/failover/circuit breaker events',
+    ['provider', 'event']
+)
+
+# GitHub API 메트릭
+github_api_requests_total = Counter(
+    'github_api_requests_total',
+    'Total GitHub REST API lookups by cache result',
+    ['endpoint', 'result']
+)
+
+github_api_request_duration_seconds = Histogram(
+    'github_api_request_duration_seconds',
+    'GitHub REST API upstream request duration in seconds',
+    ['endpoint']
+)
+
+github_api_rate_limit_remaining = Gauge(
+    'github_api_rate_limit_remaining',
+    'Last observed X-RateLimit-Remaining per GitHub credential',
+    ['resource']
+)
+
+# Prometheus 조회 메트릭 (공유 클라이언트)
+prometheus_queries_total = Counter(
+    'prometheus_queries_total',
+    'Prometheus API lookups by cache result',
+    ['kind', 'result']
+)
+
+prometheus_request_duration_seconds = Histogram(
+    'prometheus_request_duration_seconds',
+    'Prometheus upstream request duration in seconds',
+    ['kind']
+)
+
+# 알림 규칙 평가 메트릭
+alert_rule_evaluation_seconds = Histogram(
+    'alert_rule_evaluation_seconds',
+    'Duration of one background alert rule evaluation cycle',
+    ['cluster']
+)
+
+alert_rule_transitions_total = Counter(
+    'alert_rule_transitions_total',
+    'Alert state transitions persisted by the rule engine',
+    ['cluster', 'transition']
+)
+
+alerts_firing = Gauge(
+    'alerts_firing',
+    'Alerts currently firing in the rule engine state',
+    ['cluster']
+)
+
+# Slack 발신 큐 메트릭
+slack_delivery_latency_seconds = Histogram(
+    'slack_delivery_latency_seconds',
+    'Time from enqueue to successful Slack delivery in seconds',
+    buckets=(0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60, 120)
+)
+
+slack_messages_total = Counter(
+    'slack_messages_total',
+    'Slack queue outcomes (sent, edited, coalesced, retried)',
+    ['result']
+)
+
+slack_messages_dropped_total = Counter(
+    'slack_messages_dropped_total',
+    'Slack messages dropped without delivery',
+    ['reason']
+)
+
+slack_queue_depth = Gauge(
+    'slack_queue_depth',
+    'Slack messages waiting in the delivery queue'
+)
+
+# NCR 이미지 태그 인덱스 메트릭
+ncr_tag_index_lookups_total = Counter(
+    'ncr_tag_index_lookups_total',
+    'NCR image tag index lookups (hit, miss, unknown, confirmed, missing_cached)',
+    ['result']
+)
+
+ncr_tag_index_refresh_total = Counter(
+    'ncr_tag_index_refresh_total',
+    'NCR repository tag listings by outcome',
+    ['result']
+)
+
+# Kubernetes WATCH 멀티플렉서 메트릭
+k8s_watch_upstreams = Gauge(
+    'k8s_watch_upstreams',
+    'Upstream Kubernetes watches shared by WebSocket subscribers'
+)
+
+k8s_watch_subscribers = Gauge(
+    'k8s_watch_subscribers',
+    'WebSocket subscriptions attached to Kubernetes watches'
+)
+
+k8s_watch_events_total = Counter(
+    'k8s_watch_events_total',
+    'Kubernetes watch deltas broadcast to subscribers (suppressed = no visible change)',
+    ['kind', 'type']
+)
+
+k8s_watch_resyncs_total = Counter(
+    'k8s_watch_resyncs_total',
+    'Kubernetes watch resyncs (expired = relist after 410, overflow = slow subscriber snapshot)',
+    ['reason']
+)
+
 def track_http_request(func: Callable) -> Callable:
     """HTTP 요청 메트릭을 추적하는 데코레이터"""
     async def wrapper(request: Request, *args, **kwargs):
         start_time = time.time()
         
-        # 요청 정보 추출
+        # 요청 정보 추출 (경로 대신 라우트 템플릿으로 라벨 카디널리티 제한)
         method = request.method
-        endpoint = request.url.path
+        route = request.scope.get("route")
+        endpoint = getattr(route, "path", None) or "<unmatched>"
         
         try:
             response = await func(request, *args, **kwargs)
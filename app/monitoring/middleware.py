@@ -0,0 +1,154 @@
+"""
+HTTP 메트릭 ASGI 미들웨어
+
+BaseHTTPMiddleware는 요청마다 태스크/스트림을 추가로 만들기 때문에 순수 ASGI 미들웨어로 구현합니다.
+
+- endpoint 라벨은 실제 경로가 아니라 매칭된 라우트 템플릿(`/api/v1/deployment-histories/{history_id}`)
+  → ID가 들어간 경로로 라벨 카디널리티가 늘어나지 않음. 매칭 실패는 "<unmatched>"
+- 진행 중 요청 수, 요청 크기(Content-Length)/응답 본문 크기, 이벤트 루프 지연(lag)을 함께 기록
+- 라벨 조합별 child 메트릭을 캐시해 요청당 `.labels()` 조회 비용을 없앰
+  (요청당 오버헤드는 tests/test_metrics_middleware.py 벤치마크가 OVERHEAD_BUDGET_US 이하로 유지)
+- add_middleware로 등록한 미들웨어 중 가장 바깥이지만 Starlette의 ServerErrorMiddleware가 이 바깥을
+  감싸므로, 처리되지 않은 예외는 응답 시작 전에 빠져나오며 상태 코드 500으로 기록
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from .metrics import (
+    event_loop_lag_seconds,
+    http_request_duration_seconds,
+    http_request_size_bytes,
+    http_requests_in_progress,
+    http_requests_total,
+    http_response_size_bytes,
+)
+
+# 요청당 미들웨어 오버헤드 상한 (마이크로초, 벤치마크 기준)
+OVERHEAD_BUDGET_US = 40.0
+UNMATCHED = "<unmatched>"
+
+
+class EventLoopLagMonitor:
+    """interval마다 sleep이 예정보다 얼마나 늦게 깨어나는지로 이벤트 루프 지연을 측정합니다."""
+
+    def __init__(self, interval: float = 0.5) -> None:
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._task is not None and not self._task.done():
+            return
+        self._loop = loop
+        self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            event_loop_lag_seconds.observe(max(0.0, loop.time() - scheduled))
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+class PrometheusMiddleware:
+    """라우트 템플릿 라벨로 HTTP 메트릭을 기록하는 순수 ASGI 미들웨어"""
+
+    def __init__(self, app: Any, lag_interval: float = 0.5) -> None:
+        self.app = app
+        self.lag_monitor = EventLoopLagMonitor(lag_interval) if lag_interval > 0 else None
+        self._in_progress: Dict[str, Any] = {}
+        self._children: Dict[Tuple[str, str, str], Tuple[Any, Any, Any, Any]] = {}
+
+    def _metrics(self, method: str, endpoint: str, status_code: str) -> Tuple[Any, Any, Any, Any]:
+        key = (method, endpoint, status_code)
+        children = self._children.get(key)
+        if children is None:
+            children = (
+                http_requests_total.labels(method=method, endpoint=endpoint, status_code=status_code),
+                http_request_duration_seconds.labels(method=method, endpoint=endpoint),
+                http_request_size_bytes.labels(method=method, endpoint=endpoint),
+                http_response_size_bytes.labels(method=method, endpoint=endpoint),
+            )
+            self._children[key] = children
+        return children
+
+    @staticmethod
+    def _endpoint(scope: Dict[str, Any], root_path: str) -> str:
+        route = scope.get("route")
+        if route is not None:
+            return getattr(route, "path_format", None) or getattr(route, "path", UNMATCHED)
+        mounted = scope.get("root_path", "")
+        if mounted != root_path:
+            # Mount된 하위 앱(/mcp/stream 등)은 마운트 경로 단위로 집계
+            return f"{mounted}/*"
+        return UNMATCHED
+
+    async def _lifespan(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        """lifespan 동안만 이벤트 루프 지연 측정 태스크를 실행합니다."""
+
+        async def receive_wrapper() -> Dict[str, Any]:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self.lag_monitor.ensure_started()
+            elif message["type"] == "lifespan.shutdown":
+                self.lag_monitor.stop()
+            return message
+
+        try:
+            await self.app(scope, receive_wrapper, send)
+        finally:
+            self.lag_monitor.stop()
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            if scope["type"] == "lifespan" and self.lag_monitor is not None:
+                await self._lifespan(scope, receive, send)
+            else:
+                await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        root_path = scope.get("root_path", "")
+        request_size = 0
+        for name, value in scope.get("headers", ()):
+            if name == b"content-length":
+                request_size = int(value) if value.isdigit() else 0
+                break
+
+        in_progress = self._in_progress.get(method)
+        if in_progress is None:
+            in_progress = self._in_progress[method] = http_requests_in_progress.labels(method=method)
+
+        status_code = 500
+        response_size = 0
+
+        async def send_wrapper(message: Dict[str, Any]) -> None:
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            in_progress.dec()
+            requests, durations, request_sizes, response_sizes = self._metrics(
+                method, self._endpoint(scope, root_path), str(status_code)
+            )
+            requests.inc()
+            durations.observe(duration)
+            request_sizes.observe(request_size)
+            response_sizes.observe(response_size)
@@ -0,0 +1,464 @@
+"""
+알림 규칙 백그라운드 평가 엔진
+
+`/monitoring/alerts` 요청마다 PromQL 11개를 실행하고 알림마다 SELECT/flush 하던 방식을
+클러스터별 주기 평가로 바꿉니다.
+
+- 규칙은 선언형(AlertRule)으로 정의: 규칙을 추가해도 요청 경로 비용은 늘지 않음
+- 평가 주기마다 규칙 쿼리를 한 번씩 실행하고 firing/resolved 상태를 메모리에 유지
+- 상태가 바뀐 알림(새로 firing, 심각도 변경, resolved)만 한 번의 조회 + 커밋으로 DB에 일괄 반영
+- GET은 메모리 상태를 그대로 반환 (첫 평가가 끝나기 전이면 첫 평가만 기다림)
+- 쿼리가 실패한 규칙의 알림은 상태를 알 수 없으므로 resolved로 바꾸지 않음
+- 알림 ID와 labels에 클러스터를 포함하고, 엔진은 자기 클러스터의 규칙 알림만 읽고 resolve 함
+- 상태를 유지하는 엔진은 설정된 클러스터(alert_eval_clusters)에만 만들고, 요청으로 들어온
+  그 밖의 이름은 슬롯을 차지하지 않는 일회성 엔진으로 처리 (라벨 값으로 안전하지 않은 이름은 거부)
+"""
+
+import asyncio
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import structlog
+from sqlalchemy import and_, desc, not_, or_
+
+from ..core.config import get_settings
+from ..database import SessionLocal
+from ..models.notification import Notification, get_kst_now
+from ..monitoring.metrics import alert_rule_evaluation_seconds, alert_rule_transitions_total, alerts_firing
+from .monitoring import PromQuery, query_prometheus
+
+logger = structlog.get_logger(__name__)
+
+PromQueryFn = Callable[[PromQuery], Awaitable[Dict[str, Any]]]
+
+# GET 응답에 포함하는 최대 알림 수 (기존 DB 조회 limit과 동일)
+MAX_ALERTS = 200
+HIGH_BPS = 50 * 1024 * 1024  # ~50 MB/s
+# PromQL 라벨 값과 알림 ID에 그대로 들어가므로 허용하는 클러스터 이름
+_CLUSTER_NAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]{0,62}$")
+
+
+@dataclass(frozen=True)
+class AlertRule:
+    """PromQL 결과의 instance별 값이 threshold를 넘으면 `{name}-{cluster}-{instance}` 알림을 발생시키는 규칙"""
+
+    name: str
+    title: str
+    expr: str  # {cluster} 치환
+    threshold: float
+    description: str  # {instance}, {value} 치환 (value는 scale로 나눈 값)
+    severity: str = "warning"
+    critical_above: Optional[float] = None
+    scale: float = 1.0
+    source: str = "Prometheus"
+
+    def prefix(self, cluster: str) -> str:
+        return f"{self.name}-{cluster}-"
+
+    def alert_id(self, cluster: str, instance: str) -> str:
+        return f"{self.prefix(cluster)}{instance}"
+
+    def owns(self, alert_id: str, cluster: str) -> bool:
+        return alert_id.startswith(self.prefix(cluster))
+
+    def build(self, cluster: str, instance: str, value: float) -> Dict[str, Any]:
+        severity = self.severity
+        if self.critical_above is not None and value > self.critical_above:
+            severity = "critical"
+        return {
+            "id": self.alert_id(cluster, instance),
+            "title": self.title,
+            "description": self.description.format(instance=instance, value=value / self.scale),
+            "severity": severity,
+            "source": self.source,
+            "labels": {"cluster": cluster, "instance": instance, "rule": self.name},
+        }
+
+
+DEFAULT_RULES: Tuple[AlertRule, ...] = (
+    # CPU
+    AlertRule(
+        name="cpu-high",
+        title="High CPU Utilization",
+        expr='100 - (avg(rate(node_cpu_seconds_total{{cluster="{cluster}", mode="idle"}}[1m])) by (instance) * 100)',
+        threshold=80,
+        critical_above=90,
+        description="Node {instance} CPU usage {value:.2f}%",
+    ),
+    AlertRule(
+        name="cpu-iowait",
+        title="High CPU I/O wait",
+        expr='avg(rate(node_cpu_seconds_total{{cluster="{cluster}", mode="iowait"}}[1m])) by (instance) * 100',
+        threshold=5,
+        critical_above=10,
+        description="Node {instance} CPU iowait {value:.2f}%",
+    ),
+    # Memory
+    AlertRule(
+        name="mem-high",
+        title="High Memory Usage",
+        expr='(1 - (node_memory_MemAvailable_bytes{{cluster="{cluster}"}} / node_memory_MemTotal_bytes{{cluster="{cluster}"}})) * 100',
+        threshold=80,
+        critical_above=90,
+        description="Node {instance} memory usage {value:.2f}%",
+    ),
+    AlertRule(
+        name="mem-swap",
+        title="Swap In Use",
+        expr='node_memory_SwapTotal_bytes{{cluster="{cluster}"}} - node_memory_SwapFree_bytes{{cluster="{cluster}"}}',
+        threshold=0,
+        description="Node {instance} swap in use",
+    ),
+    # Disk
+    AlertRule(
+        name="disk-root",
+        title="High Disk Usage (/)",
+        expr='(1 - (node_filesystem_free_bytes{{cluster="{cluster}", mountpoint="/", fstype!="rootfs"}} / node_filesystem_size_bytes{{cluster="{cluster}", mountpoint="/", fstype!="rootfs"}})) * 100',
+        threshold=85,
+        critical_above=95,
+        description="Node {instance} root usage {value:.2f}%",
+    ),
+    AlertRule(
+        name="disk-io",
+        title="High Disk IO Saturation",
+        expr='rate(node_disk_io_time_seconds_total{{cluster="{cluster}"}}[1m])',
+        threshold=0.8,
+        description="Node {instance} IO saturation {value:.2f}",
+    ),
+    AlertRule(
+        name="disk-readonly",
+        title="Filesystem Readonly",
+        expr='node_filesystem_readonly{{cluster="{cluster}", mountpoint="/"}}',
+        threshold=0,
+        severity="critical",
+        description="Node {instance} filesystem is readonly",
+    ),
+    # Network
+    AlertRule(
+        name="net-rx-errors",
+        title="Network RX Errors",
+        expr='rate(node_network_receive_errs_total{{cluster="{cluster}"}}[1m])',
+        threshold=0,
+        description="Node {instance} rx errors {value:.2f}/s",
+    ),
+    AlertRule(
+        name="net-rx-drops",
+        title="Network RX Drops",
+        expr='rate(node_network_receive_drop_total{{cluster="{cluster}"}}[1m])',
+        threshold=0,
+        description="Node {instance} rx drops {value:.2f}/s",
+    ),
+    AlertRule(
+        name="net-rx-high",
+        title="High Inbound Traffic",
+        expr='rate(node_network_receive_bytes_total{{cluster="{cluster}", device="eth0"}}[1m])',
+        threshold=HIGH_BPS,
+        scale=1024 * 1024,
+        description="Node {instance} inbound {value:.2f} MB/s",
+    ),
+    AlertRule(
+        name="net-tx-high",
+        title="High Outbound Traffic",
+        expr='rate(node_network_transmit_bytes_total{{cluster="{cluster}", device="eth0"}}[1m])',
+        threshold=HIGH_BPS,
+        scale=1024 * 1024,
+        description="Node {instance} outbound {value:.2f} MB/s",
+    ),
+)
+
+
+def _instance_values(result: Dict[str, Any]) -> Dict[str, float]:
+    """instance별 최댓값 (디스크/NIC처럼 instance당 시계열이 여러 개인 경우 포함)"""
+    values: Dict[str, float] = {}
+    for series in result.get("data", {}).get("result", []):
+        try:
+            instance = series.get("metric", {}).get("instance")
+            value = float(series.get("value", [None, "0"])[1])
+        except (TypeError, ValueError, IndexError):
+            continue
+        if instance not in values or value > values[instance]:
+            values[instance] = value
+    return values
+
+
+def _timestamp(created_at: Optional[datetime]) -> Optional[str]:
+    return created_at.isoformat() if created_at else None
+
+
+def _like_prefix(prefix: str) -> str:
+    """LIKE 패턴용 접두사 (클러스터/규칙 이름의 %, _를 리터럴로 취급)"""
+    escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
+
+
+class AlertRuleEngine:
+    """클러스터 하나의 규칙을 주기적으로 평가하고 알림 상태를 메모리에 유지합니다."""
+
+    def __init__(
+        self,
+        cluster: str = "nks-cluster",
+        rules: Sequence[AlertRule] = DEFAULT_RULES,
+        interval: Optional[float] = None,
+        session_factory: Callable[[], Any] = SessionLocal,
+        query: PromQueryFn = query_prometheus,
+    ):
+        self.cluster = cluster
+        self.rules = tuple(rules)
+        self.interval = interval if interval is not None else get_settings().alert_eval_interval_seconds
+        self.session_factory = session_factory
+        self.query = query
+        # 현재 firing 알림 (GET 응답 형태 그대로 보관)
+        self._alerts: Dict[str, Dict[str, Any]] = {}
+        self._evaluated = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.last_evaluated_at: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    # 수명 주기
+    # ------------------------------------------------------------------
+    def ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._task is not None and not self._task.done():
+            return
+        self._loop = loop
+        self._evaluated = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._task = loop.create_task(self._run(), name=f"alert-rules-{self.cluster}")
+        logger.info("alert_rule_engine_started", cluster=self.cluster, rules=len(self.rules), interval=self.interval)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        self._loop = None
+
+    async def _run(self) -> None:
+        await self.reload()
+        while True:
+            try:
+                await self.evaluate()
+            except Exception as e:
+                logger.error("alert_rule_evaluation_failed", cluster=self.cluster, error=str(e))
+            finally:
+                self._evaluated.set()
+            await asyncio.sleep(self.interval)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    async def alerts(self) -> List[Dict[str, Any]]:
+        """firing 알림 목록 (최신순). 엔진을 시작하고 첫 평가가 끝날 때까지만 대기합니다."""
+        self.ensure_started()
+        await self._evaluated.wait()
+        return self.snapshot()
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        alerts = sorted(self._alerts.values(), key=lambda a: a["timestamp"] or "", reverse=True)
+        return [dict(alert) for alert in alerts[:MAX_ALERTS]]
+
+    def get(self, alert_id: str) -> Optional[Dict[str, Any]]:
+        alert = self._alerts.get(alert_id)
+        return dict(alert) if alert else None
+
+    def discard(self, alert_id: str) -> None:
+        """사용자가 해결 처리한 알림을 상태에서 제거합니다 (조건이 여전히 참이면 다음 평가에서 다시 firing)."""
+        self._alerts.pop(alert_id, None)
+        alerts_firing.labels(cluster=self.cluster).set(len(self._alerts))
+
+    # ------------------------------------------------------------------
+    # 평가
+    # ------------------------------------------------------------------
+    async def reload(self) -> None:
+        """DB의 firing 알림(시드/외부 생성 포함)으로 메모리 상태를 다시 채웁니다."""
+        try:
+            persisted = await asyncio.to_thread(self._load_firing)
+        except Exception as e:
+            logger.warning("alert_state_load_failed", cluster=self.cluster, error=str(e))
+            return
+        async with self._lock:
+            self._alerts = {alert["id"]: alert for alert in persisted}
+        alerts_firing.labels(cluster=self.cluster).set(len(self._alerts))
+
+    async def evaluate(self) -> Dict[str, int]:
+        """규칙을 한 번 평가하고 상태 전이를 DB에 일괄 반영합니다. 전이 건수를 반환합니다."""
+        async with self._lock:
+            started = time.perf_counter()
+            exprs = sorted({rule.expr for rule in self.rules})
+            results = await asyncio.gather(
+                *(self.query(PromQuery(query=expr.format(cluster=self.cluster))) for expr in exprs),
+                return_exceptions=True,
+            )
+            by_expr = dict(zip(exprs, results))
+
+            triggered: Dict[str, Dict[str, Any]] = {}
+            failed_rules: List[AlertRule] = []
+            for rule in self.rules:
+                result = by_expr[rule.expr]
+                if isinstance(result, BaseException) or (result or {}).get("status") != "success":
+                    failed_rules.append(rule)
+                    continue
+                for instance, value in _instance_values(result).items():
+                    if value > rule.threshold:
+                        triggered[rule.alert_id(self.cluster, instance)] = rule.build(self.cluster, instance, value)
+
+            changed = [
+                alert for alert_id, alert in triggered.items()
+                if alert_id not in self._alerts or self._alerts[alert_id]["severity"] != alert["severity"]
+            ]
+            resolved = [
+                alert_id for alert_id in self._alerts
+                if alert_id not in triggered
+                and any(rule.owns(alert_id, self.cluster) for rule in self.rules)
+                and not any(rule.owns(alert_id, self.cluster) for rule in failed_rules)
+            ]
+
+            if changed or resolved:
+                created = await asyncio.to_thread(self._persist, changed, resolved)
+                for alert_id in resolved:
+                    self._alerts.pop(alert_id, None)
+                for alert in changed:
+                    self._alerts[alert["id"]] = {**alert, "status": "firing", "timestamp": created.get(alert["id"])}
+            # 값만 바뀐 알림은 DB 쓰기 없이 설명만 갱신
+            for alert_id, alert in triggered.items():
+                if alert_id in self._alerts:
+                    self._alerts[alert_id]["description"] = alert["description"]
+
+            self.last_evaluated_at = time.time()
+            alert_rule_evaluation_seconds.labels(cluster=self.cluster).observe(time.perf_counter() - started)
+            alerts_firing.labels(cluster=self.cluster).set(len(self._alerts))
+            if changed:
+                alert_rule_transitions_total.labels(cluster=self.cluster, transition="firing").inc(len(changed))
+            if resolved:
+                alert_rule_transitions_total.labels(cluster=self.cluster, transition="resolved").inc(len(resolved))
+            if failed_rules:
+                logger.warning(
+                    "alert_rule_queries_failed",
+                    cluster=self.cluster,
+                    rules=[rule.name for rule in failed_rules],
+                )
+            return {"firing": len(changed), "resolved": len(resolved), "failed_rules": len(failed_rules)}
+
+    def _load_firing(self) -> List[Dict[str, Any]]:
+        """
+        이 클러스터의 규칙 알림과 규칙 소유가 아닌 알림(시드/외부 생성)만 읽습니다.
+
+        다른 클러스터의 규칙 알림은 읽지 않으므로 이 엔진의 평가가 resolve 하지 않습니다.
+        """
+        own = [Notification.id.like(_like_prefix(rule.prefix(self.cluster)), escape="\\") for rule in self.rules]
+        any_rule = [Notification.id.like(_like_prefix(f"{rule.name}-"), escape="\\") for rule in self.rules]
+        db = self.session_factory()
+        try:
+            notifications = db.query(Notification).filter(
+                and_(Notification.status == "firing", or_(*own, not_(or_(*any_rule))))
+            ).order_by(desc(Notification.created_at)).limit(MAX_ALERTS).all()
+            return [
+                {
+                    "id": n.id,
+                    "title": n.title,
+                    "description": n.description or "",
+                    "severity": n.severity,
+                    "status": n.status,
+                    "timestamp": _timestamp(n.created_at),
+                    "source": n.source or "System",
+                    "labels": n.labels,
+                }
+                for n in notifications
+                # 외부에서 만든 알림도 다른 클러스터 라벨이 붙어 있으면 제외
+                if (n.labels or {}).get("cluster", self.cluster) == self.cluster
+            ]
+        finally:
+            db.close()
+
+    def _persist(self, changed: List[Dict[str, Any]], resolved: List[str]) -> Dict[str, Optional[str]]:
+        """전이된 알림을 한 번의 IN 조회와 한 번의 커밋으로 upsert 합니다. 알림별 created_at을 반환합니다."""
+        db = self.session_factory()
+        try:
+            ids = [alert["id"] for alert in changed] + resolved
+            existing = {n.id: n for n in db.query(Notification).filter(Notification.id.in_(ids)).all()}
+            now = get_kst_now()
+            for alert in changed:
+                notif = existing.get(alert["id"])
+                if notif is None:
+                    notif = Notification(id=alert["id"], created_at=now)
+                    db.add(notif)
+                    existing[alert["id"]] = notif
+                notif.title = alert["title"]
+                notif.description = alert["description"]
+                notif.severity = alert["severity"]
+                notif.source = alert["source"]
+                notif.labels = alert["labels"]
+                notif.status = "firing"
+                notif.resolved_at = None
+            for alert_id in resolved:
+                notif = existing.get(alert_id)
+                if notif is not None and notif.status == "firing":
+                    notif.status = "resolved"
+                    notif.resolved_at = now
+            db.commit()
+            return {alert["id"]: _timestamp(existing[alert["id"]].created_at) for alert in changed}
+        except Exception as e:
+            db.rollback()
+            logger.error("alert_transition_persist_failed", cluster=self.cluster, error=str(e))
+            # DB 반영에 실패해도 메모리 상태는 최신 평가 결과를 따름
+            return {alert["id"]: _timestamp(get_kst_now()) for alert in changed}
+        finally:
+            db.close()
+
+
+_engines: Dict[str, AlertRuleEngine] = {}
+
+
+def _configured_clusters() -> List[str]:
+    return [name.strip() for name in get_settings().alert_eval_clusters.split(",") if name.strip()]
+
+
+def get_alert_engine(cluster: str = "nks-cluster") -> AlertRuleEngine:
+    """
+    클러스터별 전역 엔진.
+
+    설정된 클러스터만 상태를 유지하는 엔진을 받고(alert_eval_max_clusters 상한), 그 밖의 이름은
+    슬롯을 차지하지 않는 일회성 엔진을 반환합니다. 이름 형식이 잘못되면 ValueError.
+    """
+    if not _CLUSTER_NAME.match(cluster or ""):
+        raise ValueError(f"invalid cluster name: {cluster!r}")
+    engine = _engines.get(cluster)
+    if engine is None:
+        engine = AlertRuleEngine(cluster=cluster)
+        if cluster not in _configured_clusters():
+            logger.info("alert_engine_unknown_cluster", cluster=cluster)
+        elif len(_engines) < get_settings().alert_eval_max_clusters:
+            _engines[cluster] = engine
+        else:
+            logger.warning("alert_engine_cluster_limit", cluster=cluster, limit=len(_engines))
+    return engine
+
+
+async def list_alerts(cluster: str = "nks-cluster") -> List[Dict[str, Any]]:
+    engine = get_alert_engine(cluster)
+    if _engines.get(cluster) is engine:
+        return await engine.alerts()
+    await engine.reload()
+    await engine.evaluate()
+    return engine.snapshot()
+
+
+def discard_alert(alert_id: str) -> None:
+    for engine in _engines.values():
+        engine.discard(alert_id)
+
+
+async def reload_alert_engines() -> None:
+    for engine in _engines.values():
+        await engine.reload()
+
+
+async def stop_alert_engines() -> None:
+    for engine in list(_engines.values()):
+        await engine.stop()
+    _engines.clear()
@@ -0,0 +1,279 @@
+"""
+클러스터 전체 현황(overview) 엔진
+
+네임스페이스마다 Deployment/Pod/Service를 순차 조회하면 3×N번의 동기 왕복이
+발생합니다. 이 엔진은 `*_for_all_namespaces` 목록 호출을 스레드에서 동시에
+실행하고 한 번의 순회로 집계합니다.
+
+- 클러스터 이름은 kubeconfig를 파싱해 한 번만 결정 (kubectl 서브프로세스 미사용)
+- 마지막 스냅샷을 max_age 동안 재사용하고, 동시 요청은 하나의 수집으로 병합
+- all-namespaces 목록 권한이 없으면 해당 리소스만 네임스페이스별 동시 조회로 대체
+- Deployment/Pod/Service는 원본 JSON 고속 경로(k8s_fast_list)로 조회해 경량 레코드로 집계
+"""
+
+import asyncio
+import re
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import structlog
+from kubernetes import config as kube_config
+from kubernetes.client.rest import ApiException
+
+from ..core.config import get_settings
+from .k8s_client import get_apps_v1_api, get_core_v1_api
+from .k8s_fast_list import list_deployments, list_pods, list_services
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_CLUSTER_NAME = "K-Le-PaaS Cluster"
+
+_UUID_SUFFIX = re.compile(r'_[a-fA-F0-9]{8}(-[a-fA-F0-9]{4}){3}-[a-fA-F0-9]{12}$')
+
+_cluster_name: Optional[str] = None
+
+
+def normalize_cluster_name(context_name: str) -> str:
+    """
+    kubeconfig context 이름에서 UUID/번호 접미사를 제거합니다.
+
+    예: "nks_kr_contest-cluster-27_69b2edb8-2975-4cb4-9dcb-68e3902a68ec" -> "nks_kr_contest-cluster"
+    """
+    name = _UUID_SUFFIX.sub('', context_name)
+    name = re.sub(r'-\d+$', '', name)
+    return name.rstrip('-').rstrip('_') or DEFAULT_CLUSTER_NAME
+
+
+def resolve_cluster_name() -> str:
+    """현재 kubeconfig context로부터 클러스터 이름을 구합니다. 결과는 프로세스 동안 재사용합니다."""
+    global _cluster_name
+    if _cluster_name is not None:
+        return _cluster_name
+
+    settings = get_settings()
+    name = DEFAULT_CLUSTER_NAME
+    try:
+        contexts, active = kube_config.list_kube_config_contexts(config_file=settings.k8s_config_file)
+        context_name = settings.k8s_context or (active or {}).get("name")
+        if context_name and any(ctx.get("name") == context_name for ctx in contexts):
+            name = normalize_cluster_name(context_name)
+    except Exception as e:
+        logger.warning("cluster_name_resolve_failed", error=str(e))
+    _cluster_name = name
+    return name
+
+
+def aggregate_overview(
+    cluster_name: str,
+    nodes: List[Any],
+    namespaces: List[str],
+    deployments: List[Any],
+    pods: List[Any],
+    services: List[Any],
+) -> Dict[str, Any]:
+    """
+    목록 조회 결과를 한 번의 순회로 overview 응답 형식으로 집계합니다.
+
+    deployments/pods/services는 k8s_fast_list의 Deployment/Pod/ServiceRecord 목록입니다.
+    """
+
+    cluster_nodes = []
+    for node in nodes:
+        ready = any(
+            c.type == "Ready" and c.status == "True"
+            for c in (node.status.conditions or [])
+        )
+        cluster_nodes.append({"name": node.metadata.name, "status": "Ready" if ready else "NotReady"})
+
+    workloads_by_namespace = {ns: {"deployments": 0, "pods": 0} for ns in namespaces}
+
+    deployment_warnings = []
+    total_deployments = 0
+    for deployment in deployments:
+        ns = deployment.namespace
+        ready_count = deployment.ready
+        desired_count = deployment.desired
+        total_deployments += 1
+        workloads_by_namespace.setdefault(ns, {"deployments": 0, "pods": 0})["deployments"] += 1
+        if desired_count is not None and ready_count < desired_count:
+            deployment_warnings.append({
+                "namespace": ns,
+                "name": deployment.name,
+                "ready": f"{ready_count}/{desired_count}"
+            })
+
+    pending_pods, failed_pods, high_restart_pods = [], [], []
+    total_pods = running_pods = 0
+    for pod in pods:
+        ns = pod.namespace
+        phase = pod.phase
+        total_pods += 1
+        workloads_by_namespace.setdefault(ns, {"deployments": 0, "pods": 0})["pods"] += 1
+        if phase == "Running":
+            running_pods += 1
+        if phase == "Pending":
+            pending_pods.append({"namespace": ns, "name": pod.name, "status": phase})
+        elif phase in ["Failed", "CrashLoopBackOff"] or pod.crash_looping:
+            failed_pods.append({"namespace": ns, "name": pod.name, "status": phase})
+        # 높은 재시작 횟수 (10회 이상)
+        if pod.restarts >= 10:
+            high_restart_pods.append({"namespace": ns, "name": pod.name, "restarts": pod.restarts})
+
+    load_balancer_services, node_port_services = [], []
+    for service in services:
+        entry = {"name": service.name, "namespace": service.namespace}
+        if service.type == "LoadBalancer":
+            load_balancer_services.append(entry)
+        elif service.type == "NodePort":
+            node_port_services.append(entry)
+
+    summary = {
+        "cluster_name": cluster_name,
+        "total_nodes": len(cluster_nodes),
+        "total_namespaces": len(namespaces),
+        "total_deployments": total_deployments,
+        "total_pods": total_pods,
+        "total_services": len(services),
+        "running_pods": running_pods,
+        "critical_deployment_issues": len(deployment_warnings),
+        "pending_pod_issues": len(pending_pods),
+        "failed_pod_issues": len(failed_pods),
+        "high_restart_issues": len(high_restart_pods)
+    }
+
+    return {
+        "status": "success",
+        "cluster_info": {
+            "name": cluster_name,
+            "total_nodes": len(cluster_nodes),
+            "nodes": cluster_nodes
+        },
+        "namespaces": namespaces,
+        "critical_issues": {
+            "deployment_warnings": deployment_warnings,
+            "pending_pods": pending_pods,
+            "failed_pods": failed_pods
+        },
+        "warnings": {
+            "high_restart_pods": high_restart_pods
+        },
+        "workloads_by_namespace": workloads_by_namespace,
+        "external_services": {
+            "load_balancer": load_balancer_services,
+            "node_port": node_port_services
+        },
+        "summary": summary
+    }
+
+
+class ClusterOverviewEngine:
+    """클러스터 overview 스냅샷을 동시 수집하고 max_age 동안 캐시합니다."""
+
+    def __init__(
+        self,
+        core_v1_factory: Callable[[], Any] = get_core_v1_api,
+        apps_v1_factory: Callable[[], Any] = get_apps_v1_api,
+        cluster_name_resolver: Callable[[], str] = resolve_cluster_name,
+        max_age_seconds: Optional[float] = None,
+    ):
+        self._core_v1_factory = core_v1_factory
+        self._apps_v1_factory = apps_v1_factory
+        self._cluster_name_resolver = cluster_name_resolver
+        if max_age_seconds is None:
+            max_age_seconds = get_settings().k8s_overview_max_age
+        self.max_age_seconds = max_age_seconds
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._snapshot_at: float = 0.0
+        self._inflight: Optional[asyncio.Task] = None
+
+    async def _list_all(self, kind: str, lister: Callable[..., Any], api: Any,
+                        namespaces: List[str]) -> List[Any]:
+        """전체 네임스페이스 목록을 조회하고, 권한이 없으면 네임스페이스별 동시 조회로 대체합니다."""
+        try:
+            return (await asyncio.to_thread(lister, api)).items
+        except ApiException as e:
+            if e.status != 403:
+                raise
+            logger.info("overview_all_namespaces_forbidden", kind=kind, namespaces=len(namespaces))
+
+        async def one(ns: str) -> List[Any]:
+            try:
+                return (await asyncio.to_thread(lister, api, ns)).items
+            except ApiException:
+                return []  # 네임스페이스에 접근 권한이 없을 수 있음
+
+        results = await asyncio.gather(*[one(ns) for ns in namespaces])
+        return [item for items in results for item in items]
+
+    async def _collect(self) -> Dict[str, Any]:
+        start = time.perf_counter()
+        core_v1 = self._core_v1_factory()
+        apps_v1 = self._apps_v1_factory()
+
+        async def list_nodes() -> List[Any]:
+            try:
+                return (await asyncio.to_thread(core_v1.list_node)).items
+            except Exception as e:
+                logger.error("overview_list_nodes_failed", error=str(e))
+                return []
+
+        nodes_task = asyncio.ensure_future(list_nodes())
+        name_task = asyncio.ensure_future(asyncio.to_thread(self._cluster_name_resolver))
+        try:
+            namespaces = [ns.metadata.name for ns in (await asyncio.to_thread(core_v1.list_namespace)).items]
+            deployments, pods, services = await asyncio.gather(
+                self._list_all("deployment", list_deployments, apps_v1, namespaces),
+                self._list_all("pod", list_pods, core_v1, namespaces),
+                self._list_all("service", list_services, core_v1, namespaces),
+            )
+            nodes, cluster_name = await asyncio.gather(nodes_task, name_task)
+        except BaseException:
+            nodes_task.cancel()
+            name_task.cancel()
+            raise
+
+        result = aggregate_overview(cluster_name, nodes, namespaces, deployments, pods, services)
+        logger.info(
+            "overview_collected",
+            namespaces=len(namespaces),
+            pods=len(pods),
+            duration_ms=round((time.perf_counter() - start) * 1000, 2),
+        )
+        return result
+
+    async def _refresh(self) -> Dict[str, Any]:
+        result = await self._collect()
+        self._snapshot = result
+        self._snapshot_at = time.monotonic()
+        return result
+
+    async def get(self, force_refresh: bool = False, max_age: Optional[float] = None) -> Dict[str, Any]:
+        """
+        overview 스냅샷을 반환합니다.
+
+        max_age(기본: 설정값) 이내의 스냅샷이 있으면 재사용하고, 동시에 들어온
+        요청은 진행 중인 하나의 수집 결과를 공유합니다.
+        """
+        limit = self.max_age_seconds if max_age is None else max_age
+        if not force_refresh and self._snapshot is not None:
+            age = time.monotonic() - self._snapshot_at
+            if age <= limit:
+                return {**self._snapshot, "snapshot": {"cached": True, "age_seconds": round(age, 2)}}
+
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.ensure_future(self._refresh())
+        result = await asyncio.shield(self._inflight)
+        return {**result, "snapshot": {"cached": False, "age_seconds": 0.0}}
+
+    def invalidate(self) -> None:
+        self._snapshot = None
+
+
+_engine: Optional[ClusterOverviewEngine] = None
+
+
+def get_cluster_overview_engine() -> ClusterOverviewEngine:
+    global _engine
+    if _engine is None:
+        _engine = ClusterOverviewEngine()
+    return _engine
@@ -1,11 +1,12 @@
 """명령어 히스토리 서비스"""
 
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import logging
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
+from ..core.pagination import keyset_page
 from ..models.command_history import CommandHistory, CommandHistoryCreate, CommandHistoryResponse
 
 # 한국 표준시 (KST) 타임존
@@ -85,16 +86,47 @@ async def get_command_history(
     db: Session,
     user_id: Optional[str] = None,
     limit: int = 50,
-    offset: int = 0
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    tool: Optional[str] = None
 ) -> List[CommandHistoryResponse]:
-    """명령어 히스토리를 조회합니다."""
+    """
+    명령어 히스토리를 최신순으로 조회합니다.
+
+    cursor(이전 페이지의 마지막 (created_at, id))를 주면 키셋으로 이어서 조회합니다.
+    다음 페이지 커서가 필요하면 get_command_history_page를 사용합니다.
+    """
+    items, _ = await get_command_history_page(db, user_id, limit, offset, cursor, tool)
+    return items
+
+
+async def get_command_history_page(
+    db: Session,
+    user_id: Optional[str] = None,
+    limit: int = 50,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    tool: Optional[str] = None
+) -> Tuple[List[CommandHistoryResponse], Optional[str]]:
+    """명령어 히스토리 한 페이지와 다음 페이지 커서를 반환합니다."""
     try:
         query = db.query(CommandHistory)
         
         if user_id:
             query = query.filter(CommandHistory.user_id == user_id)
-        
-        command_histories = query.order_by(desc(CommandHistory.created_at)).offset(offset).limit(limit).all()
+        if tool:
+            query = query.filter(CommandHistory.tool == tool)
+        
+        if offset and not cursor:
+            # 하위 호환용 OFFSET 조회
+            command_histories = query.order_by(
+                desc(CommandHistory.created_at), desc(CommandHistory.id)
+            ).offset(offset).limit(limit).all()
+            next_cursor = None
+        else:
+            command_histories, next_cursor = keyset_page(
+                query, CommandHistory.created_at, CommandHistory.id, limit, cursor
+            )
         
         return [
             CommandHistoryResponse(
@@ -110,7 +142,7 @@ async def get_command_history(
                 updated_at=ch.updated_at
             )
             for ch in command_histories
-        ]
+        ], next_cursor
         
     except Exception as e:
         logger.error(f"Failed to get command history: {e}")
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
 import re
-import os
-import subprocess
 import asyncio
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
@@ -16,6 +14,20 @@ from fastapi import HTTPException
 
 from .deployments import DeployApplicationInput, perform_deploy
 from .k8s_client import get_apps_v1_api, get_core_v1_api, get_networking_v1_api
+from .cluster_overview import get_cluster_overview_engine
+from .cost_engine import get_cost_engine, render_cost_analysis
+from .k8s_fast_list import (
+    ListResult,
+    as_pod_record,
+    deployment_summary,
+    format_age,
+    format_created,
+    list_deployments,
+    list_pods,
+    list_services,
+    service_ports,
+    service_summary,
+)
 from .response_formatter import ResponseFormatter
 from .github_app import github_app_auth
 from ..models.user_project_integration import UserProjectIntegration
@@ -38,6 +50,12 @@ class CommandRequest(BaseModel):
     version: str = Field(default="")
     namespace: str = Field(default="default")
     previous: bool = Field(default=False)  # 이전 파드 로그 여부
+    all_pods: bool = Field(default=False)  # 모든 레플리카 로그를 시간순 병합
+    grep: str = Field(default="")  # 로그 줄 필터 (정규식)
+    level: str = Field(default="")  # 최소 로그 레벨 (debug, info, warn, error)
+    # 목록 명령 페이지네이션 (API 서버 chunked LIST)
+    limit: int = Field(default=0, ge=0)  # 페이지 크기, 0이면 설정 기본값
+    continue_token: str = Field(default="")  # 이전 응답의 continue 커서
     # NCP 롤백 관련 필드
     github_owner: str = Field(default="")      # GitHub 저장소 소유자
     github_repo: str = Field(default="")       # GitHub 저장소 이름
@@ -102,6 +120,16 @@ def _parse_version(text: str) -> Optional[str]:
     return None
 
 
+def _page_args(req: CommandRequest) -> Dict[str, Any]:
+    """목록 명령에 전달할 페이지 인자 (limit / continue)"""
+    args: Dict[str, Any] = {}
+    if req.limit:
+        args["limit"] = req.limit
+    if req.continue_token:
+        args["continue"] = req.continue_token
+    return args
+
+
 def plan_command(req: CommandRequest) -> CommandPlan:
     command = req.command.lower()
     ns = req.namespace or "default"
@@ -209,7 +237,10 @@ def plan_command(req: CommandRequest) -> CommandPlan:
                 "name": resource_name, 
                 "namespace": req.namespace or ns, 
                 "lines": req.lines,
-                "previous": req.previous
+                "previous": req.previous,
+                "all_pods": req.all_pods,
+                "grep": req.grep,
+                "level": req.level
             },
         )
     
@@ -252,7 +283,7 @@ def plan_command(req: CommandRequest) -> CommandPlan:
     elif command == "list_pods" or command == "pods":
         return CommandPlan(
             tool="k8s_list_pods",
-            args={"namespace": ns},
+            args={"namespace": ns, **_page_args(req)},
         )
     
     elif command == "overview":
@@ -264,13 +295,13 @@ def plan_command(req: CommandRequest) -> CommandPlan:
     elif command == "list_deployments":
         return CommandPlan(
             tool="k8s_list_deployments",
-            args={"namespace": ns},
+            args={"namespace": ns, **_page_args(req)},
         )
     
     elif command == "list_services":
         return CommandPlan(
             tool="k8s_list_services",
-            args={"namespace": ns},
+            args={"namespace": ns, **_page_args(req)},
         )
     
     elif command == "list_ingresses":
@@ -290,7 +321,7 @@ def plan_command(req: CommandRequest) -> CommandPlan:
     elif command == "list_endpoints":
         return CommandPlan(
             tool="k8s_list_namespaced_endpoints",
-            args={"namespace": ns},
+            args={"namespace": ns, **_page_args(req)},
         )
 
     elif command == "list_rollback":
@@ -342,71 +373,13 @@ def plan_command(req: CommandRequest) -> CommandPlan:
 
 async def _execute_cost_analysis(args: Dict[str, Any]) -> Dict[str, Any]:
     """
-    클러스터 비용 분석 실행
+    클러스터 비용 분석 실행 (requests/limits + Prometheus 사용량 기반, 네임스페이스별 캐시)
     """
     namespace = args.get("namespace", "default")
     analysis_type = args.get("analysis_type", "usage")
-    
-    # TODO: 실제 비용 분석 로직 구현
-    # 현재는 mock 데이터 반환
-    
-    if analysis_type == "optimization":
-        return {
-            "message": f"{namespace} 네임스페이스의 비용 최적화 제안을 생성했습니다.",
-            "cost_estimate": {
-                "current_cost": 150000,
-                "estimated_cost": 105000,
-                "savings": 45000,
-                "currency": "KRW",
-                "period": "월간",
-                "breakdown": {
-                    "compute": 80000,
-                    "storage": 30000,
-                    "network": 25000,
-                    "idle_resources": -45000
-                }
-            },
-            "recommendations": [
-                "미사용 Pod 3개 제거 시 월 20,000원 절감",
-                "스토리지 최적화로 월 15,000원 절감",
-                "인스턴스 다운사이징으로 월 10,000원 절감"
-            ]
-        }
-    elif analysis_type == "forecast":
-        return {
-            "message": f"{namespace} 네임스페이스의 월간 예상 비용을 계산했습니다.",
-            "cost_estimate": {
-                "estimated_cost": 150000,
-                "currency": "KRW",
-                "period": "월간 예상",
-                "breakdown": {
-                    "compute": 85000,
-                    "storage": 35000,
-                    "network": 30000
-                }
-            },
-            "trend": "지난달 대비 5% 증가 예상"
-        }
-    else:  # usage
-        return {
-            "message": f"{namespace} 네임스페이스의 현재 비용 현황입니다.",
-            "cost_estimate": {
-                "current_cost": 150000,
-                "currency": "KRW",
-                "period": "이번 달",
-                "breakdown": {
-                    "compute": 85000,
-                    "storage": 35000,
-                    "network": 30000
-                }
-            },
-            "resource_usage": {
-                "pods": 12,
-                "deployments": 5,
-                "services": 8,
-                "storage_gb": 150
-            }
-        }
+
+    analysis = await get_cost_engine().analyze(namespace)
+    return render_cost_analysis(analysis, namespace, analysis_type)
 
 
 async def _execute_list_commands(args: Dict[str, Any]) -> Dict[str, Any]:
@@ -493,34 +466,9 @@ async def _execute_deploy_github_repository(args: Dict[str, Any]) -> Dict[str, A
 
         logger.info(f"NLP deploy triggered for {owner}/{repo} (commit: {commit_info['sha'][:7]})")
 
-        # 4. handle_push_webhook을 백그라운드에서 실행
-        from ..api.v1.github_workflows import handle_push_webhook
-
-        def run_async_in_thread(coro_func, *args, **kwargs):
-            """백그라운드 스레드에서 비동기 함수 실행"""
-            session = SessionLocal()
-            try:
-                # 통합 객체는 스레드 세이프하게 재조회
-                integ = session.query(UserProjectIntegration).filter(
-                    UserProjectIntegration.id == integration.id
-                ).first()
-                if integ is None:
-                    logger.error(f"Integration {integration.id} not found in background task")
-                    return
-                asyncio.run(coro_func(*args, **kwargs, db=session, integration=integ))
-            finally:
-                try:
-                    session.close()
-                except Exception:
-                    pass
-
-        # 백그라운드 태스크로 배포 시작
-        import threading
-        thread = threading.Thread(
-            target=run_async_in_thread,
-            args=(handle_push_webhook, payload)
-        )
-        thread.start()
+        # 4. handle_push_webhook을 메인 루프의 백그라운드 태스크로 실행
+        from ..api.v1.github_workflows import schedule_push_deploy
+        schedule_push_deploy(payload, integration.id)
 
         # 5. 즉시 응답 반환 (배포는 백그라운드에서 진행)
         short_sha = commit_info["sha"][:7]
@@ -657,7 +605,7 @@ def _format_pod_statuses(pods: list, include_labels: bool = True, include_creati
     Pod 목록을 상태 정보로 포맷팅하는 공통 헬퍼 함수
     
     Args:
-        pods: Kubernetes Pod 객체 목록
+        pods: Kubernetes Pod 객체 또는 PodRecord 목록 (k8s_fast_list 고속 경로)
         include_labels: 라벨 정보 포함 여부
         include_creation_time: 생성 시간 정보 포함 여부
         include_namespace: 네임스페이스 정보 포함 여부
@@ -666,14 +614,15 @@ def _format_pod_statuses(pods: list, include_labels: bool = True, include_creati
     Returns:
         포맷팅된 Pod 상태 정보 목록
     """
+    now = datetime.now(timezone.utc).timestamp()
     pod_statuses = []
-    for pod in pods:
+    for record in map(as_pod_record, pods):
         pod_status = {
-            "name": pod.metadata.name,
-            "phase": pod.status.phase,
+            "name": record.name,
+            "phase": record.phase,
             "ready": False,
             "restarts": 0,
-            "node": pod.spec.node_name if pod.spec else None,
+            "node": record.node,
             "problem": False,  # Ready 미달이나 비정상 상태 플래그
             "problem_reason": None,
             "problem_message": None,
@@ -681,56 +630,81 @@ def _format_pod_statuses(pods: list, include_labels: bool = True, include_creati
         
         # 조건부 필드 추가
         if include_namespace:
-            pod_status["namespace"] = pod.metadata.namespace
+            pod_status["namespace"] = record.namespace
         if include_labels:
-            pod_status["labels"] = pod.metadata.labels or {}
+            pod_status["labels"] = record.labels
         if include_creation_time:
-            pod_status["creation_timestamp"] = pod.metadata.creation_timestamp.isoformat() if pod.metadata.creation_timestamp else None
+            pod_status["creation_timestamp"] = format_created(record.created)
         if include_age:
-            pod_status["age"] = None
-            if pod.metadata.creation_timestamp:
-                now = datetime.now(timezone.utc)
-                age = now - pod.metadata.creation_timestamp
-                pod_status["age"] = str(age).split('.')[0]  # 초 단위 제거
-        
-        # Container 상태 체크 및 문제 원인(reason/message) 추출
-        if pod.status.container_statuses:
-            ready_count = 0
-            total_count = len(pod.status.container_statuses)
-            total_restarts = 0
-            first_reason = None
-            first_message = None
-            
-            for container_status in pod.status.container_statuses:
-                if container_status.ready:
-                    ready_count += 1
-                total_restarts += container_status.restart_count
-                try:
-                    # waiting 상태 사유 우선, 없으면 terminated 사유 사용
-                    if container_status.state and container_status.state.waiting:
-                        if not first_reason:
-                            first_reason = getattr(container_status.state.waiting, 'reason', None)
-                            first_message = getattr(container_status.state.waiting, 'message', None)
-                    elif container_status.state and container_status.state.terminated:
-                        if not first_reason:
-                            first_reason = getattr(container_status.state.terminated, 'reason', None)
-                            first_message = getattr(container_status.state.terminated, 'message', None)
-                except Exception:
-                    pass
-            
-            pod_status["ready"] = f"{ready_count}/{total_count}"
-            pod_status["restarts"] = total_restarts
+            pod_status["age"] = format_age(record.created, now)
+        
+        # Container 상태 및 문제 원인(reason/message)
+        if record.container_count:
+            pod_status["ready"] = f"{record.ready_count}/{record.container_count}"
+            pod_status["restarts"] = record.restarts
             # 문제 플래그 및 사유
-            if pod.status.phase != "Running" or ready_count < total_count:
+            if record.phase != "Running" or record.ready_count < record.container_count:
                 pod_status["problem"] = True
-                pod_status["problem_reason"] = first_reason or pod.status.phase
-                pod_status["problem_message"] = first_message
+                pod_status["problem_reason"] = record.reason or record.phase
+                pod_status["problem_message"] = record.message
         
         pod_statuses.append(pod_status)
     
     return pod_statuses
 
 
+EXPIRED_CURSOR_MESSAGE = "목록 커서가 만료되었습니다. 처음부터 다시 조회해주세요."
+
+
+def _list_page(args: Dict[str, Any]) -> tuple[Optional[int], Optional[str]]:
+    """
+    목록 명령의 (limit, continue) 값을 결정합니다.
+
+    limit이 없으면 k8s_list_page_size(기본 None = 전체 조회)를 쓰고, k8s_list_max_page_size로 제한합니다.
+    """
+    from ..core.config import get_settings
+
+    settings = get_settings()
+    limit = int(args.get("limit") or settings.k8s_list_page_size or 0)
+    if limit and settings.k8s_list_max_page_size:
+        limit = min(limit, settings.k8s_list_max_page_size)
+    return (limit or None), (args.get("continue") or None)
+
+
+def _page_fields(
+    result: ListResult,
+    limit: Optional[int],
+    continue_token: Optional[str],
+    total_key: str,
+) -> Dict[str, Any]:
+    """
+    응답에 포함할 개수와 페이지 커서 정보
+
+    count는 이 응답에 담긴 항목 수입니다. total_key(total_pods 등)는 전체 개수를 알 때만 넣습니다:
+    전체 조회, 마지막 페이지까지 한 번에 받은 첫 페이지, 또는 API 서버가 remainingItemCount를 준 첫 페이지.
+    페이지 조회 시에는 continue(다음 페이지 커서)와 remaining(남은 항목 수 추정, 모르면 None)을 함께 반환합니다.
+    """
+    count = len(result.items)
+    fields: Dict[str, Any] = {"count": count}
+    if limit is None and continue_token is None:
+        fields[total_key] = count
+        return fields
+    fields.update({"limit": limit, "continue": result.continue_token, "remaining": result.remaining})
+    if continue_token is None:
+        if result.continue_token is None:
+            fields[total_key] = count
+        elif result.remaining is not None:
+            fields[total_key] = count + result.remaining
+    return fields
+
+
+def _expired_cursor_error(e: ApiException) -> Optional[Dict[str, Any]]:
+    """continue 토큰이 만료되면(410 Gone) 안내 응답을 반환합니다."""
+    if e.status == 410:
+        return {"status": "error", "message": EXPIRED_CURSOR_MESSAGE, "expired_cursor": True}
+    return None
+
+
 # 파드 이름이 레플리카셋 해시 등이 포함된 "정확한 파드 이름"처럼 보이는지 간단히 판단
 def _looks_like_exact_pod_name(text: str) -> bool:
     try:
@@ -856,6 +830,10 @@ async def _execute_get_logs(args: Dict[str, Any]) -> Dict[str, Any]:
                 else:
                     return {"status": "error", "message": f"Kubernetes API 오류: {e.reason}"}
         
+        # 여러 레플리카 병합 또는 필터 요청 시 모든 Pod 로그를 시간순으로 병합
+        if args.get("all_pods") or args.get("grep") or args.get("level"):
+            return await _execute_get_aggregated_logs(core_v1, name, namespace, pods.items, args)
+        
         # 첫 번째 Pod 선택
         pod = pods.items[0]
         pod_name = pod.metadata.name
@@ -899,8 +877,7 @@ async def _execute_get_logs(args: Dict[str, Any]) -> Dict[str, Any]:
                 }
         
         # Step 2: kubectl logs 명령어 조립하기 (정상 상태)
-        # follow 옵션은 실시간 로그이므로 API에서는 지원하지 않음
-        # 대신 최신 로그를 반환하고 follow=True일 때는 안내 메시지 추가
+        # 명령 응답은 최신 로그 스냅샷이며, 실시간 follow는 스트리밍 엔드포인트로 안내
         logs = core_v1.read_namespaced_pod_log(
             name=pod_name,
             namespace=namespace,
@@ -912,7 +889,11 @@ async def _execute_get_logs(args: Dict[str, Any]) -> Dict[str, Any]:
             "pod_name": pod_name,
             "lines": lines,
             "logs": logs,
-            "pod_status": pod.status.phase
+            "pod_status": pod.status.phase,
+            "stream": {
+                "websocket": f"/api/v1/ws/logs?namespace={namespace}&pod={pod_name}",
+                "sse": f"/api/v1/logs/{namespace}/{pod_name}/stream"
+            }
         }
         
         return response
@@ -925,6 +906,52 @@ async def _execute_get_logs(args: Dict[str, Any]) -> Dict[str, Any]:
         return {"status": "error", "message": f"로그 조회 실패: {str(e)}"}
 
 
+async def _execute_get_aggregated_logs(core_v1, name: str, namespace: str, pods, args: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    앱의 모든 Pod/컨테이너 로그를 동시에 조회해 타임스탬프 순으로 병합 (logs 명령어, 집계 모드)
+    예: "chat-app 전체 파드 로그 보여줘", "chat-app 에러 로그 찾아줘"
+    """
+    from .k8s_logs import aggregate_pod_logs
+    from .log_stream import LogLineFilter
+    from ..core.config import get_settings
+
+    settings = get_settings()
+    try:
+        line_filter = LogLineFilter(grep=args.get("grep") or None, level=args.get("level") or None)
+    except ValueError as e:
+        return {"status": "error", "message": str(e)}
+
+    lines = args.get("lines", 30)
+    result = await aggregate_pod_logs(
+        core_v1,
+        namespace,
+        pods,
+        lines=lines,
+        previous=args.get("previous", False),
+        line_filter=line_filter,
+        byte_budget=settings.log_aggregate_byte_budget,
+        concurrency=settings.log_aggregate_concurrency,
+    )
+    response = {
+        "status": "success",
+        "aggregated": True,
+        "name": name,
+        "namespace": namespace,
+        "pod_count": len(pods),
+        "lines": lines,
+        "logs": result["logs"],
+        "sources": result["sources"],
+        "truncated": result["truncated"],
+        "total_lines": result["total_lines"],
+        "filters": {"grep": args.get("grep") or None, "level": args.get("level") or None},
+    }
+    if result["errors"]:
+        response["errors"] = result["errors"]
+    if result["truncated"]:
+        response["warning"] = "로그가 많아 최신 로그 일부만 표시합니다. 필터를 사용해 범위를 좁혀보세요."
+    return response
+
+
 async def _execute_get_endpoints(args: Dict[str, Any]) -> Dict[str, Any]:
     """
     서비스 엔드포인트 조회 - 상세 정보 반환 (endpoint 명령어)
@@ -1285,27 +1312,32 @@ async def _execute_list_pods(args: Dict[str, Any]) -> Dict[str, Any]:
     """
     모든 파드 목록 조회 (list_pods 명령어)
     예: "모든 파드 조회해줘", "파드 목록 보여줘"
+
+    limit/continue로 API 서버의 chunked LIST를 사용하며, 응답의 continue 값으로 다음 페이지를 조회합니다.
     """
     namespace = args.get("namespace", "default")
+    limit, continue_token = _list_page(args)
     
     try:
         core_v1 = get_core_v1_api()
         
-        # 네임스페이스의 모든 파드 조회
-        pods = core_v1.list_namespaced_pod(namespace=namespace)
+        # 네임스페이스의 파드 조회 (원본 JSON 고속 경로)
+        pods = await asyncio.to_thread(list_pods, core_v1, namespace, limit=limit, continue_token=continue_token)
         
-        # Pod 상태 정보 추출 (헬퍼 함수 사용)
+        # Pod 상태 정보 추출 (헬퍼 함수 사용), 정렬 키는 생성 시각 epoch 초
         pod_list = _format_pod_statuses(pods.items, include_labels=False, include_creation_time=False, include_namespace=True, include_age=True)
+        for pod_status, record in zip(pod_list, pods.items):
+            pod_status["created_ts"] = record.created
         
         return {
             "status": "success",
             "namespace": namespace,
-            "total_pods": len(pod_list),
-            "pods": pod_list
+            "pods": pod_list,
+            **_page_fields(pods, limit, continue_token, "total_pods"),
         }
         
     except ApiException as e:
-        return {"status": "error", "message": f"Kubernetes API 오류: {e.reason}"}
+        return _expired_cursor_error(e) or {"status": "error", "message": f"Kubernetes API 오류: {e.reason}"}
     except Exception as e:
         return {"status": "error", "message": f"파드 목록 조회 실패: {str(e)}"}
 
@@ -1315,274 +1347,11 @@ async def _execute_get_overview(args: Dict[str, Any]) -> Dict[str, Any]:
     클러스터 전체 현황 보고서 조회 (overview 명령어)
     예: "클러스터 전체 현황 보여줘", "클러스터 상태 보고서", "전체 리소스 상태 확인"
     
-    모든 네임스페이스의 Deployment, Pod, Service를 조회하여 보고서 형식으로 제공
+    모든 네임스페이스의 Deployment, Pod, Service를 all-namespaces 목록 호출로 동시에
+    조회하여 보고서 형식으로 제공 (최근 스냅샷은 k8s_overview_max_age 동안 재사용)
     """
     try:
-        apps_v1 = get_apps_v1_api()
-        core_v1 = get_core_v1_api()
-        
-        # 클러스터 정보 (노드 조회)
-        try:
-            nodes = core_v1.list_node()
-            cluster_nodes = []
-            for node in nodes.items:
-                # Node Ready 상태 확인
-                ready_status = "NotReady"
-                if node.status.conditions:
-                    for condition in node.status.conditions:
-                        if condition.type == "Ready" and condition.status == "True":
-                            ready_status = "Ready"
-                            break
-                
-                cluster_nodes.append({
-                    "name": node.metadata.name,
-                    "status": ready_status
-                })
-        except Exception as e:
-            logger.error(f"Failed to get nodes: {e}")
-            cluster_nodes = []
-        
-        # 클러스터 이름 추출 (kubectl config current-context)
-        cluster_name = "Unknown Cluster"
-        try:
-            # kubeconfig 파일 경로 가져오기
-            kubeconfig_path = os.getenv('NKS')  # 환경 변수에서 kubeconfig 경로 가져오기
-            if kubeconfig_path:
-                # kubectl config current-context --kubeconfig $NKS 실행
-                result = subprocess.run(
-                    ['kubectl', 'config', 'current-context', '--kubeconfig', kubeconfig_path],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    context_name = result.stdout.strip()
-                    # UUID 형식 제거 (예: "nks_kr_contest-cluster-27_69b2edb8-2975-4cb4-9dcb-68e3902a68ec" -> "nks_kr_contest-cluster")
-                    
-                    # 1. 표준 UUID 패턴: xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx
-                    # 2. 마지막 underscore 뒤의 UUID 부분 제거
-                    # 3. 하이픈과 숫자로 구성된 끝 부분 제거
-                    
-                    # 표준 UUID 형식 제거 (예: 69b2edb8-2975-4cb4-9dcb-68e3902a68ec)
-                    uuid_pattern = r'_[a-fA-F0-9]{8}(-[a-fA-F0-9]{4}){3}-[a-fA-F0-9]{12}$'
-                    cluster_name = re.sub(uuid_pattern, '', context_name)
-                    
-                    # 혹시 남아있을 수 있는 숫자로 끝나는 패턴 제거 (예: -27)
-                    cluster_name = re.sub(r'-\d+$', '', cluster_name)
-                    
-                    # 하이픈으로 끝나면 제거
-                    cluster_name = cluster_name.rstrip('-')
-                    cluster_name = cluster_name.rstrip('_')
-            else:
-                # 환경 변수가 없으면 일반 kubectl 사용
-                result = subprocess.run(
-                    ['kubectl', 'config', 'current-context'],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    context_name = result.stdout.strip()
-                    # UUID 형식 제거
-                    # 표준 UUID 형식 제거 (예: 69b2edb8-2975-4cb4-9dcb-68e3902a68ec)
-                    uuid_pattern = r'_[a-fA-F0-9]{8}(-[a-fA-F0-9]{4}){3}-[a-fA-F0-9]{12}$'
-                    cluster_name = re.sub(uuid_pattern, '', context_name)
-                    
-                    # 혹시 남아있을 수 있는 숫자로 끝나는 패턴 제거 (예: -27)
-                    cluster_name = re.sub(r'-\d+$', '', cluster_name)
-                    
-                    # 하이픈 또는 underscore로 끝나면 제거
-                    cluster_name = cluster_name.rstrip('-')
-                    cluster_name = cluster_name.rstrip('_')
-        except Exception as e:
-            logger.warning(f"Failed to get cluster name: {e}")
-            cluster_name = "K-Le-PaaS Cluster"  # 기본값
-        
-        # 모든 네임스페이스 조회
-        namespaces = core_v1.list_namespace()
-        namespace_list = [ns.metadata.name for ns in namespaces.items]
-        
-        # 모든 네임스페이스의 리소스 수집
-        all_deployments = []
-        all_pods = []
-        all_services = []
-        
-        # Critical Issues 수집
-        deployment_warnings = []  # Ready 비율이 100% 미만
-        pending_pods = []  # Pending 상태
-        failed_pods = []  # Failed/CrashLoopBackOff 상태
-        high_restart_pods = []  # 재시작 10회 이상
-        
-        # 네임스페이스별 워크로드 집계
-        workloads_by_namespace = {}
-        
-        # 외부 서비스 목록
-        load_balancer_services = []
-        node_port_services = []
-        
-        for namespace_name in namespace_list:
-            workloads_by_namespace[namespace_name] = {
-                "deployments": 0,
-                "pods": 0
-            }
-            
-            # Deployments 조회
-            try:
-                deployments = apps_v1.list_namespaced_deployment(namespace=namespace_name)
-                for deployment in deployments.items:
-                    ready_count = deployment.status.ready_replicas or 0
-                    desired_count = deployment.spec.replicas
-                    
-                    deployment_data = {
-                        "name": deployment.metadata.name,
-                        "namespace": namespace_name,
-                        "ready": f"{ready_count}/{desired_count}",
-                        "status": "Running" if ready_count == desired_count else "Pending"
-                    }
-                    
-                    all_deployments.append(deployment_data)
-                    workloads_by_namespace[namespace_name]["deployments"] += 1
-                    
-                    # Critical: Ready 비율이 100% 미만
-                    if ready_count < desired_count:
-                        deployment_warnings.append({
-                            "namespace": namespace_name,
-                            "name": deployment.metadata.name,
-                            "ready": f"{ready_count}/{desired_count}"
-                        })
-            except ApiException:
-                pass  # 네임스페이스에 접근 권한이 없을 수 있음
-            
-            # Pods 조회
-            try:
-                pods = core_v1.list_namespaced_pod(namespace=namespace_name)
-                for pod in pods.items:
-                    # Pod 상태 정보 추출
-                    phase = pod.status.phase
-                    restart_count = 0
-                    if pod.status.container_statuses:
-                        for container_status in pod.status.container_statuses:
-                            restart_count += container_status.restart_count
-                    
-                    pod_data = {
-                        "name": pod.metadata.name,
-                        "namespace": namespace_name,
-                        "phase": phase,
-                        "restarts": restart_count,
-                        "ready": "0/1",
-                        "age": None
-                    }
-                    
-                    # Ready 상태 계산
-                    if pod.status.container_statuses:
-                        ready_count = sum(1 for cs in pod.status.container_statuses if cs.ready)
-                        total_count = len(pod.status.container_statuses)
-                        pod_data["ready"] = f"{ready_count}/{total_count}"
-                    
-                    # Age 계산
-                    if pod.metadata.creation_timestamp:
-                        now = datetime.now(timezone.utc)
-                        age = now - pod.metadata.creation_timestamp
-                        pod_data["age"] = str(age).split('.')[0]
-                    
-                    all_pods.append(pod_data)
-                    workloads_by_namespace[namespace_name]["pods"] += 1
-                    
-                    # Critical: Pending/Failed Pod
-                    if phase == "Pending":
-                        pending_pods.append({
-                            "namespace": namespace_name,
-                            "name": pod.metadata.name,
-                            "status": phase
-                        })
-                    elif phase in ["Failed", "CrashLoopBackOff"] or any(
-                        cs.state.waiting and cs.state.waiting.reason == "CrashLoopBackOff"
-                        for cs in (pod.status.container_statuses or [])
-                    ):
-                        failed_pods.append({
-                            "namespace": namespace_name,
-                            "name": pod.metadata.name,
-                            "status": phase
-                        })
-                    
-                    # Warning: 높은 재시작 횟수 (10회 이상)
-                    if restart_count >= 10:
-                        high_restart_pods.append({
-                            "namespace": namespace_name,
-                            "name": pod.metadata.name,
-                            "restarts": restart_count
-                        })
-            except ApiException:
-                pass  # 네임스페이스에 접근 권한이 없을 수 있음
-            
-            # Services 조회
-            try:
-                services = core_v1.list_namespaced_service(namespace=namespace_name)
-                for service in services.items:
-                    service_type = service.spec.type
-                    
-                    service_data = {
-                        "name": service.metadata.name,
-                        "namespace": namespace_name,
-                        "type": service_type,
-                        "cluster_ip": service.spec.cluster_ip
-                    }
-                    
-                    all_services.append(service_data)
-                    
-                    # 외부 서비스 분류
-                    if service_type == "LoadBalancer":
-                        load_balancer_services.append({
-                            "name": service.metadata.name,
-                            "namespace": namespace_name
-                        })
-                    elif service_type == "NodePort":
-                        node_port_services.append({
-                            "name": service.metadata.name,
-                            "namespace": namespace_name
-                        })
-            except ApiException:
-                pass  # 네임스페이스에 접근 권한이 없을 수 있음
-        
-        # 요약 통계
-        summary = {
-            "cluster_name": cluster_name,
-            "total_nodes": len(cluster_nodes),
-            "total_namespaces": len(namespace_list),
-            "total_deployments": len(all_deployments),
-            "total_pods": len(all_pods),
-            "total_services": len(all_services),
-            "running_pods": len([p for p in all_pods if p["phase"] == "Running"]),
-            "critical_deployment_issues": len(deployment_warnings),
-            "pending_pod_issues": len(pending_pods),
-            "failed_pod_issues": len(failed_pods),
-            "high_restart_issues": len(high_restart_pods)
-        }
-        
-        return {
-            "status": "success",
-            "cluster_info": {
-                "name": cluster_name,
-                "total_nodes": len(cluster_nodes),
-                "nodes": cluster_nodes
-            },
-            "namespaces": namespace_list,
-            "critical_issues": {
-                "deployment_warnings": deployment_warnings,
-                "pending_pods": pending_pods,
-                "failed_pods": failed_pods
-            },
-            "warnings": {
-                "high_restart_pods": high_restart_pods
-            },
-            "workloads_by_namespace": workloads_by_namespace,
-            "external_services": {
-                "load_balancer": load_balancer_services,
-                "node_port": node_port_services
-            },
-            "summary": summary
-        }
-        
+        return await get_cluster_overview_engine().get(force_refresh=bool(args.get("refresh")))
     except Exception as e:
         logger.error(f"Failed to get overview: {e}")
         return {
@@ -1596,35 +1365,24 @@ async def _execute_list_all_deployments(args: Dict[str, Any]) -> Dict[str, Any]:
     모든 네임스페이스의 Deployment 목록 조회 (list_deployments 명령어)
     예: "모든 Deployment 조회해줘", "전체 앱 목록 보여줘"
     """
+    limit, continue_token = _list_page(args)
     try:
         apps_v1 = get_apps_v1_api()
         
-        # 모든 네임스페이스의 Deployment 조회
-        deployments = apps_v1.list_deployment_for_all_namespaces()
-        
-        deployment_list = []
-        for deployment in deployments.items:
-            deployment_info = {
-                "name": deployment.metadata.name,
-                "namespace": deployment.metadata.namespace,
-                "replicas": {
-                    "desired": deployment.spec.replicas,
-                    "current": deployment.status.replicas or 0,
-                    "ready": deployment.status.ready_replicas or 0,
-                    "available": deployment.status.available_replicas or 0,
-                },
-                "image": deployment.spec.template.spec.containers[0].image if deployment.spec.template.spec.containers else None,
-                "status": "Running" if deployment.status.ready_replicas == deployment.spec.replicas else "Pending"
-            }
-            deployment_list.append(deployment_info)
+        # 모든 네임스페이스의 Deployment 조회 (원본 JSON 고속 경로)
+        deployments = await asyncio.to_thread(list_deployments, apps_v1, limit=limit, continue_token=continue_token)
+        now = datetime.now(timezone.utc).timestamp()
+        deployment_list = [deployment_summary(d, now) for d in deployments.items]
         
         return {
             "status": "success",
             "message": "모든 네임스페이스의 Deployment 목록 조회 완료",
-            "total_deployments": len(deployment_list),
-            "deployments": deployment_list
+            "deployments": deployment_list,
+            **_page_fields(deployments, limit, continue_token, "total_deployments"),
         }
         
+    except ApiException as e:
+        return _expired_cursor_error(e) or {"status": "error", "message": f"전체 Deployment 조회 실패: {e.reason}"}
     except Exception as e:
         return {"status": "error", "message": f"전체 Deployment 조회 실패: {str(e)}"}
 
@@ -1634,43 +1392,24 @@ async def _execute_list_all_services(args: Dict[str, Any]) -> Dict[str, Any]:
     모든 네임스페이스의 Service 목록 조회 (list_services 명령어)
     예: "모든 Service 조회해줘", "전체 서비스 목록 보여줘"
     """
+    limit, continue_token = _list_page(args)
     try:
         core_v1 = get_core_v1_api()
         
-        # 모든 네임스페이스의 Service 조회
-        services = core_v1.list_service_for_all_namespaces()
-        
-        service_list = []
-        for service in services.items:
-            service_info = {
-                "name": service.metadata.name,
-                "namespace": service.metadata.namespace,
-                "type": service.spec.type,
-                "cluster_ip": service.spec.cluster_ip,
-                "ports": []
-            }
-            
-            # Service 포트 정보
-            if service.spec.ports:
-                for port in service.spec.ports:
-                    port_info = {
-                        "port": port.port,
-                        "target_port": port.target_port,
-                        "protocol": port.protocol or "TCP"
-                    }
-                    if service.spec.type == "NodePort" and port.node_port:
-                        port_info["node_port"] = port.node_port
-                    service_info["ports"].append(port_info)
-            
-            service_list.append(service_info)
+        # 모든 네임스페이스의 Service 조회 (원본 JSON 고속 경로)
+        services = await asyncio.to_thread(list_services, core_v1, limit=limit, continue_token=continue_token)
+        now = datetime.now(timezone.utc).timestamp()
+        service_list = [service_summary(svc, now) for svc in services.items]
         
         return {
             "status": "success",
             "message": "모든 네임스페이스의 Service 목록 조회 완료",
-            "total_services": len(service_list),
-            "services": service_list
+            "services": service_list,
+            **_page_fields(services, limit, continue_token, "total_services"),
         }
         
+    except ApiException as e:
+        return _expired_cursor_error(e) or {"status": "error", "message": f"전체 Service 조회 실패: {e.reason}"}
     except Exception as e:
         return {"status": "error", "message": f"전체 Service 조회 실패: {str(e)}"}
 
@@ -1681,40 +1420,24 @@ async def _execute_list_services(args: Dict[str, Any]) -> Dict[str, Any]:
     예: "default 네임스페이스 service 목록 보여줘"
     """
     namespace = args.get("namespace", "default")
+    limit, continue_token = _list_page(args)
     try:
         core_v1 = get_core_v1_api()
-        services = core_v1.list_namespaced_service(namespace=namespace)
-
-        service_list = []
-        for service in services.items:
-            service_info = {
-                "name": service.metadata.name,
-                "namespace": service.metadata.namespace,
-                "type": service.spec.type,
-                "cluster_ip": service.spec.cluster_ip,
-                "ports": []
-            }
-            if service.spec.ports:
-                for port in service.spec.ports:
-                    port_info = {
-                        "port": port.port,
-                        "target_port": port.target_port,
-                        "protocol": port.protocol or "TCP"
-                    }
-                    if service.spec.type == "NodePort" and port.node_port:
-                        port_info["node_port"] = port.node_port
-                    service_info["ports"].append(port_info)
-
-            service_list.append(service_info)
+        services = await asyncio.to_thread(list_services, core_v1, namespace, limit=limit, continue_token=continue_token)
+        now = datetime.now(timezone.utc).timestamp()
+        service_list = [service_summary(svc, now) for svc in services.items]
 
         return {
             "status": "success",
             "message": f"'{namespace}' 네임스페이스의 Service 목록 조회 완료",
             "namespace": namespace,
-            "total_services": len(service_list),
-            "services": service_list
+            "services": service_list,
+            **_page_fields(services, limit, continue_token, "total_services"),
         }
     except ApiException as e:
+        expired = _expired_cursor_error(e)
+        if expired:
+            return expired
         if e.status == 404:
             return {
                 "status": "error",
@@ -1862,46 +1585,27 @@ async def _execute_list_deployments(args: Dict[str, Any]) -> Dict[str, Any]:
     예: "default 네임스페이스 deployment 목록", "test 네임스페이스 deployment 목록"
     """
     namespace = args.get("namespace", "default")
+    limit, continue_token = _list_page(args)
     
     try:
         apps_v1 = get_apps_v1_api()
         
-        # 네임스페이스의 모든 Deployment 조회
-        deployments = apps_v1.list_namespaced_deployment(namespace=namespace)
-        
-        deployment_list = []
-        for deployment in deployments.items:
-            deployment_info = {
-                "name": deployment.metadata.name,
-                "namespace": deployment.metadata.namespace,
-                "replicas": {
-                    "desired": deployment.spec.replicas,
-                    "current": deployment.status.replicas or 0,
-                    "ready": deployment.status.ready_replicas or 0,
-                    "available": deployment.status.available_replicas or 0,
-                },
-                "image": deployment.spec.template.spec.containers[0].image if deployment.spec.template.spec.containers else None,
-                "age": None,
-                "status": "Running" if deployment.status.ready_replicas == deployment.spec.replicas else "Pending"
-            }
-            
-            # Deployment 생성 시간 계산
-            if deployment.metadata.creation_timestamp:
-                now = datetime.now(timezone.utc)
-                age = now - deployment.metadata.creation_timestamp
-                deployment_info["age"] = str(age).split('.')[0]  # 초 단위 제거
-            
-            deployment_list.append(deployment_info)
+        # 네임스페이스의 Deployment 조회 (원본 JSON 고속 경로)
+        deployments = await asyncio.to_thread(
+            list_deployments, apps_v1, namespace, limit=limit, continue_token=continue_token
+        )
+        now = datetime.now(timezone.utc).timestamp()
+        deployment_list = [deployment_summary(d, now) for d in deployments.items]
         
         return {
             "status": "success",
             "namespace": namespace,
-            "total_deployments": len(deployment_list),
-            "deployments": deployment_list
+            "deployments": deployment_list,
+            **_page_fields(deployments, limit, continue_token, "total_deployments"),
         }
         
     except ApiException as e:
-        return {"status": "error", "message": f"Kubernetes API 오류: {e.reason}"}
+        return _expired_cursor_error(e) or {"status": "error", "message": f"Kubernetes API 오류: {e.reason}"}
     except Exception as e:
         return {"status": "error", "message": f"Deployment 목록 조회 실패: {str(e)}"}
 
@@ -1912,18 +1616,20 @@ async def _execute_list_namespaced_endpoints(args: Dict[str, Any]) -> Dict[str,
     예: "엔드포인트 목록 보여줘", "default 네임스페이스 모든 접속 주소 확인"
     
     Service와 연결된 Ingress 도메인을 포함하여 모든 접속 주소를 제공합니다.
+    Service는 limit/continue 페이지 단위로 조회합니다.
     """
     namespace = args.get("namespace", "default")
+    limit, continue_token = _list_page(args)
     
     try:
         core_v1 = get_core_v1_api()
         networking_v1 = get_networking_v1_api()
         
-        # 1. 네임스페이스의 모든 Service 조회
-        services = core_v1.list_namespaced_service(namespace=namespace)
-        
-        # 2. 네임스페이스의 모든 Ingress 조회
-        ingresses = networking_v1.list_namespaced_ingress(namespace=namespace)
+        # 1. 네임스페이스의 Service 조회 (원본 JSON 고속 경로) 와 2. Ingress 조회를 동시에 실행
+        services, ingresses = await asyncio.gather(
+            asyncio.to_thread(list_services, core_v1, namespace, limit=limit, continue_token=continue_token),
+            asyncio.to_thread(networking_v1.list_namespaced_ingress, namespace=namespace),
+        )
         
         # 3. Service별 Ingress 매핑 생성
         service_to_ingress = {}
@@ -1948,68 +1654,58 @@ async def _execute_list_namespaced_endpoints(args: Dict[str, Any]) -> Dict[str,
         # 4. Endpoint 정보 구성
         endpoint_list = []
         for service in services.items:
-            service_name = service.metadata.name
+            service_name = service.name
+            ports = service_ports(service)
             
             # 기본 Service 정보
             endpoint_info = {
                 "service_name": service_name,
-                "service_type": service.spec.type,
-                "cluster_ip": service.spec.cluster_ip,
-                "ports": [],
-                "ingress_domains": [],
+                "service_type": service.type,
+                "cluster_ip": service.cluster_ip,
+                "ports": ports,
+                "ingress_domains": service_to_ingress.get(service_name, []),
                 "external_access": None,
-                "service_endpoint": None
+                "service_endpoint": None,
+                "created_ts": service.created,
             }
             
-            # Service 포트 정보
-            if service.spec.ports:
-                for port in service.spec.ports:
-                    port_info = {
-                        "port": port.port,
-                        "target_port": port.target_port,
-                        "protocol": port.protocol or "TCP"
-                    }
-                    if service.spec.type == "NodePort" and port.node_port:
-                        port_info["node_port"] = port.node_port
-                    endpoint_info["ports"].append(port_info)
-                
-                # 서비스 엔드포인트 생성 (첫 번째 포트 사용)
-                endpoint_info["service_endpoint"] = f"http://{service_name}:{service.spec.ports[0].port}"
-            
-            # Ingress 도메인 정보
-            if service_name in service_to_ingress:
-                endpoint_info["ingress_domains"] = service_to_ingress[service_name]
+            # 서비스 엔드포인트 생성 (첫 번째 포트 사용)
+            if ports:
+                endpoint_info["service_endpoint"] = f"http://{service_name}:{ports[0]['port']}"
             
             # LoadBalancer 외부 IP 정보
-            if service.spec.type == "LoadBalancer" and service.status.load_balancer.ingress:
-                for lb_ingress in service.status.load_balancer.ingress:
-                    external_ip = lb_ingress.ip or lb_ingress.hostname
-                    if external_ip:
-                        endpoint_info["external_access"] = {
-                            "type": "LoadBalancer",
-                            "address": external_ip,
-                            "ports": [{"port": p.port, "protocol": p.protocol or "TCP"} 
-                                     for p in service.spec.ports] if service.spec.ports else []
-                        }
+            if service.type == "LoadBalancer" and service.external:
+                endpoint_info["external_access"] = {
+                    "type": "LoadBalancer",
+                    "address": service.external[-1],
+                    "ports": [{"port": p["port"], "protocol": p["protocol"]} for p in ports]
+                }
             
             endpoint_list.append(endpoint_info)
         
         # 요약 통계
+        page = _page_fields(services, limit, continue_token, "total_services")
         summary = {
-            "total_services": len(endpoint_list),
+            "service_count": len(endpoint_list),
             "services_with_ingress": len([e for e in endpoint_list if e["ingress_domains"]]),
             "services_with_external": len([e for e in endpoint_list if e["external_access"]])
         }
+        if "total_services" in page:
+            summary["total_services"] = page["total_services"]
         
         return {
             "status": "success",
             "message": f"'{namespace}' 네임스페이스 엔드포인트 목록 조회 완료",
             "namespace": namespace,
             "summary": summary,
-            "endpoints": endpoint_list
+            "endpoints": endpoint_list,
+            **page,
         }
         
     except ApiException as e:
+        expired = _expired_cursor_error(e)
+        if expired:
+            return {**expired, "namespace": namespace}
         if e.status == 404:
             return {
                 "status": "error",
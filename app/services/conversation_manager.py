@@ -6,19 +6,12 @@ Redis를 사용하여 멀티턴 대화 상태를 관리하고,
 """
 
 from enum import Enum
-import json
 import uuid
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 import structlog
 
-
-class DateTimeEncoder(json.JSONEncoder):
-    """datetime 객체를 JSON 직렬화 가능한 형태로 변환하는 커스텀 인코더"""
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
+from ..core.serialization import dumps_str, loads
 
 logger = structlog.get_logger(__name__)
 
@@ -77,7 +70,7 @@ class ConversationManager:
         self.redis.setex(
             key,
             self.ttl,
-            json.dumps(session_data, ensure_ascii=False, cls=DateTimeEncoder)
+            dumps_str(session_data)
         )
 
         logger.info(
@@ -114,7 +107,7 @@ class ConversationManager:
             )
             return None
 
-        return json.loads(data)
+        return loads(data)
 
     async def update_state(
         self,
@@ -147,7 +140,7 @@ class ConversationManager:
         self.redis.setex(
             key,
             self.ttl,
-            json.dumps(session, ensure_ascii=False, cls=DateTimeEncoder)
+            dumps_str(session)
         )
 
         logger.info(
@@ -201,7 +194,7 @@ class ConversationManager:
         self.redis.setex(
             key,
             self.ttl,
-            json.dumps(session, ensure_ascii=False, cls=DateTimeEncoder)
+            dumps_str(session)
         )
 
         logger.debug(
@@ -237,7 +230,7 @@ class ConversationManager:
         self.redis.setex(
             key,
             self.ttl,
-            json.dumps(session, ensure_ascii=False, cls=DateTimeEncoder)
+            dumps_str(session)
         )
 
     async def get_conversation_history(
@@ -291,7 +284,7 @@ class ConversationManager:
         self.redis.setex(
             key,
             self.ttl,
-            json.dumps(session, ensure_ascii=False, cls=DateTimeEncoder)
+            dumps_str(session)
         )
 
     async def delete_session(
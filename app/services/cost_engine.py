@@ -0,0 +1,525 @@
+"""
+클러스터 비용 분석 엔진
+
+cost_analysis 명령의 실제 계산을 담당합니다. Pod별 컨테이너 requests/limits(원본 JSON 고속 경로)와
+Prometheus 사용량을 모아 모든 Pod를 NumPy 배열 한 벌(columnar)로 만든 뒤, 비용/유휴 낭비/집계를
+객체별 루프 없이 배열 연산과 np.bincount로 한 번에 계산합니다.
+
+- 과금 기준: Pod마다 max(request, 실제 사용량) × 단가 (request가 없는 Pod는 사용량으로 과금)
+- 유휴 낭비: request - 사용량 (사용량 데이터가 있는 Pod만), 회수 가능액은 사용량의 HEADROOM배를 남긴 나머지
+- 네임스페이스/워크로드(Deployment 등)별 집계, 최적화 제안, 사용량 추세 기반 월간 예측
+- 결과는 네임스페이스별로 cost_cache_ttl_seconds 동안 캐시하고 동시 요청은 하나의 수집으로 병합
+"""
+
+import asyncio
+import re
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import structlog
+
+from ..core.config import get_settings
+from .k8s_client import get_core_v1_api
+from .k8s_fast_list import list_pod_items
+from .prometheus_client import prometheus_client
+
+logger = structlog.get_logger(__name__)
+
+HOURS_PER_MONTH = 730.0
+GIB = float(1 << 30)
+MIB = float(1 << 20)
+# 권장 request = 관측 최대 사용량 × HEADROOM
+HEADROOM = 1.2
+TOP_WORKLOADS = 20
+ALL_NAMESPACES = ("", "all", "*")
+# PromQL 셀렉터에 그대로 들어가므로 Kubernetes 네임스페이스(DNS label) 형식만 허용
+_NAMESPACE_PATTERN = re.compile(r"^[a-z0-9]([-a-z0-9]{0,61}[a-z0-9])?$")
+_ACTIVE_PHASES = frozenset(("Running", "Pending"))
+
+_QUANTITY_SUFFIXES = {
+    "Ki": 1024.0, "Mi": 1024.0 ** 2, "Gi": 1024.0 ** 3, "Ti": 1024.0 ** 4, "Pi": 1024.0 ** 5, "Ei": 1024.0 ** 6,
+    "n": 1e-9, "u": 1e-6, "m": 1e-3, "k": 1e3, "K": 1e3, "M": 1e6, "G": 1e9, "T": 1e12, "P": 1e15, "E": 1e18,
+}
+
+
+@lru_cache(maxsize=4096)
+def parse_quantity(value: Any) -> float:
+    """Kubernetes 수량 문자열("500m", "1Gi", "2", "1e3")을 기본 단위(core, byte) float로 변환합니다."""
+    text = str(value).strip()
+    if not text:
+        return 0.0
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    for suffix in (text[-2:], text[-1:]):
+        factor = _QUANTITY_SUFFIXES.get(suffix)
+        if factor is not None:
+            try:
+                return float(text[:-len(suffix)]) * factor
+            except ValueError:
+                return 0.0
+    return 0.0
+
+
+def _container_totals(containers: Sequence[Dict[str, Any]], field: str) -> Tuple[float, float]:
+    cpu = memory = 0.0
+    for container in containers:
+        values = (container.get("resources") or {}).get(field) or {}
+        if values:
+            cpu += parse_quantity(values.get("cpu", 0))
+            memory += parse_quantity(values.get("memory", 0))
+    return cpu, memory
+
+
+def _init_peak(containers: Sequence[Dict[str, Any]], field: str) -> Tuple[float, float]:
+    cpu = memory = 0.0
+    for container in containers:
+        values = (container.get("resources") or {}).get(field) or {}
+        if values:
+            cpu = max(cpu, parse_quantity(values.get("cpu", 0)))
+            memory = max(memory, parse_quantity(values.get("memory", 0)))
+    return cpu, memory
+
+
+def _workload(meta: Dict[str, Any]) -> Tuple[str, str]:
+    """Pod의 소유 워크로드 (ReplicaSet은 pod-template-hash를 떼어 Deployment로 환산)"""
+    refs = meta.get("ownerReferences") or ()
+    if not refs:
+        return "Pod", meta.get("name") or ""
+    ref = next((r for r in refs if r.get("controller")), refs[0])
+    kind, name = ref.get("kind") or "Pod", ref.get("name") or ""
+    if kind == "ReplicaSet":
+        template_hash = (meta.get("labels") or {}).get("pod-template-hash")
+        if template_hash and name.endswith(f"-{template_hash}"):
+            return "Deployment", name[: -len(template_hash) - 1]
+    return kind, name
+
+
+@dataclass
+class PodFrame:
+    """Pod 전체를 열 단위 배열로 담은 프레임"""
+    index: Dict[Tuple[str, str], int]
+    namespaces: List[str]
+    ns_codes: np.ndarray
+    workloads: List[Tuple[str, str, str]]
+    wl_codes: np.ndarray
+    active: np.ndarray
+    cpu_request: np.ndarray
+    mem_request: np.ndarray
+    cpu_limit: np.ndarray
+    mem_limit: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ns_codes)
+
+
+def build_pod_frame(items: Sequence[Dict[str, Any]]) -> PodFrame:
+    """Pod 원본 JSON 목록을 한 번 순회해 열 배열을 만듭니다 (이후 계산은 모두 배열 연산)."""
+    index: Dict[Tuple[str, str], int] = {}
+    ns_index: Dict[str, int] = {}
+    wl_index: Dict[Tuple[str, str, str], int] = {}
+    ns_codes: List[int] = []
+    wl_codes: List[int] = []
+    active: List[bool] = []
+    requests: List[Tuple[float, float]] = []
+    limits: List[Tuple[float, float]] = []
+
+    for item in items:
+        meta = item.get("metadata") or {}
+        spec = item.get("spec") or {}
+        namespace = meta.get("namespace") or ""
+        index[(namespace, meta.get("name") or "")] = len(ns_codes)
+        ns_codes.append(ns_index.setdefault(namespace, len(ns_index)))
+        kind, name = _workload(meta)
+        wl_codes.append(wl_index.setdefault((namespace, kind, name), len(wl_index)))
+        active.append((item.get("status") or {}).get("phase") in _ACTIVE_PHASES)
+
+        containers = spec.get("containers") or ()
+        init_containers = spec.get("initContainers") or ()
+        req_cpu, req_mem = _container_totals(containers, "requests")
+        lim_cpu, lim_mem = _container_totals(containers, "limits")
+        if init_containers:
+            # 유효 request/limit = max(일반 컨테이너 합, init 컨테이너 최댓값)
+            init_cpu, init_mem = _init_peak(init_containers, "requests")
+            req_cpu, req_mem = max(req_cpu, init_cpu), max(req_mem, init_mem)
+            init_cpu, init_mem = _init_peak(init_containers, "limits")
+            lim_cpu, lim_mem = max(lim_cpu, init_cpu), max(lim_mem, init_mem)
+        requests.append((req_cpu, req_mem))
+        limits.append((lim_cpu, lim_mem))
+
+    req = np.array(requests, dtype=np.float64).reshape(-1, 2)
+    lim = np.array(limits, dtype=np.float64).reshape(-1, 2)
+    return PodFrame(
+        index=index,
+        namespaces=list(ns_index),
+        ns_codes=np.array(ns_codes, dtype=np.intp),
+        workloads=list(wl_index),
+        wl_codes=np.array(wl_codes, dtype=np.intp),
+        active=np.array(active, dtype=bool),
+        cpu_request=req[:, 0],
+        mem_request=req[:, 1],
+        cpu_limit=lim[:, 0],
+        mem_limit=lim[:, 1],
+    )
+
+
+def usage_vector(frame: PodFrame, result: Optional[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+    """`sum by (namespace, pod)` instant 쿼리 결과를 프레임 순서의 (값, 존재 여부) 배열로 정렬합니다."""
+    values = np.zeros(len(frame), dtype=np.float64)
+    present = np.zeros(len(frame), dtype=bool)
+    if not result or result.get("status") != "success":
+        return values, present
+    positions: List[int] = []
+    samples: List[float] = []
+    for series in result.get("data", {}).get("result", []):
+        metric = series.get("metric") or {}
+        position = frame.index.get((metric.get("namespace"), metric.get("pod")))
+        if position is None:
+            continue
+        try:
+            samples.append(float(series["value"][1]))
+        except (KeyError, IndexError, TypeError, ValueError):
+            continue
+        positions.append(position)
+    if positions:
+        idx = np.array(positions, dtype=np.intp)
+        values[idx] = np.nan_to_num(np.array(samples, dtype=np.float64))
+        present[idx] = True
+    return values, present
+
+
+def _matrix_total(result: Optional[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+    """range 쿼리 결과의 시계열들을 타임스탬프별로 합산합니다."""
+    if not result or result.get("status") != "success":
+        return np.empty(0), np.empty(0)
+    series = [np.array(s.get("values") or [], dtype=np.float64).reshape(-1, 2) for s in result.get("data", {}).get("result", [])]
+    if not series:
+        return np.empty(0), np.empty(0)
+    stacked = np.concatenate(series)
+    timestamps, inverse = np.unique(stacked[:, 0], return_inverse=True)
+    return timestamps, np.bincount(inverse, weights=stacked[:, 1])
+
+
+def forecast_trend(
+    cpu_history: Optional[Dict[str, Any]],
+    mem_history: Optional[Dict[str, Any]],
+    cpu_price: float,
+    mem_price: float,
+) -> Optional[Dict[str, Any]]:
+    """사용량 비용 시계열에 1차 추세선을 맞춰 다음 한 달 평균의 현재 대비 배율을 구합니다."""
+    cpu_t, cpu_v = _matrix_total(cpu_history)
+    mem_t, mem_v = _matrix_total(mem_history)
+    timestamps, cpu_idx, mem_idx = np.intersect1d(cpu_t, mem_t, return_indices=True)
+    if len(timestamps) < 2:
+        return None
+    monthly = cpu_v[cpu_idx] * cpu_price + mem_v[mem_idx] / GIB * mem_price
+    hours = (timestamps - timestamps[0]) / 3600.0
+    slope, intercept = np.polyfit(hours, monthly, 1)
+    fitted_now = intercept + slope * hours[-1]
+    projected = intercept + slope * (hours[-1] + HOURS_PER_MONTH / 2)
+    growth = float(np.clip(projected / fitted_now, 0.5, 3.0)) if fitted_now > 0 else 1.0
+    mean = float(monthly.mean())
+    return {
+        "growth": round(growth, 4),
+        "trend_pct_per_month": round(float(slope * HOURS_PER_MONTH / mean * 100), 2) if mean > 0 else 0.0,
+        "samples": int(len(timestamps)),
+        "lookback_hours": round(float(hours[-1]), 1),
+    }
+
+
+def _won(value: Any) -> int:
+    return int(round(float(value)))
+
+
+def analyze_pods(
+    items: Sequence[Dict[str, Any]],
+    cpu_usage: Optional[Dict[str, Any]] = None,
+    mem_usage: Optional[Dict[str, Any]] = None,
+    cpu_history: Optional[Dict[str, Any]] = None,
+    mem_history: Optional[Dict[str, Any]] = None,
+    cpu_price: Optional[float] = None,
+    mem_price: Optional[float] = None,
+    min_savings: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Pod 원본 JSON과 Prometheus 결과로 월간 비용/낭비/집계/예측을 계산합니다."""
+    settings = get_settings()
+    cpu_price = settings.cost_cpu_core_monthly_krw if cpu_price is None else cpu_price
+    mem_price = settings.cost_memory_gib_monthly_krw if mem_price is None else mem_price
+    min_savings = settings.cost_min_savings_krw if min_savings is None else min_savings
+
+    frame = build_pod_frame(items)
+    cpu_used, cpu_seen = usage_vector(frame, cpu_usage)
+    mem_used, mem_seen = usage_vector(frame, mem_usage)
+    active = frame.active
+
+    # Pod별 월 비용 (비활성 Pod는 0)
+    cpu_cost = np.where(active, np.maximum(frame.cpu_request, cpu_used), 0.0) * cpu_price
+    mem_cost = np.where(active, np.maximum(frame.mem_request, mem_used), 0.0) / GIB * mem_price
+    cost = cpu_cost + mem_cost
+
+    # 유휴 낭비와 HEADROOM을 남기고 회수 가능한 금액
+    cpu_live, mem_live = active & cpu_seen, active & mem_seen
+    idle = (
+        np.where(cpu_live, np.maximum(frame.cpu_request - cpu_used, 0.0), 0.0) * cpu_price
+        + np.where(mem_live, np.maximum(frame.mem_request - mem_used, 0.0), 0.0) / GIB * mem_price
+    )
+    reclaimable = (
+        np.where(cpu_live, np.maximum(frame.cpu_request - cpu_used * HEADROOM, 0.0), 0.0) * cpu_price
+        + np.where(mem_live, np.maximum(frame.mem_request - mem_used * HEADROOM, 0.0), 0.0) / GIB * mem_price
+    )
+
+    n_ns, n_wl = len(frame.namespaces), len(frame.workloads)
+
+    def by_ns(weights: np.ndarray) -> np.ndarray:
+        return np.bincount(frame.ns_codes, weights=weights, minlength=n_ns)
+
+    def by_wl(weights: np.ndarray) -> np.ndarray:
+        return np.bincount(frame.wl_codes, weights=weights, minlength=n_wl)
+
+    active_f = active.astype(np.float64)
+    ns_pods, ns_cost, ns_cpu, ns_mem, ns_idle = (
+        by_ns(active_f), by_ns(cost), by_ns(cpu_cost), by_ns(mem_cost), by_ns(idle)
+    )
+    wl_pods, wl_cost, wl_idle, wl_reclaim = by_wl(active_f), by_wl(cost), by_wl(idle), by_wl(reclaimable)
+    wl_cpu_req, wl_mem_req = by_wl(frame.cpu_request * active), by_wl(frame.mem_request * active)
+    wl_cpu_peak = np.zeros(n_wl)
+    wl_mem_peak = np.zeros(n_wl)
+    np.maximum.at(wl_cpu_peak, frame.wl_codes, np.where(cpu_live, cpu_used, 0.0))
+    np.maximum.at(wl_mem_peak, frame.wl_codes, np.where(mem_live, mem_used, 0.0))
+    per_pod = np.maximum(wl_pods, 1.0)
+
+    ns_order = np.argsort(-ns_cost, kind="stable")
+    namespaces = [
+        {
+            "namespace": frame.namespaces[i],
+            "pods": int(ns_pods[i]),
+            "cost": _won(ns_cost[i]),
+            "cpu_cost": _won(ns_cpu[i]),
+            "memory_cost": _won(ns_mem[i]),
+            "waste": _won(ns_idle[i]),
+        }
+        for i in ns_order
+    ]
+
+    wl_order = np.argsort(-wl_cost, kind="stable")
+    workloads = []
+    for i in wl_order[:TOP_WORKLOADS]:
+        if wl_pods[i] == 0:
+            continue
+        namespace, kind, name = frame.workloads[i]
+        workloads.append({
+            "namespace": namespace,
+            "kind": kind,
+            "name": name,
+            "pods": int(wl_pods[i]),
+            "cost": _won(wl_cost[i]),
+            "waste": _won(wl_idle[i]),
+            "reclaimable": _won(wl_reclaim[i]),
+        })
+
+    # 회수 가능액이 큰 워크로드부터 request 조정 제안
+    optimizations = []
+    for i in np.argsort(-wl_reclaim, kind="stable"):
+        if wl_reclaim[i] < min_savings or len(optimizations) >= 10:
+            break
+        namespace, kind, name = frame.workloads[i]
+        cpu_now, mem_now = wl_cpu_req[i] / per_pod[i], wl_mem_req[i] / per_pod[i]
+        cpu_rec = min(cpu_now, wl_cpu_peak[i] * HEADROOM)
+        mem_rec = min(mem_now, wl_mem_peak[i] * HEADROOM)
+        optimizations.append({
+            "type": "rightsize_requests",
+            "namespace": namespace,
+            "workload": f"{kind}/{name}",
+            "pods": int(wl_pods[i]),
+            "cpu_request_cores": [round(float(cpu_now), 3), round(float(cpu_rec), 3)],
+            "memory_request_mib": [round(float(mem_now / MIB)), round(float(mem_rec / MIB))],
+            "monthly_savings": _won(wl_reclaim[i]),
+            "description": (
+                f"{namespace}/{name}: Pod당 CPU request {cpu_now:.2f}→{cpu_rec:.2f} core, "
+                f"메모리 {mem_now / MIB:.0f}→{mem_rec / MIB:.0f}Mi로 줄이면 월 ₩{_won(wl_reclaim[i]):,} 절감"
+            ),
+        })
+
+    no_requests = int(np.count_nonzero(active & (frame.cpu_request == 0) & (frame.mem_request == 0)))
+    if no_requests:
+        optimizations.append({
+            "type": "missing_requests",
+            "pods": no_requests,
+            "monthly_savings": 0,
+            "description": f"requests가 없는 Pod {no_requests}개: 스케줄링/비용 예측을 위해 requests를 설정하세요",
+        })
+
+    total = float(cost.sum())
+    total_idle = float(idle.sum())
+    usage_available = bool(cpu_seen.any() or mem_seen.any())
+    return {
+        "currency": "KRW",
+        "period": "월간",
+        "current_cost": _won(total),
+        "breakdown": {"cpu": _won(cpu_cost.sum()), "memory": _won(mem_cost.sum()), "idle": _won(total_idle)},
+        "waste": {
+            "monthly": _won(total_idle),
+            "ratio": round(total_idle / total, 4) if total else 0.0,
+            "reclaimable": _won(reclaimable.sum()),
+            "pods_without_requests": no_requests,
+        },
+        "namespaces": namespaces,
+        "workloads": workloads,
+        "optimizations": optimizations,
+        "forecast": forecast_trend(cpu_history, mem_history, cpu_price, mem_price),
+        "resource_usage": {
+            "pods": int(active.sum()),
+            "workloads": int(np.count_nonzero(wl_pods)),
+            "namespaces": int(np.count_nonzero(ns_pods)),
+            "usage_available": usage_available,
+            "cpu_requested_cores": round(float(frame.cpu_request[active].sum()), 3),
+            "cpu_used_cores": round(float(cpu_used[active].sum()), 3),
+            "memory_requested_gib": round(float(frame.mem_request[active].sum() / GIB), 3),
+            "memory_used_gib": round(float(mem_used[active].sum() / GIB), 3),
+        },
+    }
+
+
+def _selector(namespace: str) -> str:
+    if not namespace:
+        return ""
+    escaped = namespace.replace("\\", "\\\\").replace('"', '\\"')
+    return f', namespace="{escaped}"'
+
+
+class CostEngine:
+    """네임스페이스별 비용 분석을 수집/계산하고 TTL 동안 캐시합니다."""
+
+    def __init__(self, core_v1_factory=get_core_v1_api, prometheus=prometheus_client, ttl_seconds: Optional[float] = None):
+        self._core_v1_factory = core_v1_factory
+        self._prometheus = prometheus
+        self.ttl_seconds = get_settings().cost_cache_ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def analyze(self, namespace: str = "default", force_refresh: bool = False) -> Dict[str, Any]:
+        key = "" if namespace in ALL_NAMESPACES else namespace
+        if key and not _NAMESPACE_PATTERN.fullmatch(key):
+            raise ValueError(f"유효하지 않은 네임스페이스입니다: {namespace!r}")
+        cached = self._cache.get(key)
+        if cached is not None and not force_refresh:
+            age = time.monotonic() - cached[0]
+            if age <= self.ttl_seconds:
+                return {**cached[1], "snapshot": {"cached": True, "age_seconds": round(age, 2)}}
+
+        task = self._inflight.get(key)
+        if task is None or task.done():
+            task = self._inflight[key] = asyncio.ensure_future(self._refresh(key))
+        result = await asyncio.shield(task)
+        return {**result, "snapshot": {"cached": False, "age_seconds": 0.0}}
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        if namespace is None:
+            self._cache.clear()
+        else:
+            self._cache.pop("" if namespace in ALL_NAMESPACES else namespace, None)
+
+    async def _refresh(self, namespace: str) -> Dict[str, Any]:
+        try:
+            result = await self._collect(namespace)
+            self._cache[namespace] = (time.monotonic(), result)
+            return result
+        finally:
+            self._inflight.pop(namespace, None)
+
+    async def _collect(self, namespace: str) -> Dict[str, Any]:
+        start = time.perf_counter()
+        selector = _selector(namespace)
+        cpu_expr = f'rate(container_cpu_usage_seconds_total{{container!="", container!="POD"{selector}}}[5m])'
+        mem_expr = f'container_memory_working_set_bytes{{container!="", container!="POD"{selector}}}'
+        now = time.time()
+        lookback = get_settings().cost_forecast_lookback_days * 86400
+
+        async def prom(coro):
+            try:
+                return await coro
+            except Exception as e:
+                logger.warning("cost_usage_query_failed", namespace=namespace or "*", error=str(e))
+                return None
+
+        items, cpu_usage, mem_usage, cpu_history, mem_history = await asyncio.gather(
+            asyncio.to_thread(list_pod_items, self._core_v1_factory(), namespace or None),
+            prom(self._prometheus.query(f"sum by (namespace, pod) ({cpu_expr})")),
+            prom(self._prometheus.query(f"sum by (namespace, pod) ({mem_expr})")),
+            prom(self._prometheus.query_range(f"sum({cpu_expr})", start=now - lookback, end=now, step=3600)),
+            prom(self._prometheus.query_range(f"sum({mem_expr})", start=now - lookback, end=now, step=3600)),
+        )
+        fetched = time.perf_counter()
+        # 수천 Pod 배열 연산도 이벤트 루프를 막지 않도록 스레드에서 계산
+        result = await asyncio.to_thread(analyze_pods, items, cpu_usage, mem_usage, cpu_history, mem_history)
+        logger.info(
+            "cost_analysis_computed",
+            namespace=namespace or "*",
+            pods=len(items),
+            fetch_ms=round((fetched - start) * 1000, 2),
+            compute_ms=round((time.perf_counter() - fetched) * 1000, 2),
+        )
+        return result
+
+
+def render_cost_analysis(analysis: Dict[str, Any], namespace: str, analysis_type: str = "usage") -> Dict[str, Any]:
+    """분석 결과를 cost_analysis 명령 응답(usage/optimization/forecast)으로 변환합니다."""
+    scope = "전체" if namespace in ALL_NAMESPACES else namespace
+    current = analysis["current_cost"]
+    breakdown = analysis["breakdown"]
+    response = {
+        **analysis,
+        "namespace": scope,
+        "analysis_type": analysis_type,
+    }
+
+    if analysis_type == "optimization":
+        savings = sum(o["monthly_savings"] for o in analysis["optimizations"])
+        response["message"] = f"{scope} 네임스페이스의 비용 최적화 제안을 생성했습니다."
+        response["cost_estimate"] = {
+            "current_cost": current,
+            "estimated_cost": current - savings,
+            "savings": savings,
+            "currency": "KRW",
+            "period": "월간",
+            "breakdown": {**breakdown, "idle_resources": -savings},
+        }
+        response["recommendations"] = [o["description"] for o in analysis["optimizations"]]
+    elif analysis_type == "forecast":
+        forecast = analysis.get("forecast")
+        growth = forecast["growth"] if forecast else 1.0
+        response["message"] = f"{scope} 네임스페이스의 월간 예상 비용을 계산했습니다."
+        response["cost_estimate"] = {
+            "current_cost": current,
+            "estimated_cost": _won(current * growth),
+            "currency": "KRW",
+            "period": "월간 예상",
+            "breakdown": {key: _won(value * growth) for key, value in breakdown.items()},
+        }
+        if forecast:
+            response["trend"] = f"최근 {forecast['lookback_hours'] / 24:.0f}일 사용량 추세 기준 월 {forecast['trend_pct_per_month']:+.1f}% 변화 예상"
+        else:
+            response["trend"] = "사용량 이력이 부족해 현재 비용을 유지하는 것으로 가정했습니다"
+    else:
+        response["message"] = f"{scope} 네임스페이스의 현재 비용 현황입니다."
+        response["cost_estimate"] = {
+            "current_cost": current,
+            "currency": "KRW",
+            "period": "이번 달",
+            "breakdown": breakdown,
+        }
+    return response
+
+
+_engine: Optional[CostEngine] = None
+
+
+def get_cost_engine() -> CostEngine:
+    global _engine
+    if _engine is None:
+        _engine = CostEngine()
+    return _engine
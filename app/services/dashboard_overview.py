@@ -0,0 +1,179 @@
+"""
+대시보드 개요 조립 엔진
+
+대시보드를 서로 독립적인 섹션으로 나누어 동시에 조회합니다.
+
+- 섹션별 타임아웃: 느린 업스트림 하나가 전체 페이지를 막지 않도록 기본값으로 대체
+- 섹션별 소요 시간 기록
+- 사용자별 짧은 TTL 캐시 + stale-while-revalidate (만료 후 일정 시간은
+  캐시를 즉시 반환하고 백그라운드에서 갱신)
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+def _log_refresh_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("dashboard_revalidate_failed", error=str(task.exception()))
+
+
+class OverviewContext:
+    """섹션 간에 공유되는 조회 결과를 한 번만 실행되도록 메모이즈합니다."""
+
+    def __init__(self, user: Dict[str, Any]):
+        self.user = user
+        self._shared: Dict[str, asyncio.Task] = {}
+
+    @property
+    def user_id(self) -> str:
+        return str(self.user.get("id", ""))
+
+    def shared(self, name: str, factory: Callable[[], Awaitable[Any]]) -> Awaitable[Any]:
+        """같은 이름의 조회는 한 번만 실행하고 결과를 공유합니다."""
+        task = self._shared.get(name)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._shared[name] = task
+        return asyncio.shield(task)
+
+    def cancel_pending(self) -> None:
+        for task in self._shared.values():
+            if not task.done():
+                task.cancel()
+
+
+@dataclass
+class OverviewSection:
+    """대시보드 섹션 정의"""
+    name: str
+    fetch: Callable[[OverviewContext], Awaitable[Any]]
+    default: Callable[[], Any]
+    timeout: Optional[float] = None
+
+
+@dataclass
+class OverviewResult:
+    """섹션 조회 결과 모음"""
+    data: Dict[str, Any]
+    timings_ms: Dict[str, float]
+    degraded: List[str]
+    generated_at: float = field(default_factory=time.time)
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.degraded)
+
+
+@dataclass
+class _CacheEntry:
+    result: OverviewResult
+    fresh_until: float
+    stale_until: float
+    refreshing: Optional[asyncio.Task] = None
+
+
+class DashboardOverviewBuilder:
+    """섹션 동시 조회 + 사용자별 SWR 캐시"""
+
+    def __init__(
+        self,
+        sections: List[OverviewSection],
+        ttl_seconds: float = 10.0,
+        stale_seconds: float = 60.0,
+        default_timeout: float = 3.0,
+        max_entries: int = 1000,
+    ):
+        self.sections = sections
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.default_timeout = default_timeout
+        self.max_entries = max_entries
+        self._cache: Dict[str, _CacheEntry] = {}
+        self._building: Dict[str, asyncio.Task] = {}
+
+    async def _run_section(self, section: OverviewSection, ctx: OverviewContext):
+        start = time.perf_counter()
+        timeout = section.timeout if section.timeout is not None else self.default_timeout
+        status = "ok"
+        try:
+            value = await asyncio.wait_for(section.fetch(ctx), timeout=timeout)
+        except asyncio.TimeoutError:
+            status = "timeout"
+            value = section.default()
+            logger.warning("dashboard_section_timeout", section=section.name, timeout=timeout)
+        except Exception as e:
+            status = "error"
+            value = section.default()
+            logger.warning("dashboard_section_failed", section=section.name, error=str(e))
+        elapsed_ms = round((time.perf_counter() - start) * 1000, 2)
+        return section.name, value, elapsed_ms, status
+
+    async def build(self, user: Dict[str, Any]) -> OverviewResult:
+        """모든 섹션을 동시에 조회합니다 (캐시 미사용)."""
+        ctx = OverviewContext(user)
+        try:
+            results = await asyncio.gather(*[self._run_section(s, ctx) for s in self.sections])
+        finally:
+            ctx.cancel_pending()
+        data: Dict[str, Any] = {}
+        timings: Dict[str, float] = {}
+        degraded: List[str] = []
+        for name, value, elapsed_ms, status in results:
+            data[name] = value
+            timings[name] = elapsed_ms
+            if status != "ok":
+                degraded.append(name)
+        return OverviewResult(data=data, timings_ms=timings, degraded=degraded)
+
+    def _store(self, key: str, result: OverviewResult) -> None:
+        now = time.monotonic()
+        # 일부 섹션이 실패한 결과는 즉시 stale로 취급해 다음 요청에서 재검증
+        fresh_until = now if result.partial else now + self.ttl_seconds
+        self._cache[key] = _CacheEntry(result, fresh_until, now + self.ttl_seconds + self.stale_seconds)
+        if len(self._cache) > self.max_entries:
+            oldest = min(self._cache, key=lambda k: self._cache[k].stale_until)
+            self._cache.pop(oldest, None)
+
+    async def _build_and_store(self, key: str, user: Dict[str, Any]) -> OverviewResult:
+        result = await self.build(user)
+        self._store(key, result)
+        return result
+
+    def _revalidate(self, key: str, entry: _CacheEntry, user: Dict[str, Any]) -> None:
+        if entry.refreshing is not None and not entry.refreshing.done():
+            return
+        entry.refreshing = asyncio.ensure_future(self._build_and_store(key, user))
+        entry.refreshing.add_done_callback(_log_refresh_failure)
+
+    async def get(self, user: Dict[str, Any], force_refresh: bool = False):
+        """캐시 상태("hit"/"stale"/"miss")와 함께 결과를 반환합니다."""
+        key = str(user.get("id", ""))
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and not force_refresh:
+            if now < entry.fresh_until:
+                return entry.result, "hit"
+            if now < entry.stale_until:
+                self._revalidate(key, entry, user)
+                return entry.result, "stale"
+
+        # 같은 사용자의 동시 미스는 하나의 조립으로 병합
+        building = self._building.get(key)
+        if building is None or building.done():
+            building = asyncio.ensure_future(self._build_and_store(key, user))
+            self._building[key] = building
+            building.add_done_callback(lambda _t, k=key: self._building.pop(k, None))
+        return await asyncio.shield(building), "miss"
+
+    def invalidate(self, user_id: Optional[str] = None) -> None:
+        if user_id is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(str(user_id), None)
@@ -0,0 +1,234 @@
+"""
+배포별 이벤트 저장소
+
+배포 진행 WebSocket이 새로고침/재연결 시 놓친 이벤트를 다시 보낼 수 있도록 배포마다 최근 이벤트를
+링 버퍼로 보관합니다. 모든 이벤트에는 단조 증가하는 event_id가 붙고, 클라이언트는 마지막으로 받은
+ID를 보내 그 이후 이벤트만 이어 받습니다.
+
+- memory: 배포별 deque(maxlen) 링 버퍼, 완료된 배포는 TTL 뒤 제거, 추적 배포 수 상한(LRU)
+- redis: 배포별 Redis Stream (XADD MAXLEN ~), 완료 시 EXPIRE로 TTL 설정 → 재시작/다른 레플리카에서도 재생
+  Redis에 연결할 수 없으면 메모리 저장소로 대체
+
+같은 스테이지의 stage_progress가 연속으로 들어오면 직전 이벤트를 새 이벤트로 교체해 버퍼를 압축합니다.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import structlog
+
+from ..core.config import get_settings
+from ..core.redis_client import get_async_redis, mark_redis_unavailable
+from ..core.serialization import dumps_str, loads
+
+logger = structlog.get_logger(__name__)
+
+STREAM_KEY = "deploy:events:{deployment_id}"
+COMPLETED_TYPES = frozenset(("deployment_completed",))
+
+
+def _compactable(previous: Optional[Tuple[str, Optional[str]]], event: Dict[str, Any]) -> bool:
+    """직전 이벤트가 같은 스테이지의 진행률이면 교체 대상"""
+    return (
+        previous is not None
+        and event.get("type") == "stage_progress"
+        and previous == ("stage_progress", event.get("stage"))
+    )
+
+
+@dataclass
+class _Buffer:
+    events: Deque[Tuple[int, Dict[str, Any]]]
+    expires_at: Optional[float] = None
+
+
+class MemoryEventStore:
+    """프로세스 내 링 버퍼 저장소"""
+
+    def __init__(
+        self,
+        max_events: Optional[int] = None,
+        completed_ttl: Optional[float] = None,
+        max_deployments: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        settings = get_settings()
+        self.max_events = max_events or settings.deployment_events_max_per_deployment
+        self.completed_ttl = settings.deployment_events_completed_ttl_seconds if completed_ttl is None else completed_ttl
+        self.max_deployments = max_deployments or settings.deployment_events_max_deployments
+        self._clock = clock
+        self._buffers: "OrderedDict[str, _Buffer]" = OrderedDict()
+        # 완료 순서 = 만료 순서 (TTL이 고정이므로 앞에서부터 제거)
+        self._completed: "OrderedDict[str, float]" = OrderedDict()
+        self._seq = 0
+
+    async def append(self, deployment_id: str, event: Dict[str, Any]) -> str:
+        self._evict_expired()
+        buffer = self._buffers.get(deployment_id)
+        if buffer is None:
+            buffer = self._buffers[deployment_id] = _Buffer(deque(maxlen=self.max_events))
+            while len(self._buffers) > self.max_deployments:
+                evicted, _ = self._buffers.popitem(last=False)
+                self._completed.pop(evicted, None)
+        else:
+            self._buffers.move_to_end(deployment_id)
+
+        if buffer.events:
+            _, previous = buffer.events[-1]
+            if _compactable((previous.get("type"), previous.get("stage")), event):
+                buffer.events.pop()
+
+        self._seq += 1
+        stored = {**event, "event_id": str(self._seq)}
+        buffer.events.append((self._seq, stored))
+        if event.get("type") in COMPLETED_TYPES:
+            self._mark_completed(deployment_id, buffer)
+        return stored["event_id"]
+
+    async def read(self, deployment_id: str, after: Optional[str] = None) -> List[Dict[str, Any]]:
+        self._evict_expired()
+        buffer = self._buffers.get(deployment_id)
+        if buffer is None:
+            return []
+        try:
+            last = int(after) if after else 0
+        except ValueError:
+            last = 0
+        # 최신 쪽에서부터 last 이후 이벤트만 수집
+        newer = []
+        for seq, event in reversed(buffer.events):
+            if seq <= last:
+                break
+            newer.append(event)
+        newer.reverse()
+        return newer
+
+    async def complete(self, deployment_id: str) -> None:
+        buffer = self._buffers.get(deployment_id)
+        if buffer is not None:
+            self._mark_completed(deployment_id, buffer)
+
+    def _mark_completed(self, deployment_id: str, buffer: _Buffer) -> None:
+        buffer.expires_at = self._clock() + self.completed_ttl
+        self._completed.pop(deployment_id, None)
+        self._completed[deployment_id] = buffer.expires_at
+
+    def _evict_expired(self) -> None:
+        now = self._clock()
+        while self._completed:
+            deployment_id, expires_at = next(iter(self._completed.items()))
+            if expires_at > now:
+                break
+            self._completed.popitem(last=False)
+            buffer = self._buffers.get(deployment_id)
+            if buffer is not None and buffer.expires_at == expires_at:
+                del self._buffers[deployment_id]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "memory",
+            "deployments": len(self._buffers),
+            "completed": len(self._completed),
+            "events": sum(len(b.events) for b in self._buffers.values()),
+        }
+
+
+class RedisEventStore:
+    """Redis Streams 저장소 (연결 불가 시 메모리 저장소로 대체)"""
+
+    def __init__(
+        self,
+        max_events: Optional[int] = None,
+        completed_ttl: Optional[int] = None,
+        active_ttl: Optional[int] = None,
+        redis_factory: Callable[[], Any] = get_async_redis,
+    ):
+        settings = get_settings()
+        self.max_events = max_events or settings.deployment_events_max_per_deployment
+        self.completed_ttl = int(settings.deployment_events_completed_ttl_seconds if completed_ttl is None else completed_ttl)
+        self.active_ttl = int(active_ttl or settings.deployment_events_active_ttl_seconds)
+        self._redis_factory = redis_factory
+        self.fallback = MemoryEventStore(max_events=self.max_events, completed_ttl=self.completed_ttl)
+        # 압축 판단용 배포별 마지막 이벤트 (id, type, stage) — 이 레플리카가 쓴 것만 추적
+        self._tails: "OrderedDict[str, Tuple[str, Optional[str], Optional[str]]]" = OrderedDict()
+
+    async def append(self, deployment_id: str, event: Dict[str, Any]) -> str:
+        redis = self._redis_factory()
+        if redis is None:
+            return await self.fallback.append(deployment_id, event)
+
+        key = STREAM_KEY.format(deployment_id=deployment_id)
+        tail = self._tails.get(deployment_id)
+        completed = event.get("type") in COMPLETED_TYPES
+        try:
+            pipe = redis.pipeline(transaction=False)
+            if tail is not None and _compactable(tail[1:], event):
+                pipe.xdel(key, tail[0])
+            pipe.xadd(key, {"e": dumps_str(event)}, maxlen=self.max_events, approximate=True)
+            # 완료되지 않은 채 버려진 배포도 active_ttl 뒤에는 사라지도록 매번 갱신
+            pipe.expire(key, self.completed_ttl if completed else self.active_ttl)
+            results = await pipe.execute()
+        except Exception as e:
+            mark_redis_unavailable(e)
+            return await self.fallback.append(deployment_id, event)
+
+        event_id = results[-2]
+        if completed:
+            self._tails.pop(deployment_id, None)
+        else:
+            self._tails[deployment_id] = (event_id, event.get("type"), event.get("stage"))
+            self._tails.move_to_end(deployment_id)
+            while len(self._tails) > self.fallback.max_deployments:
+                self._tails.popitem(last=False)
+        return event_id
+
+    async def read(self, deployment_id: str, after: Optional[str] = None) -> List[Dict[str, Any]]:
+        redis = self._redis_factory()
+        if redis is None:
+            return await self.fallback.read(deployment_id, after)
+        key = STREAM_KEY.format(deployment_id=deployment_id)
+        try:
+            # "(" 접두사: after 자신은 제외 (Redis 6.2+)
+            entries = await redis.xrange(key, min=f"({after}" if after else "-", max="+")
+        except Exception as e:
+            mark_redis_unavailable(e)
+            return await self.fallback.read(deployment_id, after)
+
+        events = []
+        for event_id, fields in entries:
+            try:
+                event = loads(fields["e"])
+            except (KeyError, ValueError):
+                continue
+            event["event_id"] = event_id
+            events.append(event)
+        return events
+
+    async def complete(self, deployment_id: str) -> None:
+        self._tails.pop(deployment_id, None)
+        redis = self._redis_factory()
+        if redis is None:
+            await self.fallback.complete(deployment_id)
+            return
+        try:
+            await redis.expire(STREAM_KEY.format(deployment_id=deployment_id), self.completed_ttl)
+        except Exception as e:
+            mark_redis_unavailable(e)
+            await self.fallback.complete(deployment_id)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "redis", "tracked_tails": len(self._tails), "fallback": self.fallback.stats()}
+
+
+def create_event_store(backend: Optional[str] = None):
+    """설정된 백엔드의 이벤트 저장소를 생성합니다."""
+    backend = (backend or get_settings().deployment_events_backend).lower()
+    if backend == "redis":
+        return RedisEventStore()
+    if backend != "memory":
+        logger.warning("unknown_deployment_events_backend", backend=backend)
+    return MemoryEventStore()
@@ -1,20 +1,59 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import time
-from typing import Any, Dict, Optional
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
 
 import jwt
 import httpx
+import structlog
 
 from ..core.config import get_settings
+from ..core.redis_client import get_async_redis, mark_redis_unavailable
+from .github_client import github_client
+
+logger = structlog.get_logger(__name__)
+
+# Redis 키 (모든 레플리카가 공유)
+INSTALLATION_TOKEN_KEY = "klepaas:github:installation_token:{installation_id}"
+INSTALLATION_TOKEN_LOCK_KEY = "klepaas:github:installation_token_lock:{installation_id}"
+
+
+def _parse_github_timestamp(value: Optional[str]) -> Optional[float]:
+    """GitHub ISO8601 시각("2024-01-01T00:00:00Z")을 epoch 초로 변환합니다."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
 
 
 class GitHubAppAuth:
-    """GitHub App 인증을 위한 JWT 생성 및 설치 토큰 관리"""
+    """GitHub App 인증을 위한 JWT 생성 및 설치 토큰 관리
+
+    - App JWT는 유효 기간 동안 메모이즈
+    - 설치 토큰은 프로세스 메모리 → Redis(레플리카 공유) 순으로 조회하고,
+      GitHub이 돌려준 expires_at보다 여유 있게 미리 갱신
+    - 같은 설치에 대한 동시 갱신은 프로세스 내 Lock + Redis 락으로 단일화
+    - owner/repo → installation_id 조회 결과 캐시
+    """
     
     def __init__(self):
         self.settings = get_settings()
         self._installation_tokens: Dict[str, Dict[str, Any]] = {}
+        self._refresh_locks: Dict[str, asyncio.Lock] = {}
+        self._app_jwt: Optional[str] = None
+        self._app_jwt_expires_at: float = 0.0
+        self._installations: Optional[list[Dict[str, Any]]] = None
+        self._installations_expires_at: float = 0.0
+        self._repo_installations: Dict[Tuple[str, str], Tuple[str, float]] = {}
+
+    @property
+    def _refresh_margin(self) -> float:
+        return float(self.settings.github_token_refresh_margin)
     
     def _load_private_key_text(self) -> str:
         """Private Key 파일에서 내용을 읽어옵니다."""
@@ -31,11 +70,15 @@ class GitHubAppAuth:
             raise ValueError(f"Private Key 파일 읽기 실패: {e}")
 
     def generate_jwt(self) -> str:
-        """GitHub App JWT 생성 (RS256 알고리즘)"""
+        """GitHub App JWT 생성 (RS256 알고리즘, 유효 기간 동안 재사용)"""
         if not self.settings.github_app_id:
             raise ValueError("GitHub App ID가 설정되지 않았습니다")
         
         now = int(time.time())
+        # 만료 1분 전까지는 기존 JWT 재사용 (RS256 서명 비용 절감)
+        if self._app_jwt and self._app_jwt_expires_at - 60 > now:
+            return self._app_jwt
+
         payload = {
             "iat": now - 60,  # 60초 전에 발급 (클럭 드리프트 허용)
             "exp": now + (10 * 60),  # 10분 후 만료
@@ -47,75 +90,188 @@ class GitHubAppAuth:
             private_key_text = self._load_private_key_text()
             private_key = private_key_text.encode('utf-8')
             token = jwt.encode(payload, private_key, algorithm="RS256")
+            self._app_jwt = token
+            self._app_jwt_expires_at = payload["exp"]
             return token
         except Exception as e:
             raise ValueError(f"JWT 생성 실패: {e}")
     
-    async def get_installation_token(self, installation_id: str) -> str:
-        """설치 토큰 가져오기 (캐시된 토큰이 유효하면 재사용)"""
-        # 캐시된 토큰 확인
-        if installation_id in self._installation_tokens:
-            token_data = self._installation_tokens[installation_id]
-            if token_data["expires_at"] > time.time() + 60:  # 1분 여유
-                return token_data["token"]
-        
-        # 새 토큰 요청
+    def _cached_token(self, installation_id: str) -> Optional[str]:
+        token_data = self._installation_tokens.get(installation_id)
+        if token_data and token_data["expires_at"] - self._refresh_margin > time.time():
+            return token_data["token"]
+        return None
+
+    async def _read_shared_token(self, installation_id: str) -> Optional[str]:
+        """Redis에 공유된 설치 토큰을 읽어 메모리 캐시에 반영합니다."""
+        redis = get_async_redis()
+        if redis is None:
+            return None
+        try:
+            raw = await redis.get(INSTALLATION_TOKEN_KEY.format(installation_id=installation_id))
+        except Exception as e:
+            mark_redis_unavailable(e)
+            return None
+        if not raw:
+            return None
+        try:
+            token_data = json.loads(raw)
+        except ValueError:
+            return None
+        self._installation_tokens[installation_id] = token_data
+        return self._cached_token(installation_id)
+
+    async def _write_shared_token(self, installation_id: str, token_data: Dict[str, Any]) -> None:
+        redis = get_async_redis()
+        if redis is None:
+            return
+        ttl = int(token_data["expires_at"] - self._refresh_margin - time.time())
+        if ttl <= 0:
+            return
+        try:
+            await redis.set(
+                INSTALLATION_TOKEN_KEY.format(installation_id=installation_id),
+                json.dumps(token_data),
+                ex=ttl,
+            )
+        except Exception as e:
+            mark_redis_unavailable(e)
+
+    async def _acquire_shared_refresh(self, installation_id: str) -> bool:
+        """다른 레플리카가 갱신 중이 아니면 True (Redis 불가 시 항상 True)."""
+        redis = get_async_redis()
+        if redis is None:
+            return True
+        try:
+            acquired = await redis.set(
+                INSTALLATION_TOKEN_LOCK_KEY.format(installation_id=installation_id),
+                "1",
+                nx=True,
+                ex=15,
+            )
+            return bool(acquired)
+        except Exception as e:
+            mark_redis_unavailable(e)
+            return True
+
+    async def _release_shared_refresh(self, installation_id: str) -> None:
+        redis = get_async_redis()
+        if redis is None:
+            return
+        try:
+            await redis.delete(INSTALLATION_TOKEN_LOCK_KEY.format(installation_id=installation_id))
+        except Exception as e:
+            mark_redis_unavailable(e)
+
+    async def _request_installation_token(self, installation_id: str) -> Dict[str, Any]:
+        """GitHub에서 새 설치 토큰을 발급받습니다 (실제 expires_at 사용)."""
         jwt_token = self.generate_jwt()
+        response = await github_client.request(
+            "POST",
+            f"/app/installations/{installation_id}/access_tokens",
+            token=jwt_token,
+            endpoint="/app/installations/{id}/access_tokens",
+        )
         
-        async with httpx.AsyncClient(timeout=10) as client:
-            response = await client.post(
-                f"https://api.github.com/app/installations/{installation_id}/access_tokens",
-                headers={
-                    "Authorization": f"Bearer {jwt_token}",
-                    "Accept": "application/vnd.github+json",
-                    "X-GitHub-Api-Version": "2022-11-28"
-                }
-            )
-            
-            if response.status_code != 201:
-                raise ValueError(f"설치 토큰 요청 실패: {response.status_code} - {response.text}")
-            
-            token_data = response.json()
+        if response.status_code != 201:
+            raise ValueError(f"설치 토큰 요청 실패: {response.status_code} - {response.text}")
+        
+        token_data = response.json()
+        expires_at = _parse_github_timestamp(token_data.get("expires_at")) or time.time() + 3600
+        return {"token": token_data["token"], "expires_at": expires_at}
+
+    async def get_installation_token(self, installation_id: str) -> str:
+        """설치 토큰 가져오기 (메모리 → Redis → GitHub 순, 만료 전 미리 갱신)"""
+        installation_id = str(installation_id)
+        token = self._cached_token(installation_id)
+        if token:
+            return token
+        
+        lock = self._refresh_locks.setdefault(installation_id, asyncio.Lock())
+        async with lock:
+            # 대기하는 동안 다른 코루틴이 갱신했을 수 있음
+            token = self._cached_token(installation_id) or await self._read_shared_token(installation_id)
+            if token:
+                return token
             
-            # 토큰 캐시
-            self._installation_tokens[installation_id] = {
-                "token": token_data["token"],
-                "expires_at": time.time() + 3600  # 1시간 후 만료
-            }
+            owns_refresh = await self._acquire_shared_refresh(installation_id)
+            if not owns_refresh:
+                # 다른 레플리카가 갱신 중: 잠시 기다렸다가 공유 토큰 사용
+                for _ in range(20):
+                    await asyncio.sleep(0.1)
+                    token = await self._read_shared_token(installation_id)
+                    if token:
+                        return token
             
-            return token_data["token"]
+            try:
+                token_data = await self._request_installation_token(installation_id)
+                self._installation_tokens[installation_id] = token_data
+                await self._write_shared_token(installation_id, token_data)
+                logger.info(
+                    "github_installation_token_refreshed",
+                    installation_id=installation_id,
+                    expires_in=int(token_data["expires_at"] - time.time()),
+                )
+                return token_data["token"]
+            finally:
+                if owns_refresh:
+                    await self._release_shared_refresh(installation_id)
     
     async def get_app_installations(self) -> list[Dict[str, Any]]:
         """GitHub App 설치 목록 조회 (API가 리스트 또는 객체를 반환해도 안전하게 처리)"""
+        now = time.time()
+        if self._installations is not None and self._installations_expires_at > now:
+            return self._installations
+
         jwt_token = self.generate_jwt()
+        response = await github_client.get(
+            "/app/installations",
+            token=jwt_token,
+            endpoint="/app/installations",
+        )
         
-        async with httpx.AsyncClient(timeout=10) as client:
-            response = await client.get(
-                "https://api.github.com/app/installations",
-                headers={
-                    "Authorization": f"Bearer {jwt_token}",
-                    "Accept": "application/vnd.github+json",
-                    "X-GitHub-Api-Version": "2022-11-28"
-                }
-            )
-            
-            if response.status_code != 200:
-                raise ValueError(f"설치 목록 조회 실패: {response.status_code} - {response.text}")
-            
-            body = response.json()
-            if isinstance(body, list):
-                return body
-            if isinstance(body, dict):
-                return body.get("installations", [])
-            return []
+        if response.status_code != 200:
+            raise ValueError(f"설치 목록 조회 실패: {response.status_code} - {response.text}")
+        
+        body = response.json()
+        installations: list[Dict[str, Any]] = []
+        if isinstance(body, list):
+            installations = body
+        elif isinstance(body, dict):
+            installations = body.get("installations", [])
+        
+        self._installations = installations
+        self._installations_expires_at = now + self.settings.github_installations_cache_ttl
+        return installations
+
+    def _cached_repo_installation(self, owner: str, repo: str) -> Optional[str]:
+        entry = self._repo_installations.get((owner.lower(), repo.lower()))
+        if entry and entry[1] > time.time():
+            return entry[0]
+        return None
+
+    def _remember_repo_installation(self, owner: str, repo: str, installation_id: str) -> None:
+        self._repo_installations[(owner.lower(), repo.lower())] = (
+            str(installation_id),
+            time.time() + self.settings.github_repo_installation_cache_ttl,
+        )
     
     async def get_installation_token_for_repo(self, owner: str, repo: str, db_session=None) -> tuple[str, str]:
-        """특정 레포지토리에 대한 GitHub App 설치 토큰을 조회 (DB 우선 + API 폴백)"""
+        """특정 레포지토리에 대한 GitHub App 설치 토큰을 조회 (메모리 캐시 → DB → API 폴백)"""
+        
+        # 0. owner/repo → installation 캐시 (대부분 메모리에서 끝남)
+        cached_installation_id = self._cached_repo_installation(owner, repo)
+        if cached_installation_id:
+            try:
+                token = await self.get_installation_token(cached_installation_id)
+                return token, cached_installation_id
+            except Exception:
+                self._repo_installations.pop((owner.lower(), repo.lower()), None)
         
         # 1. DB에서 먼저 조회 (빠른 응답)
         if db_session:
             try:
-                from ...models.user_project_integration import UserProjectIntegration
+                from ..models.user_project_integration import UserProjectIntegration
                 integration = db_session.query(UserProjectIntegration).filter(
                     UserProjectIntegration.github_owner == owner,
                     UserProjectIntegration.github_repo == repo
@@ -125,6 +281,7 @@ class GitHubAppAuth:
                     try:
                         # DB에 있는 installation_id로 토큰 획득 시도
                         token = await self.get_installation_token(str(integration.github_installation_id))
+                        self._remember_repo_installation(owner, repo, str(integration.github_installation_id))
                         return token, str(integration.github_installation_id)
                     except Exception:
                         # 토큰 획득 실패 시 API로 폴백
@@ -133,94 +290,71 @@ class GitHubAppAuth:
                 # DB 조회 실패 시 API로 폴백
                 pass
         
-        # 2. DB에 없거나 실패한 경우 GitHub API로 실시간 조회
-        jwt_token = self.generate_jwt()
+        # 2. DB에 없거나 실패한 경우 GitHub API로 실시간 조회 (설치 목록은 캐시)
+        installations = await self.get_app_installations()
         
-        async with httpx.AsyncClient(timeout=10) as client:
-            # 설치 목록 조회
-            installations_response = await client.get(
-                "https://api.github.com/app/installations",
-                headers={
-                    "Authorization": f"Bearer {jwt_token}",
-                    "Accept": "application/vnd.github+json",
-                    "X-GitHub-Api-Version": "2022-11-28"
-                }
-            )
-            
-            if installations_response.status_code != 200:
-                raise ValueError(f"설치 목록 조회 실패: {installations_response.status_code}")
-            
-            installations = installations_response.json()
-            if not isinstance(installations, list):
-                installations = installations.get("installations", [])
-            
-            # 🔧 수정: 조직별로 정확한 installation 찾기
-            target_installation = None
-            
-            # 1단계: 정확한 조직(owner)에 설치된 installation 찾기
-            for installation in installations:
-                account = installation.get("account", {})
-                account_login = account.get("login", "").lower()
-                
-                if account_login == owner.lower():
-                    target_installation = installation
-                    break
-            
-            # 2단계: 정확한 조직 설치가 없으면 첫 번째 설치에서 레포지토리 접근 가능한지 확인
-            if not target_installation and installations:
-                target_installation = installations[0]
+        # 🔧 수정: 조직별로 정확한 installation 찾기
+        target_installation = None
+        
+        # 1단계: 정확한 조직(owner)에 설치된 installation 찾기
+        for installation in installations:
+            account = installation.get("account", {})
+            account_login = account.get("login", "").lower()
             
-            if not target_installation:
-                raise ValueError(f"GitHub App이 조직 '{owner}'에 설치되지 않았습니다.")
+            if account_login == owner.lower():
+                target_installation = installation
+                break
+        
+        # 2단계: 정확한 조직 설치가 없으면 첫 번째 설치에서 레포지토리 접근 가능한지 확인
+        if not target_installation and installations:
+            target_installation = installations[0]
+        
+        if not target_installation:
+            raise ValueError(f"GitHub App이 조직 '{owner}'에 설치되지 않았습니다.")
+        
+        installation_id = target_installation.get("id")
+        if not installation_id:
+            raise ValueError(f"유효하지 않은 installation ID입니다.")
+        
+        try:
+            # 설치 토큰으로 레포지토리 접근 시도
+            installation_token = await self.get_installation_token(str(installation_id))
             
-            installation_id = target_installation.get("id")
-            if not installation_id:
-                raise ValueError(f"유효하지 않은 installation ID입니다.")
+            # 특정 레포지토리에 접근 가능한지 확인
+            repo_response = await github_client.get(
+                f"/repos/{owner}/{repo}",
+                token=installation_token,
+                endpoint="/repos/{owner}/{repo}",
+            )
             
-            try:
-                # 설치 토큰으로 레포지토리 접근 시도
-                installation_token = await self.get_installation_token(str(installation_id))
-                
-                # 특정 레포지토리에 접근 가능한지 확인
-                repo_response = await client.get(
-                    f"https://api.github.com/repos/{owner}/{repo}",
-                    headers={
-                        "Authorization": f"Bearer {installation_token}",
-                        "Accept": "application/vnd.github+json",
-                        "X-GitHub-Api-Version": "2022-11-28"
-                    }
-                )
+            if repo_response.status_code == 200:
+                # 레포지토리에 접근 가능함
+                self._remember_repo_installation(owner, repo, str(installation_id))
+                # DB에 설치 정보 저장 (조직별로 정확히 매칭)
+                if db_session:
+                    try:
+                        from ..services.user_project_integration import upsert_integration
+                        upsert_integration(
+                            db=db_session,
+                            user_id="system",  # 시스템 레벨 저장
+                            owner=owner,  # 정확한 조직명 저장
+                            repo=repo,
+                            repository_id=None,
+                            installation_id=str(installation_id),
+                            sc_project_id=None,
+                            sc_repo_name=None,
+                        )
+                    except Exception:
+                        # DB 저장 실패해도 토큰은 반환
+                        pass
                 
-                if repo_response.status_code == 200:
-                    # 레포지토리에 접근 가능함
-                    # DB에 설치 정보 저장 (조직별로 정확히 매칭)
-                    if db_session:
-                        try:
-                            from ...services.user_project_integration import upsert_integration
-                            upsert_integration(
-                                db=db_session,
-                                user_id="system",  # 시스템 레벨 저장
-                                owner=owner,  # 정확한 조직명 저장
-                                repo=repo,
-                                repository_id=None,
-                                installation_id=str(installation_id),
-                                sc_project_id=None,
-                                sc_repo_name=None,
-                            )
-                        except Exception:
-                            # DB 저장 실패해도 토큰은 반환
-                            pass
+                return installation_token, str(installation_id)
+            else:
+                raise ValueError(f"레포지토리 '{owner}/{repo}'에 접근할 수 없습니다. (HTTP {repo_response.status_code})")
                     
-                    return installation_token, str(installation_id)
-                else:
-                    raise ValueError(f"레포지토리 '{owner}/{repo}'에 접근할 수 없습니다. (HTTP {repo_response.status_code})")
-                        
-            except Exception as e:
-                # 토큰 획득 또는 레포지토리 접근 실패
-                raise ValueError(f"GitHub App이 레포지토리 '{owner}/{repo}'에 접근할 수 없습니다: {str(e)}")
-            
-            # 레포지토리에 접근 가능한 설치를 찾지 못함
-            raise ValueError(f"GitHub App이 레포지토리 '{owner}/{repo}'에 설치되지 않았습니다.")
+        except Exception as e:
+            # 토큰 획득 또는 레포지토리 접근 실패
+            raise ValueError(f"GitHub App이 레포지토리 '{owner}/{repo}'에 접근할 수 없습니다: {str(e)}")
     
     async def get_latest_commit(self, owner: str, repo: str, branch: str = "main", db_session=None) -> Dict[str, Any]:
         """특정 브랜치의 최신 커밋 정보를 가져옵니다 (웹훅 payload 형식과 동일)"""
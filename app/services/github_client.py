@@ -0,0 +1,351 @@
+"""
+공유 GitHub REST 클라이언트
+
+요청마다 httpx.AsyncClient를 새로 만들던 호출 경로를 하나의 풀링된
+클라이언트로 모읍니다.
+
+- 커넥션 풀 재사용 (keep-alive)
+- ETag / If-None-Match 조건부 요청 캐시 (304 응답은 rate limit을 소모하지 않음)
+- 동일한 진행 중 GET 요청 병합 (single-flight)
+- X-RateLimit-Remaining 추적: 잔여량이 바닥이면 캐시로 응답
+- 엔드포인트별 캐시 적중률 통계
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+import structlog
+
+from ..monitoring.metrics import (
+    github_api_requests_total,
+    github_api_request_duration_seconds,
+    github_api_rate_limit_remaining,
+)
+
+logger = structlog.get_logger(__name__)
+
+GITHUB_API_BASE_URL = "https://api.github.com"
+GITHUB_API_VERSION = "2022-11-28"
+
+CacheKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+
+class GitHubRateLimitError(Exception):
+    """rate limit이 소진되었고 캐시된 응답도 없는 경우"""
+
+    def __init__(self, reset_at: float):
+        self.reset_at = reset_at
+        super().__init__(f"GitHub API rate limit exhausted until {int(reset_at)}")
+
+
+@dataclass
+class GitHubResponse:
+    """GitHub API 응답 (캐시 응답 포함)"""
+    status_code: int
+    data: Any
+    headers: Dict[str, str] = field(default_factory=dict)
+    from_cache: bool = False
+
+    def json(self) -> Any:
+        return self.data
+
+    @property
+    def text(self) -> str:
+        return str(self.data)
+
+
+@dataclass
+class _CacheEntry:
+    etag: Optional[str]
+    last_modified: Optional[str]
+    status_code: int
+    data: Any
+    headers: Dict[str, str]
+
+
+@dataclass
+class _RateLimitState:
+    remaining: Optional[int] = None
+    reset_at: float = 0.0
+
+
+@dataclass
+class EndpointStats:
+    """엔드포인트별 조회 결과 집계"""
+    requests: int = 0
+    not_modified: int = 0
+    coalesced: int = 0
+    stale: int = 0
+    errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        hits = self.not_modified + self.coalesced + self.stale
+        return hits / self.requests if self.requests else 0.0
+
+
+def _fingerprint(token: Optional[str]) -> str:
+    """캐시/rate limit 구분용 토큰 지문 (원문 토큰은 보관하지 않음)"""
+    if not token:
+        return "anonymous"
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
+class GitHubRestClient:
+    """커넥션 풀, 조건부 요청 캐시, 요청 병합을 갖춘 GitHub REST 클라이언트"""
+
+    _CACHED_HEADERS = ("link", "content-type")
+
+    def __init__(
+        self,
+        base_url: str = GITHUB_API_BASE_URL,
+        timeout: float = 10.0,
+        max_cache_entries: int = 2048,
+        rate_limit_floor: int = 50,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_cache_entries = max_cache_entries
+        self.rate_limit_floor = rate_limit_floor
+        self._transport = transport
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._cache: "OrderedDict[CacheKey, _CacheEntry]" = OrderedDict()
+        self._inflight: Dict[CacheKey, asyncio.Task] = {}
+        self._rate_limits: Dict[str, _RateLimitState] = {}
+        self._stats: Dict[str, EndpointStats] = {}
+
+    # ------------------------------------------------------------------
+    # 연결 관리
+    # ------------------------------------------------------------------
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+                transport=self._transport,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    @staticmethod
+    def _headers(token: Optional[str]) -> Dict[str, str]:
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": GITHUB_API_VERSION,
+        }
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        return headers
+
+    # ------------------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------------------
+    def _record(self, endpoint: str, result: str) -> None:
+        stats = self._stats.setdefault(endpoint, EndpointStats())
+        stats.requests += 1
+        if result == "not_modified":
+            stats.not_modified += 1
+        elif result == "coalesced":
+            stats.coalesced += 1
+        elif result == "stale":
+            stats.stale += 1
+        elif result == "error":
+            stats.errors += 1
+        github_api_requests_total.labels(endpoint=endpoint, result=result).inc()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """엔드포인트별 요청 수와 캐시 적중률을 반환합니다."""
+        return {
+            endpoint: {
+                "requests": s.requests,
+                "not_modified": s.not_modified,
+                "coalesced": s.coalesced,
+                "stale": s.stale,
+                "errors": s.errors,
+                "hit_rate": round(s.hit_rate, 4),
+            }
+            for endpoint, s in self._stats.items()
+        }
+
+    def rate_limit(self, token: Optional[str]) -> Dict[str, Any]:
+        state = self._rate_limits.get(_fingerprint(token), _RateLimitState())
+        return {"remaining": state.remaining, "reset_at": state.reset_at}
+
+    def _update_rate_limit(self, fingerprint: str, headers: httpx.Headers) -> None:
+        remaining = headers.get("x-ratelimit-remaining")
+        if remaining is None:
+            return
+        state = self._rate_limits.setdefault(fingerprint, _RateLimitState())
+        try:
+            state.remaining = int(remaining)
+            state.reset_at = float(headers.get("x-ratelimit-reset") or 0)
+        except ValueError:
+            return
+        github_api_rate_limit_remaining.labels(
+            resource=headers.get("x-ratelimit-resource", "core")
+        ).set(state.remaining)
+
+    def _budget_exhausted(self, fingerprint: str, floor: int) -> bool:
+        state = self._rate_limits.get(fingerprint)
+        if state is None or state.remaining is None:
+            return False
+        if state.reset_at and state.reset_at <= time.time():
+            return False
+        return state.remaining <= floor
+
+    # ------------------------------------------------------------------
+    # 요청
+    # ------------------------------------------------------------------
+    async def get(
+        self,
+        path: str,
+        token: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        endpoint: Optional[str] = None,
+    ) -> GitHubResponse:
+        """조건부 요청 캐시와 요청 병합을 적용한 GET.
+
+        Args:
+            path: "/repos/{owner}/{repo}/pulls" 같은 API 경로 또는 전체 URL
+            token: 설치 토큰 또는 사용자 토큰
+            params: 쿼리 파라미터
+            endpoint: 메트릭 라벨용 경로 템플릿 (카디널리티 제한용)
+        """
+        endpoint = endpoint or path
+        fingerprint = _fingerprint(token)
+        key: CacheKey = (
+            fingerprint,
+            path,
+            tuple(sorted((str(k), str(v)) for k, v in (params or {}).items())),
+        )
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._record(endpoint, "coalesced")
+            return await asyncio.shield(inflight)
+
+        cached = self._cache.get(key)
+        if cached is not None and self._budget_exhausted(fingerprint, self.rate_limit_floor):
+            # 잔여 호출량이 바닥이면 재검증 없이 캐시로 응답
+            self._record(endpoint, "stale")
+            return GitHubResponse(cached.status_code, cached.data, dict(cached.headers), from_cache=True)
+        if cached is None and self._budget_exhausted(fingerprint, 0):
+            self._record(endpoint, "error")
+            raise GitHubRateLimitError(self._rate_limits[fingerprint].reset_at)
+
+        # 실제 요청은 별도 태스크로 실행하여, 선행 호출자가 취소되어도 병합 대기자는 결과를 받도록 함
+        task = asyncio.get_running_loop().create_task(self._fetch(key, path, token, params, endpoint, cached))
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._finish_inflight(key, t))
+        return await asyncio.shield(task)
+
+    def _finish_inflight(self, key: CacheKey, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            self._inflight.pop(key, None)
+        # 대기자가 모두 취소된 경우에도 예외가 "never retrieved" 경고로 남지 않도록 소비
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch(
+        self,
+        key: CacheKey,
+        path: str,
+        token: Optional[str],
+        params: Optional[Dict[str, Any]],
+        endpoint: str,
+        cached: Optional[_CacheEntry],
+    ) -> GitHubResponse:
+        headers = self._headers(token)
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        start = time.perf_counter()
+        try:
+            response = await self._get_client().get(path, headers=headers, params=params)
+        except Exception:
+            self._record(endpoint, "error")
+            raise
+        finally:
+            github_api_request_duration_seconds.labels(endpoint=endpoint).observe(time.perf_counter() - start)
+
+        self._update_rate_limit(key[0], response.headers)
+
+        if response.status_code == 304 and cached is not None:
+            self._cache.move_to_end(key)
+            self._record(endpoint, "not_modified")
+            return GitHubResponse(cached.status_code, cached.data, dict(cached.headers), from_cache=True)
+
+        try:
+            data = response.json() if response.content else None
+        except ValueError:
+            data = response.text
+
+        kept_headers = {h: response.headers[h] for h in self._CACHED_HEADERS if h in response.headers}
+        if response.status_code == 200:
+            etag = response.headers.get("etag")
+            last_modified = response.headers.get("last-modified")
+            if etag or last_modified:
+                self._cache[key] = _CacheEntry(etag, last_modified, 200, data, kept_headers)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.max_cache_entries:
+                    self._cache.popitem(last=False)
+            self._record(endpoint, "miss")
+        else:
+            self._record(endpoint, "error")
+        return GitHubResponse(response.status_code, data, kept_headers)
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        token: Optional[str] = None,
+        json: Any = None,
+        params: Optional[Dict[str, Any]] = None,
+        endpoint: Optional[str] = None,
+    ) -> GitHubResponse:
+        """캐시하지 않는 요청 (POST/PUT/DELETE 등). 풀링과 rate limit 추적만 적용됩니다."""
+        if method.upper() == "GET":
+            return await self.get(path, token=token, params=params, endpoint=endpoint)
+
+        endpoint = endpoint or path
+        start = time.perf_counter()
+        try:
+            response = await self._get_client().request(
+                method, path, headers=self._headers(token), json=json, params=params
+            )
+        except Exception:
+            self._record(endpoint, "error")
+            raise
+        finally:
+            github_api_request_duration_seconds.labels(endpoint=endpoint).observe(time.perf_counter() - start)
+        self._update_rate_limit(_fingerprint(token), response.headers)
+        self._record(endpoint, "miss" if response.status_code < 400 else "error")
+        try:
+            data = response.json() if response.content else None
+        except ValueError:
+            data = response.text
+        return GitHubResponse(response.status_code, data, dict(response.headers))
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+
+# 전역 인스턴스
+github_client = GitHubRestClient()
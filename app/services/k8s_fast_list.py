@@ -0,0 +1,380 @@
+"""
+Kubernetes LIST 응답 고속 경로
+
+동기 kubernetes 클라이언트는 LIST 응답을 V1Pod/V1Deployment 같은 깊은 모델 객체
+그래프로 역직렬화한 뒤, 핸들러가 곧바로 dict로 평탄화합니다. 수천 개 Pod에서는
+이 역직렬화가 CPU 대부분을 차지합니다.
+
+여기서는 `_preload_content=False`로 원본 바이트를 받아 orjson(없으면 json)으로
+파싱하고, 포맷터가 쓰는 필드만 `__slots__` 레코드로 추출합니다. 모델 객체를 받는
+기존 경로와 결과가 같도록 `*_from_model` 변환도 함께 제공합니다.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson 미설치 환경
+    _loads = json.loads
+
+
+def parse_k8s_time(value: Optional[str]) -> Optional[float]:
+    """RFC3339 타임스탬프 문자열을 epoch 초로 변환합니다."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _epoch(dt: Optional[datetime]) -> Optional[float]:
+    return dt.timestamp() if dt is not None else None
+
+
+def format_created(created: Optional[float]) -> Optional[str]:
+    """epoch 초를 모델 경로와 같은 ISO 문자열로 변환합니다."""
+    if created is None:
+        return None
+    return datetime.fromtimestamp(created, timezone.utc).isoformat()
+
+
+def format_age(created: Optional[float], now: Optional[float] = None) -> Optional[str]:
+    """생성 시각으로부터 경과 시간을 `H:MM:SS` / `N days, H:MM:SS` 형식으로 반환합니다."""
+    if created is None:
+        return None
+    now = now if now is not None else datetime.now(timezone.utc).timestamp()
+    return str(timedelta(seconds=int(now - created)))
+
+
+class PodRecord:
+    """포맷터에 필요한 Pod 필드만 담는 경량 레코드"""
+
+    __slots__ = (
+        "name", "namespace", "phase", "node", "labels", "created",
+        "ready_count", "container_count", "restarts", "reason", "message",
+        "crash_looping", "containers",
+    )
+
+    def __init__(self, name, namespace, phase, node, labels, created,
+                 ready_count, container_count, restarts, reason, message,
+                 crash_looping, containers):
+        self.name = name
+        self.namespace = namespace
+        self.phase = phase
+        self.node = node
+        self.labels = labels
+        self.created = created
+        self.ready_count = ready_count
+        self.container_count = container_count
+        self.restarts = restarts
+        self.reason = reason
+        self.message = message
+        self.crash_looping = crash_looping
+        self.containers = containers
+
+    @classmethod
+    def from_json(cls, item: Dict[str, Any]) -> "PodRecord":
+        meta = item.get("metadata") or {}
+        spec = item.get("spec") or {}
+        status = item.get("status") or {}
+        statuses = status.get("containerStatuses") or []
+        ready = restarts = 0
+        reason = message = None
+        crash = False
+        for cs in statuses:
+            if cs.get("ready"):
+                ready += 1
+            restarts += cs.get("restartCount") or 0
+            state = cs.get("state") or {}
+            waiting = state.get("waiting")
+            # waiting 상태 사유 우선, 없으면 terminated 사유 사용
+            detail = waiting or state.get("terminated")
+            if detail and not reason:
+                reason = detail.get("reason")
+                message = detail.get("message")
+            if waiting and waiting.get("reason") == "CrashLoopBackOff":
+                crash = True
+        return cls(
+            meta.get("name"),
+            meta.get("namespace"),
+            status.get("phase"),
+            spec.get("nodeName"),
+            meta.get("labels") or {},
+            parse_k8s_time(meta.get("creationTimestamp")),
+            ready,
+            len(statuses),
+            restarts,
+            reason,
+            message,
+            crash,
+            [c.get("name") for c in (spec.get("containers") or [])],
+        )
+
+    @classmethod
+    def from_model(cls, pod: Any) -> "PodRecord":
+        statuses = pod.status.container_statuses or []
+        ready = restarts = 0
+        reason = message = None
+        crash = False
+        for cs in statuses:
+            if cs.ready:
+                ready += 1
+            restarts += cs.restart_count or 0
+            state = cs.state
+            waiting = getattr(state, "waiting", None) if state else None
+            detail = waiting or (getattr(state, "terminated", None) if state else None)
+            if detail and not reason:
+                reason = getattr(detail, "reason", None)
+                message = getattr(detail, "message", None)
+            if waiting and getattr(waiting, "reason", None) == "CrashLoopBackOff":
+                crash = True
+        spec = pod.spec
+        return cls(
+            pod.metadata.name,
+            pod.metadata.namespace,
+            pod.status.phase,
+            spec.node_name if spec else None,
+            pod.metadata.labels or {},
+            _epoch(pod.metadata.creation_timestamp),
+            ready,
+            len(statuses),
+            restarts,
+            reason,
+            message,
+            crash,
+            [c.name for c in (getattr(spec, "containers", None) or [])],
+        )
+
+
+class DeploymentRecord:
+    """포맷터에 필요한 Deployment 필드만 담는 경량 레코드"""
+
+    __slots__ = ("name", "namespace", "desired", "current", "ready", "available", "image", "created")
+
+    def __init__(self, name, namespace, desired, current, ready, available, image, created):
+        self.name = name
+        self.namespace = namespace
+        self.desired = desired
+        self.current = current
+        self.ready = ready
+        self.available = available
+        self.image = image
+        self.created = created
+
+    @classmethod
+    def from_json(cls, item: Dict[str, Any]) -> "DeploymentRecord":
+        meta = item.get("metadata") or {}
+        spec = item.get("spec") or {}
+        status = item.get("status") or {}
+        containers = ((spec.get("template") or {}).get("spec") or {}).get("containers") or []
+        return cls(
+            meta.get("name"),
+            meta.get("namespace"),
+            spec.get("replicas"),
+            status.get("replicas") or 0,
+            status.get("readyReplicas") or 0,
+            status.get("availableReplicas") or 0,
+            containers[0].get("image") if containers else None,
+            parse_k8s_time(meta.get("creationTimestamp")),
+        )
+
+    @classmethod
+    def from_model(cls, deployment: Any) -> "DeploymentRecord":
+        containers = deployment.spec.template.spec.containers if deployment.spec.template else None
+        return cls(
+            deployment.metadata.name,
+            deployment.metadata.namespace,
+            deployment.spec.replicas,
+            deployment.status.replicas or 0,
+            deployment.status.ready_replicas or 0,
+            deployment.status.available_replicas or 0,
+            containers[0].image if containers else None,
+            _epoch(deployment.metadata.creation_timestamp),
+        )
+
+
+class ServiceRecord:
+    """포맷터에 필요한 Service 필드만 담는 경량 레코드"""
+
+    __slots__ = ("name", "namespace", "type", "cluster_ip", "ports", "created", "external")
+
+    def __init__(self, name, namespace, type, cluster_ip, ports, created, external=()):
+        self.name = name
+        self.namespace = namespace
+        self.type = type
+        self.cluster_ip = cluster_ip
+        self.ports = ports  # [(port, target_port, protocol, node_port)]
+        self.created = created
+        self.external = external  # LoadBalancer ingress IP/hostname 목록
+
+    @classmethod
+    def from_json(cls, item: Dict[str, Any]) -> "ServiceRecord":
+        meta = item.get("metadata") or {}
+        spec = item.get("spec") or {}
+        lb = ((item.get("status") or {}).get("loadBalancer") or {}).get("ingress") or []
+        return cls(
+            meta.get("name"),
+            meta.get("namespace"),
+            spec.get("type"),
+            spec.get("clusterIP"),
+            [
+                (p.get("port"), p.get("targetPort"), p.get("protocol"), p.get("nodePort"))
+                for p in (spec.get("ports") or [])
+            ],
+            parse_k8s_time(meta.get("creationTimestamp")),
+            [addr for addr in (i.get("ip") or i.get("hostname") for i in lb) if addr],
+        )
+
+    @classmethod
+    def from_model(cls, service: Any) -> "ServiceRecord":
+        load_balancer = getattr(service.status, "load_balancer", None) if service.status else None
+        lb = (load_balancer.ingress if load_balancer else None) or []
+        return cls(
+            service.metadata.name,
+            service.metadata.namespace,
+            service.spec.type,
+            service.spec.cluster_ip,
+            [(p.port, p.target_port, p.protocol, p.node_port) for p in (service.spec.ports or [])],
+            _epoch(service.metadata.creation_timestamp),
+            [addr for addr in (i.ip or i.hostname for i in lb) if addr],
+        )
+
+
+class ListResult:
+    """LIST 결과 레코드와 다음 청크 토큰"""
+
+    __slots__ = ("items", "continue_token", "remaining")
+
+    def __init__(self, items: List[Any], continue_token: Optional[str] = None, remaining: Optional[int] = None):
+        self.items = items
+        self.continue_token = continue_token
+        self.remaining = remaining
+
+
+def _read_body(response: Any) -> bytes:
+    try:
+        return response.data
+    finally:
+        release = getattr(response, "release_conn", None)
+        if release is not None:
+            release()
+
+
+def _raw_list(call, record_cls, **kwargs) -> ListResult:
+    kwargs = {k: v for k, v in kwargs.items() if v is not None}
+    body = _loads(_read_body(call(_preload_content=False, **kwargs)))
+    meta = body.get("metadata") or {}
+    from_json = record_cls.from_json
+    return ListResult(
+        [from_json(item) for item in body.get("items") or ()],
+        meta.get("continue") or None,
+        meta.get("remainingItemCount"),
+    )
+
+
+def _pick(api: Any, namespace: Optional[str], resource: str):
+    """namespace 유무에 따라 list_namespaced_* / list_*_for_all_namespaces 메서드를 고릅니다."""
+    if namespace:
+        namespaced = getattr(api, f"list_namespaced_{resource}")
+        return lambda **kw: namespaced(namespace=namespace, **kw)
+    return getattr(api, f"list_{resource}_for_all_namespaces")
+
+
+def list_pods(
+    core_v1: Any,
+    namespace: Optional[str] = None,
+    label_selector: Optional[str] = None,
+    limit: Optional[int] = None,
+    continue_token: Optional[str] = None,
+) -> ListResult:
+    """Pod 목록을 PodRecord로 조회합니다. namespace가 없으면 전체 네임스페이스."""
+    call = _pick(core_v1, namespace, "pod")
+    return _raw_list(call, PodRecord, label_selector=label_selector, limit=limit, _continue=continue_token)
+
+
+def list_pod_items(core_v1: Any, namespace: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Pod 원본 JSON 항목을 그대로 반환합니다 (레코드에 없는 resources/ownerReferences가 필요한 집계용)."""
+    call = _pick(core_v1, namespace, "pod")
+    return _loads(_read_body(call(_preload_content=False))).get("items") or []
+
+
+def list_deployments(
+    apps_v1: Any,
+    namespace: Optional[str] = None,
+    label_selector: Optional[str] = None,
+    limit: Optional[int] = None,
+    continue_token: Optional[str] = None,
+) -> ListResult:
+    """Deployment 목록을 DeploymentRecord로 조회합니다."""
+    call = _pick(apps_v1, namespace, "deployment")
+    return _raw_list(call, DeploymentRecord, label_selector=label_selector, limit=limit, _continue=continue_token)
+
+
+def list_services(
+    core_v1: Any,
+    namespace: Optional[str] = None,
+    label_selector: Optional[str] = None,
+    limit: Optional[int] = None,
+    continue_token: Optional[str] = None,
+) -> ListResult:
+    """Service 목록을 ServiceRecord로 조회합니다."""
+    call = _pick(core_v1, namespace, "service")
+    return _raw_list(call, ServiceRecord, label_selector=label_selector, limit=limit, _continue=continue_token)
+
+
+def as_pod_record(pod: Any) -> PodRecord:
+    return pod if isinstance(pod, PodRecord) else PodRecord.from_model(pod)
+
+
+def service_ports(record: ServiceRecord) -> List[Dict[str, Any]]:
+    """ServiceRecord 포트를 기존 응답 형식으로 변환합니다."""
+    ports = []
+    for port, target_port, protocol, node_port in record.ports:
+        info = {"port": port, "target_port": target_port, "protocol": protocol or "TCP"}
+        if record.type == "NodePort" and node_port:
+            info["node_port"] = node_port
+        ports.append(info)
+    return ports
+
+
+def deployment_summary(record: DeploymentRecord, now: Optional[float] = None) -> Dict[str, Any]:
+    """DeploymentRecord를 기존 목록 응답 형식으로 변환합니다. created_ts는 정렬용 epoch 초."""
+    return {
+        "name": record.name,
+        "namespace": record.namespace,
+        "replicas": {
+            "desired": record.desired,
+            "current": record.current,
+            "ready": record.ready,
+            "available": record.available,
+        },
+        "image": record.image,
+        "age": format_age(record.created, now),
+        "created_ts": record.created,
+        "status": "Running" if record.ready == record.desired else "Pending",
+    }
+
+
+def service_summary(record: ServiceRecord, now: Optional[float] = None) -> Dict[str, Any]:
+    """ServiceRecord를 기존 목록 응답 형식으로 변환합니다. created_ts는 정렬용 epoch 초."""
+    return {
+        "name": record.name,
+        "namespace": record.namespace,
+        "type": record.type,
+        "cluster_ip": record.cluster_ip,
+        "ports": service_ports(record),
+        "age": format_age(record.created, now),
+        "created_ts": record.created,
+    }
+
+
+__all__: Tuple[str, ...] = (
+    "PodRecord", "DeploymentRecord", "ServiceRecord", "ListResult",
+    "list_pods", "list_pod_items", "list_deployments", "list_services", "as_pod_record",
+    "deployment_summary", "service_summary", "service_ports", "format_created", "format_age", "parse_k8s_time",
+)
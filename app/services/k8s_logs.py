@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 from kubernetes.client import CoreV1Api
 from kubernetes.client.rest import ApiException
 
+from .log_stream import LogLineFilter, parse_log_timestamp, split_timestamp
+
+# (정렬 키, 원본 타임스탬프, 접두사가 붙은 줄)
+LogEntry = Tuple[Tuple[datetime, int], str, str]
+
 
 def _is_pod_ready(pod: Any) -> bool:
     try:
@@ -142,3 +149,118 @@ def get_pod_logs(
         raise
 
 
+def _log_sources(pods: List[Any]) -> List[Tuple[str, Optional[str], str]]:
+    """(pod 이름, 컨테이너 이름, 표시 접두사) 목록. 컨테이너가 여럿인 Pod만 컨테이너명을 붙임."""
+    sources: List[Tuple[str, Optional[str], str]] = []
+    for p in pods:
+        pod_name = p.metadata.name
+        containers = [c.name for c in (getattr(p.spec, "containers", None) or [])]
+        if len(containers) <= 1:
+            sources.append((pod_name, containers[0] if containers else None, pod_name))
+        else:
+            sources.extend((pod_name, c, f"{pod_name}/{c}") for c in containers)
+    return sources
+
+
+def _format_entry(entry: LogEntry) -> str:
+    """출력되는 한 줄 (타임스탬프 + 접두사 + 메시지)"""
+    _, ts, line = entry
+    return f"{ts} {line}" if ts else line
+
+
+def _trim_to_budget(entries: List[LogEntry], byte_budget: int) -> Tuple[List[LogEntry], bool]:
+    """최신 줄부터 출력 형식 기준 byte_budget까지만 남깁니다. (남은 줄, 잘렸는지 여부)"""
+    used = 0
+    for i in range(len(entries) - 1, -1, -1):
+        used += len(_format_entry(entries[i]).encode("utf-8")) + 1
+        if used > byte_budget:
+            return entries[i + 1:], True
+    return entries, False
+
+
+def _parse_source_lines(text: str, prefix: str, line_filter: Optional[LogLineFilter]) -> List[LogEntry]:
+    """timestamps=True 로그를 (정렬 키, 타임스탬프, 접두사 붙은 줄) 목록으로 변환합니다."""
+    entries: List[LogEntry] = []
+    last_key: Tuple[datetime, int] = (datetime.min, 0)
+    last_ts = ""
+    for line in (text or "").splitlines():
+        ts, message = split_timestamp(line)
+        if ts is not None:
+            parsed = parse_log_timestamp(ts)
+            if parsed is not None:
+                last_key, last_ts = (parsed[0].replace(tzinfo=None), parsed[1]), ts
+        if line_filter is not None and not line_filter.match(message):
+            continue
+        # 타임스탬프가 없는 줄은 직전 줄의 시각을 이어받아 순서를 유지
+        entries.append((last_key, last_ts, f"[{prefix}] {message}"))
+    return entries
+
+
+async def aggregate_pod_logs(
+    core_v1: CoreV1Api,
+    namespace: str,
+    pods: List[Any],
+    *,
+    lines: int = 100,
+    previous: bool = False,
+    line_filter: Optional[LogLineFilter] = None,
+    byte_budget: int = 256 * 1024,
+    concurrency: int = 8,
+) -> Dict[str, Any]:
+    """Fetch log tails from every pod/container concurrently and k-way merge them by timestamp.
+
+    Each source keeps at most its share of byte_budget (newest lines first), and the
+    merged result is trimmed again to byte_budget so memory stays bounded for large
+    replica sets. Lines are prefixed with the pod (and container) name.
+    """
+    tail_lines = max(1, min(lines, 1000))
+    sources = _log_sources(pods)
+    result: Dict[str, Any] = {
+        "logs": "", "entries": [], "sources": [prefix for _, _, prefix in sources],
+        "errors": [], "truncated": False, "total_lines": 0,
+    }
+    if not sources:
+        return result
+
+    per_source_budget = max(byte_budget // len(sources), 1024)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    def fetch(pod_name: str, container: Optional[str]) -> str:
+        kwargs: Dict[str, Any] = {
+            "name": pod_name,
+            "namespace": namespace,
+            "tail_lines": tail_lines,
+            "timestamps": True,
+        }
+        if container:
+            kwargs["container"] = container
+        if previous:
+            try:
+                return core_v1.read_namespaced_pod_log(previous=True, **kwargs)
+            except ApiException:
+                pass  # 이전 컨테이너가 없으면 현재 로그로 대체
+        return core_v1.read_namespaced_pod_log(**kwargs)
+
+    async def load(pod_name: str, container: Optional[str], prefix: str) -> Tuple[List[LogEntry], bool]:
+        async with semaphore:
+            try:
+                text = await asyncio.to_thread(fetch, pod_name, container)
+            except Exception as e:
+                result["errors"].append({"source": prefix, "error": getattr(e, "reason", None) or str(e)})
+                return [], False
+        # 응답 문자열은 여기서 버려지고 예산 안의 줄만 남음
+        return _trim_to_budget(_parse_source_lines(text, prefix, line_filter), per_source_budget)
+
+    loaded = await asyncio.gather(*[load(*source) for source in sources])
+
+    # 소스별로 이미 시간순이므로 힙 기반 k-way 병합
+    merged = list(heapq.merge(*[entries for entries, _ in loaded], key=lambda entry: entry[0]))
+    kept, merged_truncated = _trim_to_budget(merged, byte_budget)
+
+    result.update({
+        "logs": "\n".join(_format_entry(entry) for entry in kept),
+        "entries": [{"ts": ts or None, "line": line} for _, ts, line in kept],
+        "truncated": merged_truncated or any(truncated for _, truncated in loaded),
+        "total_lines": len(merged),
+    })
+    return result
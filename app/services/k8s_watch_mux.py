@@ -0,0 +1,596 @@
+"""
+Kubernetes Watch 멀티플렉서
+
+`/ws/kubernetes` 구독자 수와 관계없이 (kind, namespace)마다 업스트림 WATCH를
+하나만 유지하고, 그 결과를 구독자에게 나눠 보냅니다.
+
+- 업스트림: 전용 스레드에서 원본 LIST(`_preload_content=False`)로 초기 상태와
+  resourceVersion을 얻은 뒤 그 버전부터 WATCH. 410 Gone이면 다시 LIST 해서
+  캐시와 비교한 차이만 delta로 보냄
+- 경량 투영: 객체 전체 대신 목록 화면에 필요한 필드만 보내고, 투영 결과가
+  바뀌지 않은 MODIFIED(status heartbeat, managedFields 변경 등)는 버림
+- 초기 스냅샷: 이미 실행 중인 WATCH의 캐시로 만들므로 새 구독자가 붙어도
+  API 서버 호출이 늘지 않음
+- 구독자별 라벨 셀렉터: 라벨 변경으로 조건에 들어오면 ADDED, 빠지면 DELETED
+- 느린 구독자: 큐가 가득 차면 쌓인 delta를 버리고 최신 스냅샷으로 재동기화
+- 마지막 구독자가 떠나도 linger 시간 동안 WATCH를 유지해 재연결 시 재사용
+- 상한: 프로세스 전체 업스트림 수와 연결(owner)별 구독 수를 제한 (WatchLimitError)
+"""
+
+import asyncio
+import re
+import threading
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+
+import structlog
+from kubernetes.client.rest import ApiException
+
+from ..core.config import get_settings
+from ..monitoring.metrics import (
+    k8s_watch_events_total,
+    k8s_watch_resyncs_total,
+    k8s_watch_subscribers,
+    k8s_watch_upstreams,
+)
+from .k8s_client import get_apps_v1_api, get_core_v1_api
+from .k8s_fast_list import (
+    DeploymentRecord,
+    PodRecord,
+    ServiceRecord,
+    _loads,
+    _pick,
+    _read_body,
+    format_created,
+    service_ports,
+)
+
+logger = structlog.get_logger(__name__)
+
+ADDED = "ADDED"
+MODIFIED = "MODIFIED"
+DELETED = "DELETED"
+
+# resourceVersion 만료를 뜻하는 오류 문구 (HTTP 상태 없이 메시지로만 오는 경우)
+_EXPIRED_MESSAGES = ("too old resource version", "resourceversion for the provided watch is too old")
+_NAMESPACE_PATTERN = re.compile(r"^[a-z0-9]([-a-z0-9]{0,61}[a-z0-9])?$")
+
+
+def _is_expired(error: Any) -> bool:
+    """resourceVersion이 만료되어 다시 LIST해야 하는 오류인지 (410 Gone 또는 만료 메시지)"""
+    if isinstance(error, ApiException):
+        if error.status == 410:
+            return True
+        text = f"{error.reason or ''} {error.body or ''}"
+    elif isinstance(error, dict):
+        if error.get("code") == 410:
+            return True
+        text = str(error.get("message") or "")
+    else:
+        text = str(error)
+    text = text.lower()
+    return any(marker in text for marker in _EXPIRED_MESSAGES)
+
+
+class WatchLimitError(Exception):
+    """업스트림 WATCH 수 또는 연결별 구독 수 초과"""
+
+
+def namespace_allowed(namespace: Optional[str]) -> bool:
+    """구독 가능한 네임스페이스인지 확인합니다.
+
+    이름이 비었거나 DNS 라벨 형식이 아니면 거부합니다. k8s_watch_allowed_namespaces가
+    설정되어 있으면 그 목록만, 아니면 kube- 접두사 시스템 네임스페이스를 제외하고 허용합니다.
+    """
+    if not isinstance(namespace, str) or not _NAMESPACE_PATTERN.match(namespace):
+        return False
+    allowed = {ns.strip() for ns in get_settings().k8s_watch_allowed_namespaces.split(",") if ns.strip()}
+    if allowed:
+        return namespace in allowed
+    return not namespace.startswith("kube-")
+
+
+def project_pod(item: Dict[str, Any]) -> Dict[str, Any]:
+    record = PodRecord.from_json(item)
+    return {
+        "name": record.name,
+        "namespace": record.namespace,
+        "labels": record.labels,
+        "phase": record.phase,
+        "ready": f"{record.ready_count}/{record.container_count}",
+        "restarts": record.restarts,
+        "reason": record.reason,
+        "crash_looping": record.crash_looping,
+        "node": record.node,
+        "created": format_created(record.created),
+    }
+
+
+def project_deployment(item: Dict[str, Any]) -> Dict[str, Any]:
+    record = DeploymentRecord.from_json(item)
+    return {
+        "name": record.name,
+        "namespace": record.namespace,
+        "labels": (item.get("metadata") or {}).get("labels") or {},
+        "replicas": {
+            "desired": record.desired,
+            "current": record.current,
+            "ready": record.ready,
+            "available": record.available,
+        },
+        "image": record.image,
+        "status": "Running" if record.ready == record.desired else "Pending",
+        "created": format_created(record.created),
+    }
+
+
+def project_service(item: Dict[str, Any]) -> Dict[str, Any]:
+    record = ServiceRecord.from_json(item)
+    return {
+        "name": record.name,
+        "namespace": record.namespace,
+        "labels": (item.get("metadata") or {}).get("labels") or {},
+        "type": record.type,
+        "cluster_ip": record.cluster_ip,
+        "external": list(record.external),
+        "ports": service_ports(record),
+        "created": format_created(record.created),
+    }
+
+
+# kind → (API 그룹, list_* 리소스 이름, 투영 함수)
+WATCH_KINDS: Dict[str, Tuple[str, str, Callable[[Dict[str, Any]], Dict[str, Any]]]] = {
+    "pods": ("core", "pod", project_pod),
+    "deployments": ("apps", "deployment", project_deployment),
+    "services": ("core", "service", project_service),
+}
+
+
+def _default_api_factory(group: str) -> Any:
+    return get_apps_v1_api() if group == "apps" else get_core_v1_api()
+
+
+def _object_key(item: Dict[str, Any]) -> str:
+    meta = item.get("metadata") or {}
+    return meta.get("uid") or f"{meta.get('namespace')}/{meta.get('name')}"
+
+
+class LabelSelector:
+    """
+    등호 기반 라벨 셀렉터 (`app=web,tier!=db,canary,!legacy`)
+
+    Kubernetes labelSelector 문법 중 =, ==, !=, 존재/부재 조건을 지원합니다.
+    """
+
+    def __init__(self, expression: Optional[str] = None):
+        self.expression = (expression or "").strip()
+        self.requirements: List[Tuple[str, str, Optional[str]]] = []
+        for part in filter(None, (p.strip() for p in self.expression.split(","))):
+            if "!=" in part:
+                key, value = part.split("!=", 1)
+                self.requirements.append((key.strip(), "!=", value.strip()))
+            elif "=" in part:
+                key, value = part.split("==", 1) if "==" in part else part.split("=", 1)
+                self.requirements.append((key.strip(), "=", value.strip()))
+            elif part.startswith("!"):
+                self.requirements.append((part[1:].strip(), "!", None))
+            else:
+                self.requirements.append((part, "exists", None))
+        for key, _, _ in self.requirements:
+            if not key or any(c in key for c in " ()"):
+                raise ValueError(f"잘못된 라벨 셀렉터입니다: {self.expression}")
+
+    def matches(self, labels: Optional[Dict[str, str]]) -> bool:
+        labels = labels or {}
+        for key, op, value in self.requirements:
+            if op == "=" and labels.get(key) != value:
+                return False
+            if op == "!=" and labels.get(key) == value:
+                return False
+            if op == "exists" and key not in labels:
+                return False
+            if op == "!" and key in labels:
+                return False
+        return True
+
+
+class WatchSubscription:
+    """한 클라이언트의 (kind, namespace, 라벨 셀렉터) 구독"""
+
+    def __init__(
+        self,
+        upstream: "UpstreamWatch",
+        selector: LabelSelector,
+        queue_size: int,
+        owner: Optional[str] = None,
+    ):
+        self.upstream = upstream
+        self.selector = selector
+        self.owner = owner
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.initialized = False
+        self.resyncs = 0
+        self.closed = False
+
+    @property
+    def kind(self) -> str:
+        return self.upstream.kind
+
+    @property
+    def namespace(self) -> str:
+        return self.upstream.namespace
+
+    def _snapshot(self) -> Dict[str, Any]:
+        items = [obj for obj in self.upstream.items.values() if self.selector.matches(obj.get("labels"))]
+        items.sort(key=lambda obj: (obj.get("namespace") or "", obj.get("name") or ""))
+        return {
+            "type": "snapshot",
+            "data": {
+                "kind": self.kind,
+                "namespace": self.namespace,
+                "label_selector": self.selector.expression or None,
+                "resource_version": self.upstream.resource_version,
+                "items": items,
+            },
+        }
+
+    def push_snapshot(self) -> None:
+        self._drain()
+        self.queue.put_nowait(self._snapshot())
+        self.initialized = True
+
+    def _drain(self) -> None:
+        while not self.queue.empty():
+            self.queue.get_nowait()
+
+    def offer(self, event: str, obj: Dict[str, Any], prev: Optional[Dict[str, Any]]) -> None:
+        """업스트림 변경을 이 구독자의 라벨 조건에 맞춰 delta로 변환해 큐에 넣습니다."""
+        if not self.initialized:
+            return
+        now = event != DELETED and self.selector.matches(obj.get("labels"))
+        before = prev is not None and self.selector.matches(prev.get("labels"))
+        if now and before:
+            delta = (MODIFIED, obj)
+        elif now:
+            delta = (ADDED, obj)
+        elif before:
+            delta = (DELETED, prev)
+        else:
+            return
+        try:
+            self.queue.put_nowait({
+                "type": "delta",
+                "data": {"kind": self.kind, "namespace": self.namespace, "event": delta[0], "object": delta[1]},
+            })
+        except asyncio.QueueFull:
+            # 밀린 delta 대신 현재 상태 전체를 다시 보냄
+            self.resyncs += 1
+            k8s_watch_resyncs_total.labels(reason="overflow").inc()
+            self.push_snapshot()
+
+    async def messages(self) -> AsyncIterator[Dict[str, Any]]:
+        """스냅샷 → delta 순서로 메시지를 내보냅니다."""
+        while not self.closed:
+            yield await self.queue.get()
+
+
+class UpstreamWatch:
+    """(kind, namespace) 하나의 LIST+WATCH 스트림과 경량 투영 캐시"""
+
+    def __init__(
+        self,
+        kind: str,
+        namespace: str,
+        api: Any,
+        loop: asyncio.AbstractEventLoop,
+        watch_timeout: int,
+        retry_delay: float,
+    ):
+        group, resource, project = WATCH_KINDS[kind]
+        self.kind = kind
+        self.namespace = namespace
+        self.project = project
+        self.loop = loop
+        self.watch_timeout = watch_timeout
+        self.retry_delay = retry_delay
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self.resource_version: Optional[str] = None
+        self.subscribers: Set[WatchSubscription] = set()
+        self.ready = False
+        self.linger_handle: Optional[asyncio.TimerHandle] = None
+        self._call = _pick(api, namespace or None, resource)
+        self._closed = threading.Event()
+        self._response: Any = None
+        self._thread: Optional[threading.Thread] = None
+
+    # --- 읽기 스레드 -------------------------------------------------------
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name=f"k8s-watch-{self.kind}-{self.namespace or 'all'}", daemon=True
+        )
+        self._thread.start()
+
+    def _post(self, fn: Callable, *args: Any) -> None:
+        try:
+            self.loop.call_soon_threadsafe(fn, *args)
+        except RuntimeError:
+            # 이벤트 루프가 닫힘 (종료 중)
+            self._closed.set()
+
+    def _list(self) -> None:
+        body = _loads(_read_body(self._call(_preload_content=False)))
+        items = {_object_key(item): self.project(item) for item in body.get("items") or ()}
+        rv = (body.get("metadata") or {}).get("resourceVersion")
+        self.resource_version = rv
+        self._post(self._replace, items, rv)
+
+    def _watch(self) -> bool:
+        """WATCH 한 번을 끝까지 읽습니다. 다시 LIST가 필요하면 False."""
+        self._response = self._call(
+            watch=True,
+            resource_version=self.resource_version,
+            allow_watch_bookmarks=True,
+            timeout_seconds=self.watch_timeout,
+            _preload_content=False,
+        )
+        buffer = b""
+        for chunk in self._response.stream(65536):
+            if self._closed.is_set():
+                return True
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for raw in lines:
+                if raw.strip() and not self._handle_line(raw):
+                    return False
+        return True
+
+    def _handle_line(self, raw: bytes) -> bool:
+        event = _loads(raw)
+        event_type = event.get("type")
+        obj = event.get("object") or {}
+        if event_type == "ERROR":
+            # 410 Gone: resourceVersion이 압축되어 사라짐 → 다시 LIST
+            if _is_expired(obj):
+                return False
+            raise RuntimeError(obj.get("message") or "watch error")
+        rv = (obj.get("metadata") or {}).get("resourceVersion")
+        if rv:
+            self.resource_version = rv
+        if event_type in (ADDED, MODIFIED, DELETED):
+            self._post(self._apply, event_type, _object_key(obj), self.project(obj), rv)
+        return True
+
+    def _run(self) -> None:
+        need_list = True
+        while not self._closed.is_set():
+            try:
+                if need_list:
+                    self._list()
+                    need_list = False
+                if not self._watch():
+                    k8s_watch_resyncs_total.labels(reason="expired").inc()
+                    need_list = True
+            except ApiException as e:
+                if self._closed.is_set():
+                    break
+                if not need_list and _is_expired(e):
+                    # WATCH 요청 자체가 410으로 거절됨 → 같은 resourceVersion으로 재시도하지 않고 다시 LIST
+                    k8s_watch_resyncs_total.labels(reason="expired").inc()
+                    need_list = True
+                    continue
+                logger.warning(
+                    "k8s_watch_stream_failed", kind=self.kind, namespace=self.namespace, error=str(e)
+                )
+                self._closed.wait(self.retry_delay)
+            except Exception as e:
+                if self._closed.is_set():
+                    break
+                logger.warning(
+                    "k8s_watch_stream_failed", kind=self.kind, namespace=self.namespace, error=str(e)
+                )
+                self._closed.wait(self.retry_delay)
+            finally:
+                self._release_response()
+
+    def _release_response(self) -> None:
+        response, self._response = self._response, None
+        if response is None:
+            return
+        for method in ("close", "release_conn"):
+            try:
+                getattr(response, method)()
+            except Exception:
+                pass
+
+    # --- 이벤트 루프 -------------------------------------------------------
+
+    def _replace(self, items: Dict[str, Dict[str, Any]], rv: Optional[str]) -> None:
+        """LIST 결과로 캐시를 교체하고, 재LIST인 경우 이전 캐시와의 차이만 delta로 보냅니다."""
+        previous, self.items = self.items, items
+        self.resource_version = rv
+        if not self.ready:
+            self.ready = True
+            for sub in self.subscribers:
+                sub.push_snapshot()
+            return
+        for key, obj in items.items():
+            prev = previous.get(key)
+            if prev != obj:
+                self._broadcast(MODIFIED if prev is not None else ADDED, obj, prev)
+        for key, prev in previous.items():
+            if key not in items:
+                self._broadcast(DELETED, prev, prev)
+
+    def _apply(self, event_type: str, key: str, obj: Dict[str, Any], rv: Optional[str]) -> None:
+        if rv:
+            self.resource_version = rv
+        if event_type == DELETED:
+            prev = self.items.pop(key, None)
+            if prev is not None:
+                self._broadcast(DELETED, prev, prev)
+            return
+        prev = self.items.get(key)
+        if prev == obj:
+            # 목록에 보이는 필드는 그대로 (status heartbeat 등)
+            k8s_watch_events_total.labels(kind=self.kind, type="suppressed").inc()
+            return
+        self.items[key] = obj
+        self._broadcast(MODIFIED if prev is not None else ADDED, obj, prev)
+
+    def _broadcast(self, event_type: str, obj: Dict[str, Any], prev: Optional[Dict[str, Any]]) -> None:
+        k8s_watch_events_total.labels(kind=self.kind, type=event_type).inc()
+        for sub in list(self.subscribers):
+            sub.offer(event_type, obj, prev)
+
+    async def stop(self) -> None:
+        self._closed.set()
+        # 블로킹 read 중인 스레드를 깨우기 위해 응답 소켓을 닫음
+        await asyncio.to_thread(self._release_response)
+
+
+class KubernetesWatchMux:
+    """(kind, namespace)별 업스트림 WATCH를 구독자끼리 공유합니다."""
+
+    def __init__(
+        self,
+        api_factory: Callable[[str], Any] = _default_api_factory,
+        queue_size: Optional[int] = None,
+        linger_seconds: Optional[float] = None,
+        watch_timeout: Optional[int] = None,
+        retry_delay: float = 2.0,
+        max_upstreams: Optional[int] = None,
+        max_per_owner: Optional[int] = None,
+    ):
+        settings = get_settings()
+        self._api_factory = api_factory
+        self.queue_size = queue_size if queue_size is not None else settings.k8s_watch_queue_size
+        self.linger_seconds = linger_seconds if linger_seconds is not None else settings.k8s_watch_linger_seconds
+        self.watch_timeout = watch_timeout if watch_timeout is not None else settings.k8s_watch_timeout_seconds
+        self.max_upstreams = max_upstreams if max_upstreams is not None else settings.k8s_watch_max_upstreams
+        self.max_per_owner = (
+            max_per_owner if max_per_owner is not None else settings.k8s_watch_max_subscriptions_per_connection
+        )
+        self.retry_delay = retry_delay
+        self._upstreams: Dict[Tuple[str, str], UpstreamWatch] = {}
+        self._owners: Dict[str, int] = {}
+
+    def subscribe(
+        self,
+        kind: str,
+        namespace: str,
+        label_selector: Optional[str] = None,
+        owner: Optional[str] = None,
+    ) -> WatchSubscription:
+        """구독을 만듭니다. 같은 (kind, namespace)의 WATCH가 있으면 재사용합니다.
+
+        owner(연결 ID)별 구독 수가 max_per_owner에 닿았거나, 새 WATCH가 필요한데
+        업스트림 수가 max_upstreams에 닿았으면 WatchLimitError를 발생시킵니다.
+        """
+        if kind not in WATCH_KINDS:
+            raise ValueError(f"kind는 {', '.join(WATCH_KINDS)} 중 하나여야 합니다.")
+        selector = LabelSelector(label_selector)
+        if owner is not None and self._owners.get(owner, 0) >= self.max_per_owner:
+            raise WatchLimitError(f"연결당 구독은 최대 {self.max_per_owner}개입니다.")
+        key = (kind, namespace)
+        upstream = self._upstreams.get(key)
+        if upstream is None and len(self._upstreams) >= self.max_upstreams and not self._evict_idle():
+            raise WatchLimitError(f"동시에 유지할 수 있는 WATCH는 최대 {self.max_upstreams}개입니다.")
+        if upstream is None:
+            upstream = UpstreamWatch(
+                kind,
+                namespace,
+                self._api_factory(WATCH_KINDS[kind][0]),
+                asyncio.get_running_loop(),
+                watch_timeout=self.watch_timeout,
+                retry_delay=self.retry_delay,
+            )
+            self._upstreams[key] = upstream
+            upstream.start()
+            k8s_watch_upstreams.set(len(self._upstreams))
+            logger.info("k8s_watch_started", kind=kind, namespace=namespace)
+        elif upstream.linger_handle is not None:
+            upstream.linger_handle.cancel()
+            upstream.linger_handle = None
+        sub = WatchSubscription(upstream, selector, self.queue_size, owner)
+        upstream.subscribers.add(sub)
+        if owner is not None:
+            self._owners[owner] = self._owners.get(owner, 0) + 1
+        if upstream.ready:
+            sub.push_snapshot()
+        k8s_watch_subscribers.inc()
+        return sub
+
+    def unsubscribe(self, sub: WatchSubscription) -> None:
+        if sub.closed:
+            return
+        sub.closed = True
+        upstream = sub.upstream
+        upstream.subscribers.discard(sub)
+        k8s_watch_subscribers.dec()
+        if sub.owner is not None:
+            remaining = self._owners.get(sub.owner, 0) - 1
+            if remaining > 0:
+                self._owners[sub.owner] = remaining
+            else:
+                self._owners.pop(sub.owner, None)
+        if not upstream.subscribers and upstream.linger_handle is None:
+            upstream.linger_handle = asyncio.get_running_loop().call_later(
+                self.linger_seconds, self._expire, upstream
+            )
+
+    def _evict_idle(self) -> bool:
+        """구독자 없이 linger 중인 WATCH 하나를 바로 정리합니다. 정리했으면 True."""
+        for upstream in list(self._upstreams.values()):
+            if not upstream.subscribers and upstream.linger_handle is not None:
+                upstream.linger_handle.cancel()
+                self._expire(upstream)
+                return True
+        return False
+
+    def _expire(self, upstream: UpstreamWatch) -> None:
+        upstream.linger_handle = None
+        if upstream.subscribers:
+            return
+        key = (upstream.kind, upstream.namespace)
+        if self._upstreams.get(key) is upstream:
+            del self._upstreams[key]
+            k8s_watch_upstreams.set(len(self._upstreams))
+        asyncio.ensure_future(upstream.stop())
+        logger.info("k8s_watch_stopped", kind=upstream.kind, namespace=upstream.namespace)
+
+    async def stop(self) -> None:
+        upstreams, self._upstreams = list(self._upstreams.values()), {}
+        self._owners.clear()
+        for upstream in upstreams:
+            if upstream.linger_handle is not None:
+                upstream.linger_handle.cancel()
+            await upstream.stop()
+        k8s_watch_upstreams.set(0)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "upstream_watches": len(self._upstreams),
+            "watches": {
+                f"{kind}/{namespace or '*'}": {
+                    "subscribers": len(upstream.subscribers),
+                    "objects": len(upstream.items),
+                    "resource_version": upstream.resource_version,
+                }
+                for (kind, namespace), upstream in self._upstreams.items()
+            },
+        }
+
+
+_mux: Optional[KubernetesWatchMux] = None
+
+
+def get_k8s_watch_mux() -> KubernetesWatchMux:
+    global _mux
+    if _mux is None:
+        _mux = KubernetesWatchMux()
+    return _mux
+
+
+async def stop_k8s_watch_mux() -> None:
+    if _mux is not None:
+        await _mux.stop()
@@ -0,0 +1,384 @@
+"""
+Pod 로그 실시간 스트리밍 (follow)
+
+`read_namespaced_pod_log(follow=True, _preload_content=False)`의 응답을 전용
+스레드에서 읽어 줄 단위로 잘라 bounded asyncio.Queue에 넣고, 소비자는 큐에서
+배치로 꺼내 WebSocket/SSE로 전송합니다.
+
+- 백프레셔: 클라이언트 전송이 느려 큐가 가득 차면 읽기 스레드가 멈추고,
+  소켓을 더 읽지 않으므로 API 서버 쪽도 TCP 흐름 제어로 속도가 맞춰짐
+- 재개: timestamps=True로 받은 각 줄의 타임스탬프를 커서로 내려주고,
+  since_time/since_seconds로 다시 연결하면 커서 이후 줄만 전송
+- 서버 측 필터: 포함/제외 정규식, 최소 로그 레벨
+- 유휴 스트림 정리 및 사용자별 동시 스트림 수 제한
+"""
+
+import asyncio
+import concurrent.futures
+import math
+import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import structlog
+
+from ..core.config import get_settings
+from .k8s_client import get_core_v1_api
+
+logger = structlog.get_logger(__name__)
+
+# 레벨 키워드 (낮음 → 높음)
+LOG_LEVELS = ("debug", "info", "warn", "error")
+_LEVEL_PATTERNS = {
+    "debug": re.compile(r"\b(DEBUG|TRACE)\b", re.I),
+    "info": re.compile(r"\bINFO\b", re.I),
+    "warn": re.compile(r"\bWARN(ING)?\b", re.I),
+    "error": re.compile(r"\b(ERROR|FATAL|CRITICAL|PANIC|EXCEPTION)\b|Traceback", re.I),
+}
+
+_TS_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d{1,9}))?(Z|[+-]\d{2}:\d{2})$")
+
+_EOF = object()
+
+
+class LogStreamLimitError(Exception):
+    """사용자별 동시 스트림 수 초과"""
+
+
+def parse_log_timestamp(value: str) -> Optional[Tuple[datetime, int]]:
+    """
+    RFC3339Nano 타임스탬프를 (초 단위 datetime, 나노초) 튜플로 변환합니다.
+
+    kubelet은 소수부의 끝 0을 생략하므로 문자열 비교 대신 이 튜플로 정렬/비교합니다.
+    """
+    m = _TS_PATTERN.match(value)
+    if not m:
+        return None
+    base, frac, tz = m.groups()
+    try:
+        dt = datetime.fromisoformat(base + ("+00:00" if tz == "Z" else tz)).astimezone(timezone.utc)
+    except ValueError:
+        return None
+    return dt, int((frac or "0").ljust(9, "0"))
+
+
+def split_timestamp(line: str) -> Tuple[Optional[str], str]:
+    """`<timestamp> <message>` 형식의 줄을 분리합니다."""
+    head, sep, rest = line.partition(" ")
+    if sep and parse_log_timestamp(head) is not None:
+        return head, rest
+    return None, line
+
+
+class LogLineFilter:
+    """포함/제외 정규식과 최소 레벨로 로그 줄을 거릅니다."""
+
+    def __init__(self, grep: Optional[str] = None, exclude: Optional[str] = None, level: Optional[str] = None):
+        try:
+            self.grep = re.compile(grep, re.I) if grep else None
+            self.exclude = re.compile(exclude, re.I) if exclude else None
+        except re.error as e:
+            raise ValueError(f"잘못된 필터 정규식입니다: {e}")
+        if level and level.lower() not in LOG_LEVELS:
+            raise ValueError(f"level은 {', '.join(LOG_LEVELS)} 중 하나여야 합니다.")
+        self.levels = (
+            [_LEVEL_PATTERNS[lv] for lv in LOG_LEVELS[LOG_LEVELS.index(level.lower()):]]
+            if level else None
+        )
+
+    @property
+    def active(self) -> bool:
+        return bool(self.grep or self.exclude or self.levels)
+
+    def match(self, text: str) -> bool:
+        if self.grep and not self.grep.search(text):
+            return False
+        if self.exclude and self.exclude.search(text):
+            return False
+        if self.levels and not any(p.search(text) for p in self.levels):
+            return False
+        return True
+
+
+@dataclass
+class LogStreamOptions:
+    """스트림 요청 파라미터"""
+    namespace: str
+    pod_name: str
+    container: Optional[str] = None
+    tail_lines: Optional[int] = 100
+    since_seconds: Optional[int] = None
+    since_time: Optional[str] = None
+
+
+class LogStream:
+    """단일 Pod 컨테이너의 follow 스트림"""
+
+    def __init__(
+        self,
+        core_v1: Any,
+        options: LogStreamOptions,
+        line_filter: LogLineFilter,
+        queue_size: int,
+        batch_lines: int,
+        idle_timeout: float,
+        on_close: Optional[Callable[["LogStream"], None]] = None,
+    ):
+        self.core_v1 = core_v1
+        self.options = options
+        self.line_filter = line_filter
+        self.batch_lines = batch_lines
+        self.idle_timeout = idle_timeout
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.cursor: Optional[str] = options.since_time
+        self.lines_sent = 0
+        self.lines_dropped = 0
+        self._resume_after = parse_log_timestamp(options.since_time) if options.since_time else None
+        self._on_close = on_close
+        self._closed = threading.Event()
+        self._response: Any = None
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending_put: Optional["concurrent.futures.Future"] = None
+
+    # --- 읽기 스레드 -------------------------------------------------------
+
+    def _request_kwargs(self) -> Dict[str, Any]:
+        opts = self.options
+        kwargs: Dict[str, Any] = {
+            "name": opts.pod_name,
+            "namespace": opts.namespace,
+            "follow": True,
+            "timestamps": True,
+            "_preload_content": False,
+        }
+        if opts.container:
+            kwargs["container"] = opts.container
+        if self._resume_after is not None:
+            # 클라이언트 API에는 sinceTime이 없으므로 초 단위로 올림한 뒤 커서 이전 줄을 버림
+            elapsed = (datetime.now(timezone.utc) - self._resume_after[0]).total_seconds()
+            kwargs["since_seconds"] = max(1, math.ceil(elapsed) + 1)
+        elif opts.since_seconds:
+            kwargs["since_seconds"] = opts.since_seconds
+        elif opts.tail_lines is not None:
+            kwargs["tail_lines"] = opts.tail_lines
+        return kwargs
+
+    def _put(self, item: Any) -> bool:
+        """큐가 빌 때까지 스레드를 막습니다 (백프레셔). 스트림이 닫히면 False."""
+        if self._closed.is_set():
+            return False
+        try:
+            future = asyncio.run_coroutine_threadsafe(self.queue.put(item), self._loop)
+        except RuntimeError:
+            # 이벤트 루프가 이미 닫힘
+            return False
+        self._pending_put = future
+        while not self._closed.is_set():
+            try:
+                future.result(timeout=0.5)
+                return True
+            except TimeoutError:
+                continue
+            except Exception:
+                return False
+        # 취소는 루프 스레드에서 수행하고, 그 사이 루프가 닫혔으면 전달할 곳이 없으므로 무시
+        try:
+            self._loop.call_soon_threadsafe(future.cancel)
+        except RuntimeError:
+            pass
+        return False
+
+    def _emit(self, raw: bytes) -> bool:
+        line = raw.decode("utf-8", errors="replace").rstrip("\r")
+        ts, text = split_timestamp(line)
+        if self._resume_after is not None and ts is not None:
+            parsed = parse_log_timestamp(ts)
+            if parsed is not None and parsed <= self._resume_after:
+                return True
+        if not self.line_filter.match(text):
+            self.lines_dropped += 1
+            return True
+        return self._put((ts, text))
+
+    def _pump(self) -> None:
+        buffer = b""
+        try:
+            self._response = self.core_v1.read_namespaced_pod_log(**self._request_kwargs())
+            for chunk in self._response.stream(4096):
+                if self._closed.is_set():
+                    return
+                buffer += chunk
+                *lines, buffer = buffer.split(b"\n")
+                for raw in lines:
+                    if not self._emit(raw):
+                        return
+            if buffer and not self._closed.is_set():
+                self._emit(buffer)
+        except Exception as e:
+            if not self._closed.is_set():
+                logger.warning("log_stream_read_failed", pod=self.options.pod_name, error=str(e))
+                self._put(e)
+                return
+        finally:
+            self._release_response()
+        if not self._closed.is_set():
+            self._put(_EOF)
+
+    def _release_response(self) -> None:
+        response, self._response = self._response, None
+        if response is None:
+            return
+        for method in ("close", "release_conn"):
+            try:
+                getattr(response, method)()
+            except Exception:
+                pass
+
+    # --- 소비자 ------------------------------------------------------------
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._thread = threading.Thread(target=self._pump, name=f"log-stream-{self.options.pod_name}", daemon=True)
+        self._thread.start()
+
+    async def batches(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        로그 줄을 배치로 내보냅니다.
+
+        각 배치는 {"type": "logs", "lines": [...], "cursor": 마지막 타임스탬프} 형식이며,
+        종료 시 {"type": "end", "reason": "eof"|"idle"|"error"} 를 마지막으로 내보냅니다.
+        """
+        while True:
+            try:
+                item = await asyncio.wait_for(self.queue.get(), timeout=self.idle_timeout)
+            except asyncio.TimeoutError:
+                yield {"type": "end", "reason": "idle", "cursor": self.cursor}
+                return
+            lines: List[Dict[str, Any]] = []
+            end: Optional[Dict[str, Any]] = None
+            while True:
+                if item is _EOF:
+                    end = {"type": "end", "reason": "eof", "cursor": self.cursor}
+                    break
+                if isinstance(item, Exception):
+                    end = {"type": "end", "reason": "error", "error": str(item), "cursor": self.cursor}
+                    break
+                ts, text = item
+                if ts:
+                    self.cursor = ts
+                lines.append({"ts": ts, "line": text})
+                if len(lines) >= self.batch_lines:
+                    break
+                try:
+                    item = self.queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+            if lines:
+                self.lines_sent += len(lines)
+                yield {"type": "logs", "lines": lines, "cursor": self.cursor}
+            if end is not None:
+                yield end
+                return
+
+    async def close(self) -> None:
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        # 백프레셔로 대기 중인 put은 루프가 살아 있는 지금 루프 스레드에서 취소
+        # (읽기 스레드가 나중에 취소하면 그 사이 루프가 닫힐 수 있음)
+        pending, self._pending_put = self._pending_put, None
+        if pending is not None:
+            pending.cancel()
+        # 블로킹 read 중인 스레드를 깨우기 위해 응답 소켓을 닫음
+        await asyncio.to_thread(self._release_response)
+        if self._on_close is not None:
+            self._on_close(self)
+        logger.info(
+            "log_stream_closed",
+            pod=self.options.pod_name,
+            lines_sent=self.lines_sent,
+            lines_dropped=self.lines_dropped,
+        )
+
+    async def __aenter__(self) -> "LogStream":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+
+class LogStreamManager:
+    """사용자별 동시 스트림 수를 제한하며 로그 스트림을 생성합니다."""
+
+    def __init__(
+        self,
+        core_v1_factory: Callable[[], Any] = get_core_v1_api,
+        max_per_user: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+        queue_size: Optional[int] = None,
+        batch_lines: Optional[int] = None,
+    ):
+        settings = get_settings()
+        self._core_v1_factory = core_v1_factory
+        self.max_per_user = max_per_user if max_per_user is not None else settings.log_stream_max_per_user
+        self.idle_timeout = idle_timeout if idle_timeout is not None else settings.log_stream_idle_timeout
+        self.queue_size = queue_size if queue_size is not None else settings.log_stream_queue_size
+        self.batch_lines = batch_lines if batch_lines is not None else settings.log_stream_batch_lines
+        self._active: Dict[str, List[LogStream]] = {}
+
+    def open(
+        self,
+        user_id: str,
+        options: LogStreamOptions,
+        line_filter: Optional[LogLineFilter] = None,
+    ) -> LogStream:
+        """새 스트림을 만듭니다. `async with`로 사용하면 종료 시 슬롯이 반환됩니다."""
+        self.check_capacity(user_id)
+        active = self._active.setdefault(user_id, [])
+        stream = LogStream(
+            self._core_v1_factory(),
+            options,
+            line_filter or LogLineFilter(),
+            queue_size=self.queue_size,
+            batch_lines=self.batch_lines,
+            idle_timeout=self.idle_timeout,
+            on_close=lambda s: self._release(user_id, s),
+        )
+        active.append(stream)
+        logger.info("log_stream_opened", user_id=user_id, pod=options.pod_name, active=len(active))
+        return stream
+
+    def check_capacity(self, user_id: str) -> None:
+        """슬롯을 점유하지 않고 동시 스트림 수 제한만 확인합니다 (SSE 응답 전 429 판단용)."""
+        if len(self._active.get(user_id, [])) >= self.max_per_user:
+            raise LogStreamLimitError(
+                f"동시에 열 수 있는 로그 스트림은 최대 {self.max_per_user}개입니다."
+            )
+
+    def _release(self, user_id: str, stream: LogStream) -> None:
+        active = self._active.get(user_id, [])
+        if stream in active:
+            active.remove(stream)
+        if not active:
+            self._active.pop(user_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "active_streams": sum(len(v) for v in self._active.values()),
+            "users": {user: len(streams) for user, streams in self._active.items()},
+            "max_per_user": self.max_per_user,
+        }
+
+
+_manager: Optional[LogStreamManager] = None
+
+
+def get_log_stream_manager() -> LogStreamManager:
+    global _manager
+    if _manager is None:
+        _manager = LogStreamManager()
+    return _manager
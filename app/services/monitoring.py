@@ -1,24 +1,36 @@
-from typing import Any, Dict
+import time
+from typing import Any, Dict, Optional
 
-import httpx
 from pydantic import BaseModel, Field
 
-from ..core.config import get_settings
+from .prometheus_client import prometheus_client
 
 
 class PromQuery(BaseModel):
     query: str = Field(min_length=1)
 
 
+class PromRangeQuery(BaseModel):
+    query: str = Field(min_length=1)
+    start: Optional[float] = Field(default=None, description="시작 시각 (unix 초, 기본: end - duration_seconds)")
+    end: Optional[float] = Field(default=None, description="종료 시각 (unix 초, 기본: 현재)")
+    duration_seconds: float = Field(default=3600, gt=0, description="start 미지정 시 조회 구간 (초)")
+    step: Optional[float] = Field(default=None, gt=0, description="해상도 (초, 기본: 구간과 max_points로 자동 선택)")
+    max_points: Optional[int] = Field(default=None, gt=0, description="시계열당 최대 포인트 수")
+
+
 async def query_prometheus(data: PromQuery) -> Dict[str, Any]:
-    settings = get_settings()
-    if not settings.prometheus_base_url:
-        return {"status": "skipped", "reason": "prometheus_base_url not set"}
-    url = settings.prometheus_base_url.rstrip("/") + "/api/v1/query"
-    async with httpx.AsyncClient(timeout=10) as client:
-        resp = await client.get(url, params={"query": data.query})
-        resp.raise_for_status()
-        return resp.json()
+    """공유 클라이언트로 instant 쿼리 실행 (요청 병합 + scrape 주기 캐시)"""
+    return await prometheus_client.query(data.query)
+
+
+async def query_prometheus_range(data: PromRangeQuery) -> Dict[str, Any]:
+    """공유 클라이언트로 range 쿼리 실행 (step 자동 선택 + step 경계 캐시)"""
+    end = data.end if data.end is not None else time.time()
+    start = data.start if data.start is not None else end - data.duration_seconds
+    return await prometheus_client.query_range(
+        data.query, start=start, end=end, step=data.step, max_points=data.max_points
+    )
 
 
 def get_system_metrics() -> Dict[str, Any]:
@@ -11,6 +11,7 @@ from fastapi import HTTPException
 from urllib.parse import quote
 import httpx
 import asyncio
+from functools import lru_cache
 
 # Ensure ApiException symbol exists even if SDK missing
 class ApiException(Exception):  # type: ignore
@@ -57,21 +58,27 @@ from ..services.user_project_integration import upsert_integration, get_integrat
 from ..models.deployment_history import get_kst_now
 from sqlalchemy.orm import Session
 
-# Initialize NCP client from settings (expects env vars configured)
 settings = get_settings()
-if NCP_AVAILABLE:
-    ncloud_client = NcloudClient(
+
+
+# NCP SDK 클라이언트는 첫 사용 시 생성 (모듈 import/앱 기동 시간에 SDK 초기화 비용을 넣지 않음)
+@lru_cache(maxsize=1)
+def get_ncloud_client():
+    if not NCP_AVAILABLE:
+        return None
+    return NcloudClient(
         access_key=getattr(settings, "ncp_access_key", None),
         secret_key=getattr(settings, "ncp_secret_key", None),
     )
-    # Initialize SourceDeploy API if available
-    if SourceDeployApi:
-        sourcedeploy_api = SourceDeployApi(ncloud_client)
-    else:
-        sourcedeploy_api = None
-else:
-    ncloud_client = None
-    sourcedeploy_api = None
+
+
+@lru_cache(maxsize=1)
+def get_sourcedeploy_api():
+    client = get_ncloud_client()
+    if client is None or not SourceDeployApi:
+        return None
+    return SourceDeployApi(client)
+
 def _dbg(tag: str, **kw: object) -> None:
     try:
         kv = " ".join([f"{k}={kw[k]}" for k in kw])
@@ -736,6 +743,7 @@ async def create_sourcedeploy_project_sdk(name: str, manifest_text: str, nks_clu
 
     This uses the SDK which handles the internal API schema correctly.
     """
+    sourcedeploy_api = get_sourcedeploy_api()
     if not sourcedeploy_api:
         _dbg("SD-SDK-UNAVAILABLE", fallback="REST")
         return await create_sourcedeploy_project_rest(name, manifest_text, nks_cluster_id)
@@ -1867,6 +1875,7 @@ def create_ncp_pipeline_resource(app_name: str, image_name: str) -> dict:
     print("starting to create NCP pipeline resource")
     if not NCP_AVAILABLE:
         raise HTTPException(status_code=501, detail="ncloud-sdk 미설치: 'pip install ncloud-sdk' 후 서버를 재시작하세요")
+    ncloud_client = get_ncloud_client()
     deploy_api = SourceDeployApi(ncloud_client.api_client)
     pipeline_api = SourcePipelineApi(ncloud_client.api_client)
 
@@ -2372,6 +2381,14 @@ async def run_sourcebuild(
                             await asyncio.sleep(delay)
 
                 _dbg("SB-BUILD-SUCCESS", build_id=build_id, image=container_image, image_tag=image_tag, registry_verified=verified, verify_code=verify_code)
+                # 빌드가 푸시한 태그를 인덱스에 즉시 기록 (롤백 후보/배포 시 레지스트리 확인 생략)
+                try:
+                    from .ncr_tag_index import get_ncr_tag_index
+                    tag_index = get_ncr_tag_index()
+                    if tag_index is not None:
+                        await tag_index.record_image(container_image)
+                except Exception as _ie:
+                    _dbg("SB-TAG-INDEX-ERR", err=str(_ie)[:200])
                 return {
                     "status": st,
                     "build_id": build_id,
@@ -2708,8 +2725,18 @@ async def run_sourcedeploy(
     desired_image = f"{image_repo}:{effective_tag}"
 
     # Verify image exists in registry before deployment
-    _dbg("SD-IMAGE-VERIFY-START", image=desired_image)
-    verification = await _verify_ncr_manifest_exists(desired_image)
+    # 태그 인덱스에 있으면 레지스트리 왕복 생략 (빌드 성공 시 기록 + 주기 색인)
+    from .ncr_tag_index import get_ncr_tag_index, split_image
+    tag_index = get_ncr_tag_index()
+    image_parts = split_image(desired_image)
+    if tag_index is not None and image_parts and tag_index.lookup(image_parts[1], effective_tag):
+        _dbg("SD-IMAGE-VERIFY-INDEXED", image=desired_image)
+        verification = {"exists": True, "code": None}
+    else:
+        _dbg("SD-IMAGE-VERIFY-START", image=desired_image)
+        verification = await _verify_ncr_manifest_exists(desired_image)
+        if verification.get("exists") and tag_index is not None:
+            await tag_index.record_image(desired_image)
     if not verification.get("exists"):
         error_code = verification.get("code")
         _dbg("SD-IMAGE-NOT-FOUND", image=desired_image, code=error_code)
@@ -2796,7 +2823,9 @@ async def run_sourcedeploy(
 
                 # Use new mirror function that updates manifest with actual image tag and replicas
                 # Pass SourceCommit authentication credentials for Git operations
-                mirror_result = mirror_and_update_manifest(
+                # git clone/push가 이벤트 루프를 막지 않도록 스레드에서 실행
+                mirror_result = await asyncio.to_thread(
+                    mirror_and_update_manifest,
                     github_repo_url=github_repo_url,
                     installation_or_access_token=github_token,
                     sc_project_id=sc_project_id,
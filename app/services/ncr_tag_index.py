@@ -0,0 +1,444 @@
+"""
+NCR 이미지 태그 인덱스
+
+롤백 후보 목록은 후보마다 레지스트리 매니페스트를 확인하기에 너무 느려 `can_rollback`을 무조건
+True로 보고했고, 실제 롤백/배포 시점에 `_verify_ncr_manifest_exists` 왕복으로 확인했습니다.
+저장소별 태그 목록을 백그라운드에서 주기적으로 받아 두고 조회는 메모리에서 처리합니다.
+
+- 저장소(이미지 이름)별 태그 집합을 메모리(frozenset)와 DB(ncr_image_tags)에 보관
+- 백그라운드 루프: 기동 시 DB에서 적재 → 주기마다 Registry v2 `tags/list`(페이지네이션, Bearer 인증)로 재색인
+- 빌드 성공 시 태그를 즉시 기록 (다음 주기까지 기다리지 않음)
+- 조회 결과는 True(존재) / False(색인상 없음) / None(색인 없음·오래됨 → 기존처럼 레지스트리 확인)
+- 색인상 없음(False)도 다음 주기 전에 푸시된 태그일 수 있으므로 confirm()으로 매니페스트를 직접 확인.
+  실제로 삭제된 태그가 목록 조회마다 레지스트리 왕복을 만들지 않도록, 없다고 확인된 태그는
+  그 저장소의 다음 재색인(또는 빌드 기록) 전까지 다시 확인하지 않음
+- 백그라운드 루프는 앱 기동 시 한 번 시작 (start_ncr_tag_index)
+"""
+
+import asyncio
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+import httpx
+import structlog
+
+from ..core.config import get_settings
+from ..database import SessionLocal
+from ..models.deployment_history import DeploymentHistory, get_kst_now
+from ..models.ncr_image_tag import NcrImageTag
+from ..monitoring.metrics import ncr_tag_index_lookups_total, ncr_tag_index_refresh_total
+
+logger = structlog.get_logger(__name__)
+
+# tags/list 페이지 크기
+PAGE_SIZE = 1000
+# 커밋 SHA 태그는 7자 축약형으로 푸시됨 (run_sourcedeploy의 effective_tag와 동일 규칙)
+SHORT_SHA = 7
+# 한 주기에 동시에 목록을 받는 저장소 수
+REFRESH_CONCURRENCY = 4
+
+_LINK_NEXT = re.compile(r'<([^>]+)>\s*;\s*rel="?next"?')
+
+
+def split_image(image_with_tag: str) -> Optional[Tuple[str, str, str]]:
+    """`host/name:tag` → (host, name, tag). 형식이 맞지 않으면 None"""
+    if "/" not in image_with_tag:
+        return None
+    host, rest = image_with_tag.split("/", 1)
+    if ":" not in rest:
+        return None
+    name, tag = rest.rsplit(":", 1)
+    if not name or not tag:
+        return None
+    return host, name, tag
+
+
+def _tag_candidates(tag: str) -> Tuple[str, ...]:
+    return (tag, tag[:SHORT_SHA]) if len(tag) > SHORT_SHA else (tag,)
+
+
+def _parse_challenge(header: str) -> Dict[str, str]:
+    params: Dict[str, str] = {}
+    try:
+        for part in header.split(" ", 1)[1].split(","):
+            if "=" in part:
+                key, value = part.split("=", 1)
+                params[key.strip().lower()] = value.strip().strip('"')
+    except IndexError:
+        pass
+    return params
+
+
+@dataclass
+class _RepoTags:
+    tags: FrozenSet[str]
+    refreshed_at: float
+
+
+class NcrTagIndex:
+    """저장소별 NCR 태그 집합을 주기적으로 색인하고 메모리에서 조회합니다."""
+
+    def __init__(
+        self,
+        registry: Optional[str] = None,
+        interval: Optional[float] = None,
+        max_age: Optional[float] = None,
+        session_factory: Callable[[], Any] = SessionLocal,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        settings = get_settings()
+        self.registry = (registry if registry is not None else settings.ncp_container_registry_url or "").strip()
+        self.interval = interval if interval is not None else settings.ncr_tag_index_interval_seconds
+        self.max_age = max_age if max_age is not None else settings.ncr_tag_index_max_age_seconds
+        self.session_factory = session_factory
+        self._transport = transport
+        self._clock = clock
+        self._repos: Dict[str, _RepoTags] = {}
+        # 색인 대상 저장소 (조회/기록된 저장소 + 배포 이력의 저장소)
+        self._tracked: Set[str] = set()
+        # 재색인 중 빌드 성공으로 기록된 태그 (목록 응답에 아직 없을 수 있으므로 보존)
+        self._recorded: Dict[Tuple[str, str], float] = {}
+        # 매니페스트로 없다고 확인된 (저장소, 태그). 해당 저장소 재색인 시 비움
+        self._confirmed_missing: Set[Tuple[str, str]] = set()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._tokens: Dict[str, str] = {}
+        self._loaded = False
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # ------------------------------------------------------------------
+    # 수명 주기
+    # ------------------------------------------------------------------
+    def ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._task is not None and not self._task.done():
+            return
+        # 다른 루프에 묶인 이전 루프/재색인 태스크는 그 루프에서 취소 (루프가 이미 닫혔으면 함께 종료됨)
+        old_loop, old_tasks = self._loop, [t for t in (self._task, *self._inflight.values()) if t is not None]
+        if old_loop is not None and old_loop is not loop and not old_loop.is_closed():
+            for task in old_tasks:
+                old_loop.call_soon_threadsafe(task.cancel)
+        elif old_loop is loop:
+            for task in old_tasks:
+                task.cancel()
+        self._loop = loop
+        self._inflight = {}
+        self._task = loop.create_task(self._run(), name="ncr-tag-index")
+        logger.info("ncr_tag_index_started", registry=self.registry, interval=self.interval)
+
+    async def stop(self) -> None:
+        tasks = [t for t in (self._task, *self._inflight.values()) if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._loop = None
+        self._inflight = {}
+
+    async def _run(self) -> None:
+        await self.load()
+        while True:
+            try:
+                await self.refresh_all()
+            except Exception as e:
+                logger.error("ncr_tag_index_cycle_failed", error=str(e))
+            await asyncio.sleep(self.interval)
+
+    # ------------------------------------------------------------------
+    # 조회 / 기록
+    # ------------------------------------------------------------------
+    def lookup(self, image_name: str, tag: Optional[str]) -> Optional[bool]:
+        """태그 존재 여부. 색인이 없거나 max_age보다 오래되었으면 None"""
+        self._tracked.add(image_name)
+        entry = self._repos.get(image_name)
+        if not tag or entry is None or self._clock() - entry.refreshed_at > self.max_age:
+            ncr_tag_index_lookups_total.labels(result="unknown").inc()
+            return None
+        found = any(t in entry.tags for t in _tag_candidates(tag))
+        ncr_tag_index_lookups_total.labels(result="hit" if found else "miss").inc()
+        return found
+
+    def track(self, image_name: str) -> None:
+        """색인 대상에 추가하고, 아직 색인이 없으면 곧바로 재색인을 예약합니다."""
+        self._tracked.add(image_name)
+        if image_name not in self._repos and self._loop is not None:
+            self._schedule_refresh(image_name)
+
+    async def record(self, image_name: str, tag: str, source: str = "build") -> None:
+        """빌드 성공 등으로 존재가 확인된 태그를 즉시 기록"""
+        now = self._clock()
+        self._tracked.add(image_name)
+        self._recorded[(image_name, tag)] = now
+        self._confirmed_missing = {
+            (name, t) for name, t in self._confirmed_missing if name != image_name or tag not in _tag_candidates(t)
+        }
+        entry = self._repos.get(image_name)
+        if entry is None:
+            # 목록 색인 전이므로 다른 태그 조회는 여전히 None(unknown)
+            self._repos[image_name] = _RepoTags(frozenset((tag,)), float("-inf"))
+        elif tag not in entry.tags:
+            entry.tags = entry.tags | {tag}
+        try:
+            await asyncio.to_thread(self._persist_add, image_name, tag, source)
+        except Exception as e:
+            logger.warning("ncr_tag_index_persist_failed", image=image_name, tag=tag, error=str(e))
+
+    async def confirm(self, image_name: str, tag: str) -> Optional[bool]:
+        """
+        색인에 없는 태그를 레지스트리 매니페스트로 직접 확인합니다.
+
+        있으면 색인에 기록하고 True, 없으면 False, 확인할 수 없으면 None.
+        없다는 결과는 저장소의 다음 재색인까지 기억해 레지스트리를 다시 호출하지 않습니다.
+        """
+        if not self.registry or not tag:
+            return None
+        if (image_name, tag) in self._confirmed_missing:
+            ncr_tag_index_lookups_total.labels(result="missing_cached").inc()
+            return False
+        headers = {"Accept": "application/vnd.docker.distribution.manifest.v2+json"}
+        try:
+            async with httpx.AsyncClient(timeout=10.0, follow_redirects=True, transport=self._transport) as client:
+                for candidate in _tag_candidates(tag):
+                    url = f"https://{self.registry}/v2/{image_name}/manifests/{candidate}"
+                    resp = await self._get(client, url, image_name, headers)
+                    if resp.status_code == 200:
+                        ncr_tag_index_lookups_total.labels(result="confirmed").inc()
+                        await self.record(image_name, candidate, source="registry")
+                        return True
+                    if resp.status_code != 404:
+                        return None
+        except httpx.HTTPError as e:
+            logger.warning("ncr_manifest_check_failed", image=image_name, tag=tag, error=str(e))
+            return None
+        self._confirmed_missing.add((image_name, tag))
+        return False
+
+    async def record_image(self, image_with_tag: str) -> None:
+        parts = split_image(image_with_tag)
+        if parts is not None:
+            await self.record(parts[1], parts[2])
+
+    # ------------------------------------------------------------------
+    # 색인
+    # ------------------------------------------------------------------
+    async def load(self) -> None:
+        """DB에 저장된 태그와 배포 이력의 저장소로 메모리 색인을 채웁니다."""
+        if self._loaded:
+            return
+        try:
+            stored, names = await asyncio.to_thread(self._load_rows)
+        except Exception as e:
+            logger.warning("ncr_tag_index_load_failed", error=str(e))
+            return
+        self._loaded = True
+        # DB 값은 이전 프로세스가 색인한 것이므로 기동 직후 한 번은 신뢰하고, 첫 재색인이 갱신
+        now = self._clock()
+        for image_name, tags in stored.items():
+            if image_name not in self._repos:
+                self._repos[image_name] = _RepoTags(frozenset(tags), now)
+        self._tracked.update(stored)
+        self._tracked.update(names)
+
+    async def refresh_all(self) -> None:
+        semaphore = asyncio.Semaphore(REFRESH_CONCURRENCY)
+
+        async def refresh_one(image_name: str) -> None:
+            async with semaphore:
+                await self.refresh(image_name)
+
+        await asyncio.gather(*(refresh_one(name) for name in sorted(self._tracked)))
+
+    async def refresh(self, image_name: str) -> Optional[FrozenSet[str]]:
+        """저장소 하나를 재색인 (동시에 들어온 같은 저장소 요청은 하나로 합침)"""
+        task = self._inflight.get(image_name)
+        if task is None or task.done():
+            task = self._schedule_refresh(image_name)
+        return await asyncio.shield(task)
+
+    def _schedule_refresh(self, image_name: str) -> asyncio.Task:
+        task = self._inflight.get(image_name)
+        if task is None or task.done():
+            task = asyncio.get_running_loop().create_task(self._refresh(image_name))
+            self._inflight[image_name] = task
+            task.add_done_callback(lambda t, n=image_name: self._forget(n, t))
+        return task
+
+    def _forget(self, image_name: str, task: asyncio.Task) -> None:
+        if self._inflight.get(image_name) is task:
+            del self._inflight[image_name]
+
+    async def _refresh(self, image_name: str) -> Optional[FrozenSet[str]]:
+        started = self._clock()
+        try:
+            listed = await self._list_tags(image_name)
+        except Exception as e:
+            logger.warning("ncr_tag_listing_failed", image=image_name, error=str(e))
+            listed = None
+        if listed is None:
+            # 알 수 없는 상태: 기존 색인 유지 (오래되면 lookup이 None을 돌려 레지스트리 확인으로 대체)
+            ncr_tag_index_refresh_total.labels(result="error").inc()
+            return None
+
+        recent = {tag for (name, tag), at in self._recorded.items() if name == image_name and at >= started}
+        for key in [k for k, at in self._recorded.items() if k[0] == image_name and at < started]:
+            del self._recorded[key]
+        tags = frozenset(listed) | recent
+        self._repos[image_name] = _RepoTags(tags, self._clock())
+        self._confirmed_missing = {key for key in self._confirmed_missing if key[0] != image_name}
+        ncr_tag_index_refresh_total.labels(result="ok").inc()
+        try:
+            await asyncio.to_thread(self._persist_replace, image_name, tags)
+        except Exception as e:
+            logger.warning("ncr_tag_index_persist_failed", image=image_name, error=str(e))
+        return tags
+
+    async def _list_tags(self, image_name: str) -> Optional[List[str]]:
+        """Registry v2 tags/list 전체 페이지. 저장소가 없으면 빈 목록, 확인 불가면 None"""
+        if not self.registry:
+            return None
+        base = f"https://{self.registry}"
+        url: Optional[str] = f"{base}/v2/{image_name}/tags/list?n={PAGE_SIZE}"
+        tags: List[str] = []
+        async with httpx.AsyncClient(timeout=10.0, follow_redirects=True, transport=self._transport) as client:
+            while url:
+                resp = await self._get(client, url, image_name)
+                if resp.status_code == 404:
+                    return []
+                if resp.status_code != 200:
+                    logger.warning("ncr_tag_listing_rejected", image=image_name, status=resp.status_code)
+                    return None
+                tags.extend((resp.json() or {}).get("tags") or [])
+                match = _LINK_NEXT.search(resp.headers.get("Link", ""))
+                url = (base + match.group(1) if match.group(1).startswith("/") else match.group(1)) if match else None
+        return tags
+
+    async def _get(
+        self, client: httpx.AsyncClient, url: str, image_name: str, headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        headers = dict(headers or {})
+        token = self._tokens.get(image_name)
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        resp = await client.get(url, headers=headers)
+        if resp.status_code != 401:
+            return resp
+        challenge = resp.headers.get("WWW-Authenticate") or ""
+        if "Bearer" not in challenge:
+            return resp
+        params = _parse_challenge(challenge)
+        realm = params.get("realm")
+        if not realm:
+            return resp
+        settings = get_settings()
+        user = getattr(settings, "ncp_registry_username", None) or getattr(settings, "ncp_access_key", None)
+        pwd = getattr(settings, "ncp_registry_password", None) or getattr(settings, "ncp_secret_key", None)
+        query = {"scope": params.get("scope") or f"repository:{image_name}:pull"}
+        if params.get("service"):
+            query["service"] = params["service"]
+        tok = await client.get(realm, params=query, auth=(user or "", pwd or ""))
+        if tok.status_code != 200:
+            return resp
+        body = tok.json() if tok.text else {}
+        token = body.get("token") or body.get("access_token")
+        if not token:
+            return resp
+        # 같은 저장소의 다음 페이지/다음 주기는 토큰 재사용 (만료 시 다시 401 → 재발급)
+        self._tokens[image_name] = token
+        return await client.get(url, headers={**headers, "Authorization": f"Bearer {token}"})
+
+    # ------------------------------------------------------------------
+    # DB
+    # ------------------------------------------------------------------
+    def _load_rows(self) -> Tuple[Dict[str, Set[str]], Set[str]]:
+        from .ncp_pipeline import _generate_ncr_image_name
+
+        db = self.session_factory()
+        try:
+            stored: Dict[str, Set[str]] = {}
+            for image_name, tag in db.query(NcrImageTag.image_name, NcrImageTag.tag).all():
+                stored.setdefault(image_name, set()).add(tag)
+            repos = db.query(DeploymentHistory.github_owner, DeploymentHistory.github_repo).filter(
+                DeploymentHistory.status == "success"
+            ).distinct().all()
+            names = {_generate_ncr_image_name(owner, repo) for owner, repo in repos if owner and repo}
+            return stored, names
+        finally:
+            db.close()
+
+    def _persist_add(self, image_name: str, tag: str, source: str) -> None:
+        db = self.session_factory()
+        try:
+            exists = db.query(NcrImageTag.id).filter(
+                NcrImageTag.image_name == image_name, NcrImageTag.tag == tag
+            ).first()
+            if exists is None:
+                db.add(NcrImageTag(image_name=image_name, tag=tag, source=source, indexed_at=get_kst_now()))
+                db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _persist_replace(self, image_name: str, tags: Iterable[str]) -> None:
+        """레지스트리 목록과 DB를 맞춤 (차이분만 INSERT/DELETE)"""
+        tags = set(tags)
+        db = self.session_factory()
+        try:
+            existing = {
+                tag for (tag,) in db.query(NcrImageTag.tag).filter(NcrImageTag.image_name == image_name).all()
+            }
+            removed = existing - tags
+            if removed:
+                db.query(NcrImageTag).filter(
+                    NcrImageTag.image_name == image_name, NcrImageTag.tag.in_(removed)
+                ).delete(synchronize_session=False)
+            added = tags - existing
+            if added:
+                now = get_kst_now()
+                db.bulk_insert_mappings(NcrImageTag, [
+                    {"image_name": image_name, "tag": tag, "source": "registry", "indexed_at": now}
+                    for tag in added
+                ])
+            if removed or added:
+                db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "repositories": len(self._repos),
+            "tracked": len(self._tracked),
+            "tags": sum(len(r.tags) for r in self._repos.values()),
+        }
+
+
+_index: Optional[NcrTagIndex] = None
+
+
+def get_ncr_tag_index() -> Optional[NcrTagIndex]:
+    """전역 인덱스 (비활성화 시 None). 백그라운드 색인 루프는 start_ncr_tag_index()가 시작합니다."""
+    global _index
+    if not get_settings().ncr_tag_index_enabled:
+        return None
+    if _index is None:
+        _index = NcrTagIndex()
+    return _index
+
+
+def start_ncr_tag_index() -> None:
+    """앱 기동 시 현재 이벤트 루프에서 백그라운드 색인 루프를 한 번 시작합니다."""
+    index = get_ncr_tag_index()
+    if index is not None:
+        index.ensure_started()
+
+
+async def stop_ncr_tag_index() -> None:
+    if _index is not None:
+        await _index.stop()
@@ -6,7 +6,6 @@
 from typing import Dict, Any, Optional, List
 from enum import Enum
 import time
-import requests
 import structlog
 from datetime import datetime
 import httpx
@@ -19,6 +18,7 @@ from ..models.slack_events import (
     SlackNotificationResponse,
 )
 from .slack_template_builder import SlackTemplateBuilder
+from .slack_delivery import SlackDeliveryError, get_slack_delivery_queue
 
 logger = structlog.get_logger(__name__)
 
@@ -67,7 +67,7 @@ class SlackNotificationService:
                 branch=branch,
                 timestamp=int(time.time())
             )
-            self._send_to_slack(payload, channel)
+            self._send_to_slack(payload, channel, coalesce_key=f"deployment:{deployment_id}")
             self.logger.info(
                 "deployment_started_notification_sent",
                 deployment_id=deployment_id,
@@ -109,7 +109,7 @@ class SlackNotificationService:
                 logs=logs,
                 timestamp=int(time.time())
             )
-            self._send_to_slack(payload, channel)
+            self._send_to_slack(payload, channel, coalesce_key=f"deployment:{deployment_id}")
             self.logger.info(
                 "deployment_success_notification_sent",
                 deployment_id=deployment_id,
@@ -152,7 +152,7 @@ class SlackNotificationService:
                 logs=logs,
                 timestamp=int(time.time())
             )
-            self._send_to_slack(payload, channel)
+            self._send_to_slack(payload, channel, coalesce_key=f"deployment:{deployment_id}")
             self.logger.info(
                 "deployment_failed_notification_sent",
                 deployment_id=deployment_id,
@@ -786,27 +786,26 @@ class SlackNotificationService:
             ]
         }
 
-    def _send_to_slack(self, payload: Dict[str, Any], channel: Optional[str] = None) -> None:
-        """슬랙 웹훅으로 전송"""
-        if not self.webhook_url:
+    def _send_to_slack(
+        self,
+        payload: Dict[str, Any],
+        channel: Optional[str] = None,
+        coalesce_key: Optional[str] = None,
+    ) -> None:
+        """슬랙 발신 큐에 적재 (즉시 반환, 속도 제한/재시도/병합은 큐 워커가 처리)"""
+        if not self.webhook_url and not self.settings.slack_bot_token:
             self.logger.warning("slack_webhook_url_not_configured")
             return
 
-        try:
-            # 채널 지정이 있으면 추가
-            if channel:
-                payload["channel"] = channel
-
-            response = requests.post(
-                self.webhook_url,
-                json=payload,
-                timeout=10
-            )
-            response.raise_for_status()
-            self.logger.debug("slack_message_sent", status_code=response.status_code)
-        except requests.exceptions.RequestException as e:
-            self.logger.error("slack_send_failed", error=str(e))
-            raise
+        # 채널 지정이 있으면 추가
+        if channel:
+            payload["channel"] = channel
+
+        if not get_slack_delivery_queue().submit(
+            payload, channel=channel, webhook_url=self.webhook_url, coalesce_key=coalesce_key
+        ):
+            raise SlackDeliveryError("slack message was not queued")
+        self.logger.debug("slack_message_queued", channel=channel, coalesce_key=coalesce_key)
 
 
 # ============================================================
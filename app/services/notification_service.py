@@ -12,6 +12,7 @@ import structlog
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
+from .alert_rules import discard_alert, list_alerts
 from .monitoring import PromQuery, query_prometheus
 
 from ..models.notification import Notification, NotificationReport
@@ -34,324 +35,14 @@ class NotificationService:
 
     async def list_active_alerts(self, cluster: str = "nks-cluster") -> List[Dict[str, Any]]:
         """
-        활성 알림 목록 조회 (nks-prometheus 기반, persist-on-first-trigger)
-
-        - 카테고리: CPU, Memory, Disk, Network
-        - 규칙 예시:
-          CPU: utilization>80/90, iowait>5/10
-          Memory: usage>80/90, swap>0
-          Disk: root usage>85/95, IO saturation>0.8, readonly==1
-          Network: rx_errors>0/s, rx_drops>0/s, high throughput(>~50MB/s)
-        - 동작: 조건이 참이면 DB(Notification)에 status=firing으로 1회 저장 후, 사용자가 resolve할 때까지 유지
-        - 반환: DB의 firing 알림을 시간순으로 반환
-        """
-        alerts: List[Dict[str, Any]] = []
+        활성 알림 목록 조회 (nks-prometheus 기반)
 
+        - 규칙(CPU/Memory/Disk/Network)은 alert_rules.DEFAULT_RULES에 선언형으로 정의
+        - 평가는 AlertRuleEngine이 클러스터별로 주기 실행하며, firing/resolved 전이만 DB에 일괄 반영
+        - 반환: 엔진 메모리 상태의 firing 알림(시드 등 DB에만 있는 알림 포함)을 시간순으로 반환
+        """
         try:
-            # Upsert helper: persist alert if triggered
-            def _upsert_alert(alert: Dict[str, Any]) -> None:
-                try:
-                    notif = self.db.query(Notification).filter(Notification.id == alert["id"]).first()
-                    if notif is None:
-                        notif = Notification(
-                            id=alert["id"],
-                            title=alert["title"],
-                            description=alert.get("description"),
-                            severity=alert.get("severity", "info"),
-                            source=alert.get("source", "Prometheus"),
-                            status="firing",
-                            labels=None,
-                            created_at=get_kst_now(),
-                        )
-                        self.db.add(notif)
-                    else:
-                        notif.title = alert["title"]
-                        notif.description = alert.get("description")
-                        notif.severity = alert.get("severity", notif.severity)
-                        notif.source = alert.get("source", notif.source)
-                        notif.status = "firing"
-                    self.db.flush()
-                except Exception as e:
-                    logger.error("alert_upsert_failed", error=str(e), alert_id=alert.get("id"))
-            # Build PromQL (align with monitoring.py)
-            q_cpu_util = f'100 - (avg(rate(node_cpu_seconds_total{{cluster="{cluster}", mode="idle"}}[1m])) by (instance) * 100)'
-            q_cpu_iowait = f'avg(rate(node_cpu_seconds_total{{cluster="{cluster}", mode="iowait"}}[1m])) by (instance) * 100'
-
-            q_mem_usage = f'(1 - (node_memory_MemAvailable_bytes{{cluster="{cluster}"}} / node_memory_MemTotal_bytes{{cluster="{cluster}"}})) * 100'
-            q_swap_used = f'node_memory_SwapTotal_bytes{{cluster="{cluster}"}} - node_memory_SwapFree_bytes{{cluster="{cluster}"}}'
-
-            q_disk_root_usage = f'(1 - (node_filesystem_free_bytes{{cluster="{cluster}", mountpoint="/", fstype!="rootfs"}} / node_filesystem_size_bytes{{cluster="{cluster}", mountpoint="/", fstype!="rootfs"}})) * 100'
-            q_disk_io_sat = f'rate(node_disk_io_time_seconds_total{{cluster="{cluster}"}}[1m])'
-            q_disk_readonly = f'node_filesystem_readonly{{cluster="{cluster}", mountpoint="/"}}'
-
-            q_net_rx_bps = f'rate(node_network_receive_bytes_total{{cluster="{cluster}", device="eth0"}}[1m])'
-            q_net_tx_bps = f'rate(node_network_transmit_bytes_total{{cluster="{cluster}", device="eth0"}}[1m])'
-            q_net_rx_errs = f'rate(node_network_receive_errs_total{{cluster="{cluster}"}}[1m])'
-            q_net_rx_drops = f'rate(node_network_receive_drop_total{{cluster="{cluster}"}}[1m])'
-
-            import asyncio
-            async def _q(expr: str):
-                return await query_prometheus(PromQuery(query=expr))
-
-            (cpu_util_res, cpu_iowait_res,
-             mem_usage_res, swap_used_res,
-             disk_root_res, disk_io_sat_res, disk_ro_res,
-             net_rx_res, net_tx_res, net_rx_errs_res, net_rx_drops_res) = await asyncio.gather(
-                _q(q_cpu_util), _q(q_cpu_iowait),
-                _q(q_mem_usage), _q(q_swap_used),
-                _q(q_disk_root_usage), _q(q_disk_io_sat), _q(q_disk_readonly),
-                _q(q_net_rx_bps), _q(q_net_tx_bps), _q(q_net_rx_errs), _q(q_net_rx_drops),
-                return_exceptions=False
-            )
-
-            # Helper to extract value
-            def _iter(res):
-                return (res or {}).get("data", {}).get("result", [])
-
-            # CPU alerts (2~3 rules)
-            for r in _iter(cpu_util_res):
-                try:
-                    inst = r.get("metric", {}).get("instance")
-                    val = float(r.get("value", [None, "0"]) [1])
-                    if val > 80:
-                        alert = {
-                            "id": f"cpu-high-{inst}",
-                            "title": "High CPU Utilization",
-                            "description": f"Node {inst} CPU usage {val:.2f}%",
-                            "severity": "critical" if val > 90 else "warning",
-                            "status": "firing",
-                            "timestamp": datetime.now(KST).isoformat(),
-                            "source": "Prometheus",
-                        }
-                        alerts.append(alert)
-                        _upsert_alert(alert)
-                except Exception:
-                    continue
-
-            for r in _iter(cpu_iowait_res):
-                try:
-                    inst = r.get("metric", {}).get("instance")
-                    val = float(r.get("value", [None, "0"]) [1])
-                    if val > 5:
-                        alert = {
-                            "id": f"cpu-iowait-{inst}",
-                            "title": "High CPU I/O wait",
-                            "description": f"Node {inst} CPU iowait {val:.2f}%",
-                            "severity": "critical" if val > 10 else "warning",
-                            "status": "firing",
-                            "timestamp": datetime.now(KST).isoformat(),
-                            "source": "Prometheus",
-                        }
-                        alerts.append(alert)
-                        _upsert_alert(alert)
-                except Exception:
-                    continue
-
-            # Memory alerts
-            for r in _iter(mem_usage_res):
-                try:
-                    inst = r.get("metric", {}).get("instance")
-                    val = float(r.get("value", [None, "0"]) [1])
-                    if val > 80:
-                        alert = {
-                            "id": f"mem-high-{inst}",
-                            "title": "High Memory Usage",
-                            "description": f"Node {inst} memory usage {val:.2f}%",
-                            "severity": "critical" if val > 90 else "warning",
-                            "status": "firing",
-                            "timestamp": datetime.now(KST).isoformat(),
-                            "source": "Prometheus",
-                        }
-                        alerts.append(alert)
-                        _upsert_alert(alert)
-                except Exception:
-                    continue
-
-            for r in _iter(swap_used_res):
-                try:
-                    inst = r.get("metric", {}).get("instance")
-                    val = float(r.get("value", [None, "0"]) [1])
-                    if val > 0:
-                        alert = {
-                            "id": f"mem-swap-{inst}",
-                            "title": "Swap In Use",
-                            "description": f"Node {inst} swap in use",
-                            "severity": "warning",
-                            "status": "firing",
-                            "timestamp": datetime.now(KST).isoformat(),
-                            "source": "Prometheus",
-                        }
-                        alerts.append(alert)
-                        _upsert_alert(alert)
-                except Exception:
-                    continue
-
-            # Disk alerts
-            for r in _iter(disk_root_res):
-                try:
-                    inst = r.get("metric", {}).get("instance")
-                    val = float(r.get("value", [None, "0"]) [1])
-                    if val > 85:
-                        alert = {
-                            "id": f"disk-root-{inst}",
-                            "title": "High Disk Usage (/) ",
-                            "description": f"Node {inst} root usage {val:.2f}%",
-                            "severity": "critical" if val > 95 else "warning",
-                            "status": "firing",
-                            "timestamp": datetime.now(KST).isoformat(),
-                            "source": "Prometheus",
-                        }
-                        alerts.append(alert)
-                        _upsert_alert(alert)
-                except Exception:
-                    continue
-
-            # IO saturation: use max per instance
-            max_io: Dict[str, float] = {}
-            for r in _iter(disk_io_sat_res):
-                try:
-                    inst = r.get("metric", {}).get("instance")
-                    val = float(r.get("value", [None, "0"]) [1])
-                    max_io[inst] = max(val, max_io.get(inst, 0.0))
-                except Exception:
-                    continue
-            for inst, val in max_io.items():
-                if val > 0.8:
-                    alert = {
-                        "id": f"disk-io-{inst}",
-                        "title": "High Disk IO Saturation",
-                        "description": f"Node {inst} IO saturation {val:.2f}",
-                        "severity": "warning",
-                        "status": "firing",
-                        "timestamp": datetime.now(KST).isoformat(),
-                        "source": "Prometheus",
-                    }
-                    alerts.append(alert)
-                    _upsert_alert(alert)
-
-            for r in _iter(disk_ro_res):
-                try:
-                    inst = r.get("metric", {}).get("instance")
-                    val = float(r.get("value", [None, "0"]) [1])
-                    if val > 0:
-                        alert = {
-                            "id": f"disk-readonly-{inst}",
-                            "title": "Filesystem Readonly",
-                            "description": f"Node {inst} filesystem is readonly",
-                            "severity": "critical",
-                            "status": "firing",
-                            "timestamp": datetime.now(KST).isoformat(),
-                            "source": "Prometheus",
-                        }
-                        alerts.append(alert)
-                        _upsert_alert(alert)
-                except Exception:
-                    continue
-
-            # Network alerts
-            for r in _iter(net_rx_errs_res):
-                try:
-                    inst = r.get("metric", {}).get("instance")
-                    val = float(r.get("value", [None, "0"]) [1])
-                    if val > 0:
-                        alert = {
-                            "id": f"net-rx-errors-{inst}",
-                            "title": "Network RX Errors",
-                            "description": f"Node {inst} rx errors {val:.2f}/s",
-                            "severity": "warning",
-                            "status": "firing",
-                            "timestamp": datetime.now(KST).isoformat(),
-                            "source": "Prometheus",
-                        }
-                        alerts.append(alert)
-                        _upsert_alert(alert)
-                except Exception:
-                    continue
-
-            for r in _iter(net_rx_drops_res):
-                try:
-                    inst = r.get("metric", {}).get("instance")
-                    val = float(r.get("value", [None, "0"]) [1])
-                    if val > 0:
-                        alert = {
-                            "id": f"net-rx-drops-{inst}",
-                            "title": "Network RX Drops",
-                            "description": f"Node {inst} rx drops {val:.2f}/s",
-                            "severity": "warning",
-                            "status": "firing",
-                            "timestamp": datetime.now(KST).isoformat(),
-                            "source": "Prometheus",
-                        }
-                        alerts.append(alert)
-                        _upsert_alert(alert)
-                except Exception:
-                    continue
-
-            # High throughput (optional thresholds)
-            HIGH_BPS = 50 * 1024 * 1024  # ~50 MB/s
-            for r in _iter(net_rx_res):
-                try:
-                    inst = r.get("metric", {}).get("instance")
-                    val = float(r.get("value", [None, "0"]) [1])
-                    if val > HIGH_BPS:
-                        alert = {
-                            "id": f"net-rx-high-{inst}",
-                            "title": "High Inbound Traffic",
-                            "description": f"Node {inst} inbound {val/1024/1024:.2f} MB/s",
-                            "severity": "warning",
-                            "status": "firing",
-                            "timestamp": datetime.now(KST).isoformat(),
-                            "source": "Prometheus",
-                        }
-                        alerts.append(alert)
-                        _upsert_alert(alert)
-                except Exception:
-                    continue
-
-            for r in _iter(net_tx_res):
-                try:
-                    inst = r.get("metric", {}).get("instance")
-                    val = float(r.get("value", [None, "0"]) [1])
-                    if val > HIGH_BPS:
-                        alert = {
-                            "id": f"net-tx-high-{inst}",
-                            "title": "High Outbound Traffic",
-                            "description": f"Node {inst} outbound {val/1024/1024:.2f} MB/s",
-                            "severity": "warning",
-                            "status": "firing",
-                            "timestamp": datetime.now(KST).isoformat(),
-                            "source": "Prometheus",
-                        }
-                        alerts.append(alert)
-                        _upsert_alert(alert)
-                except Exception:
-                    continue
-
-            # commit upserts
-            try:
-                self.db.commit()
-            except Exception as e:
-                logger.error("alert_commit_failed", error=str(e))
-                self.db.rollback()
-
-            # always return DB firing alerts ordered by created_at desc
-            notifications = self.db.query(Notification).filter(
-                Notification.status == "firing"
-            ).order_by(desc(Notification.created_at)).limit(200).all()
-
-            return [
-                {
-                    "id": n.id,
-                    "title": n.title,
-                    "description": n.description or "",
-                    "severity": n.severity,
-                    "status": n.status,
-                    "timestamp": n.created_at.isoformat() if n.created_at else None,
-                    "source": n.source or "System",
-                }
-                for n in notifications
-            ]
-
+            return await list_alerts(cluster)
         except Exception as e:
             logger.error("failed_to_list_alerts", error=str(e))
             return []
@@ -516,6 +207,7 @@ class NotificationService:
             notif.resolved_at = get_kst_now()
             self.db.add(notif)
             self.db.commit()
+            discard_alert(alert_id)
             return True
         except Exception as e:
             logger.error("failed_to_resolve_alert", error=str(e), alert_id=alert_id)
@@ -0,0 +1,260 @@
+"""
+공유 Prometheus 클라이언트
+
+조회마다 httpx.AsyncClient를 새로 만들던 `query_prometheus` 경로를 하나의 풀링된 클라이언트로 모읍니다.
+모니터링 엔드포인트, NKS WebSocket 루프, 알림 규칙 평가가 몇 초 간격으로 같은 PromQL을 보내므로
+다음을 적용합니다.
+
+- 커넥션 풀 재사용 (keep-alive)
+- 동일한 진행 중 조회 병합 (single-flight)
+- scrape 주기 경계까지 결과 캐시: 다음 scrape 전에는 Prometheus 값도 바뀌지 않음
+- query_range: 구간/최대 포인트 수로 step을 서버에서 선택하고 start/end를 step에 정렬해 캐시 키를 공유
+- 종류(query/query_range)별 캐시 적중률과 upstream 지연 메트릭
+
+반환하는 dict는 여러 호출자가 공유하므로 읽기 전용으로 다뤄야 합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import httpx
+import structlog
+
+from ..core.config import get_settings
+from ..monitoring.metrics import prometheus_queries_total, prometheus_request_duration_seconds
+
+logger = structlog.get_logger(__name__)
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+# 차트에 쓰기 좋은 step 후보 (초)
+STEP_CANDIDATES = (15, 30, 60, 120, 300, 600, 900, 1800, 3600, 7200, 10800, 21600, 43200, 86400)
+
+
+def select_step(start: float, end: float, min_step: float, max_points: int) -> float:
+    """구간을 max_points 이하로 나누는 가장 작은 후보 step (scrape 주기보다 작지 않게)"""
+    raw = max((end - start) / max(max_points, 1), min_step)
+    for step in STEP_CANDIDATES:
+        if step >= raw:
+            return float(step)
+    return float(math.ceil(raw / 86400) * 86400)
+
+
+def _next_boundary(now: float, interval: float) -> float:
+    return (math.floor(now / interval) + 1) * interval
+
+
+@dataclass
+class _CacheEntry:
+    data: Dict[str, Any]
+    expires_at: float
+
+
+@dataclass
+class QueryStats:
+    """조회 종류별 결과 집계"""
+    requests: int = 0
+    hits: int = 0
+    coalesced: int = 0
+    errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return (self.hits + self.coalesced) / self.requests if self.requests else 0.0
+
+
+class PrometheusClient:
+    """커넥션 풀, 요청 병합, scrape 주기 정렬 캐시를 갖춘 Prometheus HTTP API 클라이언트"""
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        scrape_interval: Optional[float] = None,
+        max_cache_entries: int = 1024,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._base_url = base_url
+        self._timeout = timeout
+        self._scrape_interval = scrape_interval
+        self.max_cache_entries = max_cache_entries
+        self._transport = transport
+        self._clock = clock
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_base_url: Optional[str] = None
+        self._cache: "OrderedDict[CacheKey, _CacheEntry]" = OrderedDict()
+        self._inflight: Dict[CacheKey, asyncio.Task] = {}
+        self._stats: Dict[str, QueryStats] = {}
+
+    # 설정은 런타임에 바뀔 수 있으므로 생성자 인자가 없으면 매번 settings에서 읽음
+    @property
+    def base_url(self) -> Optional[str]:
+        url = self._base_url or get_settings().prometheus_base_url
+        return url.rstrip("/") if url else None
+
+    @property
+    def scrape_interval(self) -> float:
+        return self._scrape_interval or get_settings().prometheus_scrape_interval_seconds
+
+    # ------------------------------------------------------------------
+    # 연결 관리
+    # ------------------------------------------------------------------
+    def _get_client(self, base_url: str) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed or self._client_base_url != base_url:
+            if self._client is not None and not self._client.is_closed:
+                # base_url 변경 시 기존 풀은 백그라운드로 정리
+                asyncio.get_running_loop().create_task(self._client.aclose())
+            self._client = httpx.AsyncClient(
+                base_url=base_url,
+                timeout=self._timeout or get_settings().prometheus_timeout_seconds,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                transport=self._transport,
+            )
+            self._client_base_url = base_url
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    # ------------------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------------------
+    def _record(self, kind: str, result: str) -> None:
+        stats = self._stats.setdefault(kind, QueryStats())
+        stats.requests += 1
+        if result == "hit":
+            stats.hits += 1
+        elif result == "coalesced":
+            stats.coalesced += 1
+        elif result == "error":
+            stats.errors += 1
+        prometheus_queries_total.labels(kind=kind, result=result).inc()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """조회 종류별 요청 수와 캐시 적중률을 반환합니다."""
+        return {
+            kind: {
+                "requests": s.requests,
+                "hits": s.hits,
+                "coalesced": s.coalesced,
+                "errors": s.errors,
+                "hit_rate": round(s.hit_rate, 4),
+            }
+            for kind, s in self._stats.items()
+        }
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    async def query(self, expr: str, at: Optional[float] = None) -> Dict[str, Any]:
+        """instant 쿼리 (/api/v1/query). 결과는 다음 scrape 경계까지 캐시됩니다."""
+        params = {"query": expr}
+        if at is not None:
+            params["time"] = f"{at:.3f}"
+        return await self._get("query", params, self.scrape_interval)
+
+    async def query_range(
+        self,
+        expr: str,
+        start: float,
+        end: float,
+        step: Optional[float] = None,
+        max_points: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """range 쿼리 (/api/v1/query_range).
+
+        step을 지정하지 않으면 구간과 max_points로 선택합니다. start/end를 step 배수로 내려
+        같은 차트를 보는 호출자들이 같은 캐시 항목을 공유하고, 결과는 다음 step 경계까지 캐시됩니다.
+        """
+        if end <= start:
+            raise ValueError("end must be greater than start")
+        if step is None:
+            max_points = max_points or get_settings().prometheus_range_max_points
+            step = select_step(start, end, self.scrape_interval, max_points)
+        start = math.floor(start / step) * step
+        end = max(math.floor(end / step) * step, start + step)
+        params = {"query": expr, "start": f"{start:.3f}", "end": f"{end:.3f}", "step": f"{step:g}"}
+        return await self._get("query_range", params, max(step, self.scrape_interval))
+
+    async def _get(self, kind: str, params: Dict[str, str], ttl_interval: float) -> Dict[str, Any]:
+        base_url = self.base_url
+        if not base_url:
+            return {"status": "skipped", "reason": "prometheus_base_url not set"}
+
+        key: CacheKey = (f"{base_url}/api/v1/{kind}", tuple(sorted(params.items())))
+        now = self._clock()
+        cached = self._cache.get(key)
+        if cached is not None:
+            if cached.expires_at > now:
+                self._cache.move_to_end(key)
+                self._record(kind, "hit")
+                return cached.data
+            del self._cache[key]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._record(kind, "coalesced")
+            return await asyncio.shield(inflight)
+
+        # 실제 조회는 별도 태스크로 실행하여, 선행 호출자가 취소되어도 병합 대기자는 결과를 받도록 함
+        task = asyncio.get_running_loop().create_task(
+            self._fetch_and_cache(key, kind, base_url, params, now, ttl_interval)
+        )
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._finish_inflight(key, t))
+        return await asyncio.shield(task)
+
+    async def _fetch_and_cache(
+        self,
+        key: CacheKey,
+        kind: str,
+        base_url: str,
+        params: Dict[str, str],
+        now: float,
+        ttl_interval: float,
+    ) -> Dict[str, Any]:
+        data = await self._fetch(kind, base_url, params)
+        if data.get("status") == "success":
+            self._cache[key] = _CacheEntry(data, _next_boundary(now, ttl_interval))
+            while len(self._cache) > self.max_cache_entries:
+                self._cache.popitem(last=False)
+        return data
+
+    def _finish_inflight(self, key: CacheKey, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            self._inflight.pop(key, None)
+        # 대기자가 모두 취소된 경우에도 예외가 "never retrieved" 경고로 남지 않도록 소비
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch(self, kind: str, base_url: str, params: Dict[str, str]) -> Dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            response = await self._get_client(base_url).get(f"/api/v1/{kind}", params=params)
+            response.raise_for_status()
+            data = response.json()
+        except Exception as e:
+            self._record(kind, "error")
+            logger.warning("prometheus_query_failed", kind=kind, query=params.get("query"), error=str(e))
+            raise
+        finally:
+            prometheus_request_duration_seconds.labels(kind=kind).observe(time.perf_counter() - start)
+        self._record(kind, "miss")
+        return data
+
+
+# 전역 인스턴스
+prometheus_client = PrometheusClient()
@@ -84,10 +84,9 @@ class ResponseFormatter:
             pending = sum(1 for pod in pods if pod.get("phase") == "Pending")
             failed = sum(1 for pod in pods if pod.get("phase") == "Failed")
             
-            # 포맷된 Pod 데이터 (나이 순으로 정렬)
-            formatted_pods = []
-            for pod in pods:
-                formatted_pods.append({
+            # 나이 순으로 정렬 (오래된 것부터, 현재 페이지 안에서)
+            formatted_pods = [
+                {
                     "name": pod.get("name", ""),
                     "status": pod.get("phase", "Unknown"),
                     "ready": pod.get("ready", "0/0"),
@@ -95,19 +94,13 @@ class ResponseFormatter:
                     "age": self._format_age(pod.get("age", "")),
                     "node": pod.get("node", ""),
                     "namespace": pod.get("namespace", namespace),
-                    "_age_seconds": self._parse_age_to_seconds(pod.get("age", ""))  # 정렬용
-                })
-            
-            # 나이 순으로 정렬 (오래된 것부터)
-            formatted_pods.sort(key=lambda x: x["_age_seconds"], reverse=True)
-            
-            # 정렬용 필드 제거
-            for pod in formatted_pods:
-                del pod["_age_seconds"]
+                }
+                for pod in sorted(pods, key=self._created_sort_key)
+            ]
             
             return {
                 "type": "list_pods",
-                "summary": f"{namespace} 네임스페이스에 {total_pods}개의 Pod가 있습니다. (실행 중: {running}, 대기: {pending}, 실패: {failed})",
+                "summary": f"{namespace} 네임스페이스에 {total_pods}개의 Pod가 있습니다. (실행 중: {running}, 대기: {pending}, 실패: {failed}){self._page_note(raw_data)}",
                 "data": {
                     "formatted": formatted_pods,
                     "raw": raw_data
@@ -117,7 +110,8 @@ class ResponseFormatter:
                     "namespace": namespace,
                     "running": running,
                     "pending": pending,
-                    "failed": failed
+                    "failed": failed,
+                    **self._page_metadata(raw_data, "total_pods")
                 }
             }
         except Exception as e:
@@ -465,9 +459,17 @@ class ResponseFormatter:
             # 로그를 줄별로 분리
             log_lines = logs.split('\n') if logs else []
             
+            if raw_data.get("aggregated"):
+                summary = (
+                    f"{pod_name}의 Pod {raw_data.get('pod_count', 0)}개 로그를 시간순으로 병합했습니다. "
+                    f"(Pod별 최근 {lines}줄)"
+                )
+            else:
+                summary = f"{pod_name} Pod의 최근 {lines}줄 로그를 조회했습니다."
+            
             return {
                 "type": "logs",
-                "summary": f"{pod_name} Pod의 최근 {lines}줄 로그를 조회했습니다.",
+                "summary": summary,
                 "data": {
                     "formatted": {
                         "pod_name": pod_name,
@@ -606,14 +608,15 @@ class ResponseFormatter:
             
             return {
                 "type": "list_deployments",
-                "summary": f"총 {total}개의 Deployment를 찾았습니다.",
+                "summary": f"총 {total}개의 Deployment를 찾았습니다.{self._page_note(raw_data)}",
                 "data": {
                     "formatted": formatted_deployments,
                     "raw": raw_data
                 },
                 "metadata": {
                     "total": total,
-                    **({"namespace": namespace} if namespace else {})
+                    **({"namespace": namespace} if namespace else {}),
+                    **self._page_metadata(raw_data, "total_deployments")
                 }
             }
         except Exception as e:
@@ -640,13 +643,14 @@ class ResponseFormatter:
             
             return {
                 "type": "list_services",
-                "summary": f"총 {total}개의 Service를 찾았습니다.",
+                "summary": f"총 {total}개의 Service를 찾았습니다.{self._page_note(raw_data)}",
                 "data": {
                     "formatted": formatted_services,
                     "raw": raw_data
                 },
                 "metadata": {
-                    "total": total
+                    "total": total,
+                    **self._page_metadata(raw_data, "total_services")
                 }
             }
         except Exception as e:
@@ -703,22 +707,23 @@ class ResponseFormatter:
                     "external_access": external_access
                 })
             
-            total_services = summary_data.get("total_services", len(formatted_endpoints))
+            total_services = summary_data.get("service_count", len(formatted_endpoints))
             services_with_ingress = summary_data.get("services_with_ingress", 0)
             services_with_external = summary_data.get("services_with_external", 0)
             
             return {
                 "type": "list_endpoints",
-                "summary": f"'{namespace}' 네임스페이스에 {total_services}개의 Service가 있습니다. Ingress 설정: {services_with_ingress}개, 외부 접근: {services_with_external}개",
+                "summary": f"'{namespace}' 네임스페이스에 {total_services}개의 Service가 있습니다. Ingress 설정: {services_with_ingress}개, 외부 접근: {services_with_external}개{self._page_note(raw_data)}",
                 "data": {
                     "formatted": formatted_endpoints,
                     "raw": raw_data
                 },
                 "metadata": {
                     "namespace": namespace,
-                    "total_services": total_services,
+                    "total_services": summary_data.get("total_services"),
                     "services_with_ingress": services_with_ingress,
-                    "services_with_external": services_with_external
+                    "services_with_external": services_with_external,
+                    **self._page_metadata(raw_data, "total_services")
                 }
             }
         except Exception as e:
@@ -1335,6 +1340,46 @@ class ResponseFormatter:
             }
         }
     
+    def _created_sort_key(self, item: Dict[str, Any]) -> tuple:
+        """
+        오래된 것부터 정렬하기 위한 키
+
+        명령 실행 결과에 포함된 created_ts(생성 시각 epoch 초)를 그대로 사용하고,
+        없을 때만 age 문자열을 파싱합니다. 생성 시각을 모르는 항목은 뒤로 보냅니다.
+        """
+        created_ts = item.get("created_ts")
+        if created_ts is not None:
+            return (0, created_ts)
+        age_seconds = self._parse_age_to_seconds(item.get("age") or "")
+        return (1, -age_seconds) if age_seconds else (2, 0)
+
+    def _page_metadata(self, raw_data: Dict[str, Any], total_key: str) -> Dict[str, Any]:
+        """
+        목록 응답의 페이지 커서 정보 (다음 페이지 조회에 continue 값을 그대로 전달)
+
+        페이지 조회면 total은 전체 개수를 알 때만 값이 있고(모르면 None), count가 이 페이지의 항목 수입니다.
+        """
+        if "continue" not in raw_data:
+            return {}
+        cursor = raw_data.get("continue")
+        return {
+            "cursor": cursor,
+            "has_more": bool(cursor),
+            "limit": raw_data.get("limit"),
+            "remaining": raw_data.get("remaining"),
+            "count": raw_data.get("count"),
+            "total": raw_data.get(total_key),
+        }
+
+    def _page_note(self, raw_data: Dict[str, Any]) -> str:
+        """다음 페이지가 있으면 요약 문장 뒤에 붙일 안내 (개수가 이 페이지 기준임을 표시)"""
+        if not raw_data.get("continue"):
+            return ""
+        remaining = raw_data.get("remaining")
+        if remaining is not None:
+            return f" (이 페이지 기준, 남은 항목 약 {remaining}개)"
+        return " (이 페이지 기준, 다음 페이지 있음)"
+
     def _parse_age_to_seconds(self, age_str: str) -> int:
         """Kubernetes age 문자열을 초 단위로 변환 (정렬용)"""
         if not age_str:
@@ -6,6 +6,7 @@ The run_sourcedeploy function will automatically update the manifest with the
 specified image tag during the mirroring process.
 """
 
+import asyncio
 from typing import Dict, Any, Optional
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
@@ -17,6 +18,7 @@ from ..core.config import get_settings
 from .ncp_pipeline import run_sourcebuild, _generate_ncr_image_name, _verify_ncr_manifest_exists
 from .user_project_integration import get_integration
 from .deployment_history import get_deployment_history_service
+from .ncr_tag_index import get_ncr_tag_index
 
 logger = structlog.get_logger(__name__)
 
@@ -90,7 +92,11 @@ async def diagnose_rollback_readiness(
         image_name = _generate_ncr_image_name(owner, repo)
         image_url = f"{get_settings().ncp_container_registry_url}/{image_name}:{latest.github_commit_sha}"
 
-        verified = await _verify_ncr_manifest_exists(image_url)
+        tag_index = get_ncr_tag_index()
+        if tag_index is not None and tag_index.lookup(image_name, latest.github_commit_sha):
+            verified = {"exists": True, "code": None}
+        else:
+            verified = await _verify_ncr_manifest_exists(image_url)
         if not verified.get("exists"):
             diagnosis["warnings"].append(
                 f"Latest deployment image not found in NCR (HTTP {verified.get('code')}). "
@@ -460,13 +466,27 @@ async def get_rollback_candidates(
         DeploymentHistory.created_at.desc()  # Use created_at instead of deployed_at
     ).limit(limit).all()
 
+    # NCR image existence comes from the background tag index (memory lookup, no registry calls)
+    image_name = _generate_ncr_image_name(owner, repo)
+    tag_index = get_ncr_tag_index()
+    if tag_index is not None:
+        tag_index.track(image_name)
+
+    indexed_by_sha: Dict[str, Optional[bool]] = {}
+    if tag_index is not None:
+        indexed_by_sha = {dep.github_commit_sha: tag_index.lookup(image_name, dep.github_commit_sha) for dep in deployments}
+        # Index miss: the tag may have been pushed after the last listing, so check the registry directly
+        misses = [sha for sha, indexed in indexed_by_sha.items() if indexed is False]
+        if misses:
+            confirmed = await asyncio.gather(*(tag_index.confirm(image_name, sha) for sha in misses))
+            indexed_by_sha.update(zip(misses, confirmed))
+
     candidates = []
     for idx, dep in enumerate(deployments):
-        # Check if NCR image still exists
-        image_name = _generate_ncr_image_name(owner, repo)
         image_url = f"klepaas-test.kr.ncr.ntruss.com/{image_name}:{dep.github_commit_sha}"
 
-        # Don't await verification for listing (too slow), just construct URL
+        # None: repository not indexed yet (or index stale) -> assume true, verify on actual rollback
+        indexed = indexed_by_sha.get(dep.github_commit_sha)
         candidates.append({
             "steps_back": idx,
             "commit_sha": dep.github_commit_sha,
@@ -474,7 +494,8 @@ async def get_rollback_candidates(
             "deployed_at": dep.deployed_at.isoformat() if dep.deployed_at else None,
             "deployed_by": getattr(dep, 'deployed_by', None),
             "image": image_url,
-            "can_rollback": True,  # Assume true, verify on actual rollback
+            "can_rollback": indexed is not False,
+            "image_verified": indexed is True,
             "is_current": idx == 0,
             "deployment_reason": getattr(dep, 'deployment_reason', None)
         })
@@ -737,7 +758,9 @@ async def scale_deployment(
     )
 
     # Mirror GitHub to SourceCommit and update manifest (image + replicas)
-    mirror_result = mirror_and_update_manifest(
+    # git clone/push가 이벤트 루프를 막지 않도록 스레드에서 실행
+    mirror_result = await asyncio.to_thread(
+        mirror_and_update_manifest,
         github_repo_url=github_repo_url,
         installation_or_access_token=github_token,
         sc_project_id=integ.sc_project_id,
@@ -18,6 +18,7 @@ from slack_sdk.webhook import WebhookClient
 from slack_sdk.webhook.async_client import AsyncWebhookClient
 
 from ..core.config import get_settings
+from .slack_delivery import SlackDeliveryError, get_slack_delivery_queue
 from ..models.slack_events import (
     SlackEventType,
     SlackChannelType,
@@ -304,18 +305,25 @@ class SlackClientWrapper:
         attachments: Optional[List[Dict[str, Any]]] = None,
         thread_ts: Optional[str] = None
     ) -> Dict[str, Any]:
-        """실제 메시지를 전송합니다."""
+        """공유 Slack 발신 큐를 거쳐 메시지를 전송하고 결과를 기다립니다."""
+        payload: Dict[str, Any] = {"text": text, "channel": channel}
+        if blocks:
+            payload["blocks"] = blocks
+        if attachments:
+            payload["attachments"] = attachments
+        if thread_ts:
+            payload["thread_ts"] = thread_ts
+
         # 클라이언트 타입 결정 (웹훅 우선)
-        if self.webhook_url and (self.client_type == SlackClientType.WEBHOOK or not self._bot_client):
-            return await self._send_webhook_message(
-                channel, text, blocks, attachments, thread_ts
-            )
-        elif self._bot_client:
-            return await self._send_bot_message(
-                channel, text, blocks, attachments, thread_ts
-            )
-        else:
-            raise SlackClientError("No Slack client configured")
+        queue = get_slack_delivery_queue()
+        try:
+            if self.webhook_url and (self.client_type == SlackClientType.WEBHOOK or not self.bot_token):
+                return await queue.deliver(payload, channel=channel, webhook_url=self.webhook_url)
+            elif self.bot_token:
+                return await queue.deliver(payload, channel=channel, bot_token=self.bot_token)
+        except SlackDeliveryError as e:
+            raise SlackClientError(str(e))
+        raise SlackClientError("No Slack client configured")
 
     async def _send_webhook_message(
         self,
@@ -325,7 +333,7 @@ class SlackClientWrapper:
         attachments: Optional[List[Dict[str, Any]]] = None,
         thread_ts: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Webhook을 사용하여 메시지를 전송합니다."""
+        """Webhook을 사용하여 메시지를 직접 전송합니다 (발신 큐를 거치지 않음)."""
         if not self.webhook_url:
             raise SlackClientError("Webhook URL not configured")
         
@@ -370,7 +378,7 @@ class SlackClientWrapper:
         attachments: Optional[List[Dict[str, Any]]] = None,
         thread_ts: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Bot Token을 사용하여 메시지를 전송합니다."""
+        """Bot Token을 사용하여 메시지를 직접 전송합니다 (발신 큐를 거치지 않음)."""
         if not self._bot_client:
             raise SlackClientError("Bot client not initialized")
         
@@ -0,0 +1,446 @@
+"""
+Slack 발신 큐
+
+배포 흐름 안에서 `requests.post`로 Slack 웹훅을 동기 호출하던 경로를 하나의 비동기 파이프라인으로 모읍니다.
+호출자는 메시지를 적재만 하고 즉시 반환하며, 채널별 워커가 다음을 지켜 전송합니다.
+채널 상태는 (웹훅 URL 또는 Bot 토큰, 채널) 단위이므로 사용자별 웹훅끼리는 같은 채널 이름이어도 서로 막지 않습니다.
+
+- 채널별 토큰 버킷: Slack 권장 속도(채널당 약 1건/초)와 짧은 버스트
+- 429 응답의 Retry-After 동안 해당 채널 전송 중지, 네트워크/5xx 오류는 지수 백오프 재시도
+- 같은 coalesce_key(예: 배포 ID)의 메시지가 아직 대기 중이면 최신 내용으로 교체하고,
+  Bot 토큰 경로에서 이미 전송된 메시지는 chat.update로 수정 (웹훅은 수정 API가 없어 새 메시지)
+- 전송 지연, 병합/재시도/버림 메트릭
+- 큐는 한 이벤트 루프(앱 메인 루프)에만 묶이며, 다른 스레드에서의 적재는 call_soon_threadsafe로 넘김
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import httpx
+import structlog
+
+from ..core.config import get_settings
+from ..monitoring.metrics import (
+    slack_delivery_latency_seconds,
+    slack_messages_dropped_total,
+    slack_messages_total,
+    slack_queue_depth,
+)
+
+logger = structlog.get_logger(__name__)
+
+SLACK_API_URL = "https://slack.com/api"
+MAX_BACKOFF_SECONDS = 30.0
+# chat.update 대상 (coalesce_key → (channel id, ts)) 보관 개수
+MAX_TRACKED_MESSAGES = 512
+
+
+class SlackDeliveryError(Exception):
+    """큐 적재 또는 전송 실패"""
+
+
+@dataclass
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 capacity개까지 쌓이는 토큰 버킷"""
+    rate: float
+    capacity: float
+    tokens: float
+    updated: float
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, now: float) -> float:
+        self._refill(now)
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def consume(self, now: float) -> None:
+        self._refill(now)
+        self.tokens -= 1
+
+
+@dataclass
+class SlackMessage:
+    payload: Dict[str, Any]
+    channel: str
+    webhook_url: Optional[str]
+    bot_token: Optional[str]
+    coalesce_key: Optional[str]
+    enqueued_at: float
+    attempts: int = 0
+    waiters: List[asyncio.Future] = field(default_factory=list)
+
+    @property
+    def route(self) -> Tuple[str, str]:
+        """속도 제한/대기열 단위 (발신 경로 지문, 채널). 웹훅 URL과 토큰은 지문으로만 보관합니다."""
+        if self.webhook_url:
+            return _fingerprint("webhook", self.webhook_url), self.channel
+        return _fingerprint("bot", self.bot_token or ""), self.channel
+
+
+def _fingerprint(kind: str, secret: str) -> str:
+    return f"{kind}:{hashlib.sha256(secret.encode()).hexdigest()[:12]}"
+
+
+@dataclass
+class _ChannelState:
+    bucket: TokenBucket
+    pending: Deque[SlackMessage] = field(default_factory=deque)
+    blocked_until: float = 0.0
+    worker: Optional[asyncio.Task] = None
+
+
+class SlackDeliveryQueue:
+    """채널별 속도 제한과 병합을 적용하는 Slack 발신 큐"""
+
+    def __init__(
+        self,
+        rate_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        bot_token: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        settings = get_settings()
+        self.rate_per_second = rate_per_second or settings.slack_rate_per_channel
+        self.burst = burst or settings.slack_rate_burst
+        self.max_pending = max_pending or settings.slack_queue_max_pending
+        self.max_attempts = max_attempts or settings.slack_max_attempts
+        self._bot_token = bot_token
+        self._transport = transport
+        self._clock = clock
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._channels: Dict[Tuple[str, str], _ChannelState] = {}
+        self._posted: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+        self._pending = 0
+        self._counts: Dict[str, int] = {}
+
+    @property
+    def bot_token(self) -> Optional[str]:
+        return self._bot_token or get_settings().slack_bot_token
+
+    # ------------------------------------------------------------------
+    # 적재
+    # ------------------------------------------------------------------
+    def submit(
+        self,
+        payload: Dict[str, Any],
+        channel: Optional[str] = None,
+        webhook_url: Optional[str] = None,
+        bot_token: Optional[str] = None,
+        coalesce_key: Optional[str] = None,
+    ) -> bool:
+        """메시지를 적재하고 즉시 반환합니다. 큐가 가득 차 버려지면 False.
+
+        웹훅 URL이 있으면 웹훅으로, 없으면 Bot 토큰(chat.postMessage)으로 전송합니다.
+        큐 루프가 아닌 스레드(다른 루프 포함)에서 호출되면 큐 루프로 넘기고, 실행 중인 큐 루프가 없으면 동기 전송합니다.
+        """
+        message = self._message(payload, channel, webhook_url, bot_token, coalesce_key)
+        try:
+            asyncio.get_running_loop()
+            on_queue_loop = self._bind_loop()
+        except RuntimeError:
+            on_queue_loop = False
+
+        if on_queue_loop:
+            return self._enqueue(message)
+        if self._loop is not None and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._enqueue, message)
+            return True
+        return self._send_blocking(message)
+
+    async def deliver(
+        self,
+        payload: Dict[str, Any],
+        channel: Optional[str] = None,
+        webhook_url: Optional[str] = None,
+        bot_token: Optional[str] = None,
+        coalesce_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """메시지를 적재하고 전송 결과({"ok", "channel", "ts"})를 기다립니다."""
+        if not self._bind_loop():
+            # 다른 루프에서는 큐 루프에서 전송을 기다린 결과만 받아옴
+            if not self._loop.is_running():
+                raise SlackDeliveryError("slack delivery loop is not running")
+            future = asyncio.run_coroutine_threadsafe(
+                self.deliver(payload, channel, webhook_url, bot_token, coalesce_key), self._loop
+            )
+            return await asyncio.wrap_future(future)
+        message = self._message(payload, channel, webhook_url, bot_token, coalesce_key)
+        waiter = asyncio.get_running_loop().create_future()
+        message.waiters.append(waiter)
+        # 버려지면 _drop이 waiter에 SlackDeliveryError를 설정
+        self._enqueue(message)
+        return await waiter
+
+    def _message(self, payload, channel, webhook_url, bot_token, coalesce_key) -> SlackMessage:
+        channel = channel or payload.get("channel") or get_settings().slack_alert_channel_default or "#general"
+        return SlackMessage(
+            payload=payload,
+            channel=channel,
+            webhook_url=webhook_url,
+            bot_token=None if webhook_url else (bot_token or self.bot_token),
+            coalesce_key=coalesce_key,
+            enqueued_at=self._clock(),
+        )
+
+    def _enqueue(self, message: SlackMessage) -> bool:
+        """큐 루프에서만 호출됩니다 (채널 상태와 워커는 큐 루프 소유)."""
+        if not message.webhook_url and not message.bot_token:
+            self._drop(message, "not_configured")
+            return False
+        route = message.route
+        state = self._channels.get(route)
+        if state is None:
+            state = self._channels[route] = _ChannelState(
+                TokenBucket(self.rate_per_second, self.burst, self.burst, self._clock())
+            )
+
+        if message.coalesce_key is not None:
+            for queued in state.pending:
+                if queued.coalesce_key == message.coalesce_key:
+                    # 아직 전송 전인 이전 단계 메시지는 최신 내용으로 교체 (순서/대기 시작 시각 유지)
+                    queued.payload = message.payload
+                    queued.waiters.extend(message.waiters)
+                    self._count("coalesced")
+                    return True
+
+        if self._pending >= self.max_pending:
+            self._drop(message, "queue_full")
+            return False
+
+        state.pending.append(message)
+        self._pending += 1
+        slack_queue_depth.set(self._pending)
+        if state.worker is None or state.worker.done():
+            state.worker = self._loop.create_task(self._run_channel(state))
+        return True
+
+    def start(self) -> None:
+        """앱 기동 시 메인 루프에 큐를 묶습니다. 다른 스레드의 루프가 먼저 묶는 것을 막습니다."""
+        self._bind_loop()
+
+    def _bind_loop(self) -> bool:
+        """
+        현재 루프가 큐 루프이면 True.
+
+        아직 묶인 루프가 없거나 이전 루프가 닫힌 경우(재시작/테스트)에만 현재 루프에 묶습니다.
+        실행 중인 다른 루프가 있으면 다시 묶지 않고 False를 반환하며, 호출자는 큐 루프로 넘겨야 합니다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return True
+        if self._loop is not None and not self._loop.is_closed():
+            return False
+        # 닫힌 루프에서 만든 워커와 커넥션 풀은 재사용할 수 없음
+        self._loop = loop
+        self._client = None
+        for state in self._channels.values():
+            state.worker = None
+        return True
+
+    # ------------------------------------------------------------------
+    # 채널 워커
+    # ------------------------------------------------------------------
+    async def _run_channel(self, state: _ChannelState) -> None:
+        while state.pending:
+            now = self._clock()
+            wait = max(state.blocked_until - now, state.bucket.wait_time(now))
+            if wait > 0:
+                await asyncio.sleep(wait)
+                continue
+
+            message = state.pending.popleft()
+            state.bucket.consume(now)
+            message.attempts += 1
+            retry_after = await self._attempt(message)
+            if retry_after is None:
+                self._pending -= 1
+                slack_queue_depth.set(self._pending)
+                continue
+
+            if message.attempts >= self.max_attempts:
+                self._pending -= 1
+                slack_queue_depth.set(self._pending)
+                self._drop(message, "retries_exhausted")
+                continue
+
+            # 순서를 지키도록 맨 앞에 되돌리고 채널 전체를 잠시 멈춤
+            state.blocked_until = self._clock() + retry_after
+            state.pending.appendleft(message)
+            self._count("retried")
+
+    async def _attempt(self, message: SlackMessage) -> Optional[float]:
+        """한 번 전송합니다. 재시도가 필요하면 대기 시간(초), 끝났으면(성공/버림) None."""
+        backoff = min(2.0 ** (message.attempts - 1), MAX_BACKOFF_SECONDS)
+        try:
+            response, result_kind = await self._post(message)
+        except httpx.HTTPError as e:
+            logger.warning("slack_delivery_error", channel=message.channel, attempt=message.attempts, error=str(e))
+            return backoff
+
+        if response.status_code == 429:
+            retry_after = _retry_after(response.headers.get("Retry-After"))
+            logger.warning("slack_rate_limited", channel=message.channel, retry_after=retry_after)
+            return retry_after
+        if response.status_code >= 500:
+            return backoff
+        if response.status_code >= 400:
+            self._drop(message, "rejected", status_code=response.status_code, body=response.text[:200])
+            return None
+
+        result = {"ok": True, "channel": message.channel, "ts": None}
+        if message.webhook_url is None:
+            try:
+                body = response.json()
+            except ValueError:
+                return backoff
+            if not body.get("ok"):
+                error = body.get("error")
+                if error == "ratelimited":
+                    return _retry_after(response.headers.get("Retry-After"))
+                if result_kind == "edited" and error in ("message_not_found", "cant_update_message"):
+                    # 수정할 메시지가 사라졌으면 새 메시지로 전송
+                    self._posted.pop(message.coalesce_key, None)
+                    return 0.0
+                self._drop(message, "rejected", error=error)
+                return None
+            result.update(channel=body.get("channel") or message.channel, ts=body.get("ts"))
+            if message.coalesce_key is not None and result["ts"]:
+                self._posted[message.coalesce_key] = (result["channel"], result["ts"])
+                self._posted.move_to_end(message.coalesce_key)
+                while len(self._posted) > MAX_TRACKED_MESSAGES:
+                    self._posted.popitem(last=False)
+
+        self._count(result_kind)
+        slack_delivery_latency_seconds.observe(self._clock() - message.enqueued_at)
+        for waiter in message.waiters:
+            if not waiter.done():
+                waiter.set_result(result)
+        return None
+
+    async def _post(self, message: SlackMessage) -> Tuple[httpx.Response, str]:
+        client = self._get_client()
+        if message.webhook_url:
+            return await client.post(message.webhook_url, json=message.payload), "sent"
+
+        headers = {"Authorization": f"Bearer {message.bot_token}"}
+        payload = {**message.payload, "channel": message.channel}
+        previous = self._posted.get(message.coalesce_key) if message.coalesce_key else None
+        if previous is not None:
+            # 같은 배포의 이후 단계는 기존 메시지를 수정
+            payload.update(channel=previous[0], ts=previous[1])
+            return await client.post(f"{SLACK_API_URL}/chat.update", json=payload, headers=headers), "edited"
+        return await client.post(f"{SLACK_API_URL}/chat.postMessage", json=payload, headers=headers), "sent"
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=get_settings().slack_send_timeout_seconds,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+                transport=self._transport,
+            )
+        return self._client
+
+    def _send_blocking(self, message: SlackMessage) -> bool:
+        # 이벤트 루프 밖(스크립트 등)에서의 호출은 속도 제한 없이 한 번만 동기 전송
+        if not message.webhook_url:
+            self._drop(message, "no_event_loop")
+            return False
+        try:
+            response = httpx.post(message.webhook_url, json=message.payload, timeout=get_settings().slack_send_timeout_seconds)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            self._drop(message, "failed", error=str(e))
+            return False
+        self._count("sent")
+        return True
+
+    # ------------------------------------------------------------------
+    # 통계/종료
+    # ------------------------------------------------------------------
+    def _count(self, result: str) -> None:
+        self._counts[result] = self._counts.get(result, 0) + 1
+        slack_messages_total.labels(result=result).inc()
+
+    def _drop(self, message: SlackMessage, reason: str, **details: Any) -> None:
+        self._counts[f"dropped_{reason}"] = self._counts.get(f"dropped_{reason}", 0) + 1
+        slack_messages_dropped_total.labels(reason=reason).inc()
+        logger.error("slack_message_dropped", reason=reason, channel=message.channel, attempts=message.attempts, **details)
+        for waiter in message.waiters:
+            if not waiter.done():
+                waiter.set_exception(SlackDeliveryError(f"slack message dropped: {reason}"))
+
+    def retry_after(
+        self,
+        channel: Optional[str] = None,
+        webhook_url: Optional[str] = None,
+        bot_token: Optional[str] = None,
+    ) -> float:
+        """해당 발신 경로의 채널이 Retry-After로 멈춰 있는 남은 시간(초)"""
+        message = self._message({}, channel, webhook_url, bot_token, None)
+        state = self._channels.get(message.route)
+        return max(state.blocked_until - self._clock(), 0.0) if state else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        channels: Dict[str, int] = {}
+        for (_, channel), state in self._channels.items():
+            if state.pending:
+                channels[channel] = channels.get(channel, 0) + len(state.pending)
+        return {"pending": self._pending, "channels": channels, **self._counts}
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """대기 중인 메시지가 모두 처리될 때까지 기다립니다. 시간 안에 끝나면 True."""
+        workers = [s.worker for s in self._channels.values() if s.worker is not None and not s.worker.done()]
+        if not workers:
+            return True
+        done, pending = await asyncio.wait(workers, timeout=timeout)
+        return not pending
+
+    async def stop(self, drain_timeout: float = 5.0) -> None:
+        """남은 메시지를 잠시 전송한 뒤 워커와 커넥션 풀을 정리합니다."""
+        if self._loop is asyncio.get_running_loop():
+            await self.drain(drain_timeout)
+            for state in self._channels.values():
+                if state.worker is not None:
+                    state.worker.cancel()
+            await asyncio.gather(*(s.worker for s in self._channels.values() if s.worker), return_exceptions=True)
+        for state in self._channels.values():
+            for message in state.pending:
+                self._drop(message, "shutdown")
+        self._channels.clear()
+        self._pending = 0
+        slack_queue_depth.set(0)
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._loop = None
+
+
+def _retry_after(value: Optional[str]) -> float:
+    try:
+        return max(float(value), 0.0) if value else 1.0
+    except ValueError:
+        return 1.0
+
+
+_delivery_queue: Optional[SlackDeliveryQueue] = None
+
+
+def get_slack_delivery_queue() -> SlackDeliveryQueue:
+    """Slack 발신 큐 인스턴스를 반환합니다."""
+    global _delivery_queue
+    if _delivery_queue is None:
+        _delivery_queue = SlackDeliveryQueue()
+    return _delivery_queue
@@ -13,7 +13,11 @@ from ..models.user_project_integration import UserProjectIntegration
 
 async def get_user_repositories(db: Session, user_id: str) -> List[Dict[str, Any]]:
     """사용자의 연동된 리포지토리 목록 조회 (user_project_integration 테이블 사용)"""
-    
+    return list_user_repositories(db, user_id)
+
+
+def list_user_repositories(db: Session, user_id: str) -> List[Dict[str, Any]]:
+    """get_user_repositories의 동기 버전 (asyncio.to_thread에서 호출용)"""
     repositories = db.query(UserProjectIntegration).filter(
         UserProjectIntegration.user_id == user_id
     ).all()
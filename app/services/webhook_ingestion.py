@@ -0,0 +1,375 @@
+"""
+GitHub 웹훅 수집 파이프라인
+
+웹훅 요청 경로에서는 중복 제거와 인박스 저장만 수행하고,
+실제 처리는 메인 이벤트 루프의 워커 풀이 담당합니다.
+
+- X-GitHub-Delivery 기준 TTL 중복 제거 (메모리 + DB 유니크 제약)
+- webhook_inbox 테이블에 영속화하여 재시작 시 미처리 이벤트 복구
+- 조건부 UPDATE로 항목을 원자적으로 점유(lease)하여 레플리카 간 중복 처리 방지
+- (installation_id, owner, repo) 기준 통합 정보 캐시
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+import structlog
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import IntegrityError
+
+from ..core.config import get_settings
+from ..database import SessionLocal
+from ..models.deployment_history import get_kst_now
+from ..models.user_project_integration import UserProjectIntegration
+from ..models.webhook_inbox import WebhookInbox
+
+logger = structlog.get_logger(__name__)
+
+WebhookHandler = Callable[..., Awaitable[Dict[str, Any]]]
+IntegrationKey = Tuple[str, str, str]
+
+
+class DeliveryDeduplicator:
+    """만료 시간이 있는 크기 제한 전송 ID 집합"""
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, float]" = OrderedDict()
+
+    def _evict(self, now: float) -> None:
+        # 삽입 순서 = 만료 순서이므로 앞에서부터 제거
+        while self._entries:
+            delivery_id, expires_at = next(iter(self._entries.items()))
+            if expires_at > now:
+                break
+            self._entries.popitem(last=False)
+
+    def seen(self, delivery_id: str) -> bool:
+        """이미 본 전송 ID면 True, 처음이면 기록 후 False를 반환합니다."""
+        now = time.monotonic()
+        self._evict(now)
+        if delivery_id in self._entries:
+            return True
+        self._entries[delivery_id] = now + self.ttl_seconds
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return False
+
+    def forget(self, delivery_id: str) -> None:
+        self._entries.pop(delivery_id, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass(frozen=True)
+class IntegrationSnapshot:
+    """캐시용 통합 정보 요약 (세션에 묶이지 않는 값 객체)"""
+    id: int
+    user_id: str
+    github_owner: str
+    github_repo: str
+    auto_deploy_enabled: bool
+
+
+class IntegrationCache:
+    """(installation_id, owner, repo) → IntegrationSnapshot TTL 캐시"""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[IntegrationKey, Tuple[float, Optional[IntegrationSnapshot]]]" = OrderedDict()
+
+    def get(self, key: IntegrationKey) -> Tuple[bool, Optional[IntegrationSnapshot]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, snapshot = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return False, None
+        self._entries.move_to_end(key)
+        return True, snapshot
+
+    def put(self, key: IntegrationKey, snapshot: Optional[IntegrationSnapshot]) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, snapshot)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, owner: str, repo: str) -> None:
+        for key in [k for k in self._entries if k[1] == owner and k[2] == repo]:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class WebhookIngestionPipeline:
+    """웹훅 중복 제거 → 인박스 저장 → 워커 풀 처리 파이프라인"""
+
+    def __init__(
+        self,
+        concurrency: int = 4,
+        dedup_ttl_seconds: float = 3600,
+        dedup_max_entries: int = 10000,
+        integration_cache_ttl_seconds: float = 60,
+        lease_seconds: float = 3600,
+    ):
+        self.concurrency = max(1, concurrency)
+        self.lease_seconds = lease_seconds
+        self.deduplicator = DeliveryDeduplicator(dedup_ttl_seconds, dedup_max_entries)
+        self.integration_cache = IntegrationCache(integration_cache_ttl_seconds)
+        self.handlers: Dict[str, WebhookHandler] = {}
+        self.session_factory = SessionLocal
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._queued: Set[int] = set()
+        self._workers: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # ------------------------------------------------------------------
+    # 등록/조회
+    # ------------------------------------------------------------------
+    def register_handler(self, event_type: str, handler: WebhookHandler) -> None:
+        """이벤트 타입별 처리 코루틴을 등록합니다."""
+        self.handlers[event_type] = handler
+
+    def supports(self, event_type: str) -> bool:
+        return event_type in self.handlers
+
+    def lookup_integration(self, db, installation_id: str, owner: str, repo: str) -> Optional[IntegrationSnapshot]:
+        """캐시를 우선 조회하고, 없으면 DB에서 통합 정보를 읽어 캐시합니다."""
+        key = (str(installation_id), owner, repo)
+        hit, snapshot = self.integration_cache.get(key)
+        if hit:
+            return snapshot
+
+        integration = db.query(UserProjectIntegration).filter(
+            UserProjectIntegration.github_installation_id == str(installation_id),
+            UserProjectIntegration.github_owner == owner,
+            UserProjectIntegration.github_repo == repo
+        ).first()
+
+        snapshot = None
+        if integration is not None:
+            snapshot = IntegrationSnapshot(
+                id=integration.id,
+                user_id=integration.user_id,
+                github_owner=integration.github_owner,
+                github_repo=integration.github_repo,
+                auto_deploy_enabled=bool(getattr(integration, "auto_deploy_enabled", False)),
+            )
+        self.integration_cache.put(key, snapshot)
+        return snapshot
+
+    def invalidate_integration(self, owner: str, repo: str) -> None:
+        """통합 정보 변경 시 캐시를 무효화합니다."""
+        self.integration_cache.invalidate(owner, repo)
+
+    # ------------------------------------------------------------------
+    # 수신
+    # ------------------------------------------------------------------
+    async def ingest(
+        self,
+        db,
+        *,
+        delivery_id: str,
+        event_type: str,
+        payload: Dict[str, Any],
+        integration_id: int,
+        installation_id: Optional[str] = None,
+        repository: Optional[str] = None,
+    ) -> bool:
+        """이벤트를 인박스에 저장하고 워커 큐에 넣습니다.
+
+        Returns:
+            새로 수락되었으면 True, 중복 전송이면 False
+        """
+        if self.deduplicator.seen(delivery_id):
+            logger.info("webhook_duplicate_delivery", delivery_id=delivery_id, source="memory")
+            return False
+
+        entry = WebhookInbox(
+            delivery_id=delivery_id,
+            event_type=event_type,
+            installation_id=str(installation_id) if installation_id is not None else None,
+            repository=repository,
+            integration_id=integration_id,
+            payload=json.dumps(payload),
+            status="pending",
+        )
+        try:
+            db.add(entry)
+            db.commit()
+        except IntegrityError:
+            # 다른 레플리카 또는 재시작 이전에 이미 저장된 전송
+            db.rollback()
+            logger.info("webhook_duplicate_delivery", delivery_id=delivery_id, source="inbox")
+            return False
+        except Exception:
+            db.rollback()
+            self.deduplicator.forget(delivery_id)
+            raise
+
+        # 기동 시 시작되지 않은 경우(초기화 실패, 단독 사용 등)를 위한 보정
+        self.start()
+        self._enqueue(entry.id)
+        return True
+
+    # ------------------------------------------------------------------
+    # 워커 풀
+    # ------------------------------------------------------------------
+    def _enqueue(self, inbox_id: int) -> None:
+        # 복구 단계와 수신 경로가 같은 항목을 중복 적재하지 않도록 방지
+        if inbox_id in self._queued:
+            return
+        self._queued.add(inbox_id)
+        self._queue.put_nowait(inbox_id)
+
+    def start(self) -> None:
+        """현재 이벤트 루프에서 워커를 시작하고 미처리 인박스를 재적재합니다.
+
+        애플리케이션 기동 시 호출되며, 이미 같은 루프에서 실행 중이면 아무것도 하지 않습니다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._workers and self._loop is loop:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._queued = set()
+        self._workers = [
+            self._loop.create_task(self._worker(i), name=f"webhook-worker-{i}")
+            for i in range(self.concurrency)
+        ]
+        for inbox_id in self._pending_inbox_ids():
+            self._enqueue(inbox_id)
+        logger.info("webhook_ingestion_started", workers=self.concurrency, recovered=self._queue.qsize())
+
+    async def stop(self) -> None:
+        """워커를 중지합니다. 처리 중이던 항목은 다음 시작 시 재처리됩니다."""
+        for task in self._workers:
+            task.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        self._loop = None
+
+    async def join(self) -> None:
+        """큐에 들어간 모든 이벤트가 처리될 때까지 대기합니다."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    @staticmethod
+    def _claimable(now):
+        """대기 중이거나 점유가 만료된(처리 중 레플리카가 죽은) 항목 조건"""
+        return or_(
+            WebhookInbox.status == "pending",
+            and_(
+                WebhookInbox.status == "processing",
+                or_(WebhookInbox.lease_expires_at.is_(None), WebhookInbox.lease_expires_at < now),
+            ),
+        )
+
+    def _pending_inbox_ids(self) -> List[int]:
+        session = self.session_factory()
+        try:
+            rows = session.query(WebhookInbox.id).filter(
+                self._claimable(get_kst_now())
+            ).order_by(WebhookInbox.id.asc()).all()
+            return [row[0] for row in rows]
+        except Exception as e:
+            logger.warning("webhook_inbox_recovery_failed", error=str(e))
+            return []
+        finally:
+            session.close()
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            inbox_id = await self._queue.get()
+            try:
+                await self._process(inbox_id)
+            except Exception as e:
+                logger.error("webhook_worker_error", worker=index, inbox_id=inbox_id, error=str(e))
+            finally:
+                self._queued.discard(inbox_id)
+                self._queue.task_done()
+
+    def _claim(self, session, inbox_id: int) -> bool:
+        """조건부 UPDATE로 항목을 점유합니다. 다른 레플리카가 먼저 점유했으면 False."""
+        now = get_kst_now()
+        claimed = session.query(WebhookInbox).filter(
+            WebhookInbox.id == inbox_id,
+            self._claimable(now),
+        ).update(
+            {
+                WebhookInbox.status: "processing",
+                WebhookInbox.attempts: WebhookInbox.attempts + 1,
+                WebhookInbox.lease_expires_at: now + timedelta(seconds=self.lease_seconds),
+            },
+            synchronize_session=False,
+        )
+        session.commit()
+        return claimed == 1
+
+    async def _process(self, inbox_id: int) -> None:
+        session = self.session_factory()
+        try:
+            if not self._claim(session, inbox_id):
+                logger.info("webhook_inbox_already_claimed", inbox_id=inbox_id)
+                return
+            entry = session.get(WebhookInbox, inbox_id)
+            if entry is None:
+                return
+
+            handler = self.handlers.get(entry.event_type)
+            integration = session.get(UserProjectIntegration, entry.integration_id) if entry.integration_id else None
+            if handler is None or integration is None or not getattr(integration, "auto_deploy_enabled", False):
+                entry.status = "done"
+                entry.error_message = "skipped: handler or integration unavailable"
+                entry.processed_at = get_kst_now()
+                entry.lease_expires_at = None
+                session.commit()
+                return
+
+            payload = json.loads(entry.payload)
+            try:
+                result = await handler(payload, db=session, integration=integration)
+                entry.status = "done"
+                if isinstance(result, dict) and result.get("status") == "error":
+                    entry.error_message = str(result.get("message"))[:2000]
+            except Exception as e:
+                session.rollback()
+                entry.status = "failed"
+                entry.error_message = str(e)[:2000]
+                logger.error("webhook_processing_failed", inbox_id=inbox_id, delivery_id=entry.delivery_id, error=str(e))
+            entry.processed_at = get_kst_now()
+            entry.lease_expires_at = None
+            session.commit()
+        finally:
+            session.close()
+
+
+_pipeline: Optional[WebhookIngestionPipeline] = None
+
+
+def get_webhook_pipeline() -> WebhookIngestionPipeline:
+    """전역 웹훅 수집 파이프라인을 반환합니다."""
+    global _pipeline
+    if _pipeline is None:
+        settings = get_settings()
+        _pipeline = WebhookIngestionPipeline(
+            concurrency=settings.webhook_worker_concurrency,
+            dedup_ttl_seconds=settings.webhook_dedup_ttl,
+            dedup_max_entries=settings.webhook_dedup_max_entries,
+            integration_cache_ttl_seconds=settings.webhook_integration_cache_ttl,
+            lease_seconds=settings.webhook_processing_lease_seconds,
+        )
+    return _pipeline
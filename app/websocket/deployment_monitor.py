@@ -5,14 +5,17 @@ Deployment Monitor WebSocket Manager
 특정 배포나 사용자별로 WebSocket 연결을 관리하고 실시간 업데이트를 전송합니다.
 """
 
-import json
 import asyncio
-from typing import Dict, List, Set, Optional
+from typing import Dict, List, Set, Optional, Union
 from fastapi import WebSocket, WebSocketDisconnect
 from fastapi.websockets import WebSocketState
 from datetime import datetime, timezone
 import structlog
 
+from ..core.serialization import dumps_str, loads
+from ..services.deployment_events import create_event_store
+from .fanout import SeenEnvelopes, create_fanout_bus, deployment_channel, make_envelope, parse_envelope, user_channel
+
 logger = structlog.get_logger(__name__)
 
 
@@ -35,11 +38,12 @@ class DeploymentMonitorManager:
         # 초기화 상태
         self.is_initialized = False
 
-        # 배포별 최근 이벤트 저장: {deployment_id: [message, ...]}
-        # 새로고침/재연결 시 스냅샷 재전송에 사용 (간단한 순차 복원)
-        self.deployment_last_events: Dict[str, List[dict]] = {}
-        # 이벤트 저장 상한 (메모리 보호)
-        self.max_events_per_deployment: int = 200
+        # 배포별 이벤트 링 버퍼 (memory/redis): 새로고침/재연결 시 last_event_id 이후 이벤트 재전송
+        self.event_store = create_event_store()
+
+        # 레플리카 간 이벤트 팬아웃 (local/redis): 로컬 소켓이 있는 배포/사용자 채널만 구독
+        self.fanout = create_fanout_bus(self._deliver_envelope)
+        self._seen_envelopes = SeenEnvelopes()
 
         # 스테이지 시작 시각 저장: {deployment_id: {stage: datetime}}
         self.stage_started_at: Dict[str, Dict[str, datetime]] = {}
@@ -77,40 +81,10 @@ class DeploymentMonitorManager:
             if user_id not in self.user_connections:
                 self.user_connections[user_id] = []
             self.user_connections[user_id].append(websocket)
-        
+
+        await self._sync_fanout()
         # WebSocket connected (logging removed for verbosity)
     
-    async def disconnect(self, connection_id: str):
-        """기존 API와 호환성을 위한 연결 해제 메서드"""
-        if connection_id in self.connections:
-            websocket = self.connections[connection_id]
-            
-            # 메타데이터에서 연결 정보 가져오기
-            if websocket in self.connection_metadata:
-                metadata = self.connection_metadata[websocket]
-                deployment_id = metadata.get("deployment_id")
-                user_id = metadata.get("user_id")
-                
-                # 배포별 연결에서 제거
-                if deployment_id and deployment_id in self.deployment_connections:
-                    if websocket in self.deployment_connections[deployment_id]:
-                        self.deployment_connections[deployment_id].remove(websocket)
-                    if not self.deployment_connections[deployment_id]:
-                        del self.deployment_connections[deployment_id]
-                
-                # 사용자별 연결에서 제거
-                if user_id and user_id in self.user_connections:
-                    if websocket in self.user_connections[user_id]:
-                        self.user_connections[user_id].remove(websocket)
-                    if not self.user_connections[user_id]:
-                        del self.user_connections[user_id]
-                
-                # 메타데이터에서 제거
-                del self.connection_metadata[websocket]
-            
-            del self.connections[connection_id]
-        # WebSocket disconnected (logging removed for verbosity)
-    
     async def handle_message(self, connection_id: str, data: dict):
         """기존 API와 호환성을 위한 메시지 처리 메서드"""
         message_type = data.get("type")
@@ -122,7 +96,7 @@ class DeploymentMonitorManager:
                 # 해당 연결 ID의 웹소켓 찾기
                 if connection_id in self.connections:
                     ws = self.connections[connection_id]
-                    await ws.send_json({"type": "pong", "data": {"message": "pong"}})
+                    await ws.send_text(dumps_str({"type": "pong", "data": {"message": "pong"}}))
                     # logger.info(f"Pong sent successfully to {connection_id}")
                 else:
                     logger.warning(f"Connection {connection_id} not found in connections")
@@ -133,6 +107,7 @@ class DeploymentMonitorManager:
             subscriber_id = data.get("subscriber_id")
             deployment_id = data.get("deployment_id")
             user_id = data.get("user_id")
+            last_event_id = data.get("last_event_id")
             
             # Subscribe message received (logging removed for verbosity)
             
@@ -160,16 +135,18 @@ class DeploymentMonitorManager:
                     if websocket not in self.user_connections[user_id]:
                         self.user_connections[user_id].append(websocket)
 
-                # 구독 직후 스냅샷 재전송 (해당 배포의 최근 이벤트들을 순서대로 전달)
+                await self._sync_fanout()
+
+                # 구독 직후 재전송 (last_event_id가 있으면 그 이후 이벤트만 순서대로 전달)
                 try:
-                    if deployment_id and deployment_id in self.deployment_last_events:
-                        snapshot_events = self.deployment_last_events[deployment_id]
+                    snapshot_events = await self.event_store.read(deployment_id, after=last_event_id) if deployment_id else []
+                    if snapshot_events:
                         logger.info(
                             f"Replaying {len(snapshot_events)} cached events to connection {connection_id} for deployment {deployment_id}"
                         )
                         for evt in snapshot_events:
                             try:
-                                await websocket.send_json(evt)
+                                await websocket.send_text(dumps_str(evt))
                             except Exception as replay_err:
                                 logger.warning(f"Failed to replay cached event: {replay_err}")
                                 break
@@ -200,6 +177,7 @@ class DeploymentMonitorManager:
             "connected_at": datetime.utcnow(),
             "connection_type": "deployment"
         }
+        await self._sync_fanout()
         
         # WebSocket connected for deployment (logging removed for verbosity)
         
@@ -225,6 +203,7 @@ class DeploymentMonitorManager:
             "connected_at": datetime.utcnow(),
             "connection_type": "user"
         }
+        await self._sync_fanout()
         
         # WebSocket connected for user (logging removed for verbosity)
         
@@ -235,43 +214,49 @@ class DeploymentMonitorManager:
             "timestamp": datetime.utcnow().isoformat()
         })
     
-    async def disconnect(self, websocket: WebSocket):
-        """WebSocket 연결 해제"""
-        if websocket not in self.connection_metadata:
+    async def disconnect(self, connection: Union[str, WebSocket]):
+        """
+        연결 해제 (기존 API의 connection_id 또는 WebSocket)
+
+        로컬 소켓이 더 이상 없는 배포/사용자 채널은 팬아웃 구독도 해제합니다.
+        """
+        if isinstance(connection, str):
+            websocket = self.connections.pop(connection, None)
+            if websocket is None:
+                return
+        else:
+            websocket = connection
+
+        metadata = self.connection_metadata.pop(websocket, None)
+        if metadata is None:
             return
-        
-        metadata = self.connection_metadata[websocket]
-        deployment_id = metadata.get("deployment_id")
-        user_id = metadata.get("user_id")
-        
-        # 배포별 연결에서 제거
-        if deployment_id and deployment_id in self.deployment_connections:
-            if websocket in self.deployment_connections[deployment_id]:
-                self.deployment_connections[deployment_id].remove(websocket)
-            if not self.deployment_connections[deployment_id]:
-                del self.deployment_connections[deployment_id]
-        
-        # 사용자별 연결에서 제거
-        if user_id and user_id in self.user_connections:
-            if websocket in self.user_connections[user_id]:
-                self.user_connections[user_id].remove(websocket)
-            if not self.user_connections[user_id]:
-                del self.user_connections[user_id]
-        
-        # 메타데이터 제거
-        del self.connection_metadata[websocket]
-        
-        # WebSocket disconnected for deployment (logging removed for verbosity)
-    
-    async def send_to_websocket(self, websocket: WebSocket, message: dict):
-        """특정 WebSocket에 메시지 전송"""
+        connection_id = metadata.get("connection_id")
+        if connection_id and self.connections.get(connection_id) is websocket:
+            del self.connections[connection_id]
+
+        # 배포별/사용자별 연결에서 제거
+        self._remove_connection(self.deployment_connections, metadata.get("deployment_id"), websocket)
+        self._remove_connection(self.user_connections, metadata.get("user_id"), websocket)
+        await self._sync_fanout()
+
+    @staticmethod
+    def _remove_connection(index: Dict[str, List[WebSocket]], key: Optional[str], websocket: WebSocket) -> None:
+        if not key or key not in index:
+            return
+        if websocket in index[key]:
+            index[key].remove(websocket)
+        if not index[key]:
+            del index[key]
+
+    async def send_to_websocket(self, websocket: WebSocket, message: dict, payload: Optional[str] = None):
+        """특정 WebSocket에 메시지 전송 (payload: 브로드캐스트에서 미리 직렬화한 본문)"""
         try:
             # WebSocket 연결 상태 확인
             if websocket.client_state != WebSocketState.CONNECTED:
                 logger.warning(f"WebSocket not connected, skipping message: {message.get('type', 'unknown')}")
                 return False
                 
-            await websocket.send_text(json.dumps(message, ensure_ascii=False))
+            await websocket.send_text(payload if payload is not None else dumps_str(message))
             # logger.info(f"Message sent to WebSocket: {message.get('type', 'unknown')}")
             return True
         except Exception as e:
@@ -279,38 +264,6 @@ class DeploymentMonitorManager:
             await self.disconnect(websocket)
             return False
     
-    async def broadcast_to_deployment(self, deployment_id: str, message: dict):
-        """특정 배포의 모든 연결에 메시지 브로드캐스트"""
-        if deployment_id not in self.deployment_connections:
-            return
-            
-        connections = self.deployment_connections[deployment_id].copy()
-        for websocket in connections:
-            success = await self.send_to_websocket(websocket, message)
-            if not success:
-                # 연결이 끊어진 경우 연결 목록에서 제거
-                if websocket in self.deployment_connections[deployment_id]:
-                    self.deployment_connections[deployment_id].remove(websocket)
-    
-    async def broadcast_to_user(self, user_id: str, message: dict):
-        """특정 사용자의 모든 연결에 메시지 브로드캐스트"""
-        # logger.info(f"Broadcasting to user {user_id}")
-        # logger.info(f"Available user connections: {list(self.user_connections.keys())}")
-        
-        if user_id not in self.user_connections:
-            logger.warning(f"User {user_id} not found in user_connections")
-            return
-            
-        connections = self.user_connections[user_id].copy()
-        # logger.info(f"Found {len(connections)} connections for user {user_id}")
-        
-        for websocket in connections:
-            success = await self.send_to_websocket(websocket, message)
-            if not success:
-                # 연결이 끊어진 경우 연결 목록에서 제거
-                if websocket in self.user_connections[user_id]:
-                    self.user_connections[user_id].remove(websocket)
-    
     async def send_deployment_started(self, deployment_id: str, user_id: str, data: dict):
         """배포 시작 알림"""
         message = {
@@ -323,9 +276,8 @@ class DeploymentMonitorManager:
         
         # Broadcasting deployment_started (logging removed for verbosity)
 
-        self._record_deployment_event(deployment_id, message)
-        await self.broadcast_to_deployment(deployment_id, message)
-        await self.broadcast_to_user(user_id, message)
+        await self._record_deployment_event(deployment_id, message)
+        await self.publish_event(deployment_id, user_id, message)
     
     async def send_stage_started(self, deployment_id: str, user_id: str, stage: str, data: dict):
         """단계 시작 알림"""
@@ -344,9 +296,8 @@ class DeploymentMonitorManager:
             "started_at": (self.stage_started_at.get(deployment_id, {}).get(stage) or datetime.now(timezone.utc)).isoformat(),
             "data": data
         }
-        self._record_deployment_event(deployment_id, message)
-        await self.broadcast_to_deployment(deployment_id, message)
-        await self.broadcast_to_user(user_id, message)
+        await self._record_deployment_event(deployment_id, message)
+        await self.publish_event(deployment_id, user_id, message)
     
     async def send_stage_completed(self, deployment_id: str, user_id: str, stage: str, status: str, data: dict):
         """단계 완료 알림"""
@@ -374,9 +325,8 @@ class DeploymentMonitorManager:
             "duration": duration_val,
             "data": data
         }
-        self._record_deployment_event(deployment_id, message)
-        await self.broadcast_to_deployment(deployment_id, message)
-        await self.broadcast_to_user(user_id, message)
+        await self._record_deployment_event(deployment_id, message)
+        await self.publish_event(deployment_id, user_id, message)
     
     async def send_deployment_completed(self, deployment_id: str, user_id: str, status: str, data: dict):
         """배포 완료 알림"""
@@ -389,9 +339,8 @@ class DeploymentMonitorManager:
             "total_duration": data.get("total_duration") if isinstance(data, dict) else None,
             "data": data
         }
-        self._record_deployment_event(deployment_id, message)
-        await self.broadcast_to_deployment(deployment_id, message)
-        await self.broadcast_to_user(user_id, message)
+        await self._record_deployment_event(deployment_id, message)
+        await self.publish_event(deployment_id, user_id, message)
     
     async def send_stage_progress(self, deployment_id: str, user_id: str, stage: str, progress: int, elapsed_time: int, message: str = None):
         """단계별 실시간 진행률 전송"""
@@ -431,37 +380,59 @@ class DeploymentMonitorManager:
         
         # logger.info(f"Sending stage_progress: {stage} - {progress}% for deployment {deployment_id}")
         # logger.info(f"Stage progress message: {websocket_message}")
-        self._record_deployment_event(deployment_id, websocket_message)
-        await self.broadcast_to_deployment(deployment_id, websocket_message)
-        await self.broadcast_to_user(user_id, websocket_message)
+        await self._record_deployment_event(deployment_id, websocket_message)
+        await self.publish_event(deployment_id, user_id, websocket_message)
 
-    def _record_deployment_event(self, deployment_id: str, message: dict) -> None:
-        """배포별 최근 이벤트를 저장한다. 구독 시 스냅샷 재전송에 사용."""
+    async def _record_deployment_event(self, deployment_id: str, message: dict) -> None:
+        """배포 이벤트를 저장하고 부여된 event_id를 메시지에 붙인다 (클라이언트 재연결 시 재개 지점)."""
+        if not deployment_id:
+            return
         try:
-            if not deployment_id:
-                return
-            if deployment_id not in self.deployment_last_events:
-                self.deployment_last_events[deployment_id] = []
-            events = self.deployment_last_events[deployment_id]
-
-            # 같은 타입/스테이지의 진행 이벤트는 최신으로 교체하여 중복 축소 (특히 stage_progress)
-            replaced = False
-            if message.get("type") == "stage_progress":
-                stage = message.get("stage")
-                for i in range(len(events) - 1, -1, -1):
-                    evt = events[i]
-                    if evt.get("type") == "stage_progress" and evt.get("stage") == stage:
-                        events[i] = message
-                        replaced = True
-                        break
-            if not replaced:
-                events.append(message)
-            # 상한 관리
-            if len(events) > self.max_events_per_deployment:
-                self.deployment_last_events[deployment_id] = events[-self.max_events_per_deployment:]
+            message["event_id"] = await self.event_store.append(deployment_id, message)
         except Exception as e:
             logger.warning(f"Failed to record deployment event: {e}")
-    
+        if message.get("type") == "deployment_completed":
+            # 완료된 배포의 스테이지 시작 시각은 더 이상 필요 없음
+            self.stage_started_at.pop(deployment_id, None)
+
+    async def publish_event(self, deployment_id: Optional[str], user_id: Optional[str], message: dict) -> None:
+        """배포/사용자 채널로 이벤트 발행 (어느 레플리카에 연결된 소켓이든 한 번씩 수신)"""
+        channels = []
+        if deployment_id:
+            channels.append(deployment_channel(deployment_id))
+        if user_id:
+            channels.append(user_channel(user_id))
+        if not channels:
+            return
+        await self.fanout.publish(channels, make_envelope(deployment_id, user_id, dumps_str(message)))
+
+    async def _deliver_envelope(self, envelope: str) -> None:
+        """수신한 봉투를 이 레플리카의 배포/사용자 소켓 합집합에 한 번씩 전달"""
+        envelope_id, deployment_id, user_id, payload = parse_envelope(envelope)
+        # 배포 채널과 사용자 채널로 같은 봉투가 두 번 도착하므로 처음 것만 처리
+        if not self._seen_envelopes.first_time(envelope_id):
+            return
+        targets = dict.fromkeys(self.deployment_connections.get(deployment_id, ()) if deployment_id else ())
+        if user_id:
+            targets.update(dict.fromkeys(self.user_connections.get(user_id, ())))
+        for websocket in targets:
+            if not await self.send_to_websocket(websocket, {}, payload):
+                # 끊긴 소켓은 목록에서 제거하고 더 이상 관심 없는 채널의 구독도 해제
+                await self.disconnect(websocket)
+
+    async def _sync_fanout(self) -> None:
+        """로컬 연결이 관심 있는 채널 집합으로 팬아웃 구독을 맞춘다."""
+        wanted = {deployment_channel(d) for d in self.deployment_connections}
+        wanted.update(user_channel(u) for u in self.user_connections)
+        try:
+            await self.fanout.sync(wanted)
+        except Exception as e:
+            logger.warning(f"Failed to sync fan-out subscriptions: {e}")
+
+    async def stop(self) -> None:
+        """팬아웃 구독 종료"""
+        await self.fanout.close()
+
     def get_connection_stats(self) -> dict:
         """연결 통계 반환"""
         return {
@@ -475,7 +446,9 @@ class DeploymentMonitorManager:
             "user_connection_counts": {
                 user_id: len(connections) 
                 for user_id, connections in self.user_connections.items()
-            }
+            },
+            "event_store": self.event_store.stats(),
+            "fanout": self.fanout.stats(),
         }
 
 
@@ -502,7 +475,7 @@ async def handle_deployment_websocket(websocket: WebSocket, deployment_id: str,
         while True:
             # 클라이언트로부터 메시지 수신 (ping/pong 등)
             data = await websocket.receive_text()
-            message = json.loads(data)
+            message = loads(data)
             
             # ping 메시지에 대한 pong 응답
             if message.get("type") == "ping":
@@ -526,7 +499,7 @@ async def handle_user_websocket(websocket: WebSocket, user_id: str):
         while True:
             # 클라이언트로부터 메시지 수신 (ping/pong 등)
             data = await websocket.receive_text()
-            message = json.loads(data)
+            message = loads(data)
             
             # ping 메시지에 대한 pong 응답
             if message.get("type") == "ping":
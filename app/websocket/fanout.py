@@ -0,0 +1,250 @@
+"""
+배포 WebSocket 이벤트 팬아웃 버스
+
+배포 진행 이벤트를 보낸 레플리카와 브라우저가 연결된 레플리카가 다를 수 있으므로
+이벤트를 배포/사용자 채널로 발행하고, 각 레플리카는 자기 로컬 소켓이 관심 있는 채널만 구독합니다.
+
+- local: 단일 레플리카. 발행 즉시 로컬 전달
+- redis: Redis pub/sub. 연결된 소켓의 배포/사용자 키가 바뀔 때마다 구독을 맞추고,
+  Redis에 연결할 수 없으면 로컬 전달로 대체. 공유 Redis 클라이언트는 앱 루프에 묶여 있으므로
+  다른 루프(스레드)에서의 발행은 앱 루프로 넘기고, 연결 오류가 아닌 실패는 Redis 장애로 보지 않음
+
+봉투(envelope)는 "<id>\\t<deployment_id>\\t<user_id>\\n<payload>" 형태의 문자열입니다.
+메시지는 발행 측에서 한 번만 직렬화하고, 같은 봉투가 배포/사용자 채널로 두 번 도착해도
+수신 측이 id로 한 번만 전달합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Iterable, Optional, Set, Tuple
+
+import structlog
+
+from ..core.config import get_settings
+from ..core.redis_client import get_async_redis, mark_redis_unavailable
+
+logger = structlog.get_logger(__name__)
+
+try:
+    from redis.exceptions import ConnectionError as _RedisConnectionError, TimeoutError as _RedisTimeoutError
+    # 프로세스 전체에서 Redis를 잠시 끄는(mark_redis_unavailable) 대상이 되는 연결 오류
+    _UNAVAILABLE_ERRORS: Tuple[type, ...] = (OSError, asyncio.TimeoutError, _RedisConnectionError, _RedisTimeoutError)
+except ImportError:  # pragma: no cover - redis 미설치 환경
+    _UNAVAILABLE_ERRORS = (OSError, asyncio.TimeoutError)
+
+EnvelopeHandler = Callable[[str], Awaitable[None]]
+
+# 중복 수신 판별용으로 기억하는 최근 봉투 수
+SEEN_ENVELOPES = 2048
+
+
+def deployment_channel(deployment_id: str) -> str:
+    return f"ws:deploy:{deployment_id}"
+
+
+def user_channel(user_id: str) -> str:
+    return f"ws:user:{user_id}"
+
+
+def make_envelope(deployment_id: Optional[str], user_id: Optional[str], payload: str) -> str:
+    return f"{uuid.uuid4().hex}\t{deployment_id or ''}\t{user_id or ''}\n{payload}"
+
+
+def parse_envelope(envelope: str) -> Tuple[str, Optional[str], Optional[str], str]:
+    header, payload = envelope.split("\n", 1)
+    envelope_id, deployment_id, user_id = header.split("\t")
+    return envelope_id, deployment_id or None, user_id or None, payload
+
+
+class SeenEnvelopes:
+    """최근 전달한 봉투 id (LRU)"""
+
+    def __init__(self, capacity: int = SEEN_ENVELOPES):
+        self.capacity = capacity
+        self._ids: "OrderedDict[str, None]" = OrderedDict()
+
+    def first_time(self, envelope_id: str) -> bool:
+        if envelope_id in self._ids:
+            return False
+        self._ids[envelope_id] = None
+        if len(self._ids) > self.capacity:
+            self._ids.popitem(last=False)
+        return True
+
+
+class LocalFanoutBus:
+    """단일 프로세스 버스: 발행한 봉투를 바로 로컬 핸들러로 전달"""
+
+    backend = "local"
+
+    def __init__(self, handler: EnvelopeHandler):
+        self._handler = handler
+
+    async def publish(self, channels: Iterable[str], envelope: str) -> None:
+        await self._handler(envelope)
+
+    async def sync(self, wanted: Set[str]) -> None:
+        return None
+
+    async def close(self) -> None:
+        return None
+
+    def stats(self) -> dict:
+        return {"backend": self.backend}
+
+
+class RedisFanoutBus:
+    """Redis pub/sub 버스: 로컬 소켓이 관심 있는 채널만 구독"""
+
+    backend = "redis"
+
+    def __init__(
+        self,
+        handler: EnvelopeHandler,
+        redis_factory: Callable[[], Any] = get_async_redis,
+        poll_timeout: float = 0.5,
+        retry_delay: float = 1.0,
+    ):
+        self._handler = handler
+        self._redis_factory = redis_factory
+        self.poll_timeout = poll_timeout
+        self.retry_delay = retry_delay
+        self._pubsub: Optional[Any] = None
+        self._wanted: Set[str] = set()
+        self._subscribed: Set[str] = set()
+        self._lock = asyncio.Lock()
+        self._reader: Optional[asyncio.Task] = None
+        self._closed = False
+        # 구독/리더가 도는 루프 (공유 Redis 커넥션이 묶인 루프)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.published = 0
+        self.received = 0
+        self.fallbacks = 0
+
+    async def publish(self, channels: Iterable[str], envelope: str) -> None:
+        channels = list(channels)
+        loop = self._loop
+        if loop is not None and loop is not asyncio.get_running_loop() and loop.is_running():
+            # 다른 루프에서 공유 커넥션을 쓰면 실패하므로 앱 루프에서 발행
+            future = asyncio.run_coroutine_threadsafe(self.publish(channels, envelope), loop)
+            await asyncio.wrap_future(future)
+            return
+        redis = self._redis_factory()
+        if redis is not None and channels:
+            try:
+                pipe = redis.pipeline(transaction=False)
+                for channel in channels:
+                    pipe.publish(channel, envelope)
+                await pipe.execute()
+                self.published += 1
+                return
+            except _UNAVAILABLE_ERRORS as e:
+                mark_redis_unavailable(e)
+            except Exception as e:
+                # 연결 오류가 아닌 실패(예: 다른 루프의 커넥션 사용)는 이 호출만의 오류
+                logger.warning("ws_fanout_publish_failed", error=str(e))
+        # Redis를 쓸 수 없으면 최소한 이 레플리카의 소켓에는 전달
+        self.fallbacks += 1
+        await self._handler(envelope)
+
+    async def sync(self, wanted: Set[str]) -> None:
+        """구독을 wanted 채널 집합에 맞춥니다 (추가/해제분만 Redis에 요청)."""
+        async with self._lock:
+            if self._closed:
+                return
+            self._wanted = set(wanted)
+            redis = self._redis_factory()
+            if redis is None:
+                return
+            try:
+                if self._pubsub is None:
+                    if not self._wanted:
+                        return
+                    self._pubsub = redis.pubsub()
+                    self._subscribed = set()
+                add = self._wanted - self._subscribed
+                remove = self._subscribed - self._wanted
+                if add:
+                    await self._pubsub.subscribe(*add)
+                    self._subscribed |= add
+                if remove:
+                    await self._pubsub.unsubscribe(*remove)
+                    self._subscribed -= remove
+            except Exception as e:
+                mark_redis_unavailable(e)
+                await self._reset()
+                return
+        if self._reader is None or self._reader.done():
+            self._loop = asyncio.get_running_loop()
+            self._reader = self._loop.create_task(self._read_loop())
+
+    async def _read_loop(self) -> None:
+        # 폴링 타임아웃과 겹치면 취소가 삼켜질 수 있으므로 종료 플래그도 확인
+        while not self._closed:
+            pubsub = self._pubsub
+            if pubsub is None:
+                # 연결이 끊긴 뒤에는 원하는 채널 전체를 다시 구독
+                await asyncio.sleep(self.retry_delay)
+                await self.sync(self._wanted)
+                if self._pubsub is None and not self._wanted:
+                    return
+                continue
+            try:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=self.poll_timeout)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("ws_fanout_read_failed", error=str(e))
+                mark_redis_unavailable(e)
+                async with self._lock:
+                    await self._reset()
+                continue
+            if not message or message.get("type") != "message":
+                continue
+            self.received += 1
+            try:
+                await self._handler(message["data"])
+            except Exception as e:
+                logger.warning("ws_fanout_delivery_failed", channel=message.get("channel"), error=str(e))
+
+    async def _reset(self) -> None:
+        pubsub, self._pubsub = self._pubsub, None
+        self._subscribed = set()
+        if pubsub is not None:
+            try:
+                await pubsub.reset()
+            except Exception:
+                pass
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._reader is not None:
+            self._reader.cancel()
+            await asyncio.gather(self._reader, return_exceptions=True)
+            self._reader = None
+        self._loop = None
+        async with self._lock:
+            self._wanted = set()
+            await self._reset()
+
+    def stats(self) -> dict:
+        return {
+            "backend": self.backend,
+            "subscribed_channels": len(self._subscribed),
+            "published": self.published,
+            "received": self.received,
+            "local_fallbacks": self.fallbacks,
+        }
+
+
+def create_fanout_bus(handler: EnvelopeHandler, backend: Optional[str] = None):
+    """설정된 백엔드의 팬아웃 버스를 생성합니다."""
+    backend = (backend or get_settings().ws_fanout_backend).lower()
+    if backend == "redis":
+        return RedisFanoutBus(handler)
+    if backend != "local":
+        logger.warning("unknown_ws_fanout_backend", backend=backend)
+    return LocalFanoutBus(handler)
@@ -0,0 +1,27 @@
+"""
+공용 pytest 설정
+
+`@pytest.mark.slow`(벤치마크, 서브프로세스/벽시계 측정 테스트)는 기본 실행에서 건너뜁니다.
+`pytest --run-slow` 또는 RUN_SLOW_TESTS=1로 함께 실행합니다.
+"""
+
+import os
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption("--run-slow", action="store_true", default=False, help="느린 벤치마크 테스트도 실행")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: 벤치마크/서브프로세스 등 느린 테스트 (기본 실행에서 제외)")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow") or os.environ.get("RUN_SLOW_TESTS") == "1":
+        return
+    skip_slow = pytest.mark.skip(reason="느린 테스트: --run-slow 또는 RUN_SLOW_TESTS=1로 실행")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
@@ -0,0 +1,230 @@
+"""
+알림 규칙 백그라운드 평가 엔진 테스트
+
+여러 GET이 평가 1회를 공유하는지, firing/resolved 전이만 DB에 일괄 반영하는지,
+쿼리 실패 시 상태를 유지하는지, DB에만 있는 알림과 사용자 해결 처리,
+클러스터별 알림 분리(다른 클러스터 엔진이 resolve 하지 않음), 설정된 클러스터만
+상태를 유지하는 엔진을 받는지를 검증합니다.
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.base import Base
+from app.models.notification import Notification
+from app.services.alert_rules import DEFAULT_RULES, AlertRule, AlertRuleEngine
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+class FakePrometheus:
+    """규칙 이름별 instance 값을 돌려주는 가짜 Prometheus"""
+
+    def __init__(self, rules=DEFAULT_RULES, cluster="nks-cluster"):
+        self.exprs = {rule.expr.format(cluster=cluster): rule.name for rule in rules}
+        self.values = {}
+        self.failing = set()
+        self.calls = 0
+
+    async def __call__(self, query):
+        self.calls += 1
+        await asyncio.sleep(0)
+        name = self.exprs[query.query]
+        if name in self.failing:
+            raise RuntimeError("prometheus timeout")
+        return {
+            "status": "success",
+            "data": {"result": [
+                {"metric": {"instance": instance}, "value": [0, str(value)]}
+                for instance, value in self.values.get(name, {}).items()
+            ]},
+        }
+
+
+def _rows(session_factory):
+    db = session_factory()
+    try:
+        return {n.id: (n.status, n.severity, n.resolved_at is not None) for n in db.query(Notification).all()}
+    finally:
+        db.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_gets_share_one_evaluation(session_factory):
+    prom = FakePrometheus()
+    prom.values = {"cpu-high": {"node-a": 95.0, "node-b": 40.0}, "disk-io": {"node-a": 0.9}}
+    engine = AlertRuleEngine(interval=60, session_factory=session_factory, query=prom)
+
+    try:
+        results = await asyncio.gather(*(engine.alerts() for _ in range(10)))
+    finally:
+        await engine.stop()
+
+    assert prom.calls == len(DEFAULT_RULES)
+    assert all(r == results[0] for r in results)
+    by_id = {a["id"]: a for a in results[0]}
+    assert set(by_id) == {"cpu-high-nks-cluster-node-a", "disk-io-nks-cluster-node-a"}
+    assert by_id["cpu-high-nks-cluster-node-a"]["severity"] == "critical"
+    assert by_id["cpu-high-nks-cluster-node-a"]["description"] == "Node node-a CPU usage 95.00%"
+    assert _rows(session_factory)["cpu-high-nks-cluster-node-a"] == ("firing", "critical", False)
+
+
+@pytest.mark.asyncio
+async def test_only_transitions_are_persisted(session_factory):
+    prom = FakePrometheus()
+    engine = AlertRuleEngine(interval=60, session_factory=session_factory, query=prom)
+
+    prom.values = {"mem-high": {"node-a": 85.0}}
+    assert (await engine.evaluate())["firing"] == 1
+
+    # 값만 바뀌면 DB 쓰기 없이 설명만 갱신
+    prom.values = {"mem-high": {"node-a": 86.5}}
+    assert await engine.evaluate() == {"firing": 0, "resolved": 0, "failed_rules": 0}
+    assert engine.get("mem-high-nks-cluster-node-a")["description"] == "Node node-a memory usage 86.50%"
+
+    # 심각도 변경은 전이로 반영
+    prom.values = {"mem-high": {"node-a": 93.0}}
+    assert (await engine.evaluate())["firing"] == 1
+    assert _rows(session_factory)["mem-high-nks-cluster-node-a"] == ("firing", "critical", False)
+
+    prom.values = {}
+    assert (await engine.evaluate())["resolved"] == 1
+    assert engine.snapshot() == []
+    assert _rows(session_factory)["mem-high-nks-cluster-node-a"] == ("resolved", "critical", True)
+
+
+@pytest.mark.asyncio
+async def test_failed_query_keeps_existing_state(session_factory):
+    prom = FakePrometheus()
+    engine = AlertRuleEngine(interval=60, session_factory=session_factory, query=prom)
+    prom.values = {"net-rx-errors": {"node-a": 2.0}, "mem-swap": {"node-b": 1024}}
+    await engine.evaluate()
+
+    prom.values = {}
+    prom.failing = {"net-rx-errors"}
+    result = await engine.evaluate()
+
+    assert result == {"firing": 0, "resolved": 1, "failed_rules": 1}
+    assert [a["id"] for a in engine.snapshot()] == ["net-rx-errors-nks-cluster-node-a"]
+
+
+@pytest.mark.asyncio
+async def test_db_only_alerts_and_user_resolve(session_factory):
+    db = session_factory()
+    db.add(Notification(id="demo-cpu-high-node-x", title="[Demo] High CPU", severity="warning", status="firing"))
+    db.commit()
+    db.close()
+
+    prom = FakePrometheus()
+    prom.values = {"disk-readonly": {"node-a": 1}}
+    engine = AlertRuleEngine(interval=60, session_factory=session_factory, query=prom)
+    await engine.reload()
+    await engine.evaluate()
+
+    ids = {a["id"] for a in engine.snapshot()}
+    assert ids == {"demo-cpu-high-node-x", "disk-readonly-nks-cluster-node-a"}
+
+    # 규칙 조건이 사라져도 규칙 소유가 아닌 알림은 유지
+    prom.values = {}
+    await engine.evaluate()
+    assert [a["id"] for a in engine.snapshot()] == ["demo-cpu-high-node-x"]
+
+    # 사용자가 해결한 알림은 조건이 다시 참이 되면 재발생
+    prom.values = {"disk-readonly": {"node-a": 1}}
+    await engine.evaluate()
+    engine.discard("disk-readonly-nks-cluster-node-a")
+    assert engine.get("disk-readonly-nks-cluster-node-a") is None
+    assert (await engine.evaluate())["firing"] == 1
+    assert engine.get("disk-readonly-nks-cluster-node-a")["severity"] == "critical"
+
+
+@pytest.mark.asyncio
+async def test_declarative_rule_adds_no_request_path_cost(session_factory):
+    rules = DEFAULT_RULES + (
+        AlertRule(
+            name="pod-restarts",
+            title="Pod Restarting",
+            expr='sum(increase(kube_pod_container_status_restarts_total{{cluster="{cluster}"}}[5m])) by (instance)',
+            threshold=3,
+            description="Node {instance} restarts {value:.0f}",
+        ),
+    )
+    prom = FakePrometheus(rules)
+    prom.values = {"pod-restarts": {"node-a": 5}}
+    engine = AlertRuleEngine(rules=rules, interval=60, session_factory=session_factory, query=prom)
+
+    try:
+        first = await engine.alerts()
+        calls = prom.calls
+        for _ in range(20):
+            assert await engine.alerts() == first
+    finally:
+        await engine.stop()
+
+    assert calls == len(rules) and prom.calls == calls
+    assert first[0]["description"] == "Node node-a restarts 5"
+
+
+@pytest.mark.asyncio
+async def test_engines_only_load_and_resolve_their_own_cluster(session_factory):
+    prod_prom = FakePrometheus(cluster="prod")
+    prod_prom.values = {"cpu-high": {"node-a": 85.0}}
+    prod = AlertRuleEngine(cluster="prod", interval=60, session_factory=session_factory, query=prod_prom)
+    await prod.evaluate()
+
+    # 같은 instance 이름이라도 다른 클러스터(오타 포함)의 엔진은 prod 알림을 읽거나 resolve 하지 않음
+    typo = AlertRuleEngine(cluster="prdo", interval=60, session_factory=session_factory, query=FakePrometheus(cluster="prdo"))
+    await typo.reload()
+    assert typo.snapshot() == []
+    assert await typo.evaluate() == {"firing": 0, "resolved": 0, "failed_rules": 0}
+
+    staging_prom = FakePrometheus(cluster="staging")
+    staging_prom.values = {"cpu-high": {"node-a": 95.0}}
+    staging = AlertRuleEngine(cluster="staging", interval=60, session_factory=session_factory, query=staging_prom)
+    await staging.reload()
+    await staging.evaluate()
+
+    rows = _rows(session_factory)
+    assert rows["cpu-high-prod-node-a"] == ("firing", "warning", False)
+    assert rows["cpu-high-staging-node-a"] == ("firing", "critical", False)
+    assert [a["id"] for a in staging.snapshot()] == ["cpu-high-staging-node-a"]
+    assert staging.get("cpu-high-staging-node-a")["labels"] == {"cluster": "staging", "instance": "node-a", "rule": "cpu-high"}
+
+    # 재시작 후에도 각 엔진은 자기 클러스터 알림만 복원
+    restored = AlertRuleEngine(cluster="prod", interval=60, session_factory=session_factory, query=prod_prom)
+    await restored.reload()
+    assert [a["id"] for a in restored.snapshot()] == ["cpu-high-prod-node-a"]
+    assert restored.snapshot()[0]["labels"]["cluster"] == "prod"
+
+
+def test_only_configured_clusters_get_persistent_engines(monkeypatch):
+    from app.core.config import get_settings
+    from app.services import alert_rules
+
+    monkeypatch.setattr(alert_rules, "_engines", {})
+    monkeypatch.setattr(get_settings(), "alert_eval_clusters", "prod, staging")
+    monkeypatch.setattr(get_settings(), "alert_eval_max_clusters", 2)
+
+    # 요청으로 들어온 임의 이름은 일회성 엔진으로 처리되어 슬롯을 차지하지 않음
+    for i in range(5):
+        assert alert_rules.get_alert_engine(f"random-{i}") is not alert_rules.get_alert_engine(f"random-{i}")
+    prod = alert_rules.get_alert_engine("prod")
+    assert alert_rules.get_alert_engine("prod") is prod
+    assert alert_rules.get_alert_engine("staging") is alert_rules.get_alert_engine("staging")
+    assert set(alert_rules._engines) == {"prod", "staging"}
+
+    with pytest.raises(ValueError):
+        alert_rules.get_alert_engine('prod", mode="idle')
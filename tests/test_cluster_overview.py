@@ -0,0 +1,170 @@
+"""
+클러스터 overview 엔진 테스트
+
+all-namespaces 목록 호출의 동시 실행, 단일 순회 집계, 스냅샷 재사용과
+동시 요청 병합, 권한 부족 시 네임스페이스별 조회 대체를 검증합니다.
+"""
+
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace as NS
+
+import pytest
+from kubernetes.client.rest import ApiException
+
+from app.services.cluster_overview import ClusterOverviewEngine, normalize_cluster_name
+
+
+def _items(*items):
+    return NS(items=list(items))
+
+
+def _raw(*items):
+    """`_preload_content=False` 응답처럼 원본 JSON 바이트를 돌려줍니다."""
+    body = json.dumps({"kind": "List", "metadata": {}, "items": list(items)}).encode()
+    return NS(data=body, release_conn=lambda: None)
+
+
+def _meta(name, namespace=None):
+    return NS(name=name, namespace=namespace, creation_timestamp=datetime.now(timezone.utc) - timedelta(hours=1))
+
+
+def _raw_meta(name, namespace):
+    created = (datetime.now(timezone.utc) - timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return {"name": name, "namespace": namespace, "creationTimestamp": created}
+
+
+def _pod(name, namespace, phase, *statuses):
+    status = {"phase": phase}
+    if statuses:
+        status["containerStatuses"] = list(statuses)
+    return {"metadata": _raw_meta(name, namespace), "spec": {}, "status": status}
+
+
+def _container(ready=True, restarts=0, waiting_reason=None):
+    state = {"waiting": {"reason": waiting_reason}} if waiting_reason else {"running": {}}
+    return {"name": "app", "ready": ready, "restartCount": restarts, "state": state}
+
+
+class FakeCoreV1:
+    def __init__(self, delay=0.0, forbid_all_namespaces=False):
+        self.delay = delay
+        self.forbid = forbid_all_namespaces
+        self.calls = []
+
+    def _call(self, name):
+        self.calls.append(name)
+        time.sleep(self.delay)
+
+    def list_node(self):
+        self._call("list_node")
+        return _items(NS(metadata=_meta("node-1"), status=NS(conditions=[NS(type="Ready", status="True")])))
+
+    def list_namespace(self):
+        self._call("list_namespace")
+        return _items(NS(metadata=_meta("default")), NS(metadata=_meta("apps")), NS(metadata=_meta("empty")))
+
+    def list_pod_for_all_namespaces(self, _preload_content=True):
+        assert _preload_content is False
+        self._call("list_pod_for_all_namespaces")
+        if self.forbid:
+            raise ApiException(status=403)
+        return _raw(
+            _pod("web-1", "apps", "Running", _container(restarts=12)),
+            _pod("web-2", "apps", "Running", _container(False, 3, "CrashLoopBackOff")),
+            _pod("job-1", "default", "Pending"),
+        )
+
+    def list_namespaced_pod(self, namespace, _preload_content=True):
+        self._call(f"list_namespaced_pod:{namespace}")
+        if namespace == "apps":
+            return _raw(_pod("web-1", "apps", "Running", _container()))
+        return _raw()
+
+    def list_service_for_all_namespaces(self, _preload_content=True):
+        self._call("list_service_for_all_namespaces")
+        return _raw(
+            {"metadata": _raw_meta("web", "apps"), "spec": {"type": "LoadBalancer", "clusterIP": "10.0.0.1"}},
+            {"metadata": _raw_meta("db", "apps"), "spec": {"type": "ClusterIP", "clusterIP": "10.0.0.2"}},
+        )
+
+
+class FakeAppsV1:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+
+    def list_deployment_for_all_namespaces(self, _preload_content=True):
+        self.calls.append("list_deployment_for_all_namespaces")
+        time.sleep(self.delay)
+        return _raw(
+            {"metadata": _raw_meta("web", "apps"), "spec": {"replicas": 2}, "status": {"readyReplicas": 1}},
+            {"metadata": _raw_meta("api", "default"), "spec": {"replicas": 1}, "status": {"readyReplicas": 1}},
+        )
+
+
+def _engine(core, apps, max_age=30.0):
+    return ClusterOverviewEngine(
+        core_v1_factory=lambda: core,
+        apps_v1_factory=lambda: apps,
+        cluster_name_resolver=lambda: "test-cluster",
+        max_age_seconds=max_age,
+    )
+
+
+def test_normalize_cluster_name_strips_uuid_and_index():
+    assert normalize_cluster_name(
+        "nks_kr_contest-cluster-27_69b2edb8-2975-4cb4-9dcb-68e3902a68ec"
+    ) == "nks_kr_contest-cluster"
+
+
+@pytest.mark.asyncio
+async def test_overview_uses_parallel_all_namespace_calls():
+    core, apps = FakeCoreV1(delay=0.1), FakeAppsV1(delay=0.1)
+    start = time.perf_counter()
+    result = await _engine(core, apps).get()
+    elapsed = time.perf_counter() - start
+
+    # 5개 호출이 순차였다면 0.5초 이상 (namespace 목록 후 나머지 동시 실행)
+    assert elapsed < 0.35
+    assert not any(c.startswith("list_namespaced") for c in core.calls)
+
+    summary = result["summary"]
+    assert summary["cluster_name"] == "test-cluster"
+    assert (summary["total_namespaces"], summary["total_deployments"], summary["total_pods"]) == (3, 2, 3)
+    assert summary["running_pods"] == 2
+    assert result["workloads_by_namespace"]["empty"] == {"deployments": 0, "pods": 0}
+    assert result["workloads_by_namespace"]["apps"] == {"deployments": 1, "pods": 2}
+    assert result["critical_issues"]["deployment_warnings"] == [{"namespace": "apps", "name": "web", "ready": "1/2"}]
+    assert [p["name"] for p in result["critical_issues"]["pending_pods"]] == ["job-1"]
+    assert [p["name"] for p in result["critical_issues"]["failed_pods"]] == ["web-2"]
+    assert [p["name"] for p in result["warnings"]["high_restart_pods"]] == ["web-1"]
+    assert result["external_services"]["load_balancer"] == [{"name": "web", "namespace": "apps"}]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_reused_and_concurrent_requests_coalesce():
+    core, apps = FakeCoreV1(delay=0.05), FakeAppsV1()
+    engine = _engine(core, apps)
+
+    results = await asyncio.gather(*[engine.get() for _ in range(5)])
+    assert core.calls.count("list_namespace") == 1
+    assert all(r["snapshot"]["cached"] is False for r in results)
+
+    cached = await engine.get()
+    assert cached["snapshot"]["cached"] is True
+    assert core.calls.count("list_namespace") == 1
+
+    await engine.get(max_age=0)
+    assert core.calls.count("list_namespace") == 2
+
+
+@pytest.mark.asyncio
+async def test_forbidden_all_namespaces_falls_back_per_namespace():
+    core, apps = FakeCoreV1(forbid_all_namespaces=True), FakeAppsV1()
+    result = await _engine(core, apps).get()
+
+    assert {"list_namespaced_pod:default", "list_namespaced_pod:apps", "list_namespaced_pod:empty"} <= set(core.calls)
+    assert result["summary"]["total_pods"] == 1
@@ -0,0 +1,265 @@
+"""
+비용 분석 엔진 테스트
+
+수량 파싱, 워크로드 소유자 환산, 비용/유휴 낭비/최적화 계산, 추세 예측,
+네임스페이스별 캐시와 동시 요청 병합, 5,000개 Pod 분석 시간을 검증합니다.
+"""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace as NS
+
+import pytest
+
+from app.services.commands import _execute_cost_analysis
+from app.services.cost_engine import CostEngine, _selector, analyze_pods, parse_quantity, render_cost_analysis
+
+CPU_PRICE = 16250.0
+MEM_PRICE = 4375.0
+
+
+def _pod(name, namespace, phase="Running", owner=None, requests=None, template_hash=None, init_requests=None):
+    meta = {"name": name, "namespace": namespace}
+    if owner:
+        meta["ownerReferences"] = [{"kind": owner[0], "name": owner[1], "controller": True}]
+    if template_hash:
+        meta["labels"] = {"pod-template-hash": template_hash}
+    spec = {"containers": [{"name": "app", "resources": {"requests": requests} if requests else {}}]}
+    if init_requests:
+        spec["initContainers"] = [{"name": "init", "resources": {"requests": init_requests}}]
+    return {"metadata": meta, "spec": spec, "status": {"phase": phase}}
+
+
+def _vector(samples):
+    return {
+        "status": "success",
+        "data": {"resultType": "vector", "result": [
+            {"metric": {"namespace": ns, "pod": pod}, "value": [0, str(value)]} for (ns, pod), value in samples.items()
+        ]},
+    }
+
+
+def _fixture():
+    items = [
+        _pod("web-7f9c-a", "shop", owner=("ReplicaSet", "web-7f9c"), template_hash="7f9c", requests={"cpu": "1", "memory": "2Gi"}),
+        _pod("web-7f9c-b", "shop", owner=("ReplicaSet", "web-7f9c"), template_hash="7f9c", requests={"cpu": "1000m", "memory": "2048Mi"}),
+        _pod("batch", "shop"),
+        _pod("old", "ops", phase="Succeeded", requests={"cpu": "2", "memory": "4Gi"}),
+    ]
+    cpu = _vector({("shop", "web-7f9c-a"): 0.25, ("shop", "web-7f9c-b"): 0.25, ("shop", "batch"): 0.5, ("ops", "old"): 0})
+    mem = _vector({("shop", "web-7f9c-a"): 512 * 2**20, ("shop", "web-7f9c-b"): 512 * 2**20, ("shop", "batch"): 2**30})
+    return items, cpu, mem
+
+
+def test_parse_quantity_suffixes():
+    assert parse_quantity("500m") == 0.5
+    assert parse_quantity("2") == 2.0
+    assert parse_quantity(3) == 3.0
+    assert parse_quantity("1Gi") == 2**30
+    assert parse_quantity("256Mi") == 256 * 2**20
+    assert parse_quantity("1G") == 1e9
+    assert parse_quantity("1e3") == 1000.0
+    assert parse_quantity("") == 0.0
+    assert parse_quantity("bogus") == 0.0
+
+
+def test_costs_waste_and_optimizations():
+    items, cpu, mem = _fixture()
+    result = analyze_pods(items, cpu, mem, cpu_price=CPU_PRICE, mem_price=MEM_PRICE, min_savings=1000)
+
+    # web: Pod당 1 core × 16,250 + 2GiB × 4,375 = 25,000 / batch: 사용량 과금 0.5 core + 1GiB = 12,500
+    assert result["current_cost"] == 62500
+    assert result["breakdown"] == {"cpu": 40625, "memory": 21875, "idle": 37500}
+    assert result["waste"] == {"monthly": 37500, "ratio": 0.6, "reclaimable": 35000, "pods_without_requests": 1}
+
+    assert result["namespaces"][0] == {
+        "namespace": "shop", "pods": 3, "cost": 62500, "cpu_cost": 40625, "memory_cost": 21875, "waste": 37500,
+    }
+    assert result["namespaces"][1]["cost"] == 0 and result["namespaces"][1]["pods"] == 0
+
+    web = result["workloads"][0]
+    assert (web["kind"], web["name"], web["pods"], web["cost"]) == ("Deployment", "web", 2, 50000)
+    assert [w["name"] for w in result["workloads"]] == ["web", "batch"]
+
+    rightsize, missing = result["optimizations"]
+    assert rightsize["workload"] == "Deployment/web"
+    assert rightsize["cpu_request_cores"] == [1.0, 0.3]
+    assert rightsize["memory_request_mib"] == [2048, 614]
+    assert rightsize["monthly_savings"] == 35000
+    assert missing == {
+        "type": "missing_requests", "pods": 1, "monthly_savings": 0,
+        "description": missing["description"],
+    }
+    assert result["resource_usage"]["pods"] == 3 and result["resource_usage"]["usage_available"] is True
+
+
+def test_without_usage_bills_requests_and_reports_no_waste():
+    items, _, _ = _fixture()
+    result = analyze_pods(items, None, {"status": "error"}, cpu_price=CPU_PRICE, mem_price=MEM_PRICE)
+
+    assert result["current_cost"] == 50000
+    assert result["waste"]["monthly"] == 0
+    assert [o["type"] for o in result["optimizations"]] == ["missing_requests"]
+    assert result["resource_usage"]["usage_available"] is False
+    assert result["forecast"] is None
+
+
+def test_owner_resolution_and_init_containers():
+    items = [
+        _pod("api-1", "a", owner=("ReplicaSet", "api-5d4"), template_hash="5d4", requests={"cpu": "100m"}),
+        _pod("db-0", "a", owner=("StatefulSet", "db"), requests={"cpu": "100m"}, init_requests={"cpu": "2"}),
+        _pod("rs-1", "a", owner=("ReplicaSet", "legacy"), requests={"cpu": "100m"}),
+    ]
+    result = analyze_pods(items, cpu_price=CPU_PRICE, mem_price=MEM_PRICE)
+
+    names = {(w["kind"], w["name"]): w["cost"] for w in result["workloads"]}
+    assert set(names) == {("Deployment", "api"), ("StatefulSet", "db"), ("ReplicaSet", "legacy")}
+    # init 컨테이너 request가 더 크면 그 값이 Pod의 유효 request
+    assert names[("StatefulSet", "db")] == 32500
+
+
+def test_forecast_follows_usage_trend():
+    hours = range(24)
+
+    def matrix(values):
+        return {"status": "success", "data": {"resultType": "matrix", "result": [
+            {"metric": {}, "values": [[1_700_000_000 + h * 3600, str(v / 2)] for h, v in zip(hours, values)]}
+            for _ in range(2)
+        ]}}
+
+    cpu_history = matrix([1 + 0.001 * h for h in hours])
+    mem_history = matrix([2**30 for _ in hours])
+    items, cpu, mem = _fixture()
+    result = analyze_pods(items, cpu, mem, cpu_history, mem_history, cpu_price=CPU_PRICE, mem_price=MEM_PRICE)
+
+    forecast = result["forecast"]
+    assert forecast["samples"] == 24
+    assert forecast["growth"] == pytest.approx(26930 / 21004.375, rel=1e-3)
+
+    response = render_cost_analysis(result, "shop", "forecast")
+    assert response["cost_estimate"]["estimated_cost"] == round(62500 * forecast["growth"])
+    assert "변화 예상" in response["trend"]
+
+
+class FakeCoreV1:
+    def __init__(self, items):
+        self.items = items
+        self.calls = []
+
+    def _raw(self, items):
+        return NS(data=json.dumps({"items": items}).encode(), release_conn=lambda: None)
+
+    def list_namespaced_pod(self, namespace, _preload_content=True):
+        self.calls.append(namespace)
+        time.sleep(0.02)
+        return self._raw([i for i in self.items if i["metadata"]["namespace"] == namespace])
+
+    def list_pod_for_all_namespaces(self, _preload_content=True):
+        self.calls.append("*")
+        return self._raw(self.items)
+
+
+class FakePrometheus:
+    def __init__(self, cpu, mem, fail=False):
+        self.cpu, self.mem, self.fail = cpu, mem, fail
+        self.queries = []
+
+    async def query(self, expr):
+        self.queries.append(expr)
+        if self.fail:
+            raise RuntimeError("prometheus down")
+        return self.cpu if "cpu" in expr else self.mem
+
+    async def query_range(self, expr, start, end, step):
+        return {"status": "success", "data": {"result": []}}
+
+
+@pytest.mark.asyncio
+async def test_engine_coalesces_and_caches_per_namespace():
+    items, cpu, mem = _fixture()
+    core = FakeCoreV1(items)
+    prom = FakePrometheus(cpu, mem)
+    engine = CostEngine(core_v1_factory=lambda: core, prometheus=prom, ttl_seconds=60)
+
+    results = await asyncio.gather(*(engine.analyze("shop") for _ in range(5)))
+    assert core.calls == ["shop"]
+    assert all(r["current_cost"] == 62500 for r in results)
+    assert 'namespace="shop"' in prom.queries[0]
+
+    cached = await engine.analyze("shop")
+    assert cached["snapshot"]["cached"] is True and core.calls == ["shop"]
+
+    await engine.analyze("all")
+    await engine.analyze("shop", force_refresh=True)
+    assert core.calls == ["shop", "*", "shop"]
+
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("namespace", ['shop"} or vector(1) or {x="', "Shop", "a" * 64, "shop\n", "kube system"])
+async def test_engine_rejects_namespaces_that_are_not_dns_labels(namespace):
+    items, cpu, mem = _fixture()
+    core = FakeCoreV1(items)
+    prom = FakePrometheus(cpu, mem)
+    engine = CostEngine(core_v1_factory=lambda: core, prometheus=prom)
+
+    with pytest.raises(ValueError):
+        await engine.analyze(namespace)
+    assert core.calls == [] and prom.queries == []
+
+
+def test_selector_escapes_label_value():
+    assert _selector('a"b\\c') == ', namespace="a\\"b\\\\c"'
+    assert _selector("") == ""
+
+@pytest.mark.asyncio
+async def test_engine_survives_prometheus_failure(monkeypatch):
+    items, cpu, mem = _fixture()
+    engine = CostEngine(core_v1_factory=lambda: FakeCoreV1(items), prometheus=FakePrometheus(cpu, mem, fail=True))
+    monkeypatch.setattr("app.services.commands.get_cost_engine", lambda: engine)
+
+    response = await _execute_cost_analysis({"namespace": "shop", "analysis_type": "optimization"})
+
+    assert response["current_cost"] == 50000
+    assert response["resource_usage"]["usage_available"] is False
+    assert response["cost_estimate"]["currency"] == "KRW"
+    assert response["cost_estimate"]["savings"] == 0
+
+
+def test_analysis_of_5000_pods_under_200ms():
+    items = []
+    cpu_samples, mem_samples = {}, {}
+    for i in range(5000):
+        ns, deploy = f"ns-{i % 50}", f"app-{i % 500}"
+        name = f"{deploy}-6c8d-{i}"
+        items.append({
+            "metadata": {
+                "name": name, "namespace": ns, "labels": {"pod-template-hash": "6c8d"},
+                "ownerReferences": [{"kind": "ReplicaSet", "name": f"{deploy}-6c8d", "controller": True}],
+            },
+            "spec": {"containers": [
+                {"name": "app", "resources": {
+                    "requests": {"cpu": f"{100 + (i % 8) * 50}m", "memory": f"{128 * (1 + i % 4)}Mi"},
+                    "limits": {"cpu": "1", "memory": "1Gi"},
+                }},
+                {"name": "sidecar", "resources": {"requests": {"cpu": "50m", "memory": "64Mi"}}},
+            ]},
+            "status": {"phase": "Running" if i % 10 else "Pending"},
+        })
+        cpu_samples[(ns, name)] = 0.05 + (i % 13) * 0.01
+        mem_samples[(ns, name)] = (64 + i % 200) * 2**20
+    cpu, mem = _vector(cpu_samples), _vector(mem_samples)
+
+    analyze_pods(items, cpu, mem)  # 수량 파싱 캐시 워밍업
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        result = analyze_pods(items, cpu, mem)
+        best = min(best, time.perf_counter() - start)
+
+    print(f"\n5000 pods cost analysis: {best * 1000:.1f}ms")
+    assert result["resource_usage"]["pods"] == 5000
+    assert result["resource_usage"]["workloads"] == 500
+    assert len(result["namespaces"]) == 50
+    assert best < 0.2
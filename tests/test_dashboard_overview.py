@@ -0,0 +1,121 @@
+"""
+대시보드 개요 조립 엔진 테스트
+
+섹션 동시 조회, 섹션별 타임아웃에 따른 부분 응답, 공유 조회 단일 실행,
+사용자별 stale-while-revalidate 캐시를 검증합니다.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services.dashboard_overview import DashboardOverviewBuilder, OverviewSection
+
+
+def _section(name, delay, value, calls=None, timeout=None):
+    async def fetch(ctx):
+        if calls is not None:
+            calls[name] = calls.get(name, 0) + 1
+        await asyncio.sleep(delay)
+        return value
+    return OverviewSection(name, fetch, dict, timeout=timeout)
+
+
+@pytest.mark.asyncio
+async def test_sections_run_concurrently_and_slow_section_degrades():
+    builder = DashboardOverviewBuilder(
+        sections=[
+            _section("a", 0.1, {"v": 1}),
+            _section("b", 0.1, {"v": 2}),
+            _section("slow", 5.0, {"v": 3}, timeout=0.15),
+        ],
+        default_timeout=1.0,
+    )
+    start = time.perf_counter()
+    result = await builder.build({"id": "u1"})
+    elapsed = time.perf_counter() - start
+
+    # 순차 실행이었다면 0.35초 이상
+    assert elapsed < 0.3
+    assert result.data == {"a": {"v": 1}, "b": {"v": 2}, "slow": {}}
+    assert result.partial is True and result.degraded == ["slow"]
+    assert set(result.timings_ms) == {"a", "b", "slow"}
+
+
+@pytest.mark.asyncio
+async def test_shared_lookup_runs_once_per_build():
+    calls = {"repos": 0}
+
+    async def repos():
+        calls["repos"] += 1
+        await asyncio.sleep(0.01)
+        return ["octo/app"]
+
+    async def repositories(ctx):
+        return await ctx.shared("repos", repos)
+
+    async def pull_requests(ctx):
+        return {"count": len(await ctx.shared("repos", repos))}
+
+    builder = DashboardOverviewBuilder(sections=[
+        OverviewSection("repositories", repositories, list),
+        OverviewSection("pull_requests", pull_requests, dict),
+    ])
+    result = await builder.build({"id": "u1"})
+    assert result.data["pull_requests"] == {"count": 1}
+    assert calls["repos"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate_per_user():
+    calls = {}
+    builder = DashboardOverviewBuilder(
+        sections=[_section("a", 0.0, {"v": 1}, calls)],
+        ttl_seconds=0.05,
+        stale_seconds=10,
+    )
+    _, status1 = await builder.get({"id": "u1"})
+    _, status2 = await builder.get({"id": "u1"})
+    assert (status1, status2) == ("miss", "hit")
+
+    # 다른 사용자는 별도 캐시
+    _, other = await builder.get({"id": "u2"})
+    assert other == "miss"
+
+    await asyncio.sleep(0.06)
+    _, status3 = await builder.get({"id": "u1"})
+    assert status3 == "stale"
+    await asyncio.sleep(0.01)  # 백그라운드 재검증 완료 대기
+    _, status4 = await builder.get({"id": "u1"})
+    assert status4 == "hit"
+    assert calls["a"] == 3
+
+
+@pytest.mark.asyncio
+async def test_db_sections_run_off_the_event_loop(monkeypatch):
+    import threading
+
+    from app.api.v1 import dashboard, deployment_histories
+    from app.services.dashboard_overview import OverviewContext
+
+    threads = []
+
+    def repositories(db, user_id):
+        threads.append(threading.current_thread())
+        return [{"id": "1", "name": "app", "fullName": "octo/app"}]
+
+    def latest(db, user_id):
+        threads.append(threading.current_thread())
+        return [{"full_name": "octo/app", "latest_deployment": {"status": "success", "image": {"tag": "v1"}}}]
+
+    monkeypatch.setattr(dashboard, "list_user_repositories", repositories)
+    monkeypatch.setattr(deployment_histories, "collect_latest_deployments", latest)
+
+    ctx = OverviewContext({"id": "u1"})
+    repos = await dashboard._fetch_connected_repositories(ctx)
+    recent = await dashboard._fetch_recent_deployments(ctx)
+
+    assert [r.fullName for r in repos] == ["octo/app"]
+    assert [(d.name, d.version, d.status) for d in recent] == [("octo/app", "v1", "success")]
+    assert threads and threading.main_thread() not in threads
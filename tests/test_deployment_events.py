@@ -0,0 +1,200 @@
+"""
+배포 이벤트 저장소 테스트
+
+링 버퍼 상한과 단조 event_id, last_event_id 이후 재생, 연속 진행률 압축,
+완료 배포 TTL 제거, Redis Streams 경로와 연결 실패 시 메모리 대체, 매니저 재연결 재생을 검증합니다.
+"""
+
+import json
+
+import pytest
+from fastapi.websockets import WebSocketState
+
+from app.services.deployment_events import MemoryEventStore, RedisEventStore
+from app.websocket.deployment_monitor import DeploymentMonitorManager
+
+
+class Clock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _progress(stage, pct):
+    return {"type": "stage_progress", "stage": stage, "progress": pct}
+
+
+@pytest.mark.asyncio
+async def test_ring_buffer_keeps_latest_events_with_monotonic_ids():
+    store = MemoryEventStore(max_events=5, completed_ttl=60)
+    ids = [await store.append("d1", {"type": "log", "n": i}) for i in range(8)]
+
+    assert [int(i) for i in ids] == sorted(int(i) for i in ids)
+    events = await store.read("d1")
+    assert [e["n"] for e in events] == [3, 4, 5, 6, 7]
+    assert [e["event_id"] for e in events] == ids[3:]
+
+    # 재연결: 마지막으로 받은 ID 이후만
+    assert [e["n"] for e in await store.read("d1", after=ids[5])] == [6, 7]
+    assert await store.read("d1", after=ids[-1]) == []
+    assert await store.read("unknown") == []
+
+
+@pytest.mark.asyncio
+async def test_consecutive_progress_is_compacted():
+    store = MemoryEventStore(max_events=50, completed_ttl=60)
+    await store.append("d1", {"type": "stage_started", "stage": "build"})
+    for pct in (10, 40, 80):
+        await store.append("d1", _progress("build", pct))
+    await store.append("d1", {"type": "stage_completed", "stage": "build"})
+    await store.append("d1", _progress("deploy", 5))
+    last = await store.append("d1", _progress("deploy", 50))
+
+    events = await store.read("d1")
+    assert [(e["type"], e.get("progress")) for e in events] == [
+        ("stage_started", None), ("stage_progress", 80), ("stage_completed", None), ("stage_progress", 50),
+    ]
+    assert events[-1]["event_id"] == last
+
+
+@pytest.mark.asyncio
+async def test_completed_deployments_expire_and_active_ones_are_capped():
+    clock = Clock()
+    store = MemoryEventStore(max_events=10, completed_ttl=30, max_deployments=3, clock=clock)
+    await store.append("done", {"type": "deployment_started"})
+    await store.append("done", {"type": "deployment_completed", "status": "success"})
+    await store.append("running", {"type": "deployment_started"})
+
+    clock.now = 29
+    assert len(await store.read("done")) == 2
+    clock.now = 31
+    assert await store.read("done") == []
+    assert len(await store.read("running")) == 1
+
+    for name in ("a", "b", "c"):
+        await store.append(name, {"type": "deployment_started"})
+    # 가장 오래 갱신되지 않은 배포부터 제거
+    assert await store.read("running") == []
+    assert store.stats()["deployments"] == 3
+
+
+class FakeStreams:
+    """XADD/XDEL/XRANGE/EXPIRE만 흉내 내는 Redis Streams"""
+
+    def __init__(self):
+        self.streams = {}
+        self.ttl = {}
+        self.seq = 0
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def xrange(self, key, min="-", max="+"):
+        entries = self.streams.get(key, [])
+        if min.startswith("("):
+            after = tuple(int(p) for p in min[1:].split("-"))
+            entries = [e for e in entries if tuple(int(p) for p in e[0].split("-")) > after]
+        return list(entries)
+
+    async def expire(self, key, seconds):
+        self.ttl[key] = seconds
+        return True
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def xdel(self, key, event_id):
+        self.ops.append(lambda: self._xdel(key, event_id))
+
+    def xadd(self, key, fields, maxlen=None, approximate=True):
+        self.ops.append(lambda: self._xadd(key, fields, maxlen))
+
+    def expire(self, key, seconds):
+        self.ops.append(lambda: self.redis.ttl.__setitem__(key, seconds) or True)
+
+    def _xdel(self, key, event_id):
+        entries = self.redis.streams.get(key, [])
+        self.redis.streams[key] = [e for e in entries if e[0] != event_id]
+        return len(entries) - len(self.redis.streams[key])
+
+    def _xadd(self, key, fields, maxlen):
+        self.redis.seq += 1
+        event_id = f"1700000000000-{self.redis.seq}"
+        entries = self.redis.streams.setdefault(key, [])
+        entries.append((event_id, dict(fields)))
+        if maxlen:
+            del entries[:-maxlen]
+        return event_id
+
+    async def execute(self):
+        return [op() for op in self.ops]
+
+
+@pytest.mark.asyncio
+async def test_redis_streams_backend_replays_and_sets_ttl():
+    redis = FakeStreams()
+    store = RedisEventStore(max_events=100, completed_ttl=600, active_ttl=86400, redis_factory=lambda: redis)
+
+    first = await store.append("42", {"type": "deployment_started"})
+    await store.append("42", _progress("build", 10))
+    await store.append("42", _progress("build", 90))
+    assert redis.ttl["deploy:events:42"] == 86400
+    done = await store.append("42", {"type": "deployment_completed", "status": "success"})
+    assert redis.ttl["deploy:events:42"] == 600
+
+    events = await store.read("42")
+    assert [e["type"] for e in events] == ["deployment_started", "stage_progress", "deployment_completed"]
+    assert events[1]["progress"] == 90
+    assert json.loads(redis.streams["deploy:events:42"][0][1]["e"])["type"] == "deployment_started"
+    assert [e["event_id"] for e in await store.read("42", after=first)][-1] == done
+
+
+@pytest.mark.asyncio
+async def test_redis_unavailable_falls_back_to_memory():
+    store = RedisEventStore(max_events=10, completed_ttl=60, redis_factory=lambda: None)
+    await store.append("7", {"type": "deployment_started"})
+    assert [e["type"] for e in await store.read("7")] == ["deployment_started"]
+    assert store.stats()["fallback"]["deployments"] == 1
+
+
+class FakeWebSocket:
+    client_state = WebSocketState.CONNECTED
+
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        self.sent.append(json.loads(text))
+
+
+@pytest.mark.asyncio
+async def test_manager_resumes_from_last_event_id():
+    manager = DeploymentMonitorManager()
+    manager.event_store = MemoryEventStore(max_events=50, completed_ttl=60)
+
+    await manager.send_deployment_started("9", "u1", {"repo": "org/app"})
+    await manager.send_stage_progress("9", "u1", "build", 30, 1)
+    await manager.send_stage_progress("9", "u1", "build", 60, 2)
+    events = await manager.event_store.read("9")
+    seen = events[0]["event_id"]
+    await manager.send_stage_completed("9", "u1", "build", "success", {"duration": 5})
+
+    ws = FakeWebSocket()
+    await manager.connect(ws, "conn-1")
+    await manager.handle_message("conn-1", {
+        "type": "subscribe", "subscriber_id": "s1", "deployment_id": "9", "last_event_id": seen,
+    })
+
+    assert [(m["type"], m.get("progress")) for m in ws.sent] == [("stage_progress", 60), ("stage_completed", None)]
+    assert all(m["event_id"] for m in ws.sent)
+
+    await manager.send_deployment_completed("9", "u1", "success", {"total_duration": 10})
+    assert "9" not in manager.stage_started_at
@@ -0,0 +1,136 @@
+"""
+로컬 의도 파서(fast path) 테스트
+
+자주 쓰는 한국어/영어 조회 명령의 해석, 모호하거나 변경 작업인 입력의 LLM 위임,
+command_history 라벨 코퍼스 기반 정확도/지연 시간 벤치마크를 검증합니다.
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.llm.fast_intent import FastIntentParser, FastPathLLMClient, interpret_locally
+from app.llm.intent_benchmark import evaluate, load_history_corpus
+from app.llm.interfaces import LLMClient
+from app.models.base import Base
+from app.models.command_history import CommandHistory
+
+parser = FastIntentParser()
+
+
+@pytest.mark.parametrize("text, command, entities", [
+    ("파드 목록 보여줘", "list_pods", {"namespace": "default"}),
+    ("kube-system 네임스페이스의 파드들을 보여주세요", "list_pods", {"namespace": "kube-system"}),
+    ("list pods in namespace kube-system", "list_pods", {"namespace": "kube-system"}),
+    ("show all deployments -n prod", "list_deployments", {"namespace": "prod"}),
+    ("모든 서비스 조회해줘", "list_services", {"namespace": "default"}),
+    ("전체 도메인 보여줘", "list_ingresses", {}),
+    ("list namespaces", "list_namespaces", {}),
+    ("엔드포인트 목록", "list_endpoints", {"namespace": "default"}),
+    ("클러스터 상태 알려줘", "overview", {"namespace": "default"}),
+    ("cluster overview", "overview", {"namespace": "default"}),
+    ("web-1 파드 상태", "status", {"pod_name": "web-1", "resource_type": "pod", "namespace": "default"}),
+    ("deployment api 상태", "status", {"deployment_name": "api", "resource_type": "deployment", "namespace": "default"}),
+])
+def test_unambiguous_commands_are_parsed_locally(text, command, entities):
+    match = parser.match(text)
+    assert match is not None and match.confidence == 1.0
+    assert (match.command, match.entities) == (command, entities)
+
+
+def test_logs_entities_lines_and_previous():
+    match = parser.match("show last 500 lines of previous logs for api-2 -n prod")
+    assert match.command == "logs"
+    assert match.entities == {
+        "pod_name": "api-2", "namespace": "prod", "lines": 100, "previous": True,
+        "all_pods": False, "grep": "", "level": "",
+    }
+    assert parser.match("web-1 로그 50줄").entities["lines"] == 50
+
+
+@pytest.mark.parametrize("text", [
+    "web 배포해줘",
+    "K-Le-PaaS/test01 3개로 스케일링",
+    "nginx 파드 목록",  # 라벨 필터인지 이름인지 모호
+    "파드 상태",  # 대상 이름 없음
+    "api 로그랑 web 로그",  # 이름이 둘
+    "비용 분석해줘",
+])
+def test_ambiguous_or_mutating_commands_go_to_llm(text):
+    assert parser.match(text) is None
+
+
+def test_unexplained_tokens_lower_confidence():
+    assert parser.match("파드 목록 빨리 좀 보여줘 제발").confidence < 0.85
+
+
+class RecordingLLM(LLMClient):
+    def __init__(self):
+        self.prompts = []
+
+    async def interpret(self, prompt, user_id="default", project_name="default"):
+        self.prompts.append(prompt)
+        return {"intent": "deploy", "entities": {}, "message": "llm"}
+
+
+@pytest.mark.asyncio
+async def test_fast_path_client_skips_llm_for_confident_matches():
+    llm = RecordingLLM()
+    client = FastPathLLMClient(llm)
+
+    local = await client.interpret("파드 목록 보여줘")
+    assert local["intent"] == "list_pods" and local["llm"]["mode"] == "fast_path"
+    assert local["message"] == "파드 목록 조회 명령을 해석했습니다."
+    assert llm.prompts == []
+
+    delegated = await client.interpret("K-Le-PaaS/test01 배포해줘")
+    assert delegated["message"] == "llm" and llm.prompts == ["K-Le-PaaS/test01 배포해줘"]
+
+
+def test_sessions_with_pending_state_skip_the_local_parser():
+    assert interpret_locally("파드 목록 보여줘", session={"pending_action": None, "context": {}})["intent"] == "list_pods"
+    # 확인 대기 중인 작업이나 직전 저장소 컨텍스트가 있으면 LLM이 컨텍스트와 함께 해석
+    assert interpret_locally("파드 목록 보여줘", session={"pending_action": {"command": "deploy"}, "context": {}}) is None
+    assert interpret_locally(
+        "파드 목록 보여줘", session={"context": {"github_owner": "octo", "github_repo": "app"}}
+    ) is None
+
+
+def test_benchmark_against_labeled_history_corpus():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    labeled = [
+        ("파드 목록 보여줘", "list_pods", {"namespace": "default"}),
+        ("default 네임스페이스 서비스 목록", "list_services", {"namespace": "default"}),
+        ("web-1 로그 30줄", "logs", {"pod_name": "web-1", "lines": 30}),
+        ("클러스터 현황", "overview", {}),
+        ("K-Le-PaaS/test01 배포해줘", "deploy", {"github_owner": "K-Le-PaaS"}),
+        ("test01 앱 상태 좀 확인해줄래?", "status", {"pod_name": "test01"}),
+        ("파드 목록 보여줘", "list_pods", {"namespace": "default"}),  # 중복
+        ("알 수 없는 말", "unknown", {}),
+    ]
+    db.add_all([
+        CommandHistory(
+            command_text=text, tool="nlp_process", status="completed",
+            args={"intent": intent, "entities": entities, "provider": "gemini" if i % 2 else None},
+        )
+        for i, (text, intent, entities) in enumerate(labeled)
+    ])
+    # 로컬 파서가 처리한 행은 파서 자신의 출력이므로 코퍼스에서 제외
+    db.add(CommandHistory(
+        command_text="서비스 목록", tool="nlp_process", status="completed",
+        args={"intent": "list_services", "entities": {}, "provider": "local"},
+    ))
+    db.commit()
+
+    corpus = load_history_corpus(db)
+    report = evaluate(corpus, repeat=20)
+    db.close()
+
+    assert report["total"] == 6
+    assert report["local_hits"] == 4 and report["accuracy"] == 1.0
+    assert report["mismatches"] == []
+    # LLM 왕복(수백 ms)과 비교해 로컬 파싱은 마이크로초 단위
+    assert report["latency_us"]["p50"] < 500
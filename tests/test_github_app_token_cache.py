@@ -0,0 +1,117 @@
+"""
+GitHub App 설치 토큰 캐시 테스트
+
+레플리카 간 Redis 공유, 실제 expires_at 기반 조기 갱신, 동시 갱신 단일화,
+App JWT 메모이즈를 검증합니다.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from app.services import github_app as github_app_module
+from app.services.github_app import GitHubAppAuth
+from app.services.github_client import GitHubResponse
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def delete(self, key):
+        self.store.pop(key, None)
+
+
+@pytest.fixture
+def private_key_pem():
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+
+@pytest.fixture
+def fake_github(monkeypatch, private_key_pem):
+    redis = FakeRedis()
+    calls = {"count": 0, "expires_in": 3600}
+
+    async def fake_request(method, path, token=None, **kwargs):
+        calls["count"] += 1
+        await asyncio.sleep(0.01)
+        expires = datetime.fromtimestamp(time.time() + calls["expires_in"], tz=timezone.utc)
+        return GitHubResponse(201, {
+            "token": f"ghs_{calls['count']}",
+            "expires_at": expires.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        })
+
+    monkeypatch.setattr(github_app_module, "get_async_redis", lambda: redis)
+    monkeypatch.setattr(github_app_module.github_client, "request", fake_request)
+
+    def make_auth():
+        auth = GitHubAppAuth()
+        auth.settings = auth.settings.model_copy(update={
+            "github_app_id": "123",
+            "github_app_private_key": private_key_pem,
+            "github_token_refresh_margin": 300,
+        })
+        return auth
+
+    return make_auth, calls, redis
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refresh_is_single_flighted(fake_github):
+    make_auth, calls, _ = fake_github
+    auth = make_auth()
+    tokens = await asyncio.gather(*[auth.get_installation_token("42") for _ in range(10)])
+    assert set(tokens) == {"ghs_1"}
+    assert calls["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_token_is_shared_across_replicas(fake_github):
+    make_auth, calls, redis = fake_github
+    replica_a, replica_b = make_auth(), make_auth()
+    assert await replica_a.get_installation_token("42") == "ghs_1"
+    assert await replica_b.get_installation_token("42") == "ghs_1"
+    assert calls["count"] == 1
+    assert any(key.endswith(":42") for key in redis.store)
+
+
+@pytest.mark.asyncio
+async def test_refreshes_early_using_real_expiry(fake_github):
+    make_auth, calls, redis = fake_github
+    # GitHub이 곧 만료되는 토큰을 반환 → 여유 시간(300초) 안쪽이므로 다음 호출에서 재발급
+    calls["expires_in"] = 200
+    auth = make_auth()
+    assert await auth.get_installation_token("42") == "ghs_1"
+    assert await auth.get_installation_token("42") == "ghs_2"
+    assert calls["count"] == 2
+    # 만료가 임박한 토큰은 Redis에 공유하지 않음
+    assert not any(key.endswith(":42") for key in redis.store)
+
+
+def test_app_jwt_is_memoized(fake_github):
+    make_auth, _, _ = fake_github
+    auth = make_auth()
+    first = auth.generate_jwt()
+    assert auth.generate_jwt() is first
+    # 만료 1분 이내면 새로 서명
+    auth._app_jwt_expires_at = time.time() + 30
+    auth.generate_jwt()
+    assert auth._app_jwt_expires_at > time.time() + 60
@@ -0,0 +1,153 @@
+"""
+공유 GitHub REST 클라이언트 테스트
+
+ETag 조건부 요청, 동일 요청 병합, rate limit 잔여량 처리를 검증합니다.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.github_client import GitHubRateLimitError, GitHubRestClient
+
+
+def _make_client(handler, **kwargs):
+    return GitHubRestClient(base_url="https://api.github.test", transport=httpx.MockTransport(handler), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_etag_revalidation_serves_304_from_cache():
+    seen_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"x-ratelimit-remaining": "4999"})
+        return httpx.Response(200, json=[{"number": 1}], headers={"etag": '"v1"', "x-ratelimit-remaining": "4999"})
+
+    client = _make_client(handler)
+    first = await client.get("/repos/o/r/pulls", token="t", endpoint="pulls")
+    second = await client.get("/repos/o/r/pulls", token="t", endpoint="pulls")
+
+    assert first.json() == [{"number": 1}] and first.from_cache is False
+    assert second.json() == [{"number": 1}] and second.from_cache is True
+    assert seen_headers == [None, '"v1"']
+    stats = client.stats()["pulls"]
+    assert stats["requests"] == 2 and stats["not_modified"] == 1
+    assert stats["hit_rate"] == 0.5
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_identical_inflight_requests_are_coalesced():
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"ok": True})
+
+    client = _make_client(handler)
+    results = await asyncio.gather(*[client.get("/installation/repositories", token="t") for _ in range(5)])
+
+    assert calls == 1
+    assert all(r.json() == {"ok": True} for r in results)
+    assert client.stats()["/installation/repositories"]["coalesced"] == 4
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_exhausted_rate_limit_uses_cache_or_raises():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={"id": 1},
+            headers={"etag": '"a"', "x-ratelimit-remaining": "0", "x-ratelimit-reset": "9999999999"},
+        )
+
+    client = _make_client(handler, rate_limit_floor=10)
+    await client.get("/repos/o/r", token="t")
+
+    # 잔여량 바닥 → 재검증 없이 캐시 응답
+    cached = await client.get("/repos/o/r", token="t")
+    assert cached.from_cache is True
+
+    # 캐시가 없는 경로는 호출하지 않고 오류
+    with pytest.raises(GitHubRateLimitError):
+        await client.get("/repos/o/other", token="t")
+
+    # 다른 토큰은 별도 예산
+    other = await client.get("/repos/o/other", token="t2")
+    assert other.status_code == 200
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_coalesced_waiters():
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(200, json={"ok": True})
+
+    client = _make_client(handler)
+    leader = asyncio.create_task(client.get("/repos/o/r", token="t"))
+    await asyncio.sleep(0.01)
+    waiter = asyncio.create_task(client.get("/repos/o/r", token="t"))
+    await asyncio.sleep(0.01)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    assert (await waiter).json() == {"ok": True}
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_pull_request_fanout_is_bounded(monkeypatch):
+    from app.api.v1 import github_workflows
+    from app.core.config import get_settings
+
+    active = peak = 0
+
+    async def tracked(result):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.005)
+        active -= 1
+        return result
+
+    class FakeClient:
+        async def get(self, path, token=None, endpoint=None):
+            prs = [{"id": n, "number": n, "title": "t", "user": {"login": "u"}, "state": "open",
+                    "head": {"ref": "f"}, "base": {"ref": "main"}, "created_at": "", "html_url": ""}
+                   for n in range(10)]
+            return await tracked(httpx.Response(200, json=prs))
+
+    async def repositories(db, user_id):
+        return [{"fullName": f"o/r{i}"} for i in range(10)]
+
+    async def installations():
+        return [{"id": 1}]
+
+    async def installation_token(installation_id):
+        return "t"
+
+    async def ci_status(token, full_name, number):
+        return await tracked("success")
+
+    monkeypatch.setattr(github_workflows, "get_user_repositories", repositories)
+    monkeypatch.setattr(github_workflows.github_app_auth, "get_app_installations", installations)
+    monkeypatch.setattr(github_workflows.github_app_auth, "get_installation_token", installation_token)
+    monkeypatch.setattr(github_workflows, "github_client", FakeClient())
+    monkeypatch.setattr(github_workflows, "get_pr_ci_status", ci_status)
+    monkeypatch.setattr(get_settings(), "github_fanout_concurrency", 4)
+
+    result = await github_workflows.get_pull_requests(db=None, current_user={"id": "u"})
+    assert result["count"] == 100
+    assert peak <= 4
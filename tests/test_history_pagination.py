@@ -0,0 +1,208 @@
+"""
+히스토리 목록 키셋 페이지네이션 테스트
+
+(started_at, id) 커서로 전체 행을 중복/누락 없이 순회하는지, 필드 선택 시
+큰 Text 컬럼을 로드하지 않는지, 깊은 페이지 조회 시간이 깊이와 무관한지 검증합니다.
+"""
+
+import statistics
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.pagination import InvalidCursorError, decode_cursor, encode_cursor, keyset_page, offset_page
+from app.models.base import Base
+from app.models.command_history import CommandHistory
+from app.models.deployment_history import DeploymentHistory
+from app.services.command_history import get_command_history_page
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _seed_deployments(db, count, user_id="u1"):
+    base = datetime(2026, 1, 1)
+    db.bulk_insert_mappings(DeploymentHistory, [
+        {
+            "user_id": user_id,
+            "github_owner": "octo",
+            "github_repo": "app",
+            "status": "success",
+            "operation_type": "deploy",
+            # 3건씩 같은 started_at → id로 순서가 결정되어야 함
+            "started_at": base + timedelta(seconds=i // 3),
+            "error_message": "boom" * 10,
+            "webhook_payload": "{}" * 2000,
+        }
+        for i in range(count)
+    ])
+    db.commit()
+
+
+def _deploy_query(db, user_id="u1"):
+    return db.query(DeploymentHistory).filter(
+        DeploymentHistory.user_id == user_id,
+        DeploymentHistory.operation_type == "deploy",
+    )
+
+
+def test_cursor_roundtrip_and_invalid_cursor():
+    ts = datetime(2026, 10, 18, 12, 30, 1, 500)
+    assert decode_cursor(encode_cursor(ts, 42)) == (ts, 42)
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not-a-cursor")
+
+
+def test_keyset_pages_cover_all_rows_once_with_timestamp_ties(db):
+    _seed_deployments(db, 25)
+    seen, cursor = [], None
+    while True:
+        rows, cursor = keyset_page(
+            _deploy_query(db), DeploymentHistory.started_at, DeploymentHistory.id, 7, cursor
+        )
+        seen.extend(row.id for row in rows)
+        if cursor is None:
+            break
+
+    assert len(seen) == 25 and len(set(seen)) == 25
+    ordered = db.query(DeploymentHistory).order_by(
+        DeploymentHistory.started_at.desc(), DeploymentHistory.id.desc()
+    ).all()
+    assert seen == [row.id for row in ordered]
+
+
+def test_field_projection_skips_large_columns(db, engine):
+    _seed_deployments(db, 3)
+    db.expire_all()
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    rows = _deploy_query(db).options(DeploymentHistory.list_load_options(["id", "status"])).all()
+    payload = [row.to_dict(["id", "status"]) for row in rows]
+
+    assert len(statements) == 1
+    assert "webhook_payload" not in statements[0] and "error_message" not in statements[0]
+    assert set(payload[0]) == {"id", "status"}
+    assert {"webhook_payload", "error_message"} <= inspect(rows[0]).unloaded
+
+
+def test_full_projection_still_defers_webhook_payload(db):
+    _seed_deployments(db, 1)
+    db.expire_all()
+    row = _deploy_query(db).options(DeploymentHistory.list_load_options()).one()
+    data = row.to_dict()
+    assert data["error"] == {"message": "boom" * 10, "stage": None}
+    assert "webhook_payload" in inspect(row).unloaded
+
+
+
+def test_plain_query_defers_large_text_columns(db):
+    _seed_deployments(db, 1)
+    db.expire_all()
+    row = _deploy_query(db).one()
+    assert {"webhook_payload", "error_message"} <= inspect(row).unloaded
+    assert row.error_message == "boom" * 10
+
+
+def test_offset_page_returns_cursor_continuing_after_last_row(db):
+    _seed_deployments(db, 7)
+    ts, id_ = DeploymentHistory.started_at, DeploymentHistory.id
+
+    rows, next_cursor = offset_page(_deploy_query(db), ts, id_, 3, 2)
+    assert next_cursor == encode_cursor(rows[-1].started_at, rows[-1].id)
+
+    rest, end_cursor = keyset_page(_deploy_query(db), ts, id_, 10, next_cursor)
+    everything = _deploy_query(db).order_by(ts.desc(), id_.desc()).all()
+    assert [r.id for r in rows + rest] == [r.id for r in everything[2:]]
+    assert end_cursor is None
+
+    last_rows, last_cursor = offset_page(_deploy_query(db), ts, id_, 3, 4)
+    assert len(last_rows) == 3 and last_cursor is None
+
+@pytest.mark.asyncio
+async def test_command_history_filters_tool_before_paging(db):
+    base = datetime(2026, 1, 1)
+    for i in range(10):
+        db.add(CommandHistory(
+            command_text=f"cmd {i}",
+            tool="user_message" if i % 2 == 0 else "assistant",
+            args={},
+            status="success",
+            user_id="u1",
+            created_at=base + timedelta(minutes=i),
+        ))
+    db.commit()
+
+    first, cursor = await get_command_history_page(db, "u1", limit=3, tool="user_message")
+    second, last_cursor = await get_command_history_page(db, "u1", limit=3, cursor=cursor, tool="user_message")
+
+    assert [c.command_text for c in first] == ["cmd 8", "cmd 6", "cmd 4"]
+    assert [c.command_text for c in second] == ["cmd 2", "cmd 0"]
+    assert last_cursor is None
+
+
+def _median_ms(fn, repeat=15):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def test_benchmark_deep_keyset_page_is_constant_time(db):
+    """
+    20,000건에서 마지막 근처 페이지 조회 시간을 비교합니다.
+
+    OFFSET은 건너뛴 행 수에 비례해 느려지지만 키셋은 첫 페이지와 비슷해야 합니다.
+    """
+    total, limit = 20_000, 20
+    _seed_deployments(db, total)
+    options = DeploymentHistory.list_load_options()
+
+    # 깊은 페이지 커서: 끝에서 두 번째 페이지 직전 행
+    anchor = _deploy_query(db).order_by(
+        DeploymentHistory.started_at.desc(), DeploymentHistory.id.desc()
+    ).offset(total - 2 * limit - 1).first()
+    deep_cursor = encode_cursor(anchor.started_at, anchor.id)
+
+    def keyset(cursor):
+        db.expunge_all()
+        rows, _ = keyset_page(
+            _deploy_query(db).options(options), DeploymentHistory.started_at, DeploymentHistory.id, limit, cursor
+        )
+        assert len(rows) == limit
+
+    def deep_offset():
+        db.expunge_all()
+        rows = _deploy_query(db).options(options).order_by(
+            DeploymentHistory.started_at.desc(), DeploymentHistory.id.desc()
+        ).offset(total - 2 * limit).limit(limit).all()
+        assert len(rows) == limit
+
+    first_ms = _median_ms(lambda: keyset(None))
+    deep_keyset_ms = _median_ms(lambda: keyset(deep_cursor))
+    deep_offset_ms = _median_ms(deep_offset)
+    print(f"\nfirst={first_ms:.2f}ms deep_keyset={deep_keyset_ms:.2f}ms deep_offset={deep_offset_ms:.2f}ms")
+
+    assert deep_keyset_ms < deep_offset_ms
+    assert deep_keyset_ms < first_ms * 3 + 2.0
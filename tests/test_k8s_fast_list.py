@@ -0,0 +1,205 @@
+"""
+Kubernetes LIST 고속 경로 테스트
+
+원본 JSON 파싱 결과가 모델 객체 경로와 같은 포맷 결과를 내는지,
+continue 토큰 전달, 그리고 1,000개 Pod 목록에서의 CPU/메모리 비교(slow)를 검증합니다.
+"""
+
+import json
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace as NS
+
+import pytest
+from kubernetes.client import ApiClient
+
+from app.services.commands import _format_pod_statuses
+from app.services.k8s_fast_list import (
+    DeploymentRecord,
+    ServiceRecord,
+    deployment_summary,
+    list_deployments,
+    list_pods,
+    list_services,
+    service_summary,
+)
+
+
+def _pod_json(i):
+    created = datetime(2026, 10, 1, tzinfo=timezone.utc) + timedelta(minutes=i)
+    crashing = i % 7 == 0
+    return {
+        "metadata": {
+            "name": f"web-{i}",
+            "namespace": f"ns-{i % 20}",
+            "uid": f"uid-{i}",
+            "resourceVersion": str(1000 + i),
+            "creationTimestamp": created.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "labels": {"app": "web", "pod-template-hash": "abc123"},
+            "ownerReferences": [{"apiVersion": "apps/v1", "kind": "ReplicaSet", "name": "web-abc123", "uid": "rs"}],
+        },
+        "spec": {
+            "nodeName": f"node-{i % 5}",
+            "containers": [
+                {
+                    "name": "app",
+                    "image": "registry/web:1.0",
+                    "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+                    "env": [{"name": f"VAR_{k}", "value": "x" * 20} for k in range(8)],
+                    "resources": {"limits": {"cpu": "500m", "memory": "256Mi"}},
+                },
+                {"name": "proxy", "image": "registry/proxy:2.0"},
+            ],
+        },
+        "status": {
+            "phase": "Running",
+            "podIP": "10.0.0.1",
+            "conditions": [{"type": "Ready", "status": "False" if crashing else "True"}],
+            "containerStatuses": [
+                {
+                    "name": "app", "image": "registry/web:1.0", "imageID": "sha", "ready": not crashing,
+                    "restartCount": 3 if crashing else 0,
+                    "state": (
+                        {"waiting": {"reason": "CrashLoopBackOff", "message": "back-off restarting"}}
+                        if crashing else {"running": {"startedAt": "2026-10-01T00:00:00Z"}}
+                    ),
+                },
+                {
+                    "name": "proxy", "image": "registry/proxy:2.0", "imageID": "sha", "ready": True,
+                    "restartCount": 1, "state": {"running": {"startedAt": "2026-10-01T00:00:00Z"}},
+                },
+            ],
+        },
+    }
+
+
+def _body(items, continue_token=None):
+    meta = {"resourceVersion": "1"}
+    if continue_token:
+        meta["continue"] = continue_token
+    return json.dumps({"kind": "PodList", "apiVersion": "v1", "metadata": meta, "items": items}).encode()
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+        self.released = False
+
+    def release_conn(self):
+        self.released = True
+
+
+class FakeApi:
+    def __init__(self, body):
+        self.body = body
+        self.calls = []
+
+    def _respond(self, name, kwargs):
+        self.calls.append((name, kwargs))
+        return FakeResponse(self.body)
+
+    def list_namespaced_pod(self, **kwargs):
+        return self._respond("list_namespaced_pod", kwargs)
+
+    def list_pod_for_all_namespaces(self, **kwargs):
+        return self._respond("list_pod_for_all_namespaces", kwargs)
+
+    def list_deployment_for_all_namespaces(self, **kwargs):
+        return self._respond("list_deployment_for_all_namespaces", kwargs)
+
+    def list_namespaced_service(self, **kwargs):
+        return self._respond("list_namespaced_service", kwargs)
+
+
+def _model_list(body, kind):
+    return ApiClient().deserialize(NS(data=body), kind)
+
+
+def test_pod_records_format_like_model_objects():
+    body = _body([_pod_json(i) for i in range(30)])
+    api = FakeApi(body)
+
+    fast = list_pods(api, "default", label_selector="app=web", limit=10, continue_token="tok")
+    model = _model_list(body, "V1PodList")
+
+    assert api.calls == [("list_namespaced_pod", {
+        "namespace": "default", "_preload_content": False,
+        "label_selector": "app=web", "limit": 10, "_continue": "tok",
+    })]
+    for flags in ({}, {"include_labels": False, "include_creation_time": False, "include_namespace": True, "include_age": True}):
+        assert _format_pod_statuses(fast.items, **flags) == _format_pod_statuses(model.items, **flags)
+
+    crashing = _format_pod_statuses(fast.items[:1])[0]
+    assert crashing["ready"] == "1/2" and crashing["restarts"] == 4
+    assert (crashing["problem_reason"], crashing["problem_message"]) == ("CrashLoopBackOff", "back-off restarting")
+    assert fast.items[0].crash_looping is True and fast.items[1].crash_looping is False
+
+
+def test_deployment_and_service_records_and_continue_token():
+    deployment = {
+        "metadata": {"name": "web", "namespace": "apps", "creationTimestamp": "2026-10-01T00:00:00Z"},
+        "spec": {"replicas": 3, "selector": {"matchLabels": {"app": "web"}}, "template": {"spec": {"containers": [{"name": "app", "image": "web:1"}]}}},
+        "status": {"replicas": 3, "readyReplicas": 2, "availableReplicas": 2},
+    }
+    service = {
+        "metadata": {"name": "web", "namespace": "apps", "creationTimestamp": "2026-10-01T00:00:00Z"},
+        "spec": {"type": "NodePort", "clusterIP": "10.0.0.9",
+                 "ports": [{"port": 80, "targetPort": 8080, "protocol": "TCP", "nodePort": 30080}]},
+    }
+    deployments = list_deployments(FakeApi(_body([deployment], continue_token="next")))
+    services = list_services(FakeApi(_body([service])), "apps")
+
+    assert deployments.continue_token == "next" and services.continue_token is None
+    model_deployment = _model_list(_body([deployment]), "V1DeploymentList").items[0]
+    model_service = _model_list(_body([service]), "V1ServiceList").items[0]
+    assert deployment_summary(deployments.items[0]) == deployment_summary(DeploymentRecord.from_model(model_deployment))
+    assert service_summary(services.items[0]) == service_summary(ServiceRecord.from_model(model_service))
+    assert service_summary(services.items[0])["ports"] == [
+        {"port": 80, "target_port": 8080, "protocol": "TCP", "node_port": 30080},
+    ]
+
+
+def _measure(fn):
+    # CPU 시간은 tracemalloc 오버헤드 없이, 최대 메모리는 별도 실행으로 측정
+    start = time.process_time()
+    result = fn()
+    cpu = time.process_time() - start
+    del result
+    tracemalloc.start()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, cpu, peak
+
+
+def test_fast_path_matches_model_objects_for_pod_list():
+    body = _body([_pod_json(i) for i in range(50)])
+    flags = {"include_labels": True, "include_creation_time": True, "include_namespace": True}
+    assert _format_pod_statuses(list_pods(FakeApi(body), "default").items, **flags) == \
+        _format_pod_statuses(_model_list(body, "V1PodList").items, **flags)
+
+
+@pytest.mark.slow
+def test_benchmark_1k_pods_fast_path_vs_model_objects():
+    """
+    1,000개 Pod LIST 응답을 모델 객체로 역직렬화하는 경로와 원본 JSON 고속 경로를
+    CPU 시간과 tracemalloc 최대 메모리로 비교합니다. (둘 다 포맷팅까지 포함)
+    """
+    body = _body([_pod_json(i) for i in range(1000)])
+    flags = {"include_labels": False, "include_creation_time": False, "include_namespace": True}
+
+    model_result, model_cpu, model_peak = _measure(
+        lambda: _format_pod_statuses(_model_list(body, "V1PodList").items, **flags)
+    )
+    fast_result, fast_cpu, fast_peak = _measure(
+        lambda: _format_pod_statuses(list_pods(FakeApi(body), "default").items, **flags)
+    )
+
+    print(
+        f"\n1k pods model: cpu={model_cpu * 1000:.0f}ms peak={model_peak / 1e6:.1f}MB"
+        f" | fast: cpu={fast_cpu * 1000:.0f}ms peak={fast_peak / 1e6:.1f}MB"
+    )
+    assert fast_result == model_result
+    assert fast_cpu * 3 < model_cpu
+    assert fast_peak < model_peak
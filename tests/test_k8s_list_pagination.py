@@ -0,0 +1,162 @@
+"""
+K8s 목록 명령 페이지네이션 테스트
+
+limit/continue 전달과 기본 페이지 크기, 만료된 커서 처리,
+생성 시각 기반 정렬과 응답 cursor 메타데이터를 검증합니다.
+"""
+
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace as NS
+
+import pytest
+from kubernetes.client.rest import ApiException
+
+from app.services import commands
+from app.services.commands import CommandRequest, plan_command
+from app.services.response_formatter import ResponseFormatter
+
+
+def _response(items, continue_token=None, remaining=None):
+    meta = {"resourceVersion": "1"}
+    if continue_token:
+        meta["continue"] = continue_token
+    if remaining is not None:
+        meta["remainingItemCount"] = remaining
+    body = json.dumps({"metadata": meta, "items": items}).encode()
+    return NS(data=body, release_conn=lambda: None)
+
+
+def _pod(name, created):
+    return {
+        "metadata": {"name": name, "namespace": "default", "creationTimestamp": created},
+        "spec": {"nodeName": "node-1"},
+        "status": {"phase": "Running", "containerStatuses": [{"ready": True, "restartCount": 0, "state": {}}]},
+    }
+
+
+def _service(name, created, lb_ip=None):
+    item = {
+        "metadata": {"name": name, "namespace": "default", "creationTimestamp": created},
+        "spec": {"type": "LoadBalancer" if lb_ip else "ClusterIP", "clusterIP": "10.0.0.1",
+                 "ports": [{"port": 80, "targetPort": 8080, "protocol": "TCP"}]},
+    }
+    if lb_ip:
+        item["status"] = {"loadBalancer": {"ingress": [{"ip": lb_ip}]}}
+    return item
+
+
+class FakeCoreV1:
+    def __init__(self, pages=None, error=None):
+        self.pages = pages or {}
+        self.error = error
+        self.calls = []
+
+    def _list(self, kwargs):
+        self.calls.append(kwargs)
+        if self.error:
+            raise self.error
+        return self.pages[kwargs.get("_continue")]
+
+    def list_namespaced_pod(self, **kwargs):
+        return self._list(kwargs)
+
+    def list_namespaced_service(self, **kwargs):
+        return self._list(kwargs)
+
+
+@pytest.fixture
+def page_settings(monkeypatch):
+    settings = NS(k8s_list_page_size=2, k8s_list_max_page_size=3)
+    monkeypatch.setattr("app.core.config.get_settings", lambda: settings)
+    return settings
+
+
+def test_plan_passes_limit_and_continue_to_list_commands():
+    plan = plan_command(CommandRequest(command="list_pods", namespace="web", limit=50, continue_token="abc"))
+    assert plan.args == {"namespace": "web", "limit": 50, "continue": "abc"}
+
+    plan = plan_command(CommandRequest(command="list_endpoints"))
+    assert plan.args == {"namespace": "default"}
+
+
+@pytest.mark.asyncio
+async def test_list_pods_pages_through_continue_token(monkeypatch, page_settings):
+    core = FakeCoreV1({
+        None: _response([_pod("b", "2026-10-02T00:00:00Z"), _pod("a", "2026-10-01T00:00:00Z")], "tok-1", 1),
+        "tok-1": _response([_pod("c", "2026-09-01T00:00:00Z")]),
+    })
+    monkeypatch.setattr(commands, "get_core_v1_api", lambda: core)
+
+    first = await commands._execute_list_pods({"namespace": "default"})
+    assert core.calls[0]["limit"] == 2 and "_continue" not in core.calls[0]
+    assert (first["continue"], first["remaining"], first["limit"]) == ("tok-1", 1, 2)
+    # 페이지 길이는 count, 전체 개수는 remainingItemCount로 알 수 있을 때만 total
+    assert (first["count"], first["total_pods"]) == (2, 3)
+    assert [p["created_ts"] for p in first["pods"]] == [
+        datetime(2026, 10, 2, tzinfo=timezone.utc).timestamp(),
+        datetime(2026, 10, 1, tzinfo=timezone.utc).timestamp(),
+    ]
+
+    formatted = ResponseFormatter().format_list_pods(first)
+    assert [p["name"] for p in formatted["data"]["formatted"]] == ["a", "b"]
+    assert formatted["metadata"]["cursor"] == "tok-1" and formatted["metadata"]["has_more"] is True
+    assert (formatted["metadata"]["count"], formatted["metadata"]["total"]) == (2, 3)
+    assert "남은 항목 약 1개" in formatted["summary"]
+
+    second = await commands._execute_list_pods({"namespace": "default", "limit": 10, "continue": "tok-1"})
+    assert core.calls[1]["limit"] == 3 and core.calls[1]["_continue"] == "tok-1"
+    assert second["continue"] is None
+    assert second["count"] == 1 and "total_pods" not in second
+    assert ResponseFormatter().format_list_pods(second)["metadata"]["has_more"] is False
+
+
+@pytest.mark.asyncio
+async def test_expired_continue_token_asks_to_restart(monkeypatch, page_settings):
+    core = FakeCoreV1(error=ApiException(status=410, reason="Gone"))
+    monkeypatch.setattr(commands, "get_core_v1_api", lambda: core)
+
+    result = await commands._execute_list_pods({"namespace": "default", "continue": "old"})
+    assert result["status"] == "error" and result["expired_cursor"] is True
+    assert result["message"] == commands.EXPIRED_CURSOR_MESSAGE
+
+
+@pytest.mark.asyncio
+async def test_namespaced_endpoints_use_paged_service_list(monkeypatch, page_settings):
+    core = FakeCoreV1({None: _response(
+        [_service("web", "2026-10-01T00:00:00Z", lb_ip="1.2.3.4"), _service("db", "2026-10-02T00:00:00Z")],
+        "tok-2",
+    )})
+    ingress = NS(
+        metadata=NS(name="web-ing"),
+        spec=NS(rules=[NS(host="web.example.com", http=NS(paths=[NS(path="/", backend=NS(service=NS(name="web")))]))]),
+    )
+    networking = NS(list_namespaced_ingress=lambda namespace: NS(items=[ingress]))
+    monkeypatch.setattr(commands, "get_core_v1_api", lambda: core)
+    monkeypatch.setattr(commands, "get_networking_v1_api", lambda: networking)
+
+    result = await commands._execute_list_namespaced_endpoints({"namespace": "default"})
+
+    web = result["endpoints"][0]
+    assert web["service_endpoint"] == "http://web:80"
+    assert web["ingress_domains"] == [{"domain": "https://web.example.com", "path": "/", "ingress_name": "web-ing"}]
+    assert web["external_access"] == {"type": "LoadBalancer", "address": "1.2.3.4", "ports": [{"port": 80, "protocol": "TCP"}]}
+    # 다음 페이지가 있고 남은 개수를 모르면 전체 개수(total_services)를 표시하지 않음
+    assert result["summary"] == {"service_count": 2, "services_with_ingress": 1, "services_with_external": 1}
+    metadata = ResponseFormatter().format_list_namespaced_endpoints(result)["metadata"]
+    assert metadata["cursor"] == "tok-2" and metadata["total_services"] is None and metadata["total"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_is_unpaged_by_default(monkeypatch):
+    from app.core.config import get_settings
+
+    assert get_settings().k8s_list_page_size is None
+    core = FakeCoreV1({None: _response([_pod("a", "2026-10-01T00:00:00Z"), _pod("b", "2026-10-02T00:00:00Z")])})
+    monkeypatch.setattr(commands, "get_core_v1_api", lambda: core)
+
+    result = await commands._execute_list_pods({"namespace": "default"})
+    assert "limit" not in core.calls[0]
+    assert (result["count"], result["total_pods"]) == (2, 2)
+    assert "continue" not in result
+    assert ResponseFormatter().format_list_pods(result)["metadata"]["total"] == 2
@@ -0,0 +1,102 @@
+"""
+여러 Pod 로그 병합 테스트
+
+모든 Pod/컨테이너 로그의 동시 조회, 타임스탬프 기준 k-way 병합,
+필터와 바이트 예산 적용을 검증합니다.
+"""
+
+import threading
+import time
+from types import SimpleNamespace as NS
+
+import pytest
+from kubernetes.client.rest import ApiException
+
+from app.services.k8s_logs import aggregate_pod_logs
+from app.services.log_stream import LogLineFilter
+
+
+def _pod(name, *containers):
+    return NS(metadata=NS(name=name), spec=NS(containers=[NS(name=c) for c in containers or ("app",)]))
+
+
+class FakeCoreV1:
+    def __init__(self, logs, delay=0.0, fail=()):
+        self.logs = logs
+        self.delay = delay
+        self.fail = set(fail)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def read_namespaced_pod_log(self, name, namespace, container=None, previous=False, **kwargs):
+        with self.lock:
+            self.calls.append((name, container, previous, kwargs.get("timestamps")))
+        time.sleep(self.delay)
+        if name in self.fail:
+            raise ApiException(status=500, reason="boom")
+        if previous:
+            raise ApiException(status=400, reason="previous terminated container not found")
+        return self.logs.get((name, container), "")
+
+
+@pytest.mark.asyncio
+async def test_merges_pods_by_timestamp_with_prefixes():
+    core = FakeCoreV1({
+        ("web-1", "app"): "2026-10-18T12:00:01Z a1\n2026-10-18T12:00:03.5Z a2\n",
+        ("web-2", "app"): "2026-10-18T12:00:02Z b1\n2026-10-18T12:00:03.25Z b2\n",
+        ("web-3", "app"): "2026-10-18T12:00:00.999999999Z c1\n",
+    }, delay=0.1)
+    pods = [_pod("web-1"), _pod("web-2"), _pod("web-3")]
+
+    start = time.perf_counter()
+    result = await aggregate_pod_logs(core, "default", pods, lines=50)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.25  # 순차라면 0.3초 이상
+    assert [e["line"] for e in result["entries"]] == [
+        "[web-3] c1", "[web-1] a1", "[web-2] b1", "[web-2] b2", "[web-1] a2",
+    ]
+    assert result["logs"].splitlines()[0] == "2026-10-18T12:00:00.999999999Z [web-3] c1"
+    assert all(call[3] is True for call in core.calls)
+    assert result["truncated"] is False
+
+
+@pytest.mark.asyncio
+async def test_multi_container_prefix_filters_and_errors():
+    core = FakeCoreV1({
+        ("api-1", "app"): "2026-10-18T12:00:01Z INFO ok\n2026-10-18T12:00:02Z ERROR db timeout\n",
+        ("api-1", "proxy"): "2026-10-18T12:00:03Z ERROR upstream reset\n",
+    }, fail={"api-2"})
+    pods = [_pod("api-1", "app", "proxy"), _pod("api-2")]
+
+    result = await aggregate_pod_logs(
+        core, "default", pods, previous=True, line_filter=LogLineFilter(level="error"),
+    )
+
+    assert [e["line"] for e in result["entries"]] == [
+        "[api-1/app] ERROR db timeout", "[api-1/proxy] ERROR upstream reset",
+    ]
+    assert result["sources"] == ["api-1/app", "api-1/proxy", "api-2"]
+    assert result["errors"] == [{"source": "api-2", "error": "boom"}]
+    # previous 요청이 실패하면 현재 로그로 대체
+    assert ("api-1", "app", False, True) in core.calls
+
+
+@pytest.mark.asyncio
+async def test_byte_budget_keeps_newest_lines():
+    logs = {
+        (f"web-{p}", "app"): "".join(
+            f"2026-10-18T12:{i:02d}:{p:02d}Z {'x' * 200} {p}-{i}\n" for i in range(50)
+        )
+        for p in range(10)
+    }
+    result = await aggregate_pod_logs(
+        FakeCoreV1(logs), "default", [_pod(f"web-{p}") for p in range(10)], byte_budget=8 * 1024,
+    )
+
+    assert result["truncated"] is True
+    # 예산은 타임스탬프와 접두사를 포함한 출력 기준
+    assert len(result["logs"].encode()) + 1 <= 8 * 1024
+    assert len(result["logs"].encode()) > 7 * 1024
+    # 가장 마지막 로그는 남아 있어야 함
+    assert result["entries"][-1]["line"].endswith("9-49")
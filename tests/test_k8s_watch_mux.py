@@ -0,0 +1,352 @@
+"""
+Kubernetes WATCH 멀티플렉서 테스트
+
+(kind, namespace)당 업스트림 WATCH 공유, 캐시 기반 초기 스냅샷, 변화 없는 MODIFIED
+생략, 구독자별 라벨 필터(조건 진입/이탈), 410 만료(스트림 이벤트/WATCH 요청 거절) 시 재LIST 차이 전송,
+느린 구독자 재동기화, linger 재사용, WATCH/연결별 구독 상한, /ws/kubernetes
+엔드포인트 연동(토큰 인증, 네임스페이스 검사)을 검증합니다.
+"""
+
+import asyncio
+import json
+import queue
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from kubernetes.client.rest import ApiException
+from starlette.websockets import WebSocketDisconnect
+
+from app.api.v1 import websocket as websocket_api
+from app.core.config import get_settings
+from app.services.k8s_watch_mux import KubernetesWatchMux, LabelSelector, WatchLimitError, namespace_allowed
+
+
+def pod(name, rv, labels=None, phase="Running", restarts=0, heartbeat=None):
+    return {
+        "metadata": {
+            "name": name,
+            "namespace": "team",
+            "uid": f"uid-{name}",
+            "resourceVersion": str(rv),
+            "labels": labels if labels is not None else {"app": "web"},
+            "annotations": {"heartbeat": heartbeat},
+            "creationTimestamp": "2026-01-01T00:00:00Z",
+        },
+        "spec": {"nodeName": "node-1", "containers": [{"name": "main"}]},
+        "status": {
+            "phase": phase,
+            "containerStatuses": [{"name": "main", "ready": True, "restartCount": restarts, "state": {}}],
+        },
+    }
+
+
+class FakeListResponse:
+    def __init__(self, body):
+        self.data = json.dumps(body).encode()
+
+    def release_conn(self):
+        pass
+
+
+class FakeWatchResponse:
+    def __init__(self):
+        self.lines = queue.Queue()
+        self.closed = threading.Event()
+
+    def send(self, event_type, obj):
+        self.lines.put(json.dumps({"type": event_type, "object": obj}).encode() + b"\n")
+
+    def stream(self, amt):
+        while not self.closed.is_set():
+            try:
+                chunk = self.lines.get(timeout=0.01)
+            except queue.Empty:
+                continue
+            if chunk is None:
+                return
+            yield chunk
+
+    def close(self):
+        self.closed.set()
+
+    def release_conn(self):
+        pass
+
+
+class FakeCoreV1:
+    def __init__(self, items, rv=10):
+        self.items = list(items)
+        self.rv = rv
+        self.list_calls = 0
+        self.watch_calls = []
+        self.watches = queue.Queue()
+        self.watch_errors = []
+
+    def list_namespaced_pod(self, namespace, watch=False, **kwargs):
+        if watch:
+            self.watch_calls.append(kwargs.get("resource_version"))
+            if self.watch_errors:
+                error = self.watch_errors.pop(0)
+                raise error() if callable(error) else error
+            response = FakeWatchResponse()
+            self.watches.put(response)
+            return response
+        self.list_calls += 1
+        return FakeListResponse({"metadata": {"resourceVersion": str(self.rv)}, "items": self.items})
+
+    def next_watch(self, timeout=2.0):
+        return self.watches.get(timeout=timeout)
+
+
+async def _next(sub, timeout=2.0):
+    return await asyncio.wait_for(sub.queue.get(), timeout)
+
+
+async def _watch(api):
+    return await asyncio.to_thread(api.next_watch)
+
+
+def _mux(api, **kwargs):
+    kwargs.setdefault("linger_seconds", 0.05)
+    return KubernetesWatchMux(api_factory=lambda group: api, queue_size=kwargs.pop("queue_size", 50), **kwargs)
+
+
+def _token(user_id="u1"):
+    import jwt
+
+    from app.api.v1.auth_verify import JWT_ALGORITHM, get_jwt_secret
+
+    return jwt.encode({"sub": user_id, "exp": time.time() + 60}, get_jwt_secret(), algorithm=JWT_ALGORITHM)
+
+
+def _ws_app(monkeypatch, mux):
+    monkeypatch.setattr(websocket_api, "get_k8s_watch_mux", lambda: mux)
+    app = FastAPI()
+    app.include_router(websocket_api.router)
+    return app
+
+
+def test_label_selector():
+    selector = LabelSelector("app=web, tier!=db, canary, !legacy")
+    assert selector.matches({"app": "web", "canary": "1"})
+    assert not selector.matches({"app": "web", "canary": "1", "tier": "db"})
+    assert not selector.matches({"app": "web"})
+    assert not selector.matches({"app": "web", "canary": "1", "legacy": "y"})
+    assert LabelSelector(None).matches({})
+    with pytest.raises(ValueError):
+        LabelSelector("app in (web)")
+
+
+@pytest.mark.asyncio
+async def test_subscribers_share_one_watch_and_receive_deltas():
+    api = FakeCoreV1([pod("a", 5), pod("b", 6)])
+    mux = _mux(api)
+    first = mux.subscribe("pods", "team")
+    second = mux.subscribe("pods", "team")
+    watch = await _watch(api)
+
+    for sub in (first, second):
+        snapshot = await _next(sub)
+        assert snapshot["type"] == "snapshot"
+        assert [p["name"] for p in snapshot["data"]["items"]] == ["a", "b"]
+        assert snapshot["data"]["items"][0] == {
+            "name": "a", "namespace": "team", "labels": {"app": "web"}, "phase": "Running",
+            "ready": "1/1", "restarts": 0, "reason": None, "crash_looping": False,
+            "node": "node-1", "created": "2026-01-01T00:00:00+00:00",
+        }
+
+    # 늦게 붙은 구독자도 API 호출 없이 캐시로 스냅샷
+    third = mux.subscribe("pods", "team")
+    assert len((await _next(third))["data"]["items"]) == 2
+
+    watch.send("MODIFIED", pod("a", 11, heartbeat="x"))  # 투영 결과 동일 → 생략
+    watch.send("MODIFIED", pod("a", 12, restarts=1))
+    watch.send("ADDED", pod("c", 13))
+    watch.send("DELETED", pod("b", 14))
+    for sub in (first, second, third):
+        events = [(m["data"]["event"], m["data"]["object"]["name"]) for m in [await _next(sub) for _ in range(3)]]
+        assert events == [("MODIFIED", "a"), ("ADDED", "c"), ("DELETED", "b")]
+
+    assert api.list_calls == 1 and api.watch_calls == ["10"]
+    assert mux.stats()["watches"]["pods/team"]["resource_version"] == "14"
+    await mux.stop()
+
+
+@pytest.mark.asyncio
+async def test_label_filter_tracks_objects_entering_and_leaving():
+    api = FakeCoreV1([pod("a", 5), pod("b", 6, labels={"app": "db"})])
+    mux = _mux(api)
+    web = mux.subscribe("pods", "team", "app=web")
+    watch = await _watch(api)
+    assert [p["name"] for p in (await _next(web))["data"]["items"]] == ["a"]
+
+    watch.send("MODIFIED", pod("b", 11, phase="Pending", labels={"app": "db"}))
+    watch.send("MODIFIED", pod("a", 12, labels={"app": "old"}))
+    watch.send("MODIFIED", pod("b", 13, labels={"app": "web"}))
+
+    first, second = await _next(web), await _next(web)
+    assert (first["data"]["event"], first["data"]["object"]["name"]) == ("DELETED", "a")
+    assert (second["data"]["event"], second["data"]["object"]["name"]) == ("ADDED", "b")
+    assert web.queue.empty()
+    await mux.stop()
+
+
+@pytest.mark.asyncio
+async def test_expired_watch_relists_and_sends_only_the_difference():
+    api = FakeCoreV1([pod("a", 5), pod("b", 6)])
+    mux = _mux(api)
+    sub = mux.subscribe("pods", "team")
+    watch = await _watch(api)
+    await _next(sub)
+
+    # WATCH 중단 동안 b 삭제, c 추가, a는 그대로
+    api.items, api.rv = [pod("a", 5), pod("c", 30)], 31
+    watch.send("ERROR", {"code": 410, "message": "too old resource version"})
+    await _watch(api)
+
+    events = {(m["data"]["event"], m["data"]["object"]["name"]) for m in [await _next(sub), await _next(sub)]}
+    assert events == {("ADDED", "c"), ("DELETED", "b")}
+    assert api.list_calls == 2 and api.watch_calls == ["10", "31"]
+    await mux.stop()
+
+
+@pytest.mark.asyncio
+async def test_watch_request_rejected_with_410_relists():
+    api = FakeCoreV1([pod("a", 5)])
+
+    def expired():
+        # WATCH 중단 동안 c 추가
+        api.items, api.rv = [pod("a", 5), pod("c", 30)], 31
+        return ApiException(status=410, reason="Gone")
+
+    # WATCH 요청 자체가 410으로 거절되면 같은 resourceVersion으로 재시도하지 않고 곧바로 재LIST
+    api.watch_errors.append(expired)
+    mux = _mux(api, retry_delay=5.0)
+    sub = mux.subscribe("pods", "team")
+    await _watch(api)
+
+    assert [p["name"] for p in (await _next(sub))["data"]["items"]] == ["a"]
+    delta = await _next(sub)
+    assert (delta["data"]["event"], delta["data"]["object"]["name"]) == ("ADDED", "c")
+    assert api.list_calls == 2 and api.watch_calls == ["10", "31"]
+    await mux.stop()
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_is_resynced_with_a_snapshot():
+    api = FakeCoreV1([pod("a", 5)])
+    mux = _mux(api, queue_size=3)
+    sub = mux.subscribe("pods", "team")
+    watch = await _watch(api)
+    await _next(sub)
+
+    for i in range(6):
+        watch.send("MODIFIED", pod("a", 20 + i, restarts=i + 1))
+    await asyncio.sleep(0.2)
+
+    message = await _next(sub)
+    assert message["type"] == "snapshot" and sub.resyncs >= 1
+    latest = message["data"]["items"][0]["restarts"]
+    remaining = [m["data"]["object"]["restarts"] for m in [sub.queue.get_nowait() for _ in range(sub.queue.qsize())]]
+    assert ([latest] + remaining)[-1] == 6
+    await mux.stop()
+
+
+@pytest.mark.asyncio
+async def test_watch_lingers_for_reconnects_then_stops():
+    api = FakeCoreV1([pod("a", 5)])
+    mux = _mux(api, linger_seconds=0.1)
+    sub = mux.subscribe("pods", "team")
+    watch = await _watch(api)
+    await _next(sub)
+
+    mux.unsubscribe(sub)
+    again = mux.subscribe("pods", "team")
+    assert (await _next(again))["type"] == "snapshot"
+    assert api.list_calls == 1
+
+    mux.unsubscribe(again)
+    await asyncio.sleep(0.3)
+    assert mux.stats()["upstream_watches"] == 0
+    assert watch.closed.is_set()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_caps_upstreams_and_per_owner_subscriptions():
+    api = FakeCoreV1([pod("a", 5)])
+    mux = _mux(api, max_upstreams=2, max_per_owner=2)
+    first = mux.subscribe("pods", "team", owner="c1")
+    second = mux.subscribe("pods", "team", "app=web", owner="c1")
+    with pytest.raises(WatchLimitError):
+        mux.subscribe("pods", "other", owner="c1")
+
+    # 다른 연결은 기존 WATCH를 재사용할 수 있지만 새 WATCH는 전체 상한까지만
+    shared = mux.subscribe("pods", "team", owner="c2")
+    mux.subscribe("pods", "staging", owner="c2")
+    with pytest.raises(WatchLimitError):
+        mux.subscribe("pods", "other", owner="c3")
+
+    # 구독 해제 시 연결별 수가 줄고, linger 중인 WATCH는 새 WATCH에 자리를 내줌
+    for sub in (first, second, shared):
+        mux.unsubscribe(sub)
+    mux.subscribe("pods", "other", owner="c1")
+    assert set(mux.stats()["watches"]) == {"pods/staging", "pods/other"}
+    await mux.stop()
+
+
+def test_namespace_allowed(monkeypatch):
+    assert namespace_allowed("team")
+    assert not namespace_allowed("")
+    assert not namespace_allowed(None)
+    assert not namespace_allowed("Team/..")
+    assert not namespace_allowed("kube-system")
+
+    monkeypatch.setattr(get_settings(), "k8s_watch_allowed_namespaces", "team, staging")
+    assert namespace_allowed("staging")
+    assert not namespace_allowed("default")
+
+
+def test_kubernetes_websocket_requires_token(monkeypatch):
+    mux = _mux(FakeCoreV1([]))
+    client = TestClient(_ws_app(monkeypatch, mux))
+
+    with pytest.raises(WebSocketDisconnect):
+        with client.websocket_connect("/ws/kubernetes") as ws:
+            ws.receive_json()
+    with pytest.raises(WebSocketDisconnect) as e:
+        with client.websocket_connect("/ws/kubernetes?token=invalid") as ws:
+            ws.receive_json()
+    assert e.value.code == 4401
+    assert mux.stats()["upstream_watches"] == 0
+
+
+def test_kubernetes_websocket_streams_snapshot_and_deltas(monkeypatch):
+    api = FakeCoreV1([pod("a", 5), pod("b", 6, labels={"app": "db"})])
+    mux = _mux(api)
+    app = _ws_app(monkeypatch, mux)
+
+    with TestClient(app).websocket_connect(f"/ws/kubernetes?token={_token()}") as ws:
+        assert ws.receive_json()["type"] == "connection"
+        ws.send_json({"type": "subscribe", "data": {"namespace": "team", "kind": "pods", "label_selector": "app=web"}})
+        assert ws.receive_json()["type"] == "subscribed"
+        snapshot = ws.receive_json()
+        assert snapshot["type"] == "snapshot"
+        assert [p["name"] for p in snapshot["data"]["items"]] == ["a"]
+
+        api.next_watch().send("ADDED", pod("c", 20))
+        delta = ws.receive_json()
+        assert delta["type"] == "delta"
+        assert (delta["data"]["event"], delta["data"]["object"]["name"]) == ("ADDED", "c")
+
+        ws.send_json({"type": "subscribe", "data": {"namespace": "team", "kind": "jobs"}})
+        assert ws.receive_json()["type"] == "error"
+        for namespace in (None, "", "kube-system"):
+            ws.send_json({"type": "subscribe", "data": {"namespace": namespace, "kind": "pods"}})
+            assert ws.receive_json()["type"] == "error"
+        ws.send_json({"type": "unsubscribe", "data": {"namespace": "team"}})
+        assert ws.receive_json()["type"] == "unsubscribed"
+
+    assert mux.stats()["watches"]["pods/team"]["subscribers"] == 0
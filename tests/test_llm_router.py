@@ -0,0 +1,229 @@
+"""
+LLM 라우터 테스트
+
+지연 분포를 조절할 수 있는 가짜 공급자로 헤지 요청의 꼬리 지연(p99) 개선,
+오류 시 장애 조치, 회로 차단기(open → half-open → closed), 지연 예산 강제를 검증합니다.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+import httpx
+
+from app.core.circuit_breaker import CLOSED, HALF_OPEN, OPEN
+from app.llm.interfaces import LLMClient
+from app.llm.providers import OpenAIClient
+from app.llm.router import LLMRouter
+
+
+class FakeProvider(LLMClient):
+    """호출 순번별 지연/실패를 지정하는 가짜 공급자"""
+
+    def __init__(self, name, latency=0.002, slow_every=0, slow_latency=0.2, fail=False, error_result=False):
+        self.name = name
+        self.latency = latency
+        self.slow_every = slow_every
+        self.slow_latency = slow_latency
+        self.fail = fail
+        self.error_result = error_result
+        self.calls = 0
+        self.cancelled = 0
+
+    async def interpret(self, prompt, user_id="default", project_name="default"):
+        self.calls += 1
+        slow = self.slow_every and self.calls % self.slow_every == 0
+        try:
+            await asyncio.sleep(self.slow_latency if slow else self.latency)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise RuntimeError(f"{self.name} unavailable")
+        if self.error_result:
+            return {"intent": "error", "entities": {}, "error": "quota exceeded"}
+        return {"intent": "list_pods", "entities": {"namespace": "default"}, "llm": {"provider": self.name}}
+
+
+def _p99(samples):
+    ordered = sorted(samples)
+    return ordered[int(len(ordered) * 0.99) - 1]
+
+
+async def _run(router, n):
+    latencies = []
+    for _ in range(n):
+        start = time.perf_counter()
+        result = await router.interpret("파드 목록")
+        latencies.append(time.perf_counter() - start)
+        assert result["intent"] == "list_pods"
+    return latencies
+
+
+@pytest.mark.asyncio
+async def test_hedging_cuts_tail_latency():
+    def providers():
+        # 40번째 호출마다 200ms가 걸리는 꼬리 지연 (2.5%)
+        return {
+            "primary": FakeProvider("primary", slow_every=40),
+            "secondary": FakeProvider("secondary", slow_every=40),
+        }
+
+    plain = LLMRouter(providers(), budget_seconds=2.0, hedge_enabled=False)
+    hedged_providers = providers()
+    hedged = LLMRouter(
+        hedged_providers, budget_seconds=2.0, hedge_enabled=True,
+        hedge_min_delay=0.005, hedge_default_delay=0.02,
+    )
+
+    plain_p99 = _p99(await _run(plain, 200))
+    hedged_p99 = _p99(await _run(hedged, 200))
+
+    assert plain_p99 >= 0.19
+    assert hedged_p99 < 0.1
+    # 헤지 요청은 꼬리 구간에서만 나가므로 추가 호출량은 제한적
+    extra_calls = sum(p.calls for p in hedged_providers.values()) - 200
+    assert extra_calls <= 20
+    # 헤지에서 진 쪽(느린 1차 호출)은 취소됨
+    assert sum(p.cancelled for p in hedged_providers.values()) >= 1
+
+
+@pytest.mark.asyncio
+async def test_failover_on_exception_and_error_result():
+    broken = FakeProvider("gemini", fail=True)
+    quota = FakeProvider("anthropic", error_result=True)
+    healthy = FakeProvider("openai")
+    router = LLMRouter({"gemini": broken, "anthropic": quota, "openai": healthy}, budget_seconds=1.0)
+
+    result = await router.interpret("파드 목록")
+
+    assert result["intent"] == "list_pods" and result["llm"]["provider"] == "openai"
+    assert [a["status"] for a in result["llm"]["router"]["attempts"]] == ["error", "error", "success"]
+    assert router.health["gemini"].consecutive_failures == 1
+
+
+@pytest.mark.asyncio
+async def test_validation_error_is_returned_without_failover():
+    class MissingRepo(FakeProvider):
+        async def interpret(self, prompt, user_id="default", project_name="default"):
+            self.calls += 1
+            message = "저장소 이름을 입력해주세요"
+            return {"intent": "error", "entities": {"error": message}, "message": message}
+
+    gemini = MissingRepo("gemini")
+    backup = FakeProvider("openai")
+    router = LLMRouter({"gemini": gemini, "openai": backup}, budget_seconds=1.0, failure_threshold=1)
+
+    result = await router.interpret("배포해줘")
+
+    assert result["intent"] == "error" and result["entities"]["error"] == "저장소 이름을 입력해주세요"
+    assert backup.calls == 0
+    assert router.health["gemini"].state == CLOSED
+    assert router.health["gemini"].consecutive_failures == 0
+
+
+def test_unmeasured_provider_ranks_at_prior_not_first():
+    router = LLMRouter(
+        {"gemini": FakeProvider("gemini"), "openai": FakeProvider("openai"), "anthropic": FakeProvider("anthropic")},
+        hedge_default_delay=2.0,
+    )
+    router.health["openai"].ewma = 0.3
+    router.health["anthropic"].ewma = 4.0
+
+    assert router._ordered() == ["openai", "gemini", "anthropic"]
+
+
+@pytest.mark.asyncio
+async def test_provider_reuses_pooled_http_client():
+    connections = []
+
+    def respond(request):
+        return httpx.Response(200, json={"choices": [{"message": {"content": '{"command": "list_pods"}'}}]})
+
+    client = OpenAIClient()
+    client.settings = type("S", (), {"openai_api_key": "sk-test", "openai_model": "gpt-test"})()
+    real_http = client._http
+
+    def tracked():
+        http = real_http()
+        if http not in connections:
+            http._transport = httpx.MockTransport(respond)
+            connections.append(http)
+        return http
+
+    client._http = tracked
+    for _ in range(3):
+        await client._complete("파드 목록")
+
+    assert len(connections) == 1
+    await client.aclose()
+    assert connections[0].is_closed
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_opens_and_recovers_through_half_open():
+    now = [0.0]
+    flaky = FakeProvider("gemini", fail=True)
+    backup = FakeProvider("openai")
+    router = LLMRouter(
+        {"gemini": flaky, "openai": backup},
+        budget_seconds=1.0, failure_threshold=2, reset_timeout=30.0, clock=lambda: now[0],
+    )
+    # 측정값이 사전값(2초)보다 느리게 해 표본이 없는 gemini가 먼저 시도되도록
+    router.health["openai"].ewma = 5.0
+
+    for _ in range(2):
+        await router.interpret("파드 목록")
+    assert router.health["gemini"].state == OPEN
+
+    # 열린 동안에는 호출하지 않음
+    await router.interpret("파드 목록")
+    assert flaky.calls == 2
+
+    # half-open 시험 호출이 실패하면 다시 열림
+    now[0] = 31.0
+    assert router.health["gemini"].state == HALF_OPEN
+    await router.interpret("파드 목록")
+    assert flaky.calls == 3 and router.health["gemini"].state == OPEN
+
+    # 복구 후 시험 호출이 성공하면 닫힘
+    now[0] = 62.0
+    flaky.fail = False
+    router.health["openai"].ewma = 5.0
+    result = await router.interpret("파드 목록")
+    assert result["llm"]["provider"] == "gemini"
+    assert router.health["gemini"].state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_latency_budget_cancels_inflight_calls():
+    slow_a = FakeProvider("gemini", latency=1.0)
+    slow_b = FakeProvider("openai", latency=1.0)
+    router = LLMRouter(
+        {"gemini": slow_a, "openai": slow_b},
+        budget_seconds=5.0, hedge_default_delay=0.02, failure_threshold=5,
+    )
+
+    start = time.perf_counter()
+    result = await router.interpret("파드 목록", budget_seconds=0.1)
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0)
+
+    assert result["intent"] == "error" and "지연 예산" in result["error"]
+    assert elapsed < 0.3
+    assert result["llm"]["router"]["hedged"] is True
+    assert (slow_a.cancelled, slow_b.cancelled) == (1, 1)
+    assert router.health["gemini"].consecutive_failures == 1
+
+
+@pytest.mark.asyncio
+async def test_all_breakers_open_returns_error_without_calls():
+    provider = FakeProvider("gemini", fail=True)
+    router = LLMRouter({"gemini": provider}, budget_seconds=1.0, failure_threshold=1, reset_timeout=60.0)
+
+    await router.interpret("파드 목록")
+    result = await router.interpret("파드 목록")
+
+    assert provider.calls == 1
+    assert result["intent"] == "error" and result["llm"]["mode"] == "error"
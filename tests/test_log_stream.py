@@ -0,0 +1,229 @@
+"""
+Pod 로그 follow 스트리밍 테스트
+
+청크 경계 처리, 서버 측 필터, since_time 재개, 백프레셔, 유휴 종료,
+사용자별 동시 스트림 제한, SSE/WebSocket 인증과 네임스페이스 검사를 검증합니다.
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.services.log_stream import (
+    LogLineFilter,
+    LogStreamLimitError,
+    LogStreamManager,
+    LogStreamOptions,
+    parse_log_timestamp,
+)
+
+
+class FakeLogResponse:
+    def __init__(self, chunks, hold_open=False, delay=0.0):
+        self.chunks = chunks
+        self.hold_open = hold_open
+        self.delay = delay
+        self.produced = 0
+        self.closed = threading.Event()
+
+    def stream(self, amt):
+        for chunk in self.chunks:
+            if self.closed.is_set():
+                raise ConnectionError("closed")
+            if self.delay:
+                time.sleep(self.delay)
+            self.produced += 1
+            yield chunk
+        # follow 스트림처럼 새 로그가 없어도 연결 유지
+        while self.hold_open and not self.closed.is_set():
+            time.sleep(0.01)
+
+    def close(self):
+        self.closed.set()
+
+    def release_conn(self):
+        pass
+
+
+class FakeCoreV1:
+    def __init__(self, response):
+        self.response = response
+        self.kwargs = None
+
+    def read_namespaced_pod_log(self, **kwargs):
+        self.kwargs = kwargs
+        return self.response
+
+
+def _ts(seconds, nanos=0):
+    dt = datetime(2026, 10, 18, 12, 0, 0, tzinfo=timezone.utc) + timedelta(seconds=seconds)
+    frac = f".{nanos:09d}".rstrip("0") if nanos else ""
+    return dt.strftime("%Y-%m-%dT%H:%M:%S") + frac + "Z"
+
+
+def _manager(response, **kwargs):
+    core = FakeCoreV1(response)
+    kwargs.setdefault("max_per_user", 2)
+    kwargs.setdefault("idle_timeout", 1.0)
+    kwargs.setdefault("queue_size", 100)
+    kwargs.setdefault("batch_lines", 50)
+    return LogStreamManager(core_v1_factory=lambda: core, **kwargs), core
+
+
+async def _collect(stream):
+    messages = []
+    async with stream:
+        async for message in stream.batches():
+            messages.append(message)
+    return messages
+
+
+def _lines(messages):
+    return [line["line"] for m in messages if m["type"] == "logs" for line in m["lines"]]
+
+
+@pytest.mark.asyncio
+async def test_follow_stream_splits_chunks_filters_and_tracks_cursor():
+    body = (
+        f"{_ts(1)} INFO started\n{_ts(2)} ERROR db down\n{_ts(3, 5)} WARN slow".encode()
+        + f" query\n{_ts(4)} DEBUG tick\n".encode()
+    )
+    response = FakeLogResponse([body[:30], body[30:70], body[70:]])
+    manager, core = _manager(response)
+    stream = manager.open("u1", LogStreamOptions("default", "web-1"), LogLineFilter(level="warn"))
+
+    messages = await _collect(stream)
+
+    assert core.kwargs["follow"] is True and core.kwargs["_preload_content"] is False
+    assert core.kwargs["timestamps"] is True
+    assert _lines(messages) == ["ERROR db down", "WARN slow query"]
+    assert messages[-1] == {"type": "end", "reason": "eof", "cursor": _ts(3, 5)}
+    assert manager.stats()["active_streams"] == 0
+
+
+@pytest.mark.asyncio
+async def test_resume_from_cursor_skips_already_sent_lines():
+    cursor = _ts(2, 5)
+    body = f"{_ts(2)} a\n{_ts(2, 5)} b\n{_ts(2, 6)} c\n{_ts(3)} d\n".encode()
+    manager, core = _manager(FakeLogResponse([body]))
+    stream = manager.open("u1", LogStreamOptions("default", "web-1", since_time=cursor))
+
+    messages = await _collect(stream)
+
+    assert _lines(messages) == ["c", "d"]
+    assert "since_seconds" in core.kwargs and "tail_lines" not in core.kwargs
+    assert parse_log_timestamp(_ts(2, 6)) > parse_log_timestamp(cursor)
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_applies_backpressure_to_reader():
+    chunks = [f"{_ts(i)} line {i}\n".encode() for i in range(200)]
+    response = FakeLogResponse(chunks)
+    manager, _ = _manager(response, queue_size=5, batch_lines=1)
+    stream = manager.open("u1", LogStreamOptions("default", "web-1"))
+
+    async with stream:
+        batches = stream.batches()
+        await batches.__anext__()
+        await asyncio.sleep(0.2)
+        # 소비하지 않는 동안 읽기 스레드는 큐 크기 근처에서 멈춰 있어야 함
+        assert response.produced < 20
+    assert response.closed.is_set()
+
+
+@pytest.mark.asyncio
+async def test_idle_stream_is_closed():
+    response = FakeLogResponse([f"{_ts(1)} hello\n".encode()], hold_open=True)
+    manager, _ = _manager(response, idle_timeout=0.1)
+    stream = manager.open("u1", LogStreamOptions("default", "web-1"))
+
+    messages = await asyncio.wait_for(_collect(stream), timeout=2)
+
+    assert _lines(messages) == ["hello"]
+    assert messages[-1]["reason"] == "idle"
+    assert response.closed.is_set()
+
+
+def test_per_user_stream_cap_and_filter_validation():
+    manager, _ = _manager(FakeLogResponse([]), max_per_user=1)
+    manager.open("u1", LogStreamOptions("default", "a"))
+    with pytest.raises(LogStreamLimitError):
+        manager.open("u1", LogStreamOptions("default", "b"))
+    manager.open("u2", LogStreamOptions("default", "a"))
+
+    with pytest.raises(ValueError):
+        LogLineFilter(grep="(")
+    with pytest.raises(ValueError):
+        LogLineFilter(level="verbose")
+
+
+def _sse_app(monkeypatch, manager):
+    from fastapi import FastAPI
+
+    from app.api.v1 import k8s
+
+    monkeypatch.setattr(k8s, "get_log_stream_manager", lambda: manager)
+    app = FastAPI()
+    app.include_router(k8s.router)
+    return app
+
+
+def _token(user_id="u1"):
+    import jwt
+
+    from app.api.v1.auth_verify import JWT_ALGORITHM, get_jwt_secret
+
+    return jwt.encode({"sub": user_id, "exp": time.time() + 60}, get_jwt_secret(), algorithm=JWT_ALGORITHM)
+
+
+def test_sse_accepts_token_query_parameter(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    manager, _ = _manager(FakeLogResponse([f"{_ts(1)} hello\n".encode()]))
+    client = TestClient(_sse_app(monkeypatch, manager))
+
+    assert client.get("/logs/default/web/stream").status_code in (401, 403)
+    response = client.get("/logs/default/web/stream", params={"token": _token()})
+    assert response.status_code == 200
+    assert "event: logs" in response.text and "hello" in response.text
+    assert manager.stats()["active_streams"] == 0
+
+
+def test_sse_and_websocket_reject_disallowed_namespaces(monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from starlette.websockets import WebSocketDisconnect
+
+    from app.api.v1 import websocket as websocket_api
+
+    manager, core = _manager(FakeLogResponse([f"{_ts(1)} secret\n".encode()]))
+    client = TestClient(_sse_app(monkeypatch, manager))
+    assert client.get("/logs/kube-system/coredns/stream", params={"token": _token()}).status_code == 403
+
+    monkeypatch.setattr(websocket_api, "get_log_stream_manager", lambda: manager)
+    ws_app = FastAPI()
+    ws_app.include_router(websocket_api.router)
+    with pytest.raises(WebSocketDisconnect) as e:
+        with TestClient(ws_app).websocket_connect(f"/ws/logs?token={_token()}&namespace=kube-system&pod=coredns") as ws:
+            ws.receive_json()
+    assert e.value.code == 4403
+    assert core.kwargs is None and manager.stats()["active_streams"] == 0
+
+
+@pytest.mark.asyncio
+async def test_sse_slot_is_not_reserved_until_the_body_is_streamed():
+    from app.api.v1 import k8s
+
+    manager, _ = _manager(FakeLogResponse([], hold_open=True), max_per_user=1)
+    original = k8s.get_log_stream_manager
+    k8s.get_log_stream_manager = lambda: manager
+    try:
+        for _ in range(3):
+            # 응답 본문을 한 번도 읽지 않고 버려도 슬롯이 남지 않음
+            await k8s.stream_pod_logs("default", "web", None, 100, None, None, None, None, None, None, {"id": "u1"})
+        assert manager.stats()["active_streams"] == 0
+    finally:
+        k8s.get_log_stream_manager = original
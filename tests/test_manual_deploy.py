@@ -0,0 +1,69 @@
+"""
+수동 배포 트리거 테스트
+
+배포가 별도 스레드의 asyncio.run()이 아니라 요청을 처리한 메인 이벤트 루프에서
+실행되는지 검증합니다 (공유 httpx/Redis 클라이언트와 asyncio 락은 루프에 묶여 있음).
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.v1 import github_workflows
+from app.models.base import Base
+from app.models.user_project_integration import UserProjectIntegration
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.mark.asyncio
+async def test_manual_deploy_runs_on_the_request_loop(monkeypatch, session_factory):
+    db = session_factory()
+    db.add(UserProjectIntegration(
+        user_id="u1", github_owner="octo", github_repo="app", github_full_name="octo/app",
+        github_installation_id="42", auto_deploy_enabled=True,
+    ))
+    db.commit()
+
+    async def latest_commit(owner, repo, branch, db):
+        return {
+            "sha": "abcdef1234567", "message": "fix", "author": {"name": "dev"},
+            "url": "https://github.test/c", "timestamp": "2026-01-01T00:00:00Z",
+        }
+
+    deployed = []
+    done = asyncio.Event()
+
+    async def handle_push_webhook(payload, integration, db):
+        deployed.append((asyncio.get_running_loop(), payload["head_commit"]["id"], integration.github_full_name))
+        done.set()
+        return {"status": "success"}
+
+    monkeypatch.setattr(github_workflows.github_app_auth, "get_latest_commit", latest_commit)
+    monkeypatch.setattr(github_workflows, "handle_push_webhook", handle_push_webhook)
+    monkeypatch.setattr(github_workflows, "SessionLocal", session_factory)
+
+    try:
+        response = await github_workflows.manual_deploy(
+            github_workflows.ManualDeployRequest(github_owner="octo", github_repo="app"),
+            db=db,
+            current_user={"id": "u1"},
+        )
+        assert response["status"] == "started"
+        await asyncio.wait_for(done.wait(), timeout=2)
+    finally:
+        db.close()
+
+    assert deployed == [(asyncio.get_running_loop(), "abcdef1234567", "octo/app")]
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.mcp.external.catalog import ToolCatalogCache
+from app.mcp.external.errors import MCPExternalError
+from app.mcp.external.handlers import MCPHandler, MCPHandlerConfig, MCPHandlerPool
+from app.mcp.external.interfaces import ExternalMCPClient
+from app.mcp.external.providers.github import GitHubMCPClient
+from app.mcp.external.registry import MCPProviderConfig, MCPProviderRegistry
+
+
+class CountingClient(ExternalMCPClient):
+    def __init__(self, tools=None, delay=0.0, health_delay=0.0, connect_delay=0.0, base_url=""):
+        self.tools = tools if tools is not None else [
+            {"name": "deploy", "description": "", "inputSchema": {"type": "object", "required": ["app"]}},
+            {"name": "scale", "description": "", "inputSchema": {"type": "object"}},
+        ]
+        self.delay = delay
+        self.health_delay = health_delay
+        self.connect_delay = connect_delay
+        self.list_calls = 0
+        self.health_result = {"ok": True}
+        self.fail_list = False
+
+    async def connect(self):
+        await asyncio.sleep(self.connect_delay)
+
+    async def close(self):
+        return None
+
+    async def list_tools(self):
+        self.list_calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail_list:
+            raise MCPExternalError(code="upstream_unavailable", message="down")
+        return list(self.tools)
+
+    async def call_tool(self, name, arguments):
+        if name not in {t["name"] for t in self.tools}:
+            raise MCPExternalError(code="not_found", message=f"unknown tool {name}")
+        return {"ok": True}
+
+    async def health(self):
+        await asyncio.sleep(self.health_delay)
+        return dict(self.health_result)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_schema_lookups_hit_cached_catalog_and_coalesce() -> None:
+    client = CountingClient(delay=0.05)
+    handler = MCPHandler(client, name="fake")
+
+    schemas = await asyncio.gather(*(handler.get_tool_schema("deploy") for _ in range(20)))
+    assert all(s == {"type": "object", "required": ["app"]} for s in schemas)
+    assert await handler.get_tool_schema("missing") is None
+    assert client.list_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_catalog_expires_after_ttl_and_on_version_change() -> None:
+    clock = Clock()
+    client = CountingClient()
+    handler = MCPHandler(client, config=MCPHandlerConfig(catalog_ttl_sec=60), name="fake")
+    handler.catalog = ToolCatalogCache("fake", ttl=60, clock=clock)
+
+    first = await handler.tool_catalog()
+    clock.now = 59
+    await handler.tool_catalog()
+    assert client.list_calls == 1
+
+    clock.now = 61
+    await handler.tool_catalog()
+    assert client.list_calls == 2
+
+    # The first advertised version is a baseline even though it differs from
+    # the catalog's content hash; repeating it keeps the catalog, a new one drops it
+    client.health_result = {"ok": True, "tools_version": "v1"}
+    assert "v1" != first.version
+    await handler.health_check()
+    await handler.tool_catalog()
+    await handler.health_check()
+    await handler.tool_catalog()
+    assert client.list_calls == 2
+
+    client.tools.append({"name": "restart", "inputSchema": {}})
+    client.health_result = {"ok": True, "tools_version": "v2"}
+    await handler.health_check()
+    assert await handler.get_tool_schema("restart") == {}
+    assert client.list_calls == 3
+
+
+@pytest.mark.asyncio
+async def test_unknown_tool_call_invalidates_and_failed_refresh_serves_stale() -> None:
+    client = CountingClient()
+    handler = MCPHandler(client, name="fake")
+    await handler.list_tools()
+
+    client.tools = [t for t in client.tools if t["name"] != "scale"]
+    with pytest.raises(MCPExternalError):
+        await handler.call_tool("scale", {})
+    assert await handler.get_tool_schema("scale") is None
+    assert client.list_calls == 2
+
+    client.fail_list = True
+    tools = await handler.list_tools(force_refresh=True)
+    assert [t["name"] for t in tools] == ["deploy"]
+
+
+@pytest.mark.asyncio
+async def test_health_check_all_runs_concurrently_with_timeouts() -> None:
+    pool = MCPHandlerPool()
+    config = MCPHandlerConfig(health_timeout_sec=0.3)
+    for i in range(4):
+        pool.add_handler(f"p{i}", MCPHandler(CountingClient(health_delay=0.2), config=config, name=f"p{i}"))
+    hung = MCPHandler(CountingClient(health_delay=10), config=config, name="hung")
+    pool.add_handler("hung", hung)
+
+    start = time.perf_counter()
+    results = await pool.health_check_all()
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.6  # sequential would take 0.8s + the hung provider
+    assert all(results[f"p{i}"]["ok"] for i in range(4))
+    assert results["hung"]["ok"] is False and "timed out" in results["hung"]["error"]
+    assert hung.breaker.consecutive_failures == 1
+
+
+@pytest.mark.asyncio
+async def test_registry_initializes_providers_concurrently() -> None:
+    class SlowClient(CountingClient):
+        def __init__(self, base_url="", connect_delay=0.2):
+            super().__init__(connect_delay=connect_delay)
+
+    registry = MCPProviderRegistry()
+    registry._providers = {**MCPProviderRegistry._providers, "slow": SlowClient}
+    registry.init_timeout_sec = 0.5
+    for i in range(4):
+        registry.add_provider_config(MCPProviderConfig(name=f"s{i}", provider_type="slow", base_url="x", config={}))
+    registry.add_provider_config(
+        MCPProviderConfig(name="stuck", provider_type="slow", base_url="x", config={"connect_delay": 10})
+    )
+
+    start = time.perf_counter()
+    results = await registry.initialize_all_providers()
+    assert time.perf_counter() - start < 0.8
+    assert results == {"s0": True, "s1": True, "s2": True, "s3": True, "stuck": False}
+
+
+@pytest.mark.asyncio
+async def test_github_tool_listing_uses_etag() -> None:
+    requests = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        requests.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            headers={"content-type": "application/json", "ETag": '"v1"'},
+            json={"tools": [{"name": "gh.clone", "inputSchema": {"type": "object"}}]},
+        )
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(respond), base_url="https://mcp.example") as http:
+        gh = GitHubMCPClient(base_url="https://mcp.example", http_client=http)
+        handler = MCPHandler(gh, name="github")
+
+        catalog = await handler.tool_catalog()
+        assert catalog.version == '"v1"'
+        refreshed = await handler.tool_catalog(force_refresh=True)
+        assert refreshed.schema("gh.clone") == {"type": "object"}
+        assert requests == [None, '"v1"']
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import asyncio
+import random
+
+import pytest
+
+from app.mcp.external.errors import MCPExternalError
+from app.mcp.external.handlers import MCPHandler
+from app.mcp.external.interfaces import ExternalMCPClient
+from app.mcp.external.resilience import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    AIMDLimiter,
+    CircuitBreaker,
+    ProviderPolicy,
+    ProviderPolicyConfig,
+    RetryBudget,
+)
+from app.mcp.external.retry import retry_async
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class DegradedProvider:
+    """Fake provider with a concurrency capacity and a failure rate.
+
+    Requests beyond ``capacity`` are answered with ``rate_limited``; the rest
+    fail with ``unavailable`` with probability ``failure_rate``.
+    """
+
+    def __init__(self, capacity=100, failure_rate=0.0, latency=0.002, seed=7):
+        self.capacity = capacity
+        self.failure_rate = failure_rate
+        self.latency = latency
+        self.rng = random.Random(seed)
+        self.inflight = 0
+        self.attempts = 0
+        self.overloaded = 0
+
+    async def request(self):
+        self.attempts += 1
+        self.inflight += 1
+        try:
+            await asyncio.sleep(self.latency)
+            if self.inflight > self.capacity:
+                self.overloaded += 1
+                raise MCPExternalError(code="rate_limited", message="too many requests")
+            if self.rng.random() < self.failure_rate:
+                raise MCPExternalError(code="unavailable", message="degraded")
+            return {"ok": True}
+        finally:
+            self.inflight -= 1
+
+
+async def _drive(provider, requests, concurrency, policy=None):
+    """Issue ``requests`` logical calls from ``concurrency`` workers; return success count."""
+    queue = list(range(requests))
+    ok = 0
+
+    async def worker():
+        nonlocal ok
+        while queue:
+            queue.pop()
+            try:
+                await retry_async(provider.request, attempts=5, base_delay=0.001, jitter=0, policy=policy)
+                ok += 1
+            except MCPExternalError:
+                pass
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return ok
+
+
+def test_retry_budget_caps_retries_to_ratio_within_window() -> None:
+    clock = Clock()
+    budget = RetryBudget(ratio=0.1, min_per_sec=0.0, window=10, clock=clock)
+    for _ in range(100):
+        budget.record_request()
+    assert sum(budget.try_retry() for _ in range(50)) == 10
+
+    # Old requests and retries slide out of the window
+    clock.now = 11
+    assert budget.try_retry() is False
+    for _ in range(20):
+        budget.record_request()
+    assert sum(budget.try_retry() for _ in range(5)) == 2
+
+
+def test_retry_budget_minimum_allows_retries_at_low_volume() -> None:
+    budget = RetryBudget(ratio=0.1, min_per_sec=0.5, window=10, clock=Clock())
+    budget.record_request()
+    assert sum(budget.try_retry() for _ in range(10)) == 5
+
+
+@pytest.mark.asyncio
+async def test_simulated_outage_retry_amplification_is_bounded_by_budget() -> None:
+    unbudgeted = DegradedProvider(failure_rate=1.0)
+    await _drive(unbudgeted, requests=200, concurrency=20)
+    assert unbudgeted.attempts == 1000  # every call retried 5x
+
+    budgeted = DegradedProvider(failure_rate=1.0)
+    policy = ProviderPolicy("sim", ProviderPolicyConfig(retry_budget_min_per_sec=0.0, queue_timeout_sec=5))
+    await _drive(budgeted, requests=200, concurrency=20, policy=policy)
+    assert budgeted.attempts <= 200 * 1.1
+
+
+@pytest.mark.asyncio
+async def test_simulated_partial_degradation_still_retries_transient_failures() -> None:
+    provider = DegradedProvider(failure_rate=0.05)
+    policy = ProviderPolicy("sim", ProviderPolicyConfig(retry_budget_min_per_sec=0.0, queue_timeout_sec=5))
+    ok = await _drive(provider, requests=400, concurrency=10, policy=policy)
+    # ~5% failures fit inside a 10% budget, so nearly all calls succeed
+    assert ok >= 395
+    assert provider.attempts <= 400 * 1.1
+
+
+@pytest.mark.asyncio
+async def test_aimd_limit_shrinks_under_overload_and_recovers() -> None:
+    provider = DegradedProvider(capacity=4)
+    policy = ProviderPolicy("sim", ProviderPolicyConfig(initial_limit=16, max_limit=32, queue_timeout_sec=5))
+
+    await _drive(provider, requests=300, concurrency=32, policy=policy)
+    degraded_limit = policy.limiter.limit
+    assert degraded_limit < 16
+    # Overload responses stop once the limit has converged near capacity
+    early_overloads = provider.overloaded
+    await _drive(provider, requests=200, concurrency=32, policy=policy)
+    assert provider.overloaded - early_overloads < early_overloads
+
+    provider.capacity = 100
+    await _drive(provider, requests=600, concurrency=32, policy=policy)
+    assert policy.limiter.limit > degraded_limit + 2
+
+
+@pytest.mark.asyncio
+async def test_aimd_limiter_rejects_locally_after_queue_timeout() -> None:
+    limiter = AIMDLimiter("sim", initial=1, queue_timeout=0.01)
+    gate = asyncio.Event()
+
+    async def hold():
+        async with limiter.acquire():
+            await gate.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    with pytest.raises(MCPExternalError) as e:
+        async with limiter.acquire():
+            pass
+    assert e.value.code == "overloaded"
+    gate.set()
+    await holder
+    assert limiter.inflight == 0
+
+
+def test_breaker_state_machine() -> None:
+    clock = Clock()
+    breaker = CircuitBreaker("sim", failure_threshold=2, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    assert breaker.state == OPEN and not breaker.try_acquire()
+
+    clock.now = 10
+    assert breaker.state == HALF_OPEN
+    assert breaker.try_acquire() is True
+    assert breaker.try_acquire() is False
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    clock.now = 20
+    assert breaker.try_acquire() is True
+    breaker.record_success()
+    assert breaker.state == CLOSED and breaker.try_acquire()
+
+
+class SlowClient(ExternalMCPClient):
+    def __init__(self):
+        self.calls = 0
+        self.fail = True
+        self.gate = asyncio.Event()
+
+    async def connect(self):
+        return None
+
+    async def close(self):
+        return None
+
+    async def list_tools(self):
+        return []
+
+    async def call_tool(self, name, arguments):
+        self.calls += 1
+        await self.gate.wait()
+        if self.fail:
+            raise MCPExternalError(code="unavailable", message="down")
+        return {"ok": True}
+
+    async def health(self):
+        return {"ok": True}
+
+
+@pytest.mark.asyncio
+async def test_half_open_breaker_lets_exactly_one_probe_through() -> None:
+    clock = Clock()
+    client = SlowClient()
+    handler = MCPHandler(client, name="sim")
+    handler.breaker = CircuitBreaker("sim", failure_threshold=1, reset_timeout=10, clock=clock)
+
+    client.gate.set()
+    with pytest.raises(MCPExternalError):
+        await handler.call_tool("x", {})
+    assert handler.breaker.state == OPEN
+
+    clock.now = 10
+    client.gate.clear()
+    client.fail = False
+    calls = [asyncio.create_task(handler.call_tool("x", {})) for _ in range(10)]
+    await asyncio.sleep(0.01)
+    client.gate.set()
+    results = await asyncio.gather(*calls, return_exceptions=True)
+
+    assert client.calls == 2  # the tripping call + one probe
+    assert sum(isinstance(r, dict) for r in results) == 1
+    assert all(r.code == "circuit_open" for r in results if isinstance(r, MCPExternalError))
+    assert handler.breaker.state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_frees_the_probe_slot() -> None:
+    clock = Clock()
+    client = SlowClient()
+    handler = MCPHandler(client, name="sim")
+    handler.breaker = CircuitBreaker("sim", failure_threshold=1, reset_timeout=10, clock=clock)
+    handler.breaker.record_failure()
+
+    clock.now = 10
+    probe = asyncio.create_task(handler.call_tool("x", {}))
+    await asyncio.sleep(0.01)
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+
+    assert handler.breaker.try_acquire() is True
@@ -0,0 +1,123 @@
+"""
+HTTP 메트릭 ASGI 미들웨어 테스트
+
+라우트 템플릿 라벨(카디널리티 제한), 진행 중 요청 게이지, 요청/응답 크기, 예외 시 500 기록,
+lifespan 동안의 이벤트 루프 지연 측정, 그리고 요청당 오버헤드 벤치마크를 검증합니다.
+"""
+
+import time
+from types import SimpleNamespace as NS
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.monitoring.middleware import OVERHEAD_BUDGET_US, UNMATCHED, PrometheusMiddleware
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def _app(lag_interval=0.0):
+    app = FastAPI()
+    app.add_middleware(PrometheusMiddleware, lag_interval=lag_interval)
+
+    @app.get("/mw-items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id, "in_progress": _sample("http_requests_in_progress", method="GET")}
+
+    @app.post("/mw-upload")
+    async def upload(request: Request):
+        await request.body()
+        return {"ok": True}
+
+    @app.get("/mw-boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    @app.get("/mw-block")
+    async def block():
+        time.sleep(0.3)  # 이벤트 루프를 막는 동기 호출
+        return {"ok": True}
+
+    return app
+
+
+def test_labels_use_route_template_not_raw_path():
+    client = TestClient(_app())
+    before = _sample("http_requests_total", method="GET", endpoint="/mw-items/{item_id}", status_code="200")
+
+    for item_id in (1, 2, 3):
+        body = client.get(f"/mw-items/{item_id}").json()
+        assert body["in_progress"] >= 1
+    client.get("/mw-missing/123")
+
+    assert _sample("http_requests_total", method="GET", endpoint="/mw-items/{item_id}", status_code="200") == before + 3
+    assert _sample("http_requests_total", method="GET", endpoint="/mw-items/1", status_code="200") == 0
+    assert _sample("http_requests_total", method="GET", endpoint=UNMATCHED, status_code="404") >= 1
+    assert _sample("http_requests_in_progress", method="GET") == 0
+
+
+def test_request_and_response_sizes_and_server_errors():
+    client = TestClient(_app(), raise_server_exceptions=False)
+    labels = {"method": "POST", "endpoint": "/mw-upload"}
+    before_req = _sample("http_request_size_bytes_sum", **labels)
+    before_resp = _sample("http_response_size_bytes_sum", **labels)
+
+    client.post("/mw-upload", content=b"x" * 1234)
+
+    assert _sample("http_request_size_bytes_sum", **labels) == before_req + 1234
+    assert _sample("http_response_size_bytes_sum", **labels) == before_resp + len(b'{"ok":true}')
+
+    assert client.get("/mw-boom").status_code == 500
+    assert _sample("http_requests_total", method="GET", endpoint="/mw-boom", status_code="500") >= 1
+
+
+def test_event_loop_lag_is_recorded_during_lifespan():
+    before = _sample("event_loop_lag_seconds_count")
+    with TestClient(_app(lag_interval=0.05)) as client:
+        client.get("/mw-block")
+        time.sleep(0.15)
+    assert _sample("event_loop_lag_seconds_count") > before
+    assert _sample("event_loop_lag_seconds_bucket", le="0.1") < _sample("event_loop_lag_seconds_count")
+
+
+async def _endpoint(scope, receive, send):
+    scope["route"] = NS(path_format="/bench/{item_id}")
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def _noop_send(message):
+    return None
+
+
+async def _noop_receive():
+    return {"type": "http.request", "body": b""}
+
+
+async def _time_requests(app, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        scope = {"type": "http", "method": "GET", "path": "/bench/1", "root_path": "",
+                 "headers": [(b"content-length", b"0")]}
+        await app(scope, _noop_receive, _noop_send)
+    return time.perf_counter() - start
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_per_request_overhead_within_budget():
+    wrapped = PrometheusMiddleware(_endpoint, lag_interval=0)
+    n = 20000
+    await _time_requests(wrapped, 1000)  # 라벨 child 캐시 워밍업
+
+    overheads = []
+    for _ in range(5):
+        bare = await _time_requests(_endpoint, n)
+        measured = await _time_requests(wrapped, n)
+        overheads.append((measured - bare) / n * 1e6)
+
+    assert min(overheads) < OVERHEAD_BUDGET_US, f"middleware overhead {min(overheads):.1f}us"
@@ -0,0 +1,266 @@
+"""
+NCR 이미지 태그 인덱스 테스트
+
+Registry v2 tags/list 페이지네이션과 Bearer 인증(토큰 재사용), 축약 SHA 조회,
+오래된 색인/확인 실패 시 unknown 처리, DB 적재/동기화, 재색인 중 빌드 기록 보존,
+롤백 후보의 can_rollback 반영(색인 miss 시 매니페스트 직접 확인), 루프 재바인딩 시 이전 태스크 취소를 검증합니다.
+"""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.base import Base
+from app.models.deployment_history import DeploymentHistory
+from app.models.ncr_image_tag import NcrImageTag
+from app.services import rollback
+from app.services.ncr_tag_index import NcrTagIndex, split_image
+
+REGISTRY = "reg.ncr.test"
+SHA_A = "a1b2c3d4e5f60718293a4b5c6d7e8f9012345678"
+SHA_B = "b1b2c3d4e5f60718293a4b5c6d7e8f9012345678"
+SHA_C = "c1b2c3d4e5f60718293a4b5c6d7e8f9012345678"
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRegistry:
+    """Bearer 인증이 필요한 Registry v2 tags/list (페이지당 2개)"""
+
+    def __init__(self, repos):
+        self.repos = repos
+        self.token_requests = 0
+        self.list_requests = 0
+        self.manifest_requests = 0
+        self.status = None
+        self.gate = None
+
+    async def __call__(self, request):
+        if request.url.path == "/token":
+            self.token_requests += 1
+            return httpx.Response(200, json={"token": "tok"})
+        if request.headers.get("Authorization") != "Bearer tok":
+            return httpx.Response(401, headers={
+                "WWW-Authenticate": f'Bearer realm="https://{REGISTRY}/token",service="ncr"',
+            })
+        if "/manifests/" in request.url.path:
+            self.manifest_requests += 1
+            name, tag = request.url.path[len("/v2/"):].split("/manifests/")
+            return httpx.Response(200 if tag in self.repos.get(name, ()) else 404)
+        self.list_requests += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.status:
+            return httpx.Response(self.status)
+        name = request.url.path[len("/v2/"):-len("/tags/list")]
+        if name not in self.repos:
+            return httpx.Response(404, json={"errors": [{"code": "NAME_UNKNOWN"}]})
+        tags = sorted(self.repos[name])
+        last = request.url.params.get("last")
+        start = tags.index(last) + 1 if last else 0
+        page = tags[start:start + 2]
+        headers = {}
+        if start + 2 < len(tags):
+            headers["Link"] = f'</v2/{name}/tags/list?n=2&last={page[-1]}>; rel="next"'
+        return httpx.Response(200, json={"name": name, "tags": page}, headers=headers)
+
+
+def _index(registry, session_factory, clock=None, max_age=3600):
+    return NcrTagIndex(
+        registry=REGISTRY,
+        interval=600,
+        max_age=max_age,
+        session_factory=session_factory,
+        transport=httpx.MockTransport(registry),
+        clock=clock or Clock(),
+    )
+
+
+def _stored(session_factory, image_name):
+    db = session_factory()
+    try:
+        return {tag for (tag,) in db.query(NcrImageTag.tag).filter(NcrImageTag.image_name == image_name)}
+    finally:
+        db.close()
+
+
+def test_split_image():
+    assert split_image(f"{REGISTRY}/org-app:abc1234") == (REGISTRY, "org-app", "abc1234")
+    assert split_image("org-app:abc1234") is None
+    assert split_image(f"{REGISTRY}/org-app") is None
+
+
+@pytest.mark.asyncio
+async def test_paginated_listing_with_bearer_token_and_short_sha(session_factory):
+    registry = FakeRegistry({"org-app": {SHA_A[:7], SHA_B[:7], "latest", "v1", "v2"}})
+    index = _index(registry, session_factory)
+
+    assert index.lookup("org-app", SHA_A) is None
+    tags = await index.refresh("org-app")
+
+    assert tags == {SHA_A[:7], SHA_B[:7], "latest", "v1", "v2"}
+    assert registry.list_requests == 3
+    assert index.lookup("org-app", SHA_A) is True
+    assert index.lookup("org-app", "v1") is True
+    assert index.lookup("org-app", SHA_C) is False
+
+    # 토큰은 다음 주기에도 재사용
+    await index.refresh("org-app")
+    assert registry.token_requests == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_or_failed_listing_is_unknown(session_factory):
+    clock = Clock()
+    registry = FakeRegistry({"org-app": {SHA_A[:7]}})
+    index = _index(registry, session_factory, clock=clock, max_age=60)
+    await index.refresh("org-app")
+
+    # 확인 실패는 기존 색인 유지
+    registry.status = 500
+    assert await index.refresh("org-app") is None
+    assert index.lookup("org-app", SHA_A) is True
+
+    clock.now += 61
+    assert index.lookup("org-app", SHA_A) is None
+
+    # 저장소 자체가 없으면 롤백 불가로 확정
+    registry.status = None
+    assert await index.refresh("missing") == frozenset()
+    assert index.lookup("missing", SHA_A) is False
+
+
+@pytest.mark.asyncio
+async def test_index_is_persisted_and_reloaded(session_factory):
+    registry = FakeRegistry({"org-app": {SHA_A[:7], SHA_B[:7]}})
+    index = _index(registry, session_factory)
+    await index.refresh("org-app")
+    assert _stored(session_factory, "org-app") == {SHA_A[:7], SHA_B[:7]}
+
+    registry.repos["org-app"] = {SHA_B[:7], SHA_C[:7]}
+    await index.refresh("org-app")
+    assert _stored(session_factory, "org-app") == {SHA_B[:7], SHA_C[:7]}
+
+    # 재기동: 레지스트리 호출 없이 DB에서 적재
+    offline = FakeRegistry({})
+    restarted = _index(offline, session_factory)
+    await restarted.load()
+    assert restarted.lookup("org-app", SHA_C) is True
+    assert restarted.lookup("org-app", SHA_A) is False
+    assert offline.list_requests == 0
+
+
+@pytest.mark.asyncio
+async def test_build_recorded_during_refresh_is_kept(session_factory):
+    registry = FakeRegistry({"org-app": {SHA_A[:7]}})
+    registry.gate = asyncio.Event()
+    index = _index(registry, session_factory)
+
+    refreshing = asyncio.create_task(index.refresh("org-app"))
+    await asyncio.sleep(0.01)
+    # 목록 응답 이후 푸시된 이미지
+    await index.record_image(f"{REGISTRY}/org-app:{SHA_B[:7]}")
+    registry.gate.set()
+    await refreshing
+
+    assert index.lookup("org-app", SHA_A) is True
+    assert index.lookup("org-app", SHA_B) is True
+    assert _stored(session_factory, "org-app") == {SHA_A[:7], SHA_B[:7]}
+
+
+@pytest.mark.asyncio
+async def test_record_before_first_listing_does_not_claim_other_tags(session_factory):
+    index = _index(FakeRegistry({}), session_factory)
+    await index.record("org-app", SHA_A[:7])
+    assert index.lookup("org-app", SHA_B) is None
+
+
+@pytest.mark.asyncio
+async def test_rollback_candidates_report_indexed_image_state(session_factory, monkeypatch):
+    db = session_factory()
+    base = datetime(2026, 1, 1)
+    for i, sha in enumerate((SHA_A, SHA_B, SHA_C)):
+        db.add(DeploymentHistory(
+            user_id="u1", github_owner="org", github_repo="app", github_commit_sha=sha,
+            status="success", is_rollback=False, created_at=base + timedelta(minutes=i),
+        ))
+    db.commit()
+
+    registry = FakeRegistry({"org-app": {SHA_B[:7]}})
+    index = _index(registry, session_factory)
+    await index.refresh("org-app")
+    monkeypatch.setattr(rollback, "get_ncr_tag_index", lambda: index)
+
+    # 마지막 목록 이후 푸시된 태그(SHA_C)는 직접 확인으로 찾고 색인에 기록
+    registry.repos["org-app"].add(SHA_C[:7])
+    result = await rollback.get_rollback_candidates("org", "app", db)
+    flags = {c["commit_sha"]: (c["can_rollback"], c["image_verified"]) for c in result["candidates"]}
+    assert flags == {SHA_C: (True, True), SHA_B: (True, True), SHA_A: (False, False)}
+    # 색인 miss(SHA_A, SHA_C)만 매니페스트로 직접 확인 (전체/축약 태그)
+    assert registry.list_requests == 1 and registry.manifest_requests == 4
+    assert index.lookup("org-app", SHA_C) is True
+
+    # 삭제된 태그(SHA_A)는 다음 재색인 전까지 다시 확인하지 않음
+    result = await rollback.get_rollback_candidates("org", "app", db)
+    assert {c["commit_sha"]: c["can_rollback"] for c in result["candidates"]}[SHA_A] is False
+    assert registry.manifest_requests == 4
+
+    # 재색인 후에는 목록에 나타난 태그로 판단
+    registry.repos["org-app"].add(SHA_A[:7])
+    await index.refresh("org-app")
+    result = await rollback.get_rollback_candidates("org", "app", db)
+    flags = {c["commit_sha"]: (c["can_rollback"], c["image_verified"]) for c in result["candidates"]}
+    assert flags[SHA_A] == (True, True)
+    # 태그 3개 → 목록 2페이지
+    assert registry.list_requests == 3 and registry.manifest_requests == 4
+    db.close()
+
+
+def test_rebinding_cancels_the_task_on_the_previous_loop(session_factory):
+    index = _index(FakeRegistry({}), session_factory)
+    other = asyncio.new_event_loop()
+    thread = threading.Thread(target=other.run_forever)
+    thread.start()
+
+    async def start():
+        index.ensure_started()
+        return index._task
+
+    try:
+        old = asyncio.run_coroutine_threadsafe(start(), other).result(2)
+
+        async def rebind():
+            index.ensure_started()
+            assert index._task is not old
+            await index.stop()
+
+        asyncio.run(rebind())
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), other).result(2)
+        assert old.cancelled()
+    finally:
+        other.call_soon_threadsafe(other.stop)
+        thread.join(2)
+        other.close()
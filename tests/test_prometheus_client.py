@@ -0,0 +1,162 @@
+"""
+공유 Prometheus 클라이언트 테스트
+
+동일 쿼리 병합, scrape 주기 경계 캐시, query_range step 선택/정렬, 적중률 통계를 검증합니다.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.config import get_settings
+from app.services.prometheus_client import PrometheusClient, select_step
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _make_client(handler, clock, **kwargs):
+    return PrometheusClient(
+        base_url="http://prometheus.test",
+        scrape_interval=15,
+        transport=httpx.MockTransport(handler),
+        clock=clock,
+        **kwargs,
+    )
+
+
+def _vector(value):
+    return {"status": "success", "data": {"resultType": "vector", "result": [{"metric": {}, "value": [0, str(value)]}]}}
+
+
+@pytest.mark.asyncio
+async def test_identical_inflight_queries_are_coalesced():
+    calls = 0
+
+    async def handler(request):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=_vector(42))
+
+    client = _make_client(handler, Clock(1000.0))
+    results = await asyncio.gather(*(client.query("up") for _ in range(8)))
+
+    assert calls == 1
+    assert all(r["data"]["result"][0]["value"][1] == "42" for r in results)
+    assert client.stats()["query"]["coalesced"] == 7
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_coalesced_followers():
+    calls = 0
+
+    async def handler(request):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=_vector(7))
+
+    client = _make_client(handler, Clock(1000.0))
+    leader = asyncio.create_task(client.query("up"))
+    await asyncio.sleep(0.01)
+    followers = [asyncio.create_task(client.query("up")) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    results = await asyncio.gather(*followers)
+    assert leader.cancelled()
+    assert calls == 1
+    assert all(r["data"]["result"][0]["value"][1] == "7" for r in results)
+    # 공유 조회 결과는 캐시에도 남음
+    assert (await client.query("up"))["data"]["result"][0]["value"][1] == "7"
+    assert calls == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_cache_expires_at_next_scrape_boundary():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.params["query"])
+        return httpx.Response(200, json=_vector(len(calls)))
+
+    clock = Clock(1001.0)  # 다음 scrape 경계: 1005
+    client = _make_client(handler, clock)
+
+    first = await client.query("up")
+    clock.now = 1004.9
+    assert await client.query("up") is first
+    clock.now = 1005.0
+    refreshed = await client.query("up")
+
+    assert refreshed["data"]["result"][0]["value"][1] == "2"
+    assert calls == ["up", "up"]
+    stats = client.stats()["query"]
+    assert stats == {"requests": 3, "hits": 1, "coalesced": 0, "errors": 0, "hit_rate": round(1 / 3, 4)}
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached():
+    responses = [httpx.Response(503, text="unavailable"), httpx.Response(200, json=_vector(1))]
+
+    def handler(request):
+        return responses.pop(0)
+
+    client = _make_client(handler, Clock(1000.0))
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.query("up")
+    assert (await client.query("up"))["status"] == "success"
+    assert client.stats()["query"]["errors"] == 1
+    await client.aclose()
+
+
+def test_select_step_respects_scrape_interval_and_max_points():
+    assert select_step(0, 600, 15, 300) == 15
+    assert select_step(0, 3600, 15, 300) == 15
+    assert select_step(0, 6 * 3600, 15, 300) == 120
+    assert select_step(0, 7 * 86400, 15, 300) == 3600
+    assert select_step(0, 3600, 30, 1000) == 30
+
+
+@pytest.mark.asyncio
+async def test_query_range_aligns_to_step_and_shares_cache():
+    seen = []
+
+    def handler(request):
+        seen.append(dict(request.url.params))
+        return httpx.Response(200, json={"status": "success", "data": {"resultType": "matrix", "result": []}})
+
+    clock = Clock(100_010.0)
+    client = _make_client(handler, clock)
+
+    # 같은 1시간 차트를 몇 초 차이로 연 두 사용자
+    await client.query_range("rate(x[1m])", start=96_405.0, end=100_005.0, max_points=100)
+    await client.query_range("rate(x[1m])", start=96_410.0, end=100_010.0, max_points=100)
+
+    assert len(seen) == 1
+    params = seen[0]
+    assert params["step"] == "60"
+    assert float(params["start"]) % 60 == 0 and float(params["end"]) % 60 == 0
+    assert client.stats()["query_range"]["hits"] == 1
+
+    with pytest.raises(ValueError):
+        await client.query_range("rate(x[1m])", start=10.0, end=10.0)
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_missing_base_url_is_skipped(monkeypatch):
+    monkeypatch.setattr(get_settings(), "prometheus_base_url", None)
+    client = PrometheusClient(transport=httpx.MockTransport(lambda r: httpx.Response(500)))
+    result = await client.query("up")
+    assert result["status"] == "skipped"
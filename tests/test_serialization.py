@@ -0,0 +1,228 @@
+"""
+JSON 직렬화 테스트
+
+orjson/표준 json 백엔드의 출력 동등성, 기본 응답 클래스, 브로드캐스트 1회 직렬화,
+Redis 대화 세션 왕복, 그리고 대표 페이로드(클러스터 overview, 배포 이력 목록) 벤치마크를 검증합니다.
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from uuid import UUID
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi.websockets import WebSocketState
+from pydantic import BaseModel
+
+from app.core import serialization
+from app.core.serialization import FastJSONResponse, dumps, dumps_str, loads
+from app.services.conversation_manager import ConversationManager, ConversationState
+from app.websocket.deployment_monitor import DeploymentMonitorManager
+from app.websocket.fanout import LocalFanoutBus
+
+pytestmark = pytest.mark.skipif(serialization.orjson is None, reason="orjson 미설치")
+
+
+class Status(Enum):
+    RUNNING = "running"
+
+
+class Replica(BaseModel):
+    name: str
+    ready: bool
+
+
+@dataclass
+class Usage:
+    cpu: float
+    memory: int
+
+
+@pytest.fixture
+def backend():
+    original = serialization.backend_name()
+    yield serialization.set_backend
+    serialization.set_backend(original)
+
+
+def _mixed_payload():
+    return {
+        "id": UUID("12345678-1234-5678-1234-567812345678"),
+        "status": Status.RUNNING,
+        "created_at": datetime(2024, 5, 1, 9, 30, 15, 123456, tzinfo=timezone.utc),
+        "cost": Decimal("12.50"),
+        "replicas": Decimal("3"),
+        "tags": {"prod"},
+        "replica": Replica(name="api-0", ready=True),
+        "usage": Usage(cpu=0.25, memory=512),
+        "message": "배포 완료",
+    }
+
+
+def test_backends_produce_identical_json(backend):
+    payload = _mixed_payload()
+    assert backend("json") == "json"
+    stdlib = dumps(payload)
+    assert backend("orjson") == "orjson"
+    fast = dumps(payload)
+
+    assert loads(stdlib) == loads(fast)
+    decoded = loads(fast)
+    assert decoded["created_at"] == "2024-05-01T09:30:15.123456+00:00"
+    assert decoded["status"] == "running" and decoded["cost"] == 12.5 and decoded["replicas"] == 3
+    assert decoded["replica"] == {"name": "api-0", "ready": True}
+    assert decoded["usage"] == {"cpu": 0.25, "memory": 512}
+    # ensure_ascii=False와 동일하게 한국어를 그대로 UTF-8로 출력
+    assert "배포 완료".encode("utf-8") in fast and "배포 완료" in dumps_str(payload)
+
+
+def test_unknown_backend_falls_back_to_stdlib(backend):
+    assert backend("ujson") == "json"
+    with pytest.raises(TypeError):
+        dumps({"value": object()})
+
+
+def test_default_response_class_renders_with_fast_backend():
+    app = FastAPI(default_response_class=FastJSONResponse)
+
+    @app.get("/payload")
+    async def payload():
+        return {"message": "정상", "at": datetime(2024, 1, 1)}
+
+    response = TestClient(app).get("/payload")
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"message": "정상", "at": "2024-01-01T00:00:00"}
+
+
+class FakeWebSocket:
+    client_state = WebSocketState.CONNECTED
+
+    def __init__(self):
+        self.frames = []
+
+    async def send_text(self, text):
+        self.frames.append(text)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_serializes_once_per_message(monkeypatch):
+    manager = DeploymentMonitorManager()
+    manager.fanout = LocalFanoutBus(manager._deliver_envelope)
+    sockets = [FakeWebSocket() for _ in range(5)]
+    manager.deployment_connections["dep-1"] = list(sockets)
+    manager.user_connections["user-1"] = list(sockets)
+
+    calls = []
+    monkeypatch.setattr(
+        "app.websocket.deployment_monitor.dumps_str",
+        lambda obj: calls.append(obj) or serialization.dumps_str(obj),
+    )
+
+    message = {"type": "stage_progress", "data": {"progress": 50, "at": datetime(2024, 1, 1)}}
+    await manager.publish_event("dep-1", "user-1", message)
+    await manager.publish_event("dep-1", None, message)
+
+    assert len(calls) == 2
+    assert all(len(ws.frames) == 2 for ws in sockets)
+    assert loads(sockets[0].frames[0])["data"]["at"] == "2024-01-01T00:00:00"
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value.encode("utf-8") if isinstance(value, str) else value
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+
+@pytest.mark.asyncio
+async def test_conversation_session_round_trip_through_redis():
+    manager = ConversationManager(FakeRedis())
+    session_id = await manager.create_session("user-1")
+
+    await manager.add_message("user-1", session_id, "user", "nginx 재시작해줘", metadata={"at": datetime(2024, 1, 1)})
+    await manager.update_state(
+        "user-1", session_id, ConversationState.WAITING_CONFIRMATION,
+        pending_action={"command": "restart", "cost": Decimal("0.10")},
+    )
+
+    session = await manager.get_session("user-1", session_id)
+    assert session["state"] == "waiting_confirmation"
+    assert session["pending_action"] == {"command": "restart", "cost": 0.1}
+    assert session["conversation_history"][0]["content"] == "nginx 재시작해줘"
+    assert session["conversation_history"][0]["metadata"]["at"] == "2024-01-01T00:00:00"
+
+
+def _overview_payload():
+    now = datetime(2024, 5, 1, tzinfo=timezone.utc)
+    return {
+        "cluster": "nks-cluster",
+        "generated_at": now,
+        "nodes": [
+            {"name": f"node-{i}", "status": "Ready", "cpu": 0.42, "memory": 0.61, "pods": 30}
+            for i in range(10)
+        ],
+        "pods": [
+            {
+                "name": f"app-{i}-7d9f8c6b5-x2k4q",
+                "namespace": "default",
+                "phase": "Running",
+                "restarts": i % 3,
+                "labels": {"app": f"app-{i % 20}", "tier": "backend"},
+                "containers": [{"name": "app", "image": f"registry/app:{i}", "ready": True}],
+                "started_at": now - timedelta(minutes=i),
+            }
+            for i in range(300)
+        ],
+    }
+
+
+def _history_payload():
+    now = datetime(2024, 5, 1, tzinfo=timezone.utc)
+    return {
+        "histories": [
+            {
+                "id": i,
+                "repository": "owner/app",
+                "commit_sha": f"{i:040x}",
+                "commit_message": "배포 파이프라인 수정",
+                "status": "success",
+                "started_at": now - timedelta(hours=i),
+                "completed_at": now - timedelta(hours=i, minutes=-3),
+                "total_duration": 180 + i,
+                "stages": {"sourcecommit": {"status": "success"}, "sourcebuild": {"status": "success"}},
+            }
+            for i in range(200)
+        ],
+        "total_count": 200,
+    }
+
+
+def _best_of(fn, payload, repeat=5, number=20):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn(payload)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.parametrize("make_payload", [_overview_payload, _history_payload])
+def test_fast_backend_is_several_times_faster(backend, make_payload):
+    payload = make_payload()
+    backend("json")
+    stdlib = _best_of(dumps, payload)
+    backend("orjson")
+    fast = _best_of(dumps, payload)
+    assert stdlib / fast >= 3, f"orjson speedup only {stdlib / fast:.1f}x"
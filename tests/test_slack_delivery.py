@@ -0,0 +1,242 @@
+"""
+Slack 발신 큐 테스트
+
+호출자가 느린 웹훅에 막히지 않는지, 채널별 토큰 버킷, Retry-After 준수,
+웹훅별 상태 분리, 대기 중 메시지 병합과 Bot 경로의 chat.update 수정, 버림 처리,
+다른 스레드의 이벤트 루프에서 적재할 때 큐 루프로 넘기는지를 검증합니다.
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from app.services.notification import SlackNotificationService
+from app.services.slack_delivery import SlackDeliveryError, SlackDeliveryQueue, TokenBucket
+
+WEBHOOK = "https://hooks.slack.test/services/T/B/X"
+OTHER_WEBHOOK = "https://hooks.slack.test/services/T2/B2/Y"
+
+
+class Recorder:
+    """요청을 기록하고 준비된 응답을 순서대로 돌려주는 MockTransport 핸들러"""
+
+    def __init__(self, responses=None, delay=0.0):
+        self.responses = list(responses or [])
+        self.delay = delay
+        self.requests = []
+
+    async def __call__(self, request):
+        self.requests.append((time.monotonic(), request.url.path, json.loads(request.content)))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.responses:
+            return self.responses.pop(0)
+        return httpx.Response(200, text="ok")
+
+
+def _queue(handler, **kwargs):
+    kwargs.setdefault("rate_per_second", 1000)
+    kwargs.setdefault("burst", 1000)
+    return SlackDeliveryQueue(transport=httpx.MockTransport(handler), **kwargs)
+
+
+def test_token_bucket_refills_at_rate():
+    bucket = TokenBucket(rate=1.0, capacity=2, tokens=2, updated=0.0)
+    assert bucket.wait_time(0.0) == 0
+    bucket.consume(0.0)
+    bucket.consume(0.0)
+    assert bucket.wait_time(0.0) == pytest.approx(1.0)
+    assert bucket.wait_time(0.5) == pytest.approx(0.5)
+    assert bucket.wait_time(1.0) == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_webhook_does_not_block_caller():
+    recorder = Recorder(delay=0.3)
+    queue = _queue(recorder)
+
+    start = time.perf_counter()
+    assert queue.submit({"text": "hello"}, channel="#deploy", webhook_url=WEBHOOK)
+    assert time.perf_counter() - start < 0.05
+
+    assert await queue.drain(timeout=2)
+    assert len(recorder.requests) == 1
+    assert queue.stats()["sent"] == 1
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_per_channel_rate_limit():
+    recorder = Recorder()
+    queue = _queue(recorder, rate_per_second=20, burst=1)
+
+    for i in range(4):
+        queue.submit({"text": f"a{i}"}, channel="#a", webhook_url=WEBHOOK)
+    queue.submit({"text": "b0"}, channel="#b", webhook_url=WEBHOOK)
+    await queue.drain(timeout=2)
+
+    times = {}
+    for at, _, body in recorder.requests:
+        times.setdefault(body["text"][0], []).append(at)
+    gaps = [b - a for a, b in zip(times["a"], times["a"][1:])]
+    assert len(times["a"]) == 4 and min(gaps) >= 0.04
+    # 다른 채널은 #a의 대기열에 막히지 않음
+    assert times["b"][0] < times["a"][1]
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_retry_after_pauses_channel_and_keeps_order():
+    recorder = Recorder([httpx.Response(429, headers={"Retry-After": "0.2"}), httpx.Response(503)])
+    queue = _queue(recorder)
+
+    queue.submit({"text": "first"}, channel="#a", webhook_url=WEBHOOK)
+    queue.submit({"text": "second"}, channel="#a", webhook_url=WEBHOOK)
+    await queue.drain(timeout=5)
+
+    texts = [body["text"] for _, _, body in recorder.requests]
+    assert texts == ["first", "first", "first", "second"]
+    assert recorder.requests[1][0] - recorder.requests[0][0] >= 0.2
+    assert queue.stats()["retried"] == 2 and queue.stats()["sent"] == 2
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_webhooks_sharing_a_channel_name_do_not_throttle_each_other():
+    class PerWebhook(Recorder):
+        async def __call__(self, request):
+            await super().__call__(request)
+            if request.url.path.endswith("/X") and not self.limited:
+                self.limited = True
+                return httpx.Response(429, headers={"Retry-After": "0.5"})
+            return httpx.Response(200, text="ok")
+
+    recorder = PerWebhook()
+    recorder.limited = False
+    queue = _queue(recorder, rate_per_second=20, burst=1)
+
+    # 채널을 생략한 사용자별 웹훅은 모두 기본 채널로 모이지만 버킷/대기열/Retry-After는 웹훅마다 따로
+    for i in range(2):
+        queue.submit({"text": f"x{i}"}, webhook_url=WEBHOOK)
+        queue.submit({"text": f"y{i}"}, webhook_url=OTHER_WEBHOOK)
+    await asyncio.sleep(0.2)
+    assert queue.retry_after(webhook_url=WEBHOOK) > 0
+    assert queue.retry_after(webhook_url=OTHER_WEBHOOK) == 0
+    await queue.drain(timeout=5)
+
+    sent = {}
+    for at, path, body in recorder.requests:
+        sent.setdefault(path[-1], []).append((at, body["text"]))
+    start = recorder.requests[0][0]
+    assert [text for _, text in sent["Y"]] == ["y0", "y1"]
+    # 다른 웹훅의 429(0.5초)와 무관하게 자기 속도(20건/초)로 전송
+    assert sent["Y"][-1][0] - start < 0.3
+    assert [text for _, text in sent["X"]] == ["x0", "x0", "x1"]
+    assert sent["X"][1][0] - sent["X"][0][0] >= 0.5
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_pending_stage_updates_are_coalesced():
+    recorder = Recorder()
+    queue = _queue(recorder, rate_per_second=10, burst=1)
+
+    queue.submit({"text": "other"}, channel="#a", webhook_url=WEBHOOK)
+    for stage in ("started", "building", "deploying", "success"):
+        queue.submit({"text": stage}, channel="#a", webhook_url=WEBHOOK, coalesce_key="deployment:7")
+    await queue.drain(timeout=2)
+
+    assert [body["text"] for _, _, body in recorder.requests] == ["other", "success"]
+    assert queue.stats()["coalesced"] == 3
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_bot_token_path_edits_sent_message():
+    def respond(request):
+        body = json.loads(request.content)
+        return httpx.Response(200, json={"ok": True, "channel": "C123", "ts": body.get("ts", "1700.0001")})
+
+    recorder = Recorder()
+
+    async def handler(request):
+        await recorder(request)
+        return respond(request)
+
+    queue = _queue(handler, bot_token="xoxb-test")
+    first = await queue.deliver({"text": "started"}, channel="#deploy", coalesce_key="deployment:9")
+    second = await queue.deliver({"text": "success"}, channel="#deploy", coalesce_key="deployment:9")
+
+    paths = [path for _, path, _ in recorder.requests]
+    assert paths == ["/api/chat.postMessage", "/api/chat.update"]
+    assert recorder.requests[1][2]["ts"] == "1700.0001" and recorder.requests[1][2]["channel"] == "C123"
+    assert first["ts"] == second["ts"] == "1700.0001"
+    assert queue.stats()["edited"] == 1
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_rejected_and_overflow_messages_are_dropped():
+    recorder = Recorder([httpx.Response(400, text="invalid_payload")], delay=0.05)
+    queue = _queue(recorder, max_pending=2)
+
+    with pytest.raises(SlackDeliveryError):
+        await queue.deliver({"text": "bad"}, channel="#a", webhook_url=WEBHOOK)
+
+    assert queue.submit({"text": "1"}, channel="#a", webhook_url=WEBHOOK)
+    assert queue.submit({"text": "2"}, channel="#a", webhook_url=WEBHOOK)
+    assert not queue.submit({"text": "3"}, channel="#a", webhook_url=WEBHOOK)
+    await queue.drain(timeout=2)
+
+    stats = queue.stats()
+    assert stats["dropped_rejected"] == 1 and stats["dropped_queue_full"] == 1 and stats["sent"] == 2
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_notification_service_enqueues_without_blocking(monkeypatch):
+    recorder = Recorder(delay=0.5)
+    queue = _queue(recorder)
+    monkeypatch.setattr("app.services.notification.get_slack_delivery_queue", lambda: queue)
+    service = SlackNotificationService(webhook_url=WEBHOOK)
+
+    start = time.perf_counter()
+    first = await service.send_simple_message("배포", "시작", channel="#deploy")
+    second = await service.send_simple_message("배포", "완료", channel="#deploy")
+    assert time.perf_counter() - start < 0.1
+    assert first.success and second.success
+
+    await queue.drain(timeout=3)
+    assert [body["channel"] for _, _, body in recorder.requests] == ["#deploy", "#deploy"]
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_foreign_thread_loop_hands_off_without_rebinding():
+    recorder = Recorder(delay=0.05)
+    queue = _queue(recorder)
+    queue.start()
+    main_loop = asyncio.get_running_loop()
+    assert queue.submit({"text": "main"}, channel="#deploy", webhook_url=WEBHOOK)
+    client = queue._get_client()
+    results = {}
+
+    def other_thread():
+        async def run():
+            results["submitted"] = queue.submit({"text": "thread"}, channel="#deploy", webhook_url=WEBHOOK)
+            results["delivered"] = await queue.deliver({"text": "wait"}, channel="#other", webhook_url=WEBHOOK)
+        asyncio.run(run())
+
+    thread = threading.Thread(target=other_thread)
+    thread.start()
+    await asyncio.to_thread(thread.join, 5)
+
+    assert results["submitted"] is True and results["delivered"]["ok"] is True
+    assert queue._loop is main_loop and queue._get_client() is client
+    await queue.drain(timeout=2)
+    assert sorted(body["text"] for _, _, body in recorder.requests) == ["main", "thread", "wait"]
+    await queue.stop()
@@ -0,0 +1,156 @@
+"""
+기동 경로 테스트
+
+liveness/readiness 분리, 서브시스템 초기화 상태와 재시도, -X importtime 파싱, 스키마 확인(누락 컬럼 포함),
+startup-profile 인증, 그리고 app.main 콜드 스타트 벤치마크(import 시 DDL이 실행되지 않는지 포함)를 검증합니다.
+"""
+
+import asyncio
+import sqlite3
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app import database
+from app.api.v1.auth_verify import get_current_user
+from app.api.v1.system import router as system_router
+from app.core.config import get_settings
+from app.core.startup import FAILED, READY, RETRYING, StartupProfiler, measure_cold_start, parse_importtime
+
+IMPORTTIME_SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _io
+import time:      2000 |       5000 |   sqlalchemy
+import time:      3000 |       3000 |     kubernetes.client
+import time:      1000 |      10000 | app.main
+"""
+
+
+def test_parse_importtime_rows_and_depth():
+    rows = parse_importtime(IMPORTTIME_SAMPLE)
+    assert [(r["module"], r["depth"]) for r in rows] == [
+        ("_io", 2), ("sqlalchemy", 1), ("kubernetes.client", 2), ("app.main", 0),
+    ]
+    assert rows[-1]["cumulative_ms"] == 10.0 and rows[1]["self_ms"] == 2.0
+
+
+def _app(profiler, authenticated=True):
+    app = FastAPI()
+    app.state.startup = profiler
+    app.include_router(system_router, prefix="/api/v1")
+    if authenticated:
+        app.dependency_overrides[get_current_user] = lambda: {"id": "admin"}
+    return TestClient(app)
+
+
+@pytest.mark.asyncio
+async def test_readiness_waits_for_required_subsystems_only():
+    profiler = StartupProfiler()
+    profiler.register("database")
+    profiler.register("kubernetes", required=False)
+    client = _app(profiler)
+
+    assert client.get("/api/v1/health").status_code == 200
+    assert client.get("/api/v1/ready").status_code == 503
+
+    def no_kubeconfig():
+        raise RuntimeError("kubeconfig missing")
+
+    assert await profiler.run_subsystem("kubernetes", no_kubeconfig, required=False) is False
+    assert client.get("/api/v1/ready").status_code == 503
+
+    assert await profiler.run_subsystem("database", lambda: None) is True
+    ready = client.get("/api/v1/ready")
+    assert ready.status_code == 200
+    assert ready.json()["subsystems"]["kubernetes"]["status"] == FAILED
+    assert profiler.ready_after_ms is not None
+
+    with profiler.phase("mount_mcp"):
+        pass
+    profile = client.get("/api/v1/admin/startup-profile").json()
+    assert [p["name"] for p in profile["phases"]] == ["mount_mcp"]
+    assert profile["subsystems"]["database"]["status"] == READY
+
+
+@pytest.mark.asyncio
+async def test_required_subsystem_failure_keeps_pod_unready_while_retrying():
+    profiler = StartupProfiler(retry_initial_delay=0.01, retry_max_delay=0.02)
+    profiler.register("database")
+
+    def missing_tables():
+        raise RuntimeError("DB 스키마에 누락된 테이블이 있습니다")
+
+    task = asyncio.create_task(profiler.run_subsystem("database", missing_tables))
+    await asyncio.sleep(0.1)
+    response = _app(profiler).get("/api/v1/ready")
+    assert response.status_code == 503
+    database_status = response.json()["subsystems"]["database"]
+    assert database_status["status"] == RETRYING and database_status["attempts"] >= 3
+    assert "누락된 테이블" in database_status["error"]
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.asyncio
+async def test_required_subsystem_becomes_ready_after_transient_failure():
+    profiler = StartupProfiler(retry_initial_delay=0.01)
+    profiler.register("database")
+    calls = 0
+
+    def flaky_database():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("connection refused")
+
+    assert await profiler.run_subsystem("database", flaky_database) is True
+    response = _app(profiler).get("/api/v1/ready")
+    assert response.status_code == 200
+    database_status = response.json()["subsystems"]["database"]
+    assert database_status["attempts"] == 2 and database_status["error"] is None
+
+
+def test_startup_profile_requires_auth_and_gates_import_profiling(monkeypatch):
+    profiler = StartupProfiler()
+    monkeypatch.setattr(profiler, "import_profile", lambda *a: pytest.fail("subprocess spawned"))
+
+    assert _app(profiler, authenticated=False).get("/api/v1/admin/startup-profile").status_code in (401, 403)
+    client = _app(profiler)
+    assert client.get("/api/v1/admin/startup-profile").status_code == 200
+    assert client.get("/api/v1/admin/startup-profile?imports=true").status_code == 403
+
+
+def test_check_schema_reports_columns_added_after_table_creation(tmp_path, monkeypatch):
+    from app.models.base import Base
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'schema.db'}")
+    monkeypatch.setattr(database, "engine", engine)
+    database._register_models()
+    Base.metadata.create_all(bind=engine)
+    assert database.check_schema() == []
+
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE webhook_inbox DROP COLUMN lease_expires_at"))
+        conn.execute(text("ALTER TABLE deployment_histories DROP COLUMN replica_count"))
+    assert database.check_schema() == ["deployment_histories.replica_count", "webhook_inbox.lease_expires_at"]
+
+    database._ensure_webhook_inbox_columns()
+    database._ensure_deployment_history_columns()
+    assert database.check_schema() == []
+
+
+@pytest.mark.slow
+def test_cold_start_import_is_within_budget_and_runs_no_ddl(tmp_path, monkeypatch):
+    db_path = tmp_path / "cold.db"
+    monkeypatch.setenv("KLEPAAS_DATABASE_URL", f"sqlite:///{db_path}")
+    monkeypatch.delenv("KLEPAAS_DB_MIGRATE_ON_STARTUP", raising=False)
+
+    result = measure_cold_start("app.main", runs=2)
+
+    assert result["median_seconds"] < get_settings().startup_import_budget_seconds
+    # DDL은 python -m app.migrate 단계로 이동: import만으로는 테이블이 생기지 않음
+    if db_path.exists():
+        tables = sqlite3.connect(db_path).execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+        assert tables == []
@@ -0,0 +1,200 @@
+"""
+GitHub 웹훅 수집 파이프라인 테스트
+
+중복 전송 제거, 인박스 영속화, 워커 처리, 통합 정보 캐시를 검증합니다.
+"""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.base import Base
+from app.models.deployment_history import get_kst_now
+from app.models.user_project_integration import UserProjectIntegration
+from app.models.webhook_inbox import WebhookInbox
+from app.services.webhook_ingestion import DeliveryDeduplicator, WebhookIngestionPipeline
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def integration(session_factory):
+    db = session_factory()
+    integ = UserProjectIntegration(
+        user_id="u1",
+        github_owner="octo",
+        github_repo="app",
+        github_full_name="octo/app",
+        github_installation_id="42",
+        auto_deploy_enabled=True,
+    )
+    db.add(integ)
+    db.commit()
+    db.refresh(integ)
+    db.close()
+    return integ
+
+
+def _make_pipeline(session_factory, calls):
+    pipeline = WebhookIngestionPipeline(concurrency=2)
+    pipeline.session_factory = session_factory
+
+    async def handler(payload, integration, db):
+        calls.append((payload["n"], integration.github_full_name))
+        return {"status": "success"}
+
+    pipeline.register_handler("push", handler)
+    return pipeline
+
+
+def test_deduplicator_ttl_and_bound():
+    dedup = DeliveryDeduplicator(ttl_seconds=0, max_entries=10)
+    assert dedup.seen("a") is False
+    # TTL 0 → 즉시 만료되어 다시 새 전송으로 취급
+    assert dedup.seen("a") is False
+
+    bounded = DeliveryDeduplicator(ttl_seconds=60, max_entries=2)
+    for key in ("a", "b", "c"):
+        assert bounded.seen(key) is False
+    assert len(bounded) == 2
+    assert bounded.seen("c") is True
+
+
+@pytest.mark.asyncio
+async def test_duplicate_delivery_processed_once(session_factory, integration):
+    calls = []
+    pipeline = _make_pipeline(session_factory, calls)
+    db = session_factory()
+    try:
+        for _ in range(3):
+            await pipeline.ingest(db, delivery_id="d-1", event_type="push", payload={"n": 1}, integration_id=integration.id)
+        # 메모리 집합을 비워도 인박스 유니크 제약으로 중복이 걸러짐
+        pipeline.deduplicator.forget("d-1")
+        accepted = await pipeline.ingest(db, delivery_id="d-1", event_type="push", payload={"n": 1}, integration_id=integration.id)
+        assert accepted is False
+
+        await asyncio.wait_for(pipeline.join(), timeout=2)
+        assert calls == [(1, "octo/app")]
+        row = db.query(WebhookInbox).filter(WebhookInbox.delivery_id == "d-1").one()
+        db.refresh(row)
+        assert row.status == "done"
+        assert row.attempts == 1
+    finally:
+        await pipeline.stop()
+        db.close()
+
+
+@pytest.mark.asyncio
+async def test_pending_inbox_recovered_on_start(session_factory, integration):
+    db = session_factory()
+    db.add(WebhookInbox(delivery_id="left-over", event_type="push", payload='{"n": 7}',
+                        integration_id=integration.id, status="pending"))
+    db.commit()
+    db.close()
+
+    calls = []
+    pipeline = _make_pipeline(session_factory, calls)
+    pipeline.start()
+    try:
+        await asyncio.wait_for(pipeline.join(), timeout=2)
+        assert calls == [(7, "octo/app")]
+    finally:
+        await pipeline.stop()
+
+
+@pytest.mark.asyncio
+async def test_replicas_claim_each_row_once(session_factory, integration):
+    db = session_factory()
+    db.add(WebhookInbox(delivery_id="shared", event_type="push", payload='{"n": 3}',
+                        integration_id=integration.id, status="pending"))
+    db.commit()
+    db.close()
+
+    calls = []
+    replicas = [_make_pipeline(session_factory, calls) for _ in range(2)]
+    for replica in replicas:
+        replica.start()
+    try:
+        await asyncio.wait_for(asyncio.gather(*(r.join() for r in replicas)), timeout=2)
+        # 두 레플리카가 모두 같은 행을 복구 대상으로 적재해도 한 번만 처리
+        assert calls == [(3, "octo/app")]
+        db = session_factory()
+        row = db.query(WebhookInbox).one()
+        assert (row.status, row.attempts, row.lease_expires_at) == ("done", 1, None)
+        db.close()
+    finally:
+        for replica in replicas:
+            await replica.stop()
+
+
+@pytest.mark.asyncio
+async def test_processing_row_recovered_only_after_lease_expires(session_factory, integration):
+    db = session_factory()
+    db.add_all([
+        WebhookInbox(delivery_id="live", event_type="push", payload='{"n": 1}', integration_id=integration.id,
+                     status="processing", attempts=1, lease_expires_at=get_kst_now() + timedelta(minutes=5)),
+        WebhookInbox(delivery_id="crashed", event_type="push", payload='{"n": 2}', integration_id=integration.id,
+                     status="processing", attempts=1, lease_expires_at=get_kst_now() - timedelta(minutes=5)),
+    ])
+    db.commit()
+    db.close()
+
+    calls = []
+    pipeline = _make_pipeline(session_factory, calls)
+    pipeline.start()
+    try:
+        await asyncio.wait_for(pipeline.join(), timeout=2)
+        assert calls == [(2, "octo/app")]
+    finally:
+        await pipeline.stop()
+
+
+def test_workers_start_at_application_startup(monkeypatch):
+    from app import main
+    from app.services import webhook_ingestion
+
+    started = []
+
+    class Pipeline:
+        def start(self):
+            started.append(asyncio.get_running_loop())
+
+    async def ok(name, init, required=True):
+        return True
+
+    monkeypatch.setattr(webhook_ingestion, "get_webhook_pipeline", lambda: Pipeline())
+    monkeypatch.setattr(main.startup_profiler, "run_subsystem", ok)
+    asyncio.run(main._run_background_init())
+    assert len(started) == 1
+
+
+def test_integration_lookup_is_cached(session_factory, integration):
+    pipeline = WebhookIngestionPipeline()
+    db = session_factory()
+    try:
+        first = pipeline.lookup_integration(db, "42", "octo", "app")
+        assert first is not None and first.auto_deploy_enabled is True
+
+        # DB가 바뀌어도 TTL 동안은 캐시 결과를 사용
+        db.query(UserProjectIntegration).update({"auto_deploy_enabled": False})
+        db.commit()
+        assert pipeline.lookup_integration(db, "42", "octo", "app").auto_deploy_enabled is True
+
+        pipeline.invalidate_integration("octo", "app")
+        assert pipeline.lookup_integration(db, "42", "octo", "app").auto_deploy_enabled is False
+        assert pipeline.lookup_integration(db, "42", "octo", "missing") is None
+    finally:
+        db.close()
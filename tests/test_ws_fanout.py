@@ -0,0 +1,277 @@
+"""
+배포 WebSocket 레플리카 간 팬아웃 테스트
+
+한 프로세스 안의 가짜 pub/sub 허브를 여러 매니저(레플리카)가 공유하도록 구성해
+다른 레플리카에 연결된 소켓의 수신, 로컬 소켓 기준 구독/해제, 중복 없는 전달,
+Redis 장애 시 로컬 전달, 끊긴 소켓 정리, 다른 루프에서의 발행,
+레플리카 수를 늘려도 레플리카당 전달량이 일정한지(부하 시뮬레이션)를 검증합니다.
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+from fastapi.websockets import WebSocketState
+
+from app.websocket import fanout
+from app.websocket.deployment_monitor import DeploymentMonitorManager
+from app.websocket.fanout import LocalFanoutBus, RedisFanoutBus
+
+
+class FakeHub:
+    """PUBLISH / SUBSCRIBE만 흉내 내는 Redis (모든 레플리카가 공유)"""
+
+    def __init__(self):
+        self.subscribers = {}
+        self.published = 0
+        self.down = False
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+    def publish(self, channel, data):
+        if self.down:
+            raise ConnectionError("redis down")
+        self.published += 1
+        for pubsub in list(self.subscribers.get(channel, ())):
+            pubsub.queue.put_nowait({"type": "message", "channel": channel, "data": data})
+
+
+class FakePipeline:
+    def __init__(self, hub):
+        self.hub = hub
+        self.ops = []
+
+    def publish(self, channel, data):
+        self.ops.append((channel, data))
+
+    async def execute(self):
+        return [self.hub.publish(channel, data) for channel, data in self.ops]
+
+
+class FakePubSub:
+    def __init__(self, hub):
+        self.hub = hub
+        self.queue = asyncio.Queue()
+        self.channels = set()
+
+    async def subscribe(self, *channels):
+        for channel in channels:
+            self.hub.subscribers.setdefault(channel, set()).add(self)
+        self.channels.update(channels)
+
+    async def unsubscribe(self, *channels):
+        for channel in channels:
+            self.hub.subscribers.get(channel, set()).discard(self)
+        self.channels.difference_update(channels)
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=None):
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def reset(self):
+        await self.unsubscribe(*list(self.channels))
+
+
+class FakeWebSocket:
+    client_state = WebSocketState.CONNECTED
+
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        self.sent.append(json.loads(text))
+
+
+def _replica(hub):
+    manager = DeploymentMonitorManager()
+    manager.fanout = RedisFanoutBus(manager._deliver_envelope, redis_factory=lambda: hub, poll_timeout=0.05)
+    return manager
+
+
+async def _wait_until(predicate, timeout=2.0):
+    """리더 태스크가 전달을 마칠 때까지 대기"""
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        await asyncio.sleep(0.001)
+    # 초과 전달(중복)이 있었다면 드러나도록 한 번 더 양보
+    await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_event_reaches_socket_on_other_replica_once():
+    hub = FakeHub()
+    a, b = _replica(hub), _replica(hub)
+    watcher = FakeWebSocket()
+    # 배포 채널과 사용자 채널 양쪽에 등록된 소켓
+    await b.connect(watcher, "c1", deployment_id="42", user_id="u1")
+
+    await a.send_stage_progress("42", "u1", "build", 50, 3)
+    await _wait_until(lambda: watcher.sent)
+
+    assert [(m["type"], m["progress"]) for m in watcher.sent] == [("stage_progress", 50)]
+    assert hub.published == 2
+    await a.stop()
+    await b.stop()
+
+
+@pytest.mark.asyncio
+async def test_replica_subscribes_only_to_local_interest():
+    hub = FakeHub()
+    manager = _replica(hub)
+    ws1, ws2 = FakeWebSocket(), FakeWebSocket()
+
+    await manager.connect_deployment(ws1, "1", "alice")
+    await manager.connect_user(ws2, "bob")
+    assert set(hub.subscribers) == {"ws:deploy:1", "ws:user:alice", "ws:user:bob"}
+
+    await manager.disconnect(ws1)
+    assert {c for c, subs in hub.subscribers.items() if subs} == {"ws:user:bob"}
+    assert manager.get_connection_stats()["fanout"]["subscribed_channels"] == 1
+
+    await manager.stop()
+    assert not any(hub.subscribers.values())
+
+
+@pytest.mark.asyncio
+async def test_redis_outage_falls_back_to_local_delivery():
+    hub = FakeHub()
+    manager = _replica(hub)
+    ws = FakeWebSocket()
+    await manager.connect(ws, "c1", deployment_id="5")
+
+    hub.down = True
+    await manager.send_deployment_completed("5", "u1", "success", {})
+
+    assert [m["type"] for m in ws.sent] == ["deployment_completed"]
+    assert manager.fanout.stats()["local_fallbacks"] == 1
+    await manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_dead_socket_is_pruned_and_unsubscribed_on_send_failure():
+    hub = FakeHub()
+    manager = _replica(hub)
+    alive, dead = FakeWebSocket(), FakeWebSocket()
+    await manager.connect(alive, "c1", deployment_id="7")
+    await manager.connect(dead, "c2", deployment_id="8")
+    dead.client_state = WebSocketState.DISCONNECTED
+
+    await manager.send_stage_progress("8", None, "build", 10, 1)
+    await _wait_until(lambda: "8" not in manager.deployment_connections)
+
+    assert "c2" not in manager.connections and dead not in manager.connection_metadata
+    assert {c for c, subs in hub.subscribers.items() if subs} == {"ws:deploy:7"}
+    await manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_disconnect_by_connection_id_releases_subscription():
+    hub = FakeHub()
+    manager = _replica(hub)
+    ws = FakeWebSocket()
+    await manager.connect(ws, "c1", deployment_id="9", user_id="dave")
+
+    await manager.disconnect("c1")
+
+    assert manager.connections == {} and manager.connection_metadata == {}
+    assert manager.deployment_connections == {} and manager.user_connections == {}
+    assert not any(hub.subscribers.values())
+    await manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_publish_from_another_loop_is_handed_off_without_disabling_redis(monkeypatch):
+    hub = FakeHub()
+    manager = _replica(hub)
+    ws = FakeWebSocket()
+    await manager.connect(ws, "c1", deployment_id="11")
+    marked = []
+    monkeypatch.setattr(fanout, "mark_redis_unavailable", marked.append)
+    main_loop = asyncio.get_running_loop()
+    publish_loops = []
+    real_pipeline = hub.pipeline
+
+    def pipeline(transaction=True):
+        loop = asyncio.get_running_loop()
+        publish_loops.append(loop)
+        if loop is not main_loop:
+            raise RuntimeError("attached to a different loop")
+        return real_pipeline(transaction)
+
+    hub.pipeline = pipeline
+    thread = threading.Thread(
+        target=lambda: asyncio.run(manager.send_stage_progress("11", None, "deploy", 90, 2))
+    )
+    thread.start()
+    await asyncio.to_thread(thread.join, 5)
+    await _wait_until(lambda: ws.sent)
+
+    assert publish_loops == [main_loop]
+    assert [m["type"] for m in ws.sent] == ["stage_progress"]
+
+    # 앱 루프가 아닌 곳에서 연결 오류가 아닌 실패가 나도 로컬 오류로만 처리
+    def broken_pipeline(transaction=True):
+        raise RuntimeError("attached to a different loop")
+
+    manager.fanout._loop = None
+    hub.pipeline = broken_pipeline
+    await manager.send_stage_progress("11", None, "deploy", 95, 3)
+    assert marked == []
+    assert manager.fanout.stats()["local_fallbacks"] == 1
+    await manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_local_backend_delivers_without_duplicates():
+    manager = DeploymentMonitorManager()
+    manager.fanout = LocalFanoutBus(manager._deliver_envelope)
+    ws = FakeWebSocket()
+    await manager.connect_deployment(ws, "3", "carol")
+    ws.sent.clear()
+
+    await manager.send_deployment_started("3", "carol", {"repo": "org/app"})
+    assert [m["type"] for m in ws.sent] == ["deployment_started"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("replicas", [1, 2, 4])
+async def test_fanout_scales_horizontally(replicas):
+    """레플리카를 늘리면 총 수용 소켓이 늘고, 레플리카당 전달/수신량은 일정"""
+    hub = FakeHub()
+    managers = [_replica(hub) for _ in range(replicas)]
+    deployments, per_replica, events = 10, 50, 20
+
+    sockets = []
+    for r, manager in enumerate(managers):
+        for i in range(per_replica):
+            ws = FakeWebSocket()
+            sockets.append(ws)
+            await manager.connect(ws, f"r{r}-{i}", deployment_id=str(i % deployments), user_id=f"user-{r}-{i}")
+
+    start = time.perf_counter()
+    publisher = managers[0]
+    for n in range(events):
+        for d in range(deployments):
+            await publisher.send_stage_progress(str(d), "publisher", "deploy", n, n)
+    await _wait_until(lambda: all(len(ws.sent) >= events for ws in sockets))
+    elapsed = time.perf_counter() - start
+
+    # 모든 레플리카의 모든 소켓이 자기 배포 이벤트를 빠짐없이 한 번씩 수신
+    assert all(len(ws.sent) == events for ws in sockets)
+    # 레플리카당 수신 메시지 수는 레플리카 수와 무관 (관심 있는 배포 채널만 구독)
+    assert all(m.fanout.stats()["received"] == events * deployments for m in managers)
+    print(f"replicas={replicas} sockets={len(sockets)} deliveries={events * len(sockets)} elapsed={elapsed:.3f}s")
+
+    for manager in managers:
+        await manager.stop()